@@ -8,13 +8,14 @@ from PyQt6.QtWidgets import (
     QLabel, QHeaderView, QToolButton, QMenu, QCheckBox, QFrame, QApplication,
     QStyle, QStyleOptionHeader, QSizePolicy, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QSize, QPoint, QEvent, QPropertyAnimation, pyqtSignal
+from PyQt6.QtCore import Qt, QSize, QPoint, QEvent, QPropertyAnimation, pyqtSignal, QObject, QTimer
 from PyQt6.QtGui import QColor, QIcon, QCursor, QFont, QLinearGradient, QPainter, QPen, QBrush
 from functools import partial
 import weakref
 
 from UI.Styles import AppStyles, AppColors, AppConstants
 from UI.Icons import resource_path
+from Utils.data_formatters import format_age_from_epoch
 import logging
 import os
 
@@ -34,6 +35,96 @@ class SortableTableWidgetItem(QTableWidgetItem):
             return self.value < other.value
         return super().__lt__(other)
 
+AGE_REPAINT_INTERVAL_MS = 30000  # Ages are shown in minutes at best - repaint them twice a minute
+
+
+class AgeTableWidgetItem(SortableTableWidgetItem):
+    """
+    Age cell holding the creation time as epoch seconds.
+    The text is formatted from it whenever the cell is painted, so it never goes stale,
+    and sorting compares the stored times instead of parsing "5m" back into a number.
+    """
+    def __init__(self, created_ts, fallback_text="Unknown"):
+        super().__init__("", created_ts)
+        self.fallback_text = fallback_text
+
+    def data(self, role):
+        if role == Qt.ItemDataRole.DisplayRole:
+            if self.value is None:
+                return self.fallback_text
+            return format_age_from_epoch(self.value)
+        return super().data(role)
+
+    def __lt__(self, other):
+        # Later creation times are younger - ascending age is descending time
+        if isinstance(other, AgeTableWidgetItem) and self.value is not None and other.value is not None:
+            return self.value > other.value
+        return super().__lt__(other)
+
+
+class AgeColumnTicker(QObject):
+    """
+    One timer for the whole application that repaints the age columns of visible tables.
+    Only the column's on-screen cells are repainted, and painting is what formats them.
+    """
+    def __init__(self):
+        super().__init__()
+        self._views = weakref.WeakKeyDictionary()  # table view -> age column indexes
+        self._timer = QTimer(self)
+        self._timer.setInterval(AGE_REPAINT_INTERVAL_MS)
+        self._timer.timeout.connect(self._repaint_age_columns)
+
+    def register(self, view, columns):
+        """Repaint these columns of a table view on every tick"""
+        columns = set(columns)
+        if not columns:
+            self.unregister(view)
+            return
+        self._views[view] = columns
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unregister(self, view):
+        self._views.pop(view, None)
+        if not self._views:
+            self._timer.stop()
+
+    def _repaint_age_columns(self):
+        for view, columns in list(self._views.items()):
+            try:
+                if not view.isVisible():
+                    continue
+                viewport = view.viewport()
+                for column in columns:
+                    x = view.columnViewportPosition(column)
+                    if x < 0 or view.isColumnHidden(column):
+                        continue  # Scrolled out of view
+                    viewport.update(x, 0, view.columnWidth(column), viewport.height())
+            except RuntimeError:
+                # The underlying widget was deleted
+                self._views.pop(view, None)
+        if not self._views:
+            self._timer.stop()
+
+
+_age_column_ticker = None
+
+def get_age_column_ticker() -> AgeColumnTicker:
+    """Get the application-wide age column ticker (create on the GUI thread)"""
+    global _age_column_ticker
+    if _age_column_ticker is None:
+        _age_column_ticker = AgeColumnTicker()
+    return _age_column_ticker
+
+
+AGE_COLUMN_HEADERS = ("age", "last seen")
+
+
+def find_age_columns(headers) -> set:
+    """Indexes of the columns showing an age"""
+    return {index for index, header in enumerate(headers) if str(header).strip().lower() in AGE_COLUMN_HEADERS}
+
+
 class CustomHeader(QHeaderView):
     """
     Custom table header that enables sorting only for specific columns
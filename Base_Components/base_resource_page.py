@@ -9,7 +9,7 @@ import weakref
 import time  # FIXED: Add missing time import
 from PyQt6.QtWidgets import (
     QMessageBox, QWidget, QVBoxLayout, QLineEdit, QComboBox,
-    QLabel, QProgressBar, QHBoxLayout, QPushButton, QApplication, QTableWidgetItem,
+    QLabel, QProgressBar, QHBoxLayout, QPushButton, QApplication,
     QAbstractItemView, QStackedWidget, QHeaderView, QFrame, QSizePolicy, QProgressDialog, QCheckBox
 )
 from PyQt6.QtGui import QColor, QFont
@@ -19,12 +19,17 @@ from typing import List, Any, Dict
 # Import optimized unified components
 from .resource_deleters import ResourceDeleterThread, BatchResourceDeleterThread
 from .virtual_scroll_table import VirtualScrollTable
+from .virtualized_table_model import TableColumn, ALIGN_CENTER
 
 from Base_Components.base_components import BaseTablePage
 from UI.Styles import AppStyles, AppColors
 from UI.Icons import resource_path
 from UI.LoadingSpinner import LoadingOverlay, create_loading_overlay, create_compact_spinner
 from Utils.unified_resource_loader import get_unified_resource_loader, LoadResult
+from Utils.resource_delta import get_row_key
+from Utils.filter_query import FilterQueryError, is_structured_query
+from Utils.column_extractors import get_searchable_fields
+from Utils.resource_registry import get_resource_registry
 from Utils.data_formatters import format_age, parse_memory_value, format_percentage, truncate_string
 from Utils.error_handler import get_error_handler, safe_execute, error_handler
 from Utils.enhanced_worker import EnhancedBaseWorker
@@ -38,9 +43,10 @@ from log_handler import method_logger, class_logger
 BATCH_SIZE = 100  # FIXED: Increased batch size for better large data performance
 SCROLL_DEBOUNCE_MS = 150   # FIXED: Optimized debounce for large data stability
 SEARCH_DEBOUNCE_MS = 500  # FIXED: Longer debounce for large dataset search performance
-MAX_ITEMS_IN_MEMORY = 2000  # FIXED: Increased memory limit for large datasets
+FILTER_DEBOUNCE_MS = 50  # Searches of the loaded rows run in the background on (nearly) every keystroke
 LARGE_DATASET_THRESHOLD = 200  # FIXED: Lower threshold to activate optimizations earlier
 MAX_TABLE_ROWS_BEFORE_VIRTUAL = 100  # FIXED: New constant for virtual scrolling
+TABLE_ROW_HEIGHT = 40
 
 # Cache system removed
 
@@ -78,6 +84,10 @@ class BaseResourcePage(BaseTablePage):
         self._loaded_item_count = 0
         self._enable_virtual_scrolling = False  # FIXED: Add virtual scrolling control
         self._progressive_loading = True  # FIXED: Enable progressive loading
+        self._streaming_rows = False  # True while partial pages of the current load are being appended
+        self._loading_namespace = None  # Namespace of the in-flight unified load (None = all namespaces)
+        self._showing_stale_rows = False  # Rows on screen came from the result cache or disk snapshot
+        self._shown_resource_version = None  # List resourceVersion of the rows on screen, the base for deltas
         self._last_load_time = 0  # FIXED: Track last load time
 
         self.is_showing_skeleton = False
@@ -94,7 +104,6 @@ class BaseResourcePage(BaseTablePage):
         self._visible_start = 0
         self._visible_end = 100  # Increased for better performance
         self._render_buffer = 20  # Extra rows to render for smooth scrolling
-        self._remaining_resources = []  # Store remaining resources for lazy loading
         
         # Debouncing timers
         # Use unified debounced updater instead of individual timers
@@ -166,23 +175,8 @@ class BaseResourcePage(BaseTablePage):
         """Show a subtle message that data is loading"""
         try:
             if hasattr(self, 'table') and self.table:
-                # Clear the table completely first to remove any status/action widgets
                 self.clear_table()
-                
-                # Set a loading message in the table temporarily
-                self.table.setRowCount(1)
-                
-                from PyQt6.QtWidgets import QTableWidgetItem
-                from PyQt6.QtCore import Qt
-                
-                item = QTableWidgetItem("🔄 Loading resources...")
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.table.setItem(0, 0, item)
-                
-                # Span the loading message across all columns
-                if self.table.columnCount() > 0:
-                    self.table.setSpan(0, 0, 1, self.table.columnCount())
-                    
+                self._show_status_message("🔄 Loading resources...", "color: #9ca3af; font-size: 14px;")
         except Exception as e:
             logging.debug(f"Error showing startup loading message: {e}")
     
@@ -290,35 +284,6 @@ class BaseResourcePage(BaseTablePage):
             logging.error(f"Error formatting age: {e}")
             return "Unknown"
 
-    def _manage_memory_usage(self):
-        """Manage memory usage to prevent crashes with large datasets"""
-        try:
-            if not self._large_dataset_mode:
-                return
-            
-            # If we have too many items loaded, trim the oldest ones
-            if len(self.resources) > MAX_ITEMS_IN_MEMORY:
-                items_to_remove = len(self.resources) - MAX_ITEMS_IN_MEMORY
-                # Move oldest items back to remaining resources for potential reload
-                removed_items = self.resources[:items_to_remove]
-                self.resources = self.resources[items_to_remove:]
-                
-                # Add removed items back to the front of remaining resources
-                self._remaining_resources = removed_items + self._remaining_resources
-                
-                # Update display
-                self._display_resources(self.resources)
-                self._update_items_count()
-                
-                logging.info(f"Memory management: Trimmed {items_to_remove} items from display")
-                
-            # Force garbage collection
-            import gc
-            gc.collect()
-            
-        except Exception as e:
-            logging.error(f"Error in memory management: {e}")
-
     # Thread-safe data access methods
     # Cache methods removed
     
@@ -491,13 +456,7 @@ class BaseResourcePage(BaseTablePage):
         """Get currently selected resources - to be implemented by subclasses"""
         # Default implementation - subclasses should override
         if hasattr(self, 'table'):
-            selected_rows = []
-            for row in range(self.table.rowCount()):
-                if hasattr(self.table, 'item'):
-                    item = self.table.item(row, 0)  # First column
-                    if item and item.isSelected():
-                        selected_rows.append(row)
-            return selected_rows
+            return self.table.get_selected_indices()
         return []
     
     def _confirm_deletion(self, selected_items):
@@ -634,17 +593,28 @@ class BaseResourcePage(BaseTablePage):
 
     def _on_search_text_changed(self, text):
         """Handle search text changes with debouncing"""
-        # Use debounced updater for search
+        # Use debounced updater for search - only searches that go to the API wait for typing to pause
+        local = self._local_search_available() or self._is_structured_query(text)
         self._debounced_updater.schedule_update(
             'search_' + self.__class__.__name__,
             self._perform_search,
-            delay_ms=SEARCH_DEBOUNCE_MS
+            delay_ms=FILTER_DEBOUNCE_MS if local else SEARCH_DEBOUNCE_MS
         )
 
     def _perform_search(self):
         """Perform comprehensive search across all resources"""
         search_text = self.search_bar.text().strip()
         
+        # Loaded rows that are the whole listing answer searches in place, without an API round trip.
+        # Field, label and negated terms (status!=Running label:app=web) always filter the loaded rows.
+        if search_text and (self._local_search_available() or self._is_structured_query(search_text)):
+            self._apply_table_filter(search_text)
+            return
+        if getattr(self, 'table', None) is not None and self.table.is_filtering:
+            self.table.clear_filter()
+            if not search_text and not getattr(self, '_is_searching', False):
+                return  # The table still holds every loaded row
+        
         if not search_text:
             # No search query, reload normal resources
             self._clear_search_and_reload()
@@ -653,6 +623,50 @@ class BaseResourcePage(BaseTablePage):
         # Perform global search across all resources
         self._perform_global_search(search_text.lower())
 
+    def _local_search_available(self):
+        """True when the loaded rows are the complete listing a search of the API would scan"""
+        return (getattr(self, 'table', None) is not None and self.all_data_loaded and
+                not self._streaming_rows and not self.is_loading_initial)
+    
+    def _is_structured_query(self, text):
+        """Whether a search names fields of the table - tokens like nginx:1.25 stay plain searches"""
+        table = getattr(self, 'table', None)
+        return is_structured_query(text, table.filter_fields() if table is not None else frozenset())
+    
+    def get_search_fields(self):
+        """Row fields plain search words are looked up in - the resource type's searchable columns and labels"""
+        return list(get_searchable_fields(self.resource_type)) + ['labels']
+    
+    def _apply_table_filter(self, query):
+        """Show the loaded rows a query matches - matched in the background, see Utils.filter_query"""
+        if getattr(self, 'table', None) is None:
+            return
+        if getattr(self, '_is_searching', False):
+            # The table holds search results - filter every loaded row instead
+            self._is_searching = False
+            self._current_search_query = None
+            self._display_resources(self.resources)
+        
+        if getattr(self, '_filter_signals_table', None) is not self.table:
+            self.table.filter_applied.connect(self._on_table_filter_applied)
+            self.table.filter_error.connect(self._on_table_filter_error)
+            self._filter_signals_table = self.table
+        
+        try:
+            self.table.set_search_fields(self.get_search_fields())
+            self.table.set_filter_query(query)
+        except FilterQueryError as e:
+            self._on_table_filter_error(str(e))
+    
+    def _on_table_filter_applied(self, shown, total):
+        self.search_bar.setToolTip("")
+        self._update_items_count()
+    
+    def _on_table_filter_error(self, message):
+        """Keep the last matched rows and say why the query was not applied"""
+        self.search_bar.setToolTip(message)
+        self.items_count.setText(f"Filter error: {message}")
+
     def _clear_search_and_reload(self):
         """Clear search and reload normal resources"""
         # Mark that we're no longer in search mode
@@ -684,23 +698,9 @@ class BaseResourcePage(BaseTablePage):
         """Show loading message during search"""
         try:
             if hasattr(self, 'table') and self.table:
-                # Clear the table completely first to remove any status/action widgets
                 self.clear_table()
-                
-                # Set single row for loading message
-                self.table.setRowCount(1)
-                
-                from PyQt6.QtWidgets import QTableWidgetItem
-                from PyQt6.QtCore import Qt
-                
-                item = QTableWidgetItem(f"🔍 Searching for '{search_query}' across all resources...")
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.table.setItem(0, 0, item)
-                
-                # Span the loading message across all columns
-                if self.table.columnCount() > 1:
-                    self.table.setSpan(0, 0, 1, self.table.columnCount())
-                    
+                self._show_status_message(f"🔍 Searching for '{search_query}' across all resources...",
+                                          "color: #9ca3af; font-size: 14px;")
         except Exception as e:
             logging.debug(f"Error showing search loading message: {e}")
     
@@ -770,26 +770,11 @@ class BaseResourcePage(BaseTablePage):
             
         logging.error(f"Search error for {resource_type}: {error_message}")
         
-        # Show error message in table
+        # Show error message in place of the table
         try:
             if hasattr(self, 'table') and self.table:
-                # Clear the table completely first to remove any status/action widgets
                 self.clear_table()
-                
-                # Set single row for error message
-                self.table.setRowCount(1)
-                
-                from PyQt6.QtWidgets import QTableWidgetItem
-                from PyQt6.QtCore import Qt
-                
-                item = QTableWidgetItem(f"❌ Search failed: {error_message}")
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.table.setItem(0, 0, item)
-                
-                # Span the error message across all columns
-                if self.table.columnCount() > 1:
-                    self.table.setSpan(0, 0, 1, self.table.columnCount())
-                    
+                self._show_status_message(f"❌ Search failed: {error_message}", "color: #ef4444; font-size: 14px;")
         except Exception as e:
             logging.debug(f"Error showing search error message: {e}")
     
@@ -818,26 +803,21 @@ class BaseResourcePage(BaseTablePage):
             
             # Connect signals if not already connected
             if not hasattr(self, '_namespace_signals_connected'):
-                unified_loader.loading_completed.connect(self._on_namespaces_loaded_unified)
-                unified_loader.loading_error.connect(self._on_namespace_error_unified)
+                unified_loader.namespace_names_loaded.connect(self._on_namespaces_loaded_unified)
                 self._namespace_signals_connected = True
             
-            # Load namespaces using unified loader (same as AppsChart for fast performance)
-            self._namespace_operation_id = unified_loader.load_resources_async('namespaces')
+            # The dropdown only needs names - list namespace metadata instead of full objects
+            self._namespace_operation_id = unified_loader.load_namespace_names_async()
             
         except Exception as e:
             logging.error(f"Failed to start namespace loading: {e}")
             # Fallback to default namespaces
             self._on_namespaces_loaded(["default", "kube-system", "kube-public"])
 
-    def _on_namespaces_loaded_unified(self, resource_type: str, result):
-        """Handle namespaces loaded from unified loader"""
-        if resource_type != 'namespaces':
-            return
-        
+    def _on_namespaces_loaded_unified(self, result):
+        """Handle namespace names loaded from unified loader"""
         if result.success:
-            # Extract namespace names from the processed results
-            namespaces = [item.get('name', '') for item in result.items if item.get('name')]
+            namespaces = list(result.items)
             
             # Sort namespaces with default first, then alphabetically  
             important_namespaces = ["default", "kube-system", "kube-public", "kube-node-lease"]
@@ -956,38 +936,6 @@ class BaseResourcePage(BaseTablePage):
         # FIXED: Force immediate reload with new namespace
         self.force_load_data()
 
-    def _load_more_data_batch(self):
-        """Load more data for large datasets when needed"""
-        if not self._large_dataset_mode or not self._remaining_resources:
-            return
-        
-        try:
-            # Load next batch
-            batch_size = min(BATCH_SIZE, len(self._remaining_resources))
-            next_batch = self._remaining_resources[:batch_size]
-            self._remaining_resources = self._remaining_resources[batch_size:]
-            
-            # Add to existing resources
-            self.resources.extend(next_batch)
-            self._loaded_item_count = len(self.resources)
-            
-            # Check if all data is loaded
-            if not self._remaining_resources:
-                self.all_data_loaded = True
-                logging.info(f"All {self._total_item_count} items loaded")
-            
-            # Manage memory usage to prevent crashes
-            self._manage_memory_usage()
-            
-            # Update display
-            self._display_resources(self.resources)
-            self._update_items_count()
-            
-            logging.debug(f"Loaded batch: {batch_size} items. Total loaded: {self._loaded_item_count}/{self._total_item_count}")
-            
-        except Exception as e:
-            logging.error(f"Error loading more data batch: {e}")
-
     def _handle_scroll(self, value):
         """Handle scroll events with debouncing"""
         # Use debounced updater for scroll
@@ -1004,11 +952,7 @@ class BaseResourcePage(BaseTablePage):
         
         scrollbar = self.table.verticalScrollBar()
         if scrollbar.value() >= scrollbar.maximum() - 10:  # Near bottom
-            if self._large_dataset_mode and self._remaining_resources:
-                # For large datasets, load next batch from memory
-                self._load_more_data_batch()
-            elif not self.all_data_loaded and self.current_continue_token:
-                # For normal pagination, use traditional method
+            if not self.all_data_loaded and self.current_continue_token:
                 self._load_more_data()
 
     def _load_more_data(self):
@@ -1031,13 +975,23 @@ class BaseResourcePage(BaseTablePage):
         
         # Connect signals if not already connected
         if not hasattr(self, '_signals_connected'):
+            unified_loader.loading_partial.connect(self._on_unified_resources_partial)
             unified_loader.loading_completed.connect(self._on_unified_resources_loaded)
             unified_loader.loading_error.connect(self._on_unified_loading_error)
+            unified_loader.cache_revalidated.connect(self._on_unified_cache_revalidated)
             self._signals_connected = True
         
+        self._streaming_rows = False
+        
         # Start loading with optimized configuration
         # Handle "All Namespaces" efficiently by using None (which triggers optimized multi-namespace loading)
         namespace = None if self.namespace_filter == "All Namespaces" else self.namespace_filter
+        
+        # Stop fetching the remaining pages of a load for a previously selected namespace
+        if getattr(self, '_current_operation_id', None) and self._loading_namespace != namespace:
+            unified_loader.cancel_load(self.resource_type, self._loading_namespace)
+        self._loading_namespace = namespace
+        
         self._current_operation_id = unified_loader.load_resources_async(
             resource_type=self.resource_type,
             namespace=namespace
@@ -1045,17 +999,67 @@ class BaseResourcePage(BaseTablePage):
         
         logging.debug(f"Started unified loading for {self.resource_type} (operation: {self._current_operation_id})")
 
+    def _on_unified_resources_partial(self, resource_type: str, result: LoadResult):
+        """Append a streamed page of resources while the rest of the list is still loading"""
+        try:
+            if resource_type != self.resource_type or not self._progressive_loading or not result.items:
+                return
+            
+            # Ignore pages still arriving from a load for a previously selected namespace
+            requested_namespace = None if self.namespace_filter == "All Namespaces" else self.namespace_filter
+            if result.metadata.get('namespace') != requested_namespace:
+                return
+            
+            if not self._streaming_rows:
+                # First page of a new load replaces whatever was shown before
+                self._streaming_rows = True
+                self.resources = []
+                self.clear_table()
+                self.selected_items.clear()
+                self._table_stack.setCurrentWidget(self.table)
+                self.hide_loading_indicator()
+            
+            self.resources.extend(result.items)
+            self._render_resources_batch(result.items, append=True)
+            
+            self._loaded_item_count = len(self.resources)
+            self._update_items_count()
+            
+            expected_total = result.metadata.get('expected_total')
+            if expected_total:
+                self.items_count.setText(f"{result.total_count} of {expected_total} items")
+            
+        except Exception as e:
+            logging.error(f"Error appending streamed {resource_type}: {e}")
+    
     def _on_unified_resources_loaded(self, resource_type: str, result: LoadResult):
         """Handle resources loaded from unified loader with large dataset optimizations"""
         try:
             # Only process if this matches our resource type
             if resource_type != self.resource_type:
                 return
+            if 'search_query' in (result.metadata or {}):
+                return  # Search results are shown by _on_search_results_loaded, never kept as the loaded rows
+            
+            streamed_rows = self._streaming_rows
+            self._streaming_rows = False
             
             if not result.success:
                 self._on_unified_loading_error(resource_type, result.error_message or "Unknown error")
                 return
             
+            # Cached or persisted rows are shown marked stale until the live list confirms or replaces them
+            self._showing_stale_rows = bool(result.from_cache and result.metadata.get('stale'))
+            
+            # A revalidation of the rows on screen only touches the rows that changed
+            delta = result.metadata.get('delta')
+            delta_base = result.metadata.get('delta_base')
+            delta_applied = (
+                delta is not None and not streamed_rows and delta_base is not None and
+                delta_base == self._shown_resource_version and self._apply_resource_delta(delta)
+            )
+            self._shown_resource_version = result.metadata.get('resource_version')
+            
             # Process the optimized result format
             resources = result.items or []
             
@@ -1063,23 +1067,21 @@ class BaseResourcePage(BaseTablePage):
             self._total_item_count = len(resources)
             self._large_dataset_mode = self._total_item_count > LARGE_DATASET_THRESHOLD
             
-            if self._large_dataset_mode:
-                logging.info(f"Large dataset detected: {self._total_item_count} items. Activating optimizations.")
-                # For large datasets, only load the first batch
-                self.resources = resources[:MAX_ITEMS_IN_MEMORY]
-                self._loaded_item_count = len(self.resources)
-                self.all_data_loaded = False
-                # Store remaining items for lazy loading
-                self._remaining_resources = resources[MAX_ITEMS_IN_MEMORY:]
-            else:
-                # Small dataset - load everything
+            # Rows already appended page by page only need the load state finalized
+            rows_complete = (
+                streamed_rows and result.metadata.get('streamed') and
+                len(self.resources) == self._total_item_count
+            )
+            
+            # The table model holds every row - only the rows on screen are ever painted
+            if not delta_applied and not rows_complete:
                 self.resources = resources
-                self._loaded_item_count = len(self.resources)
-                self.all_data_loaded = True
-                self._remaining_resources = []
+            self._loaded_item_count = len(self.resources)
+            self.all_data_loaded = True
             
             # Always display resources, even if empty
-            self._display_resources(self.resources)
+            if not rows_complete and not delta_applied:
+                self._display_resources(self.resources)
             self._update_items_count()
             
             self.is_loading_initial = False
@@ -1091,6 +1093,10 @@ class BaseResourcePage(BaseTablePage):
 
             self.all_items_loaded_signal.emit()
             self.load_more_complete.emit()
+            
+            # A search sent to the API while rows were loading is answered from the now complete rows
+            if getattr(self, '_is_searching', False) and self.search_bar and self.search_bar.text().strip():
+                self._perform_search()
 
             # Log performance info
             logging.info(f"Loaded {self._loaded_item_count}/{self._total_item_count} {resource_type} in {result.load_time_ms:.1f}ms")
@@ -1099,6 +1105,41 @@ class BaseResourcePage(BaseTablePage):
             logging.error(f"Error processing unified resources: {e}")
             self._on_unified_loading_error(resource_type, str(e))
 
+    def _apply_resource_delta(self, delta) -> bool:
+        """Update only the inserted, changed and removed rows - False when a full render is needed"""
+        if not self.resources or self.table.get_total_items() != len(self.resources):
+            return False
+        if getattr(self, '_is_searching', False):
+            return False  # The table shows search results, not the loaded rows
+        if not delta.is_worth_applying(len(self.resources)):
+            return False
+        
+        row_by_key = {get_row_key(resource): row for row, resource in enumerate(self.resources)}
+        if (any(get_row_key(resource) not in row_by_key for resource in delta.changed) or
+                any(key not in row_by_key for key in delta.removed) or
+                any(get_row_key(resource) in row_by_key for resource in delta.added)):
+            return False  # The delta was computed against rows this page is not showing
+        
+        # The model moves its own rows - checks of removed rows are dropped there
+        if not self.table.apply_delta(delta):
+            return False
+        
+        for resource in delta.changed:
+            self.resources[row_by_key[get_row_key(resource)]] = resource
+        removed = set(delta.removed)
+        self.resources = [resource for resource in self.resources if get_row_key(resource) not in removed]
+        self.resources.extend(delta.added)
+        
+        logging.info(f"Applied {self.resource_type} delta {delta.summary()}")
+        return True
+    
+    def _on_unified_cache_revalidated(self, resource_type: str, result: LoadResult):
+        """The live list matched the cached rows on screen - clear the stale marker"""
+        if resource_type != self.resource_type or not self._showing_stale_rows:
+            return
+        self._showing_stale_rows = False
+        self._update_items_count()
+    
     def _on_unified_loading_error(self, resource_type: str, error_message: str):
         """Handle loading errors from unified loader"""
         if resource_type != self.resource_type:
@@ -1106,6 +1147,9 @@ class BaseResourcePage(BaseTablePage):
         
         self.is_loading_initial = False
         self.is_loading_more = False
+        self._streaming_rows = False
+        if self._showing_stale_rows:
+            self.items_count.setText(f"{len(self.resources)} items (cached - refresh failed)")
 
         # Hide loading indicator on error
         self.hide_loading_indicator()
@@ -1161,7 +1205,7 @@ class BaseResourcePage(BaseTablePage):
         self._show_error_message(error_message)
 
     def _display_resources(self, resources):
-        """Display resources in the table with optimized handling for large datasets"""
+        """Display resources in the table - the model keeps every row and only visible cells are painted"""
         if not resources:
             self._show_empty_message()
             return
@@ -1171,102 +1215,46 @@ class BaseResourcePage(BaseTablePage):
         # Clear previous selections when displaying new data
         self.selected_items.clear()
         
-        # Log performance info for large datasets
-        if len(resources) > 100:
-            logging.info(f"Displaying {len(resources)} resources (large dataset optimization active)")
-        
-        # Optimized rendering for all datasets
         self._render_resources_batch(resources)
 
-
     def _render_resources_batch(self, resources, append=False):
-        """Render a batch of resources to the table with optimized performance"""
-        if not append:
-            self.clear_table()
-        
-        if not resources:
-            return
-            
-        # Disable sorting during batch rendering for better performance
-        self.table.setSortingEnabled(False)
-        
-        start_row = self.table.rowCount() if append else 0
-        
-        # Set row count all at once instead of inserting one by one
-        total_rows = start_row + len(resources)
-        self.table.setRowCount(total_rows)
-        
-        # Handle large datasets efficiently
-        if len(resources) > 500:
-            # For large datasets, render only visible items
-            batch_size = 100  # Larger batches for better performance with large data
-            for i in range(0, min(200, len(resources)), batch_size):  # Limit initial render to 200 items
-                batch = resources[i:i + batch_size]
-                
-                for j, resource in enumerate(batch):
-                    row = start_row + i + j
-                    if hasattr(self, 'populate_resource_row'):
-                        self.populate_resource_row(row, resource)
-                    else:
-                        self._populate_resource_row(row, resource)
-                
-                # Process events every other batch for large datasets
-                if i % (batch_size * 2) == 0:
-                    QApplication.processEvents()
+        """Hand rows to the table model - cells are computed from them when painted"""
+        if append:
+            self.table.append_data(list(resources))
         else:
-            # For smaller datasets, render normally in batches
-            batch_size = 50
-            for i in range(0, len(resources), batch_size):
-                batch = resources[i:i + batch_size]
-                
-                for j, resource in enumerate(batch):
-                    row = start_row + i + j
-                    if hasattr(self, 'populate_resource_row'):
-                        self.populate_resource_row(row, resource)
-                    else:
-                        self._populate_resource_row(row, resource)
-                
-                # Process events less frequently to reduce overhead
-            if i % (batch_size * 2) == 0:
-                QApplication.processEvents()
-        
-        # Re-enable sorting after all rows are added
-        self.table.setSortingEnabled(True)
-
-    def _populate_resource_row(self, row, resource):
-        """Populate a table row with resource data - default implementation"""
-        from PyQt6.QtWidgets import QTableWidgetItem
-        
-        # Default implementation for common fields - can be overridden by subclasses
-        # Create checkbox for the first column
-        checkbox_container = self._create_checkbox_container(row, resource.get("name", "Unknown"))
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Extract common resource fields
-        name = resource.get("name", "Unknown")
-        namespace = resource.get("namespace", "")
-        age = resource.get("age", "Unknown")
-        status = resource.get("status", "Unknown")
-        
-        # Populate basic columns that most resources have
-        columns = []
-        if namespace:
-            columns = [name, namespace, age, status]
-        else:
-            columns = [name, age, status]
-        
-        # Populate table cells
-        for col_idx, value in enumerate(columns):
-            table_col = col_idx + 1  # Skip checkbox column
-            if table_col < self.table.columnCount():
-                item = QTableWidgetItem(str(value))
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.table.setItem(row, table_col, item)
+            self.table.set_resource_data(list(resources))
+
+    def get_table_columns(self, headers):
+        """
+        Column specs for the table - pages override this to describe their columns.
+        The default shows a checkbox, the row field named after each header, and the action button.
+        """
+        specs = []
+        for col, header in enumerate(headers):
+            if col == 0 and not header:
+                specs.append(TableColumn.checkbox())
+            elif col == len(headers) - 1 and not header:
+                specs.append(TableColumn.action())
+            elif header.lower() == "age":
+                specs.append(TableColumn.age(header))
+            else:
+                specs.append(TableColumn(header, key=header.lower().replace(" ", "_")))
+        return specs
+
+    def get_resource_at(self, row):
+        """Resource shown at a table row - rows are in the table's sort order, not load order"""
+        return self.table.get_row(row) if self.table is not None else None
 
     def _update_items_count(self):
         """Update the items count label"""
         count = len(self.resources)
-        self.items_count.setText(f"{count} items")
+        table = getattr(self, 'table', None)
+        if table is not None and table.is_filtering:
+            self.items_count.setText(f"{table.rowCount()} of {count} items")
+        elif self._showing_stale_rows:
+            self.items_count.setText(f"{count} items (cached, refreshing...)")
+        else:
+            self.items_count.setText(f"{count} items")
 
     def _show_empty_message(self):
         """Show empty state message in center of table section while keeping headers visible"""
@@ -1297,6 +1285,18 @@ class BaseResourcePage(BaseTablePage):
         # Switch to message container view
         self._table_stack.setCurrentWidget(self._message_widget_container)
 
+    def _show_status_message(self, text, style):
+        """Show a single line of text in place of the table"""
+        self._clear_message_container()
+        
+        label = QLabel(text)
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setStyleSheet(style)
+        label.setWordWrap(True)
+        
+        self._message_widget_container.layout().addWidget(label)
+        self._table_stack.setCurrentWidget(self._message_widget_container)
+
     def _show_error_message(self, message):
         """Show error message"""
         self._clear_message_container()
@@ -1331,13 +1331,11 @@ class BaseResourcePage(BaseTablePage):
     def _clear_resources(self):
         """Clear resources data array - used only for force refresh"""
         self.resources.clear()
-        # Also clear any remaining resources for large datasets
-        if hasattr(self, '_remaining_resources'):
-            self._remaining_resources.clear()
         # Reset large dataset mode
         self._large_dataset_mode = False
         self._total_item_count = 0
         self._loaded_item_count = 0
+        self._shown_resource_version = None
         logging.debug("Resources data array cleared for refresh")
         
     def clear_for_cluster_change(self):
@@ -1397,29 +1395,8 @@ class BaseResourcePage(BaseTablePage):
 
     def _handle_select_all(self, state):
         """Handle select-all checkbox state changes."""
-        # Clear current selections
-        self.selected_items.clear()
-
-        # Update all row checkboxes
-        for row in range(self.table.rowCount()):
-            checkbox_container = self.table.cellWidget(row, 0)
-            if checkbox_container:
-                # Find checkbox in container
-                checkbox = checkbox_container.findChild(QCheckBox)
-                if checkbox:
-                    # Block signals to prevent individual handler from firing
-                    checkbox.blockSignals(True)
-                    checkbox.setChecked(state == Qt.CheckState.Checked.value)
-                    checkbox.blockSignals(False)
-
-        # Update selected_items based on state
-        if state == Qt.CheckState.Checked.value:
-            # Add all items to selected set  
-            for resource in self.resources:
-                resource_namespace = resource.get("namespace", "")
-                resource_key = (resource["name"], resource_namespace) if resource_namespace else (resource["name"], "")
-                self.selected_items.add(resource_key)
-                
+        # Checks live in the table model - selected_items follows through check_state_changed
+        self.table.set_all_checked(state == Qt.CheckState.Checked.value)
         logging.debug(f"Select all: {state == Qt.CheckState.Checked.value}, Selected items: {len(self.selected_items)}")
 
     def _validate_resource_name(self, resource_name):
@@ -1428,15 +1405,7 @@ class BaseResourcePage(BaseTablePage):
             return False
         
         # Skip validation for cluster-scoped resources that don't have namespaces
-        cluster_scoped_resources = {
-            'nodes', 'clusterroles', 'clusterrolebindings', 
-            'storageclasses', 'customresourcedefinitions',
-            'ingressclasses', 'persistentvolumes',
-            'validatingwebhookconfigurations', 'mutatingwebhookconfigurations',
-            'priorityclasses', 'runtimeclasses'
-        }
-        
-        if hasattr(self, 'resource_type') and self.resource_type in cluster_scoped_resources:
+        if hasattr(self, 'resource_type') and not get_resource_registry().is_namespaced(self.resource_type):
             return True  # Allow all names for cluster-scoped resources
             
         # For namespaced resources, check for common pod naming patterns that shouldn't appear in other resource types
@@ -1589,7 +1558,8 @@ class BaseResourcePage(BaseTablePage):
             
             QMessageBox.information(self, "Deletion Results", result_message)
             
-            # Refresh data to show current state
+            # Refresh data to show current state - the cached list still has the deleted rows
+            get_unified_resource_loader().invalidate_cache(self.resource_type)
             self.force_load_data()
             
         except Exception as e:
@@ -1625,6 +1595,7 @@ class BaseResourcePage(BaseTablePage):
         if success:
             QMessageBox.information(self, "Deletion Successful", message)
             self.selected_items.discard((resource_name, resource_namespace))
+            get_unified_resource_loader().invalidate_cache(self.resource_type)
             self.force_load_data()
         else:
             QMessageBox.critical(self, "Deletion Failed", message)
@@ -1647,24 +1618,7 @@ class BaseResourcePage(BaseTablePage):
     def clear_table(self):
         """Clear UI table display only - DO NOT clear resources data array"""
         try:
-            if hasattr(self.table, 'set_data'):
-                # For VirtualScrollTable
-                self.table.set_data([])
-            elif hasattr(self.table, 'setRowCount'):
-                # For QTableWidget - clear spans and widgets first
-                if hasattr(self.table, 'clearSpans'):
-                    self.table.clearSpans()
-                
-                # Clear any cell widgets that might interfere with new layout
-                for row in range(self.table.rowCount()):
-                    for col in range(self.table.columnCount()):
-                        if self.table.cellWidget(row, col):
-                            self.table.removeCellWidget(row, col)
-                
-                self.table.setRowCount(0)
-            elif hasattr(self.table, 'clear'):
-                # For other table widgets
-                self.table.clear()
+            self.table.set_resource_data([])
             
             # DO NOT clear self.resources array - this was causing action button failures!
             # The resources array must persist so action buttons can reference resource data
@@ -1676,29 +1630,31 @@ class BaseResourcePage(BaseTablePage):
     
     def _create_table(self, headers, sortable_columns=None):
         """Create and configure the table with proper column resizing"""
-        from PyQt6.QtWidgets import QTableWidget, QAbstractItemView, QHeaderView
+        from PyQt6.QtWidgets import QAbstractItemView, QHeaderView, QStyledItemDelegate
         from Base_Components.base_components import CustomHeader
         from UI.Styles import AppStyles
         
-        table = QTableWidget()
-        table.setColumnCount(len(headers))
-        table.setHorizontalHeaderLabels(headers)
+        table = VirtualScrollTable(headers, responsive_columns=False)
+        table.set_table_columns(self.get_table_columns(headers))
         
-        # Use custom header for selective header-based sorting
+        # Use custom header for selective header-based sorting - no sort until a header is clicked
         custom_header = CustomHeader(Qt.Orientation.Horizontal, sortable_columns, table)
         table.setHorizontalHeader(custom_header)
+        custom_header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         table.setSortingEnabled(True)
 
-        # Apply enhanced styling with platform overrides
+        # Apply enhanced styling with platform overrides - the style sheet paints selection and hover
+        table.setItemDelegate(QStyledItemDelegate(table))
         table.setStyleSheet(AppStyles.TABLE_STYLE)
         table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
 
         # Configure appearance with explicit settings
         table.setShowGrid(False)
         table.setAlternatingRowColors(False)
+        table.setWordWrap(False)
         table.verticalHeader().setVisible(False)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        table.verticalHeader().setDefaultSectionSize(TABLE_ROW_HEIGHT)
         
         # Force consistent selection behavior
         table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
@@ -1707,8 +1663,10 @@ class BaseResourcePage(BaseTablePage):
         # Configure resizable columns
         self._configure_table_resizing(table, headers)
 
-        # Connect cell click signal
-        table.cellClicked.connect(self.handle_row_click)
+        # Connect cell click, row checks and the painted action buttons
+        table.cell_clicked.connect(self._on_cell_clicked)
+        table.check_state_changed.connect(self._on_check_state_changed)
+        table.action_requested.connect(self._show_action_menu)
         
         return table
 
@@ -1777,9 +1735,6 @@ class BaseResourcePage(BaseTablePage):
         if not self.table or not self.select_all_checkbox:
             return
             
-        # Set the header label to empty for column 0
-        self.table.setHorizontalHeaderItem(0, QTableWidgetItem(""))
-        
         # Position the checkbox over the header
         def position_checkbox():
             if self.table and self.select_all_checkbox:
@@ -1808,51 +1763,37 @@ class BaseResourcePage(BaseTablePage):
         QTimer.singleShot(100, safe_position)
         self.table.horizontalHeader().sectionResized.connect(lambda: QTimer.singleShot(10, safe_position))
 
-    def _set_header_widget(self, column, widget):
-        """Set widget in table header"""
-        from PyQt6.QtWidgets import QTableWidgetItem, QWidget, QHBoxLayout
-        
-        if hasattr(self.table, 'horizontalHeader') and widget:
-            # Create a container widget to center the checkbox
-            container = QWidget()
-            layout = QHBoxLayout(container)
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(widget)
-            
-            # Set header item and widget
-            self.table.setHorizontalHeaderItem(column, QTableWidgetItem(""))
-            self.table.horizontalHeader().setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
-            self.table.setColumnWidth(column, 30)
-            
-            # Set the container as the header widget
-            header_view = self.table.horizontalHeader()
-            if hasattr(header_view, 'setSectionWidget'):
-                header_view.setSectionWidget(column, container)
-            else:
-                # Fallback: use viewport to position widget
-                self.table.setIndexWidget(self.table.model().index(0, column), container)
-
     def _on_select_all_changed(self, state):
         """Handle select all checkbox state change"""
         self._handle_select_all(state)
 
+    def _on_cell_clicked(self, row, column):
+        """Clicks on the checkbox column only toggle the check"""
+        if self.table.get_column_kind(column) == TableColumn.CHECK:
+            return
+        self.handle_row_click(row, column)
+
     def handle_row_click(self, row, column):
         """Handle table row click"""
         # This is a placeholder - implement based on your row click logic
         pass
 
+    def _on_check_state_changed(self):
+        """Mirror the model's checked rows into selected_items for the delete actions"""
+        self.selected_items = {
+            (resource.get("name"), resource.get("namespace") or "") for resource in self.table.checked_rows()
+        }
+        self._update_select_all_state()
+
     def update_table_row(self, row, resource):
         """Update a specific row in the table - backward compatibility method"""
         try:
-            if hasattr(self.table, 'set_data') and hasattr(self, 'resources'):
-                # For VirtualScrollTable, update the data and refresh
-                if 0 <= row < len(self.resources):
-                    self.resources[row] = resource
-                    self.table.set_data(self.resources)
-            elif hasattr(self.table, 'item'):
-                # For QTableWidget, update individual cells
-                self._populate_resource_row(row, resource)
+            current = self.get_resource_at(row)
+            if current is None:
+                return
+            key = get_row_key(current)
+            self.resources = [resource if get_row_key(r) == key else r for r in self.resources]
+            self.table.update_data(self.resources)
             
             logging.debug(f"Updated table row {row}")
             
@@ -1865,10 +1806,6 @@ class BaseResourcePage(BaseTablePage):
             return
             
         try:
-            # Skip for VirtualScrollTable as it handles its own layout
-            if hasattr(self.table, 'set_data'):
-                return
-                
             if not hasattr(self.table, 'horizontalHeader'):
                 return
                 
@@ -1979,52 +1916,22 @@ class BaseResourcePage(BaseTablePage):
         except Exception as e:
             logging.error(f"Error triggering edit mode: {e}")
 
-    def _create_action_button(self, row, resource_name=None, resource_namespace=None):
-        """Create an action button with menu for resource actions - OLD WORKING PATTERN"""
-        from PyQt6.QtWidgets import QToolButton, QMenu
+    def _show_action_menu(self, row, pos):
+        """Open the action menu of a row at the clicked action button"""
+        menu = self._create_action_menu(row)
+        if menu is None:
+            return
+        menu.exec(pos)
+        menu.deleteLater()
+
+    def _create_action_menu(self, row):
+        """Create the menu of resource actions for a row - OLD WORKING PATTERN"""
+        from PyQt6.QtWidgets import QMenu
         from PyQt6.QtGui import QIcon
-        from PyQt6.QtCore import QSize
         from functools import partial
-        
-        button = QToolButton()
-
-        # Use custom SVG icon
-        try:
-            icon_path = resource_path("Icons/Moreaction_Button.svg")
-            if os.path.exists(icon_path):
-                button.setIcon(QIcon(icon_path))
-                button.setIconSize(QSize(16, 16))
-        except Exception as e:
-            logging.warning(f"Could not load action button icon: {e}")
-
-        # Remove text and change to icon-only style
-        button.setText("")
-        button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
-
-        button.setFixedWidth(30)
-        try:
-            from UI.Styles import AppStyles
-            button.setStyleSheet(AppStyles.HOME_ACTION_BUTTON_STYLE)
-        except (ImportError, AttributeError) as e:
-            logging.debug(f"Could not load AppStyles for button: {e}")
-            # Fallback styling
-            button.setStyleSheet("""
-                QToolButton {
-                    background-color: transparent;
-                    border: none;
-                    padding: 2px;
-                }
-                QToolButton:hover {
-                    background-color: #3d3d3d;
-                    border-radius: 2px;
-                }
-            """)
-        
-        button.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
-        button.setCursor(Qt.CursorShape.PointingHandCursor)
 
         # Create menu
-        menu = QMenu(button)
+        menu = QMenu(self)
         try:
             from UI.Styles import AppStyles
             menu.setStyleSheet(AppStyles.MENU_STYLE)
@@ -2056,22 +1963,19 @@ class BaseResourcePage(BaseTablePage):
         actions = []
         
         # Resource-specific actions based on resource type
+        resource = self.get_resource_at(row)
         if hasattr(self, 'resource_type') and self.resource_type == "pods":
             actions.extend([
                 {"text": "View Logs", "icon": "Icons/logs.png", "dangerous": False},
                 {"text": "SSH", "icon": "Icons/terminal.png", "dangerous": False}
             ])
             # Check if pod has ports for port forwarding
-            if row < len(self.resources) and self.resources:
-                pod_resource = self.resources[row]
-                if self._has_pod_ports(pod_resource):
-                    actions.append({"text": "Port Forward", "icon": "Icons/network.png", "dangerous": False})
+            if self._has_pod_ports(resource):
+                actions.append({"text": "Port Forward", "icon": "Icons/network.png", "dangerous": False})
         elif hasattr(self, 'resource_type') and self.resource_type == "services":
             # Check if service has ports for port forwarding
-            if row < len(self.resources) and self.resources:
-                service_resource = self.resources[row]
-                if self._has_service_ports(service_resource):
-                    actions.append({"text": "Port Forward", "icon": "Icons/network.png", "dangerous": False})
+            if self._has_service_ports(resource):
+                actions.append({"text": "Port Forward", "icon": "Icons/network.png", "dangerous": False})
         elif hasattr(self, 'resource_type') and self.resource_type == "nodes":
             # Node-specific actions
             actions.append({"text": "View Metrics", "icon": "Icons/chart.png", "dangerous": False})
@@ -2104,8 +2008,7 @@ class BaseResourcePage(BaseTablePage):
             except Exception as e:
                 logging.error(f"Error adding action {action_info['text']}: {e}")
 
-        button.setMenu(menu)
-        return button
+        return menu
     
     def _has_service_ports(self, service_resource):
         """Check if service has ports for port forwarding"""
@@ -2144,31 +2047,16 @@ class BaseResourcePage(BaseTablePage):
             logging.error(f"Unexpected error checking pod port forward availability: {e}")
             return False
 
-    def _create_action_container(self, row, action_button):
-        """Create container widget for action button"""
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(action_button)
-        return container
-
     def _on_menu_show(self, row):
         """Handle menu about to show - debugging"""
         logging.info(f"Action button menu opening for row {row}")
         self._highlight_active_row(row, True)
     
     def _highlight_active_row(self, row, highlight):
-        """Highlight or unhighlight the active row"""
+        """Highlight the row whose menu is open - the selection stays on it after the menu closes"""
         try:
-            if hasattr(self, 'table') and self.table and row < self.table.rowCount():
-                for col in range(self.table.columnCount()):
-                    item = self.table.item(row, col)
-                    if item:
-                        if highlight:
-                            item.setBackground(QColor(AppColors.HOVER_BG))
-                        else:
-                            item.setBackground(QColor("transparent"))
+            if highlight and hasattr(self, 'table') and self.table and row < self.table.rowCount():
+                self.table.selectRow(row)
         except Exception as e:
             logging.debug(f"Error highlighting row {row}: {e}")
 
@@ -2181,16 +2069,11 @@ class BaseResourcePage(BaseTablePage):
         # Add debugging for resources array
         logging.info(f"BaseResourcePage: Resources array length: {len(self.resources) if hasattr(self, 'resources') else 'No resources attribute'}")
         
-        if not hasattr(self, 'resources') or not self.resources:
-            logging.warning(f"BaseResourcePage: No resources available for action '{action}' on row {row}")
-            return
-            
-        if row >= len(self.resources):
-            logging.warning(f"BaseResourcePage: Invalid row {row} for action '{action}' (only {len(self.resources)} resources)")
-            return
-
         # OLD WORKING PATTERN: Fresh resource lookup every time
-        resource = self.resources[row]
+        resource = self.get_resource_at(row)
+        if resource is None:
+            logging.warning(f"BaseResourcePage: Invalid row {row} for action '{action}' (only {self.table.rowCount()} rows)")
+            return
         resource_name = resource.get("name", "")
         resource_namespace = resource.get("namespace", "")
         
@@ -2334,85 +2217,6 @@ class BaseResourcePage(BaseTablePage):
                 f"Failed to open SSH for pod {pod_name}: {str(e)}"
             )
 
-    def _create_checkbox_container(self, row, resource_name):
-        """Create checkbox container for row selection"""
-        from PyQt6.QtWidgets import QCheckBox, QWidget, QHBoxLayout
-        
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        checkbox = QCheckBox()
-        checkbox.setProperty("row", row)
-        checkbox.setProperty("resource_name", resource_name)
-        checkbox.stateChanged.connect(self._on_row_checkbox_changed)
-        
-        # Apply styling to use proper icons with dynamic resource path resolution
-        unchecked_path = resource_path("Icons/check_box_unchecked.svg")
-        checked_path = resource_path("Icons/check_box_checked.svg")
-        
-        checkbox.setStyleSheet(f"""
-            QCheckBox {{
-                margin: 0px;
-                padding: 0px;
-                background-color: transparent;
-            }}
-            QCheckBox::indicator {{
-                width: 14px;
-                height: 14px;
-                margin: 1px;
-                background-color: transparent;
-                border: none;
-                image: url({unchecked_path.replace(os.sep, '/')});
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: transparent;
-                border: none;
-                image: url({checked_path.replace(os.sep, '/')});
-            }}
-            QCheckBox::indicator:hover {{
-                border-color: #0078d4;
-            }}
-        """)
-        
-        layout.addWidget(checkbox)
-        return container
-
-    def _on_row_checkbox_changed(self, state):
-        """Handle row checkbox state changes"""
-        try:
-            checkbox = self.sender()
-            row = checkbox.property("row")
-            resource_name = checkbox.property("resource_name")
-            
-            # Find the resource by name instead of relying only on row index
-            resource = None
-            for r in self.resources:
-                if r.get("name") == resource_name:
-                    resource = r
-                    break
-            
-            if resource:
-                # Handle both namespaced and cluster-scoped resources
-                resource_namespace = resource.get("namespace", "")
-                resource_key = (resource["name"], resource_namespace) if resource_namespace else (resource["name"], "")
-                
-                if state == Qt.CheckState.Checked.value:
-                    self.selected_items.add(resource_key)
-                    logging.debug(f"Selected resource: {resource_key}")
-                else:
-                    self.selected_items.discard(resource_key)
-                    logging.debug(f"Deselected resource: {resource_key}")
-                    
-                # Update select-all checkbox state
-                self._update_select_all_state()
-            else:
-                logging.warning(f"Resource not found for checkbox: {resource_name}")
-                    
-        except Exception as e:
-            logging.error(f"Error handling checkbox change: {e}")
-    
     def _update_select_all_state(self):
         """Update the select-all checkbox based on individual selections"""
         try:
@@ -2571,5 +2375,6 @@ __all__ = [
     'BATCH_SIZE',
     'SCROLL_DEBOUNCE_MS',
     'SEARCH_DEBOUNCE_MS',
+    'FILTER_DEBOUNCE_MS',
     'CACHE_TTL_SECONDS'
 ]
\ No newline at end of file
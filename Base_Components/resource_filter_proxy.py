@@ -0,0 +1,178 @@
+"""
+Resource Filter Proxy - structured query filtering between a resource table and its model
+Queries (Utils.filter_query) are matched on the worker pool against a snapshot of the model's rows;
+the proxy then shows the matched rows by identity. A newer query, or rows changing under the filter,
+cancels the match in flight and drops its result, so typing never waits for a scan of every row.
+"""
+
+import logging
+import time
+from functools import partial
+from typing import List, Optional, Sequence
+
+from PyQt6.QtCore import QSortFilterProxyModel, QModelIndex, QTimer, Qt, pyqtSignal
+
+from Utils.enhanced_worker import EnhancedBaseWorker
+from Utils.filter_query import DEFAULT_SEARCH_FIELDS, FilterTerm, FilterSnapshot, match_rows, parse_filter_query
+from Utils.resource_delta import get_row_key
+from Utils.thread_manager import get_thread_manager
+
+REMATCH_DELAY_MS = 250  # Batches bursts of row changes under an active filter into one match
+
+
+def row_identity(row):
+    """Key a filtered row is shown by - its row key, or the row object itself for rows without one"""
+    key = get_row_key(row)
+    return key if key is not None else id(row)
+
+
+class RowFilterWorker(EnhancedBaseWorker):
+    """Matches a query against a snapshot of a model's rows"""
+
+    def __init__(self, worker_id: str, query_id: int, terms: List[FilterTerm], snapshot: FilterSnapshot):
+        super().__init__(worker_id)
+        self.query_id = query_id
+        self.terms = terms
+        self.snapshot = snapshot
+
+    def execute(self):
+        started = time.perf_counter()
+        rows = self.snapshot.rows
+        positions = match_rows(self.terms, self.snapshot, self.cancel_token.raise_if_cancelled)
+        keys = {row_identity(rows[position]) for position in positions}
+        logging.debug(f"Filter matched {len(keys)} of {len(rows)} rows "
+                      f"in {(time.perf_counter() - started) * 1000:.1f}ms")
+        return self.query_id, keys
+
+
+class ResourceFilterProxyModel(QSortFilterProxyModel):
+    """
+    Shows the source rows a structured query matched, in the source model's order.
+    Sorting is forwarded to the source model, whose typed column keys sort every row at once.
+    """
+
+    filter_applied = pyqtSignal(int)  # Rows shown after a query was matched or cleared
+    filter_error = pyqtSignal(str)    # Query that names an unknown field or an unreadable value
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._terms: Optional[List[FilterTerm]] = None
+        self._accepted_keys: Optional[set] = None  # None shows every row
+        self._query_id = 0
+        self._worker_id = f"row_filter_{id(self)}"
+        self._search_fields = DEFAULT_SEARCH_FIELDS
+        self._indexes = (-1, {})  # (row generation, label and search indexes built by matches of its rows)
+        self._rematch_timer = QTimer(self)
+        self._rematch_timer.setSingleShot(True)
+        self._rematch_timer.timeout.connect(self._start_match)
+
+    @property
+    def is_filtering(self) -> bool:
+        return self._terms is not None
+
+    def setSourceModel(self, model):
+        old = self.sourceModel()
+        if old is not None:
+            for signal in (old.modelReset, old.rowsInserted, old.dataChanged):
+                try:
+                    signal.disconnect(self._on_source_rows_changed)
+                except (TypeError, RuntimeError):
+                    pass
+        super().setSourceModel(model)
+        self._indexes = (-1, {})
+        if model is not None:
+            model.modelReset.connect(self._on_source_rows_changed)
+            model.rowsInserted.connect(self._on_source_rows_changed)
+            model.dataChanged.connect(self._on_source_rows_changed)
+            if self._terms:
+                self._start_match()
+
+    def set_search_fields(self, fields: Sequence[str]):
+        """Row fields the words of a query are looked up in"""
+        self._search_fields = tuple(fields) or DEFAULT_SEARCH_FIELDS
+
+    def set_query(self, text: Optional[str]):
+        """Filter by a query, or show every row for empty text - raises FilterQueryError for invalid queries"""
+        model = self.sourceModel()
+        fields = model.filter_fields() if model is not None else None
+        terms = parse_filter_query(text, fields) if text and text.strip() else []
+        if not terms:
+            self.clear_query()
+            return
+        self._terms = terms
+        self._start_match()
+
+    def clear_query(self):
+        self._query_id += 1  # Results still in flight are for a query that is gone
+        self._rematch_timer.stop()
+        get_thread_manager().cancel_worker(self._worker_id)
+        was_filtering = self._accepted_keys is not None
+        self._terms = None
+        self._accepted_keys = None
+        if was_filtering:
+            self.invalidateFilter()
+        self.filter_applied.emit(self.rowCount())
+
+    def _on_source_rows_changed(self, *args):
+        if not self._terms:
+            return
+        roles = args[2] if len(args) > 2 else None
+        if roles and list(roles) == [Qt.ItemDataRole.CheckStateRole]:
+            return  # Checking rows does not change what they match
+        self._rematch_timer.start(REMATCH_DELAY_MS)
+
+    def _start_match(self):
+        model = self.sourceModel()
+        if model is None or not self._terms:
+            return
+        self._rematch_timer.stop()
+        self._query_id += 1
+        snapshot = model.filter_snapshot()
+        snapshot.search_fields = self._search_fields
+        # Matches of the same rows reuse the indexes earlier matches built
+        if self._indexes[0] != snapshot.generation:
+            self._indexes = (snapshot.generation, {})
+        snapshot.indexes = self._indexes[1]
+
+        worker = RowFilterWorker(self._worker_id, self._query_id, self._terms, snapshot)
+        worker.signals.finished.connect(self._on_match_finished)
+        worker.signals.error.connect(partial(self._on_match_error, self._query_id))
+        # Submitting under the same id cancels the previous match
+        get_thread_manager().submit_worker(self._worker_id, worker)
+
+    def _on_match_finished(self, result):
+        query_id, keys = result
+        if query_id != self._query_id:
+            return  # A newer query or newer rows are being matched
+        self._accepted_keys = keys
+        self.invalidateFilter()
+        self.filter_applied.emit(self.rowCount())
+
+    def _on_match_error(self, query_id: int, error: str):
+        if query_id == self._query_id:
+            logging.info(f"Filter query failed: {error}")
+            self.filter_error.emit(error)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self._accepted_keys is None:
+            return True
+        item = self.sourceModel().get_row_data(source_row)
+        return item is not None and row_identity(item) in self._accepted_keys
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """Rows keep the source model's order - sort there"""
+        model = self.sourceModel()
+        if model is not None:
+            model.sort(column, order)
+
+    def source_rows(self, rows: List[int]) -> List[int]:
+        """Source model rows of proxy rows"""
+        source = []
+        for row in rows:
+            index = self.mapToSource(self.index(row, 0))
+            if index.isValid():
+                source.append(index.row())
+        return source
+
+    def visible_source_rows(self) -> List[int]:
+        return self.source_rows(range(self.rowCount()))
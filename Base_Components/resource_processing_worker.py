@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 import threading
 # Cache system removed
 from Utils.data_formatters import format_age
+from Utils.column_extractors import get_column_extractor
 
 
 class ResourceProcessingWorker(QThread):
@@ -203,6 +204,8 @@ class PodProcessingWorker(ResourceProcessingWorker):
     
     def __init__(self, raw_resources: List[Dict]):
         super().__init__(raw_resources, "pods", batch_size=50)
+        # Status, ready and restarts come from the same columns the resource loader uses
+        self._extract_columns = get_column_extractor("pods")
     
     def _process_single_resource(self, resource: Dict) -> Dict:
         """Process pod-specific data"""
@@ -215,17 +218,19 @@ class PodProcessingWorker(ResourceProcessingWorker):
             # Extract pod information
             metadata = raw_data.get("metadata", {})
             spec = raw_data.get("spec", {})
-            status = raw_data.get("status", {})
+            
+            columns = {}
+            self._extract_columns(raw_data, columns)
             
             processed = {
                 "name": metadata.get("name", "Unknown"),
                 "namespace": metadata.get("namespace", "default"),
-                "status": self._calculate_pod_status(status),
-                "ready": self._calculate_ready_status(status),
-                "restarts": self._calculate_restarts(status),
+                "status": columns["status"],
+                "ready": columns["ready"],
+                "restarts": columns["restarts"],
                 "age": self._calculate_age(metadata.get("creationTimestamp")),
-                "node": spec.get("nodeName", ""),
-                "containers": self._count_containers(spec),
+                "node": columns["node_name"] or "",
+                "containers": self._format_containers(columns),
                 "cpu_requests": self._calculate_cpu_requests(spec),
                 "memory_requests": self._calculate_memory_requests(spec),
                 "labels": metadata.get("labels", {}),
@@ -238,97 +243,11 @@ class PodProcessingWorker(ResourceProcessingWorker):
             logging.error(f"Error processing pod: {e}")
             return resource  # Return original on error
     
-    def _calculate_pod_status(self, status: Dict) -> str:
-        """Calculate pod status with caching"""
-        try:
-            phase = status.get("phase", "Unknown")
-            
-            if phase == "Running":
-                # Check container states
-                container_statuses = status.get("containerStatuses", [])
-                if not container_statuses:
-                    return "Pending"
-                
-                for container_status in container_statuses:
-                    state = container_status.get("state", {})
-                    if "waiting" in state:
-                        waiting = state["waiting"]
-                        reason = waiting.get("reason", "")
-                        if reason in ["ImagePullBackOff", "ErrImagePull", "CrashLoopBackOff"]:
-                            return reason
-                        return "Waiting"
-                    elif "terminated" in state:
-                        terminated = state["terminated"]
-                        reason = terminated.get("reason", "")
-                        if terminated.get("exitCode", 0) != 0:
-                            return f"Error ({reason})"
-                
-                return "Running"
-            
-            elif phase == "Pending":
-                # Check conditions for more specific status
-                conditions = status.get("conditions", [])
-                for condition in conditions:
-                    if condition.get("type") == "PodScheduled" and condition.get("status") == "False":
-                        return "Unschedulable"
-                return "Pending"
-            
-            elif phase in ["Succeeded", "Failed"]:
-                return phase
-            
-            else:
-                return phase
-                
-        except Exception:
-            return "Unknown"
-    
-    def _calculate_ready_status(self, status: Dict) -> str:
-        """Calculate pod ready status"""
-        try:
-            container_statuses = status.get("containerStatuses", [])
-            if not container_statuses:
-                return "0/0"
-            
-            ready_count = sum(1 for cs in container_statuses if cs.get("ready", False))
-            total_count = len(container_statuses)
-            
-            return f"{ready_count}/{total_count}"
-        except (KeyError, TypeError, AttributeError) as e:
-            logging.debug(f"Could not calculate ready status: {e}")
-            return "0/0"
-        except Exception as e:
-            logging.error(f"Unexpected error calculating ready status: {e}")
-            return "0/0"
-    
-    def _calculate_restarts(self, status: Dict) -> int:
-        """Calculate total restart count"""
-        try:
-            container_statuses = status.get("containerStatuses", [])
-            return sum(cs.get("restartCount", 0) for cs in container_statuses)
-        except (KeyError, TypeError, AttributeError) as e:
-            logging.debug(f"Could not calculate restart count: {e}")
-            return 0
-        except Exception as e:
-            logging.error(f"Unexpected error calculating restart count: {e}")
-            return 0
-    
-    def _count_containers(self, spec: Dict) -> str:
-        """Count containers and init containers"""
-        try:
-            containers = spec.get("containers", [])
-            init_containers = spec.get("initContainers", [])
-            
-            total = len(containers) + len(init_containers)
-            if init_containers:
-                return f"{len(containers)}+{len(init_containers)}"
-            else:
-                return str(len(containers))
-        except (KeyError, TypeError, AttributeError) as e:
-            logging.debug(f"Could not count containers: {e}")
-            return "0"
-        except Exception as e:
-            logging.error(f"Unexpected error counting containers: {e}")
-            return "0"
+    def _format_containers(self, columns: Dict) -> str:
+        """Containers, with init containers as a +N suffix"""
+        if columns["init_containers"]:
+            return f"{columns['containers']}+{columns['init_containers']}"
+        return str(columns["containers"])
     
     def _calculate_cpu_requests(self, spec: Dict) -> str:
         """Calculate total CPU requests"""
@@ -4,15 +4,19 @@ Uses QTableView with VirtualizedResourceModel for optimal performance
 """
 
 import logging
+from collections.abc import Mapping
 from PyQt6.QtWidgets import (
     QTableView, QVBoxLayout, QWidget, QHeaderView, QAbstractItemView,
-    QStyledItemDelegate, QApplication
+    QStyledItemDelegate, QApplication, QStyle, QStyleOptionViewItem
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QModelIndex, QTimer
-from PyQt6.QtGui import QColor, QPainter, QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QModelIndex, QTimer, QEvent, QPoint, QRect
+from PyQt6.QtGui import QColor, QPainter, QFont, QIcon
 from typing import List, Dict, Any, Optional, Callable
 
-from .virtualized_table_model import VirtualizedResourceModel
+from .virtualized_table_model import VirtualizedResourceModel, TableColumn, SEGMENTS_ROLE
+from .resource_filter_proxy import ResourceFilterProxyModel
+from .base_components import get_age_column_ticker
+from UI.Icons import resource_path
 
 
 class HighPerformanceDelegate(QStyledItemDelegate):
@@ -32,6 +36,155 @@ class HighPerformanceDelegate(QStyledItemDelegate):
         super().paint(painter, option, index)
 
 
+def _draw_cell_panel(painter: QPainter, option, index: QModelIndex, delegate: QStyledItemDelegate) -> QStyleOptionViewItem:
+    """Paint a cell's background, hover and selection without its text - returns the initialized option"""
+    opt = QStyleOptionViewItem(option)
+    delegate.initStyleOption(opt, index)
+    opt.text = ""
+    opt.features &= ~QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator
+    style = opt.widget.style() if opt.widget else QApplication.style()
+    style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, opt.widget)
+    return opt
+
+
+def _is_release_inside(event, option) -> bool:
+    return (event.type() == QEvent.Type.MouseButtonRelease and
+            event.button() == Qt.MouseButton.LeftButton and
+            option.rect.contains(event.position().toPoint()))
+
+
+class CheckBoxDelegate(QStyledItemDelegate):
+    """Paints the row selection checkbox from the model's check state and toggles it on click"""
+    
+    ICON_SIZE = 18
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._checked_icon = QIcon(resource_path("Icons/check_box_checked.svg"))
+        self._unchecked_icon = QIcon(resource_path("Icons/check_box_unchecked.svg"))
+    
+    @staticmethod
+    def _is_checked(index: QModelIndex) -> bool:
+        state = index.data(Qt.ItemDataRole.CheckStateRole)
+        return state in (Qt.CheckState.Checked, Qt.CheckState.Checked.value)
+    
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        _draw_cell_panel(painter, option, index, self)
+        icon = self._checked_icon if self._is_checked(index) else self._unchecked_icon
+        rect = QRect(0, 0, self.ICON_SIZE, self.ICON_SIZE)
+        rect.moveCenter(option.rect.center())
+        icon.paint(painter, rect)
+    
+    def editorEvent(self, event, model, option, index: QModelIndex) -> bool:
+        if _is_release_inside(event, option):
+            state = Qt.CheckState.Unchecked if self._is_checked(index) else Qt.CheckState.Checked
+            model.setData(index, state, Qt.ItemDataRole.CheckStateRole)
+            return True
+        # A quick second click toggles again rather than opening the row
+        return event.type() == QEvent.Type.MouseButtonDblClick
+
+
+class StatusBadgeDelegate(QStyledItemDelegate):
+    """
+    Paints colored status text, or several colored words, straight from the model.
+    Style sheets override ForegroundRole for plain items, so these cells draw their own text.
+    """
+    
+    PADDING = 8
+    SEGMENT_SPACING = 5
+    
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        opt = _draw_cell_panel(painter, option, index, self)
+        rect = option.rect.adjusted(self.PADDING, 0, -self.PADDING, 0)
+        alignment = Qt.AlignmentFlag(index.data(Qt.ItemDataRole.TextAlignmentRole) or
+                                     int((Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter).value))
+        default_color = index.data(Qt.ItemDataRole.ForegroundRole) or opt.palette.color(opt.palette.ColorRole.Text)
+        metrics = opt.fontMetrics
+        
+        segments = index.data(SEGMENTS_ROLE)
+        if not segments:
+            segments = [(index.data(Qt.ItemDataRole.DisplayRole) or "", default_color)]
+        
+        painter.save()
+        painter.setFont(opt.font)
+        painter.setClipRect(option.rect)
+        
+        widths = [metrics.horizontalAdvance(text) for text, _ in segments]
+        total = sum(widths) + self.SEGMENT_SPACING * (len(segments) - 1)
+        if len(segments) == 1 or total > rect.width():
+            # One run of text, elided to the cell
+            text = " ".join(text for text, _ in segments)
+            painter.setPen(segments[0][1] or default_color)
+            painter.drawText(rect, alignment, metrics.elidedText(text, Qt.TextElideMode.ElideRight, rect.width()))
+        else:
+            if alignment & Qt.AlignmentFlag.AlignHCenter:
+                x = rect.left() + (rect.width() - total) // 2
+            elif alignment & Qt.AlignmentFlag.AlignRight:
+                x = rect.right() - total
+            else:
+                x = rect.left()
+            for (text, color), width in zip(segments, widths):
+                painter.setPen(color or default_color)
+                painter.drawText(QRect(x, rect.top(), width, rect.height()),
+                                 Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+                x += width + self.SEGMENT_SPACING
+        painter.restore()
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """Paints the row's action button and reports clicks as (row, global position for the menu)"""
+    
+    action_requested = pyqtSignal(int, QPoint)
+    
+    ICON_SIZE = 16
+    BUTTON_SIZE = 28
+    HOVER_COLOR = QColor("#3d3d3d")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._icon = QIcon(resource_path("Icons/Moreaction_Button.svg"))
+    
+    def _button_rect(self, cell: QRect) -> QRect:
+        rect = QRect(0, 0, self.BUTTON_SIZE, self.BUTTON_SIZE)
+        rect.moveCenter(cell.center())
+        return rect
+    
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        _draw_cell_panel(painter, option, index, self)
+        button = self._button_rect(option.rect)
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            painter.save()
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(self.HOVER_COLOR)
+            painter.drawRoundedRect(button, 4, 4)
+            painter.restore()
+        icon_rect = QRect(0, 0, self.ICON_SIZE, self.ICON_SIZE)
+        icon_rect.moveCenter(button.center())
+        self._icon.paint(painter, icon_rect)
+    
+    def editorEvent(self, event, model, option, index: QModelIndex) -> bool:
+        if _is_release_inside(event, option):
+            button = self._button_rect(option.rect)
+            view = option.widget
+            anchor = view.viewport().mapToGlobal(button.bottomLeft()) if view else event.globalPosition().toPoint()
+            self.action_requested.emit(index.row(), anchor)
+            return True
+        return event.type() == QEvent.Type.MouseButtonDblClick
+
+
+class _CellText:
+    """Read-only stand-in for a QTableWidgetItem, for callers that read cell text by row and column"""
+    
+    __slots__ = ('_text',)
+    
+    def __init__(self, text: str):
+        self._text = text
+    
+    def text(self) -> str:
+        return self._text
+
+
 class VirtualScrollTable(QTableView):
     """
     High-performance virtual scrolling table using QTableView + VirtualizedResourceModel.
@@ -43,14 +196,22 @@ class VirtualScrollTable(QTableView):
     item_double_clicked = pyqtSignal(int)  # Emitted when an item is double-clicked
     data_changed = pyqtSignal()  # Emitted when data changes
     selection_changed = pyqtSignal(list)  # Emitted when selection changes
+    cell_clicked = pyqtSignal(int, int)  # Row and column of a click, like QTableWidget.cellClicked
+    action_requested = pyqtSignal(int, QPoint)  # Row whose action button was clicked, and where to open its menu
+    check_state_changed = pyqtSignal()  # Rows were checked or unchecked
+    filter_applied = pyqtSignal(int, int)  # Rows shown and total rows after a filter query was matched or cleared
+    filter_error = pyqtSignal(str)  # Filter query that cannot be matched
     
-    def __init__(self, headers: List[str], parent=None):
+    def __init__(self, headers: List[str], parent=None, responsive_columns: bool = True):
         """Initialize virtual scroll table with headers"""
         super().__init__(parent)
         self.headers = headers or []
         self._model = None
         self._formatters = {}
+        self._table_columns = None
+        self._column_delegates = {}
         self._last_selected_rows = []
+        self.responsive_columns = responsive_columns
         
         # Performance settings
         self.setAlternatingRowColors(True)
@@ -81,14 +242,27 @@ class VirtualScrollTable(QTableView):
         
         # Connect double-click - this works without model
         self.doubleClicked.connect(self._on_double_clicked)
+        self.clicked.connect(self._on_clicked)
+        
+        # Hover state for painted buttons
+        self.setMouseTracking(True)
+        
+        # Delegates for painted cells, installed per column by set_table_columns
+        self._checkbox_delegate = CheckBoxDelegate(self)
+        self._status_delegate = StatusBadgeDelegate(self)
+        self._action_delegate = ActionButtonDelegate(self)
+        self._action_delegate.action_requested.connect(self.action_requested.emit)
+        
+        # The view shows its models through one filter proxy, so filtering keeps header sizes and selection
+        self._proxy = ResourceFilterProxyModel(self)
+        self._proxy.filter_applied.connect(lambda shown: self.filter_applied.emit(shown, self.get_total_items()))
+        self._proxy.filter_error.connect(self.filter_error.emit)
+        self.setModel(self._proxy)
+        self.selectionModel().selectionChanged.connect(self._on_selection_changed)
         
         # Initialize with empty model
         self.set_resource_data([], self.headers)
         
-        # Connect selection changes after model is set
-        if self.selectionModel():
-            self.selectionModel().selectionChanged.connect(self._on_selection_changed)
-        
         logging.info(f"VirtualScrollTable initialized with {len(headers)} columns: {headers}")
     
     def _setup_responsive_columns(self):
@@ -104,7 +278,7 @@ class VirtualScrollTable(QTableView):
     
     def _adjust_columns_to_screen(self):
         """Adjust column widths to fit screen size optimally"""
-        if not self._model or not self.headers:
+        if not self.responsive_columns or not self._model or not self.headers:
             return
             
         try:
@@ -150,23 +324,60 @@ class VirtualScrollTable(QTableView):
         if hasattr(self, '_responsive_timer'):
             self._responsive_timer.start(150)  # 150ms delay
     
+    def set_table_columns(self, specs: List[TableColumn]):
+        """
+        Describe columns by TableColumn - cells are then computed from row dicts when painted,
+        with checkboxes, status badges and action buttons drawn by delegates.
+        """
+        self._table_columns = list(specs)
+        self.headers = [spec.header for spec in self._table_columns]
+        
+        for column in self._column_delegates:
+            self.setItemDelegateForColumn(column, None)
+        self._column_delegates = {}
+        for column, spec in enumerate(self._table_columns):
+            if spec.kind == TableColumn.CHECK:
+                delegate = self._checkbox_delegate
+            elif spec.kind == TableColumn.ACTION:
+                delegate = self._action_delegate
+            elif spec.kind == TableColumn.STATUS or spec.color is not None or spec.segments is not None:
+                delegate = self._status_delegate
+            else:
+                continue
+            self.setItemDelegateForColumn(column, delegate)
+            self._column_delegates[column] = delegate
+        
+        self.set_resource_data([], self.headers)
+    
     def set_resource_data(self, data: List[Dict], columns: Optional[List[str]] = None):
         """Set data using virtualized model for optimal performance"""
         try:
             if columns:
                 self.headers = columns
             
+            specs = self._table_columns if self._table_columns and \
+                [spec.header for spec in self._table_columns] == list(self.headers) else None
+            
+            # Same columns - keep the model, header sizes and sort, and swap the rows
+            if (self._model is not None and self._model.columns == list(self.headers) and
+                    self._model.table_columns == specs):
+                self._model.reset_rows(data)
+                self._last_selected_rows = []
+                logging.info(f"Set resource data: {len(data)} items, {len(self.headers)} columns")
+                return
+            
             # Create new model
-            self._model = VirtualizedResourceModel(data, self.headers, self._formatters)
-            self.setModel(self._model)
+            self._model = VirtualizedResourceModel(data, self.headers, self._formatters, specs)
+            self._proxy.setSourceModel(self._model)
             
             # Connect model signals
             self._model.data_changed_custom.connect(self.data_changed.emit)
+            self._model.check_state_changed.connect(self.check_state_changed.emit)
+            
+            # Age cells are formatted when painted - the shared ticker repaints them
+            get_age_column_ticker().register(self, self._model.age_columns)
             
-            # Connect selection changes now that model is set
-            if self.selectionModel() and not hasattr(self, '_selection_connected'):
-                self.selectionModel().selectionChanged.connect(self._on_selection_changed)
-                self._selection_connected = True
+            self._last_selected_rows = []
             
             # Apply responsive column sizing
             QTimer.singleShot(100, self._adjust_columns_to_screen)  # Delay to ensure proper widget size
@@ -188,6 +399,13 @@ class VirtualScrollTable(QTableView):
             self._model.update_data(new_data, incremental)
             self.data_changed.emit()
     
+    def apply_delta(self, delta) -> bool:
+        """Apply inserted, changed and removed rows without resetting the model"""
+        if self._model and self._model.apply_delta(delta):
+            self.data_changed.emit()
+            return True
+        return False
+
     def refresh_data(self, new_data: List[Dict]):
         """Refresh all data"""
         if self._model:
@@ -200,6 +418,34 @@ class VirtualScrollTable(QTableView):
         if self._model:
             self._model.set_formatters(formatters)
     
+    def set_filter_query(self, text: Optional[str]):
+        """
+        Show only the rows a structured query matches (Utils.filter_query), or every row for empty text.
+        Matching runs in the background - filter_applied reports the result. Raises FilterQueryError.
+        """
+        self._proxy.set_query(text)
+    
+    def clear_filter(self):
+        self._proxy.clear_query()
+    
+    def set_search_fields(self, fields: List[str]):
+        """Row fields the plain words of a filter query are looked up in (name and namespace by default)"""
+        self._proxy.set_search_fields(fields)
+    
+    def filter_fields(self) -> frozenset:
+        """Field names a filter query can use on the current rows"""
+        return self._model.filter_fields() if self._model else frozenset()
+    
+    @property
+    def is_filtering(self) -> bool:
+        return self._proxy.is_filtering
+    
+    def _source_row(self, row: int) -> int:
+        """Model row shown at a view row, -1 for rows outside the view"""
+        if not 0 <= row < self._proxy.rowCount():
+            return -1
+        return self._proxy.mapToSource(self._proxy.index(row, 0)).row()
+    
     def _on_selection_changed(self, selected, deselected):
         """Handle selection changes"""
         selected_rows = []
@@ -212,6 +458,10 @@ class VirtualScrollTable(QTableView):
         self._last_selected_rows = selected_rows
         self.selection_changed.emit(selected_rows)
     
+    def _on_clicked(self, index: QModelIndex):
+        if index.isValid():
+            self.cell_clicked.emit(index.row(), index.column())
+    
     def _on_double_clicked(self, index: QModelIndex):
         """Handle double-click events"""
         if index.isValid():
@@ -220,7 +470,7 @@ class VirtualScrollTable(QTableView):
     # Backward compatibility methods for old VirtualScrollTable interface
     def set_data(self, data):
         """Backward compatibility - redirect to set_resource_data"""
-        if isinstance(data, list) and data and isinstance(data[0], dict):
+        if isinstance(data, list) and data and isinstance(data[0], Mapping):
             self.set_resource_data(data, self.headers)
         else:
             # Convert list data to dict format
@@ -251,7 +501,7 @@ class VirtualScrollTable(QTableView):
         """Get data for currently selected items"""
         selected_rows = self.get_selected_indices()
         if self._model:
-            return self._model.get_selected_data(selected_rows)
+            return self._model.get_selected_data(self._proxy.source_rows(selected_rows))
         return []
     
     def clear_selection(self):
@@ -266,12 +516,12 @@ class VirtualScrollTable(QTableView):
     
     def scroll_to_item(self, index):
         """Scroll to make the specified item visible"""
-        if self._model and 0 <= index < self._model.rowCount():
-            model_index = self._model.index(index, 0)
+        if self._model and 0 <= index < self._proxy.rowCount():
+            model_index = self._proxy.index(index, 0)
             self.scrollTo(model_index, QAbstractItemView.ScrollHint.PositionAtCenter)
     
     def search_and_filter(self, search_terms: List[str], search_columns: Optional[List[str]] = None) -> List[int]:
-        """Search through data and return matching row indices"""
+        """Search through data and return matching model row indices"""
         if self._model:
             return self._model.search_and_filter(search_terms, search_columns)
         return []
@@ -287,10 +537,44 @@ class VirtualScrollTable(QTableView):
             return self._model.get_cache_stats()
         return {}
     
+    def get_row(self, row: int) -> Optional[Dict]:
+        """Row dict shown at a view row"""
+        return self._model.get_row_data(self._source_row(row)) if self._model else None
+    
+    def get_column_kind(self, column: int) -> Optional[str]:
+        """TableColumn kind of a column, None without column specs"""
+        specs = self._table_columns
+        return specs[column].kind if specs and 0 <= column < len(specs) else None
+    
+    def checked_rows(self) -> List[Dict]:
+        """Rows whose checkbox is checked"""
+        return self._model.checked_items() if self._model else []
+    
+    def set_all_checked(self, checked: bool):
+        """Check or uncheck every row the view shows"""
+        if self._model:
+            rows = self._proxy.visible_source_rows() if self._proxy.is_filtering else None
+            self._model.set_all_checked(checked, rows)
+    
     # Backward compatibility methods for QTableWidget interface
     def rowCount(self):
-        """Return number of rows - backward compatibility method"""
-        return self._model.rowCount() if self._model else 0
+        """Return number of rows shown - backward compatibility method"""
+        return self._proxy.rowCount() if self._model else 0
+    
+    def columnCount(self):
+        """Return number of columns - backward compatibility method"""
+        return len(self.headers)
+    
+    def item(self, row, column):
+        """Cell text at row and column - backward compatibility method for readers of QTableWidget items"""
+        if not self._model or not 0 <= row < self._proxy.rowCount() or not 0 <= column < len(self.headers):
+            return None
+        text = self._proxy.data(self._proxy.index(row, column), Qt.ItemDataRole.DisplayRole)
+        return None if text is None else _CellText(str(text))
+    
+    def cellWidget(self, row, column):
+        """Cells are painted, never widgets - backward compatibility method"""
+        return None
     
     def insertRow(self, row):
         """Insert a row - backward compatibility method (no-op for virtual table)"""
@@ -322,15 +606,18 @@ class VirtualScrollTable(QTableView):
         elif top_index.isValid():
             return (top_index.row(), top_index.row() + 1)
         else:
-            return (0, min(self._model.rowCount(), 100))  # Default range
+            return (0, min(self._proxy.rowCount(), 100))  # Default range
     
     def get_total_items(self):
-        """Get total number of items"""
+        """Get total number of items, including rows a filter hides"""
         return self._model.rowCount() if self._model else 0
     
     def refresh(self):
-        """Refresh the virtual table display"""
+        """Refresh the virtual table display - cells are formatted and sort keys computed again from their rows"""
         if self._model:
+            self._model.clear_cache()
+            self._model.invalidate_sort_keys()
+            self._model.layoutAboutToBeChanged.emit()
             self._model.layoutChanged.emit()
         self.viewport().update()
     
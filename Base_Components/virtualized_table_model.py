@@ -6,10 +6,120 @@ This replaces QTableWidget with QAbstractTableModel for better performance
 from PyQt6.QtCore import QAbstractTableModel, Qt, QModelIndex, pyqtSignal
 from PyQt6.QtGui import QColor, QFont
 from typing import List, Dict, Any, Optional, Callable
+from collections import OrderedDict
 import logging
 import time
 import hashlib
 
+from Utils.resource_delta import ResourceDelta, compute_delta, get_row_key
+from Utils.data_formatters import format_age_from_epoch
+from Utils.sort_keys import NATURAL, NUMERIC, get_sort_key_function, missing_key
+from Utils.column_store import ColumnStore
+from Utils.filter_query import FIELD_SAMPLE_ROWS, FilterColumn, FilterSnapshot, filter_field_names
+from Utils.performance_config import TABLE_CELL_CACHE_SIZE
+
+AGE_COLUMN_KEYS = ("age",)  # Columns formatted from the row's created_ts epoch at paint time
+
+SEGMENTS_ROLE = Qt.ItemDataRole.UserRole + 1  # [(text, QColor)] for cells painted as several colored words
+
+ALIGN_LEFT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
+
+def _created_ts(item) -> Optional[float]:
+    return item.get("created_ts")
+
+
+class TableColumn:
+    """
+    How one column reads, sorts and colors a row - cells are computed when painted, never stored.
+    
+    Attributes:
+        header: Column title
+        key: Row field shown when no value callable is given (defaults to the lowercased header)
+        value: row -> display text
+        sort_key: row -> value the column sorts by (defaults to the display text)
+        sort_as: Sort-key kind the sorted value is read as - NATURAL, NUMERIC, QUANTITY, DURATION or
+                 VERSION from Utils.sort_keys (NUMERIC for ages and sort_key callables, NATURAL otherwise)
+        color: row -> text color name, or None for the table's default
+        segments: row -> [(text, color name)] for cells painted as several colored words
+        align: Text alignment
+        kind: TEXT, AGE, CHECK (row selection), STATUS (painted badge) or ACTION (menu button)
+        cached: False for text that changes without the row changing (clock or graph driven) -
+                other cells are cached per row identity and resourceVersion
+    """
+    TEXT = 'text'
+    AGE = 'age'
+    CHECK = 'check'
+    STATUS = 'status'
+    ACTION = 'action'
+    
+    __slots__ = ('header', 'key', 'value', 'sort_key', 'sort_as', 'color', 'segments', 'align', 'kind', 'cached')
+    
+    def __init__(self, header: str, key: Optional[str] = None, value: Optional[Callable] = None,
+                 sort_key: Optional[Callable] = None, color: Optional[Callable] = None,
+                 segments: Optional[Callable] = None, align=ALIGN_LEFT, kind: str = TEXT,
+                 sort_as: Optional[str] = None, cached: bool = True):
+        self.header = header
+        self.key = key or header.lower()
+        self.value = value
+        self.sort_key = sort_key
+        self.color = color
+        self.segments = segments
+        self.align = align
+        self.kind = kind
+        self.cached = cached
+        if sort_as is None:
+            sort_as = NUMERIC if sort_key is not None or kind == self.AGE else NATURAL
+        get_sort_key_function(sort_as)  # Unknown kinds fail when the column is declared, not when sorted
+        self.sort_as = sort_as
+    
+    @classmethod
+    def checkbox(cls) -> 'TableColumn':
+        return cls("", key="", align=ALIGN_CENTER, kind=cls.CHECK)
+    
+    @classmethod
+    def action(cls) -> 'TableColumn':
+        return cls("", key="", align=ALIGN_CENTER, kind=cls.ACTION)
+    
+    @classmethod
+    def age(cls, header: str = "Age", align=ALIGN_CENTER, epoch: Optional[Callable] = None) -> 'TableColumn':
+        """Column formatted as an age when painted - epoch is row -> epoch seconds (the creation time by default)"""
+        return cls(header, key="age", value=epoch or _created_ts, align=align, kind=cls.AGE)
+    
+    @classmethod
+    def numeric(cls, header: str, key: Optional[str] = None, align=ALIGN_CENTER) -> 'TableColumn':
+        """Column of an extracted row field that sorts as a number"""
+        return cls(header, key=key, align=align, sort_as=NUMERIC)
+    
+    @classmethod
+    def status(cls, header: str = "Status", value: Optional[Callable] = None, color: Optional[Callable] = None,
+               segments: Optional[Callable] = None, key: Optional[str] = None) -> 'TableColumn':
+        return cls(header, key=key, value=value, color=color, segments=segments, align=ALIGN_CENTER, kind=cls.STATUS)
+    
+    def display(self, item) -> str:
+        """Text of this column for a row"""
+        if self.value is not None:
+            value = self.value(item)
+        else:
+            value = item.get(self.key, "")
+        if value is None:
+            return ""
+        if isinstance(value, (list, tuple)):
+            return ", ".join(str(v) for v in value)
+        return str(value)
+    
+    def sort_value(self, item):
+        """Value of this column a row sorts by, before it is read as the column's sort-key kind"""
+        if self.sort_key is not None:
+            return self.sort_key(item)
+        if self.kind == self.AGE:
+            return self.value(item)
+        if self.value is None and self.sort_as != NATURAL:
+            return item.get(self.key)  # The raw field - no need to format numbers just to parse them back
+        return self.display(item)
+
+
 class VirtualizedResourceModel(QAbstractTableModel):
     """
     High-performance table model that virtualizes data rendering.
@@ -17,29 +127,78 @@ class VirtualizedResourceModel(QAbstractTableModel):
     """
     
     data_changed_custom = pyqtSignal()
+    check_state_changed = pyqtSignal()  # Rows were checked or unchecked
     
     def __init__(self, resource_data: List[Dict], columns: List[str], 
-                 formatters: Optional[Dict[str, Callable]] = None):
+                 formatters: Optional[Dict[str, Callable]] = None,
+                 table_columns: Optional[List[TableColumn]] = None):
         super().__init__()
         self._data = resource_data or []
-        self._columns = columns or []
+        self._specs = list(table_columns) if table_columns else None
+        self._columns = [spec.header for spec in self._specs] if self._specs else (columns or [])
         self._formatters = formatters or {}
+        self._age_columns = self._find_age_columns(self._columns, self._specs)
+        
+        # Checked rows by row identity, so checks survive sorting and refreshes
+        self._checked_keys = set()
+        self._check_column = next((col for col, spec in enumerate(self._specs or ())
+                                   if spec.kind == TableColumn.CHECK), None)
+        self._color_cache: Dict[str, QColor] = {}
         
-        # Performance optimizations
-        self._dirty_rows = set()  # Track which rows need updates
+        # Current sort, re-applied when rows are replaced or appended
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        
+        # Typed keys of each sorted, filtered or totalled column, parallel to self._data -
+        # computed once per row change
+        self._column_store = ColumnStore()
+        
+        # Bumped whenever rows are replaced, added, removed or moved - what a filter snapshot was taken of
+        self._generation = 0
+        
+        # Formatted cells by (row key, resourceVersion, column) - a row's cells stay valid while it
+        # keeps its resourceVersion, wherever sorts, filters and deltas move it
+        self._formatted_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._cache_capacity = TABLE_CELL_CACHE_SIZE
         self._cache_hits = 0
         self._cache_misses = 0
+        self._cache_evictions = 0
+        self._uncached_formats = 0  # Cells of rows without a resourceVersion or of uncached columns
         
-        # Use unified cache system
-        # Cache system removed
-        
-        # Cache system removed
+        # Row colors, keyed by row number - cleared whenever rows move
+        self._row_colors_cache: Dict[str, Dict[str, Any]] = {}
         
-        # Configuration - caching disabled
-        self.enable_caching = False
+        self.enable_caching = True
         
         logging.info(f"VirtualizedResourceModel initialized with {len(self._data)} rows, {len(self._columns)} columns")
     
+    @staticmethod
+    def _find_age_columns(columns: List[str], specs: Optional[List[TableColumn]] = None) -> set:
+        if specs:
+            return {col for col, spec in enumerate(specs) if spec.kind == TableColumn.AGE}
+        return {col for col, key in enumerate(columns) if str(key).strip().lower() in AGE_COLUMN_KEYS}
+    
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+    
+    @property
+    def table_columns(self) -> Optional[List[TableColumn]]:
+        return self._specs
+    
+    def _epoch_getter(self, col: int) -> Callable:
+        """row -> epoch seconds an age column is formatted from"""
+        return self._specs[col].value if self._specs else _created_ts
+    
+    @property
+    def generation(self) -> int:
+        return self._generation
+    
+    @property
+    def age_columns(self) -> set:
+        """Indexes of the columns whose text changes with the clock"""
+        return set(self._age_columns)
+    
     def rowCount(self, parent=QModelIndex()) -> int:
         """Return number of rows"""
         return len(self._data)
@@ -63,10 +222,19 @@ class VirtualizedResourceModel(QAbstractTableModel):
             return None
             
         row, col = index.row(), index.column()
+        spec = self._specs[col] if self._specs and col < len(self._specs) else None
+        
+        if spec is not None and spec.kind in (TableColumn.CHECK, TableColumn.ACTION):
+            # Painted by the view's delegates - only the check state is data
+            if role == Qt.ItemDataRole.CheckStateRole and spec.kind == TableColumn.CHECK:
+                return Qt.CheckState.Checked if self.is_checked(row) else Qt.CheckState.Unchecked
+            return None
         
         # Handle different roles
         if role == Qt.ItemDataRole.DisplayRole:
             return self._get_display_data(row, col)
+        elif role == SEGMENTS_ROLE:
+            return self._get_segments(row, spec)
         elif role == Qt.ItemDataRole.BackgroundRole:
             return self._get_background_color(row, col)
         elif role == Qt.ItemDataRole.ForegroundRole:
@@ -75,6 +243,9 @@ class VirtualizedResourceModel(QAbstractTableModel):
             return self._get_font(row, col)
         elif role == Qt.ItemDataRole.TextAlignmentRole:
             return self._get_text_alignment(row, col)
+        elif role == Qt.ItemDataRole.ToolTipRole and spec is not None:
+            # Cells elide long text - the tooltip shows all of it
+            return self._get_display_data(row, col) or None
             
         return None
     
@@ -82,38 +253,65 @@ class VirtualizedResourceModel(QAbstractTableModel):
         """Get display data with caching"""
         if col >= len(self._columns):
             return ""
-            
-        # Create cache key
-        cache_key = f"display_{row}_{col}"
         
-        # Use cache if row is not dirty and caching is enabled
-        if (self.enable_caching and 
-            row not in self._dirty_rows):
+        item = self._data[row]
+        # Ages depend on the clock - format them from the stored epoch, never from the cache
+        if col in self._age_columns:
+            return self._format_item(item, col)
+        
+        cache_key = self._cell_cache_key(item, col) if self.enable_caching else None
+        if cache_key is not None:
             cached_value = self._formatted_cache.get(cache_key)
             if cached_value is not None:
+                self._formatted_cache.move_to_end(cache_key)
                 self._cache_hits += 1
                 return cached_value
         
-        # Calculate value
+        value = self._format_item(item, col)
+        if cache_key is None:
+            self._uncached_formats += 1
+            return value
+        
+        self._formatted_cache[cache_key] = value
+        if len(self._formatted_cache) > self._cache_capacity:
+            self._formatted_cache.popitem(last=False)
+            self._cache_evictions += 1
+        self._cache_misses += 1
+        return value
+    
+    def _format_item(self, item, col: int) -> str:
+        """Display text of a row's cell, without the cache"""
+        if col in self._age_columns:
+            epoch = self._epoch_getter(col)(item)
+            if epoch is not None:
+                return format_age_from_epoch(epoch)
+        
         column_key = self._columns[col]
-        item = self._data[row]
         
         # Use custom formatter if available
-        if column_key in self._formatters:
+        if self._specs:
             try:
-                value = self._formatters[column_key](item)
+                return self._specs[col].display(item)
+            except Exception as e:
+                logging.warning(f"Column {column_key} could not format a row: {e}")
+                return ""
+        elif column_key in self._formatters:
+            try:
+                return self._formatters[column_key](item)
             except Exception as e:
                 logging.warning(f"Formatter error for column {column_key}: {e}")
-                value = str(item.get(column_key, ""))
-        else:
-            value = self._format_cell_value(item, column_key)
-        
-        # Cache the result if caching is enabled (bounded cache handles size limits)
-        if self.enable_caching:
-            self._formatted_cache.set(cache_key, value)
-        
-        self._cache_misses += 1
-        return value
+                return str(item.get(column_key, ""))
+        return self._format_cell_value(item, column_key)
+    
+    def _cell_cache_key(self, item, col: int) -> Optional[tuple]:
+        """(row key, resourceVersion, column) - None for cells that cannot be cached"""
+        if self._specs and not self._specs[col].cached:
+            return None
+        version = item.get("resource_version")
+        if not version:
+            return None  # Rows without a version can change in place
+        row_key = get_row_key(item)
+        return None if row_key is None else (row_key, version, col)
     
     def _format_cell_value(self, item: Dict, column_key: str) -> str:
         """Format individual cell value"""
@@ -129,8 +327,29 @@ class VirtualizedResourceModel(QAbstractTableModel):
         else:
             return str(value)
     
+    def _get_segments(self, row: int, spec: Optional[TableColumn]) -> Optional[List[tuple]]:
+        if spec is None or spec.segments is None:
+            return None
+        try:
+            return [(text, self._color(color)) for text, color in spec.segments(self._data[row])]
+        except Exception as e:
+            logging.warning(f"Column {spec.header} could not format a row: {e}")
+            return None
+    
+    def _color(self, name) -> Optional[QColor]:
+        """QColor for a color name - one instance per distinct color"""
+        if not name:
+            return None
+        color = self._color_cache.get(name)
+        if color is None:
+            color = self._color_cache[name] = QColor(name)
+        return color
+    
     def _get_background_color(self, row: int, col: int) -> Optional[QColor]:
         """Get background color for cell"""
+        if self._specs:
+            return None  # Resource tables color the status column instead of whole rows
+        
         # Use bounded cache for row colors
         cache_key = f"row_color_{row}"
         
@@ -144,13 +363,20 @@ class VirtualizedResourceModel(QAbstractTableModel):
         
         # Cache the color
         color_data = {'background': color}
-        self._row_colors_cache.set(cache_key, color_data)
+        self._row_colors_cache[cache_key] = color_data
         
         return color
     
     def _get_foreground_color(self, row: int, col: int) -> Optional[QColor]:
         """Get foreground color for cell"""
-        return None  # Default color
+        spec = self._specs[col] if self._specs else None
+        if spec is None or spec.color is None:
+            return None  # Default color
+        try:
+            return self._color(spec.color(self._data[row]))
+        except Exception as e:
+            logging.warning(f"Column {spec.header} could not color a row: {e}")
+            return None
     
     def _get_font(self, row: int, col: int) -> Optional[QFont]:
         """Get font for cell"""
@@ -158,11 +384,91 @@ class VirtualizedResourceModel(QAbstractTableModel):
     
     def _get_text_alignment(self, row: int, col: int) -> int:
         """Get text alignment for cell"""
-        return int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        if self._specs:
+            return int(self._specs[col].align.value)
+        return int(ALIGN_LEFT.value)
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self._check_column:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+    
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        """Only check states are editable"""
+        if (not index.isValid() or role != Qt.ItemDataRole.CheckStateRole or
+                index.column() != self._check_column):
+            return False
+        checked = value in (Qt.CheckState.Checked, Qt.CheckState.Checked.value, True)
+        return self.set_checked(index.row(), checked)
+    
+    # Row checks - the selection used by bulk actions
+    
+    def is_checked(self, row: int) -> bool:
+        if not self._checked_keys or not 0 <= row < len(self._data):
+            return False
+        return get_row_key(self._data[row]) in self._checked_keys
+    
+    def set_checked(self, row: int, checked: bool) -> bool:
+        if not 0 <= row < len(self._data):
+            return False
+        key = get_row_key(self._data[row])
+        if key is None or (key in self._checked_keys) == checked:
+            return False
+        if checked:
+            self._checked_keys.add(key)
+        else:
+            self._checked_keys.discard(key)
+        if self._check_column is not None:
+            index = self.index(row, self._check_column)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.check_state_changed.emit()
+        return True
+    
+    def set_all_checked(self, checked: bool, rows: Optional[List[int]] = None):
+        """Check or uncheck every row, or only the given rows (the ones a filter shows)"""
+        if rows is None:
+            keys = {get_row_key(item) for item in self._data} if checked else set()
+        else:
+            changed = {get_row_key(self._data[row]) for row in rows if 0 <= row < len(self._data)}
+            keys = self._checked_keys | changed if checked else self._checked_keys - changed
+        keys.discard(None)
+        if keys == self._checked_keys:
+            return
+        self._checked_keys = keys
+        self._emit_check_column_changed()
+        self.check_state_changed.emit()
+    
+    def checked_items(self) -> List[Dict]:
+        """Checked rows, in display order"""
+        if not self._checked_keys:
+            return []
+        return [item for item in self._data if get_row_key(item) in self._checked_keys]
+    
+    @property
+    def checked_count(self) -> int:
+        return len(self._checked_keys)
+    
+    def _prune_checked_keys(self):
+        """Forget checks of rows that are gone"""
+        if not self._checked_keys:
+            return
+        present = {get_row_key(item) for item in self._data}
+        if not self._checked_keys <= present:
+            self._checked_keys &= present
+            self.check_state_changed.emit()
+    
+    def _emit_check_column_changed(self):
+        if self._check_column is not None and self._data:
+            self.dataChanged.emit(self.index(0, self._check_column),
+                                  self.index(len(self._data) - 1, self._check_column),
+                                  [Qt.ItemDataRole.CheckStateRole])
     
     def _calculate_row_color(self, item: Dict) -> Optional[QColor]:
         """Calculate background color based on item status"""
-        status = item.get("status", "").lower()
+        status = str(item.get("status") or "").lower()
         
         # Color coding based on status
         if "error" in status or "failed" in status:
@@ -175,54 +481,155 @@ class VirtualizedResourceModel(QAbstractTableModel):
         return None  # Default color
     
     def mark_row_dirty(self, row: int):
-        """Mark a row as needing update"""
-        self._dirty_rows.add(row)
-        
-        # Clear cache for this row (bounded cache handles pattern clearing)
-        if self.enable_caching:
-            self._formatted_cache.clear_pattern(f"display_{row}_")
-            self._row_colors_cache.clear_pattern(f"row_color_{row}")
+        """Drop the cached cells of a row that changed without a new resourceVersion"""
+        if 0 <= row < len(self._data):
+            item = self._data[row]
+            for col in range(len(self._columns)):
+                cache_key = self._cell_cache_key(item, col)
+                if cache_key is not None:
+                    self._formatted_cache.pop(cache_key, None)
+        self._row_colors_cache.pop(f"row_color_{row}", None)
     
     def mark_all_dirty(self):
         """Mark all rows as dirty - forces complete refresh"""
-        self._dirty_rows = set(range(len(self._data)))
         self.clear_cache()
+        self.invalidate_sort_keys()
     
     def clear_cache(self):
-        """Clear all cached data"""
+        """Clear all cached data - for row values that changed without a new resourceVersion"""
         self._formatted_cache.clear()
         self._row_colors_cache.clear()
+    
+    def reset_cache_stats(self):
         self._cache_hits = 0
         self._cache_misses = 0
+        self._cache_evictions = 0
+        self._uncached_formats = 0
     
     def update_data(self, new_data: List[Dict], incremental: bool = False):
         """Update model data efficiently"""
+        if not incremental and self._data:
+            # Match rows by uid so only inserted, changed and removed rows are repainted
+            delta = compute_delta(self._data, new_data)
+            if delta is not None and delta.is_worth_applying(len(self._data)):
+                if self.apply_delta(delta):
+                    return
+        
         self.beginResetModel()
         
         if incremental and len(new_data) > len(self._data):
             # Appending new data
             old_count = len(self._data)
             self._data.extend(new_data[old_count:])
+            self._column_store.append(new_data[old_count:])
+            self._generation += 1
             logging.info(f"Appended {len(new_data) - old_count} new rows")
         else:
-            # Complete refresh
-            if len(new_data) != len(self._data):
-                # Size changed, clear all cache
-                self.clear_cache()
-            else:
-                # Check for changes and mark dirty rows
-                for i, (old, new) in enumerate(zip(self._data, new_data)):
-                    if old != new:
-                        self.mark_row_dirty(i)
-            
+            # Complete refresh - cached cells of rows that kept their resourceVersion stay valid
             self._data = new_data
+            self._generation += 1
+            self._row_colors_cache.clear()
+            self.invalidate_sort_keys()
+        if self._sort_column >= 0:
+            self._sort_rows(self._sort_column, self._sort_reverse(self._sort_column, self._sort_order))
+            self._row_colors_cache.clear()
         
-        self._dirty_rows.clear()
         self.endResetModel()
+        self._prune_checked_keys()
         self.data_changed_custom.emit()
         
         logging.info(f"Model updated: {len(self._data)} rows, cache hits: {self._cache_hits}, cache misses: {self._cache_misses}")
     
+    def apply_delta(self, delta: ResourceDelta) -> bool:
+        """
+        Apply a UID-keyed delta with row-level model signals instead of a reset.
+        Returns False without touching the model when the delta does not match its rows.
+        """
+        row_by_key = {get_row_key(item): row for row, item in enumerate(self._data)}
+        
+        changed_rows = []
+        for item in delta.changed:
+            row = row_by_key.get(get_row_key(item))
+            if row is None:
+                return False
+            changed_rows.append((row, item))
+        
+        removed_rows = []
+        for key in delta.removed:
+            row = row_by_key.get(key)
+            if row is None:
+                return False
+            removed_rows.append(row)
+        
+        added_items = [item for item in delta.added if get_row_key(item) not in row_by_key]
+        if len(added_items) != len(delta.added):
+            return False
+        
+        # Updates first, while row numbers still match the lookup
+        for row, item in changed_rows:
+            self._data[row] = item
+            self.mark_row_dirty(row)
+        for row, item in changed_rows:
+            self._column_store.update(row, item)
+        last_column = max(0, len(self._columns) - 1)
+        for first, last in self._contiguous_ranges(sorted(row for row, _ in changed_rows)):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_column))
+        
+        # Remove from the bottom up so earlier ranges keep their row numbers
+        for first, last in reversed(self._contiguous_ranges(sorted(removed_rows))):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._data[first:last + 1]
+            self._column_store.delete(first, last)
+            self.endRemoveRows()
+        if removed_rows:
+            self._row_colors_cache.clear()  # Row colors are keyed by row number and the rows below moved up
+            self._prune_checked_keys()
+        
+        if added_items:
+            start = len(self._data)
+            self.beginInsertRows(QModelIndex(), start, start + len(added_items) - 1)
+            self._data.extend(added_items)
+            self._column_store.append(added_items)
+            self.endInsertRows()
+        
+        if changed_rows or added_items:
+            self._reapply_sort()
+        
+        if not delta.is_empty():
+            self._generation += 1
+            self.data_changed_custom.emit()
+        
+        logging.info(f"Model delta applied: {delta.summary()}, {len(self._data)} rows")
+        return True
+    
+    @staticmethod
+    def _contiguous_ranges(rows: List[int]) -> List[tuple]:
+        """Group sorted row numbers into (first, last) runs"""
+        ranges = []
+        for row in rows:
+            if ranges and row == ranges[-1][1] + 1:
+                ranges[-1] = (ranges[-1][0], row)
+            else:
+                ranges.append((row, row))
+        return ranges
+    
+    def reset_rows(self, new_data: List[Dict]):
+        """
+        Replace every row in one reset - for a new listing rather than a refresh of the current one.
+        Checks are dropped and the current sort is re-applied.
+        """
+        self.beginResetModel()
+        self._data = list(new_data or [])
+        self._generation += 1
+        self.invalidate_sort_keys()
+        self._checked_keys.clear()
+        self._row_colors_cache.clear()
+        if self._sort_column >= 0:
+            self._sort_rows(self._sort_column, self._sort_reverse(self._sort_column, self._sort_order))
+        self.endResetModel()
+        self.check_state_changed.emit()
+        self.data_changed_custom.emit()
+    
     def refresh_data(self, new_data: List[Dict]):
         """Refresh data - alias for update_data"""
         self.update_data(new_data, incremental=False)
@@ -234,7 +641,10 @@ class VirtualizedResourceModel(QAbstractTableModel):
             
         self.beginInsertRows(QModelIndex(), len(self._data), len(self._data) + len(additional_data) - 1)
         self._data.extend(additional_data)
+        self._column_store.append(additional_data)
+        self._generation += 1
         self.endInsertRows()
+        self._reapply_sort()
         
         self.data_changed_custom.emit()
         logging.info(f"Appended {len(additional_data)} rows, total: {len(self._data)}")
@@ -270,22 +680,143 @@ class VirtualizedResourceModel(QAbstractTableModel):
         
         return matching_rows
     
+    def _sort_reverse(self, column: int, order: Qt.SortOrder) -> bool:
+        reverse = (order == Qt.SortOrder.DescendingOrder)
+        # Ascending age is descending creation time
+        return not reverse if column in self._age_columns else reverse
+    
+    def _row_sort_key(self, column: int) -> tuple:
+        """(row -> typed sort key, sort-key kind) of a column - one key type per column, so keys always compare"""
+        column_key = self._columns[column]
+        spec = self._specs[column] if self._specs else None
+        
+        if spec is not None:
+            kind, source = spec.sort_as, spec.sort_value
+        elif column in self._age_columns:
+            kind, source = NUMERIC, self._epoch_getter(column)
+        elif column_key in self._formatters:
+            # Columns with a formatter sort by what they display
+            kind, source = NATURAL, self._formatters[column_key]
+        else:
+            kind, source = NATURAL, lambda item: item.get(column_key)
+        
+        to_key, missing = get_sort_key_function(kind), missing_key(kind)
+        
+        def key(item):
+            try:
+                return to_key(source(item))
+            except Exception:
+                return missing
+        return key, kind
+    
+    def _ensure_column(self, column: int):
+        """Compute a column's keys for every row on its first sort, filter or total"""
+        if column not in self._column_store:
+            key, kind = self._row_sort_key(column)
+            self._column_store.add_column(column, self._data, key, kind)
+    
+    def invalidate_sort_keys(self):
+        """Forget the precomputed column keys - for rows whose values changed without a row update"""
+        self._column_store.clear()
+    
+    def _sort_rows(self, column: int, reverse: bool) -> List[int]:
+        """Reorder the rows and every stored column by an argsort of the column's keys"""
+        self._ensure_column(column)
+        order = self._column_store.argsort(column, reverse)
+        self._permute_rows(order)
+        return order
+    
+    def _permute_rows(self, order: List[int]):
+        self._data = [self._data[row] for row in order]
+        self._column_store.permute(order)
+        self._generation += 1
+    
+    def _move_rows(self, order: List[int]):
+        """Reorder the rows under the view - its selection and current index stay on the same rows"""
+        self.layoutAboutToBeChanged.emit()
+        try:
+            self._permute_rows(order)
+            persistent = self.persistentIndexList()
+            if persistent:
+                new_row = [0] * len(order)
+                for row, old_row in enumerate(order):
+                    new_row[old_row] = row
+                self.changePersistentIndexList(
+                    persistent, [self.index(new_row[index.row()], index.column()) for index in persistent])
+            self._row_colors_cache.clear()  # Formatted cells are keyed by row identity and survive the move
+        finally:
+            self.layoutChanged.emit()
+    
+    def _reapply_sort(self):
+        """Move rows added or changed under the current sort to their sorted place"""
+        if self._sort_column < 0 or not self._data:
+            return
+        self._ensure_column(self._sort_column)
+        order = self._column_store.argsort(self._sort_column, self._sort_reverse(self._sort_column, self._sort_order))
+        if any(row != position for position, row in enumerate(order)):
+            self._move_rows(order)
+    
+    def rows_matching(self, column: int, op: str, value: Any, rows: Optional[List[int]] = None) -> List[int]:
+        """
+        Rows whose typed key of a column compares to value - op is one of =, !=, <, <=, >, >=.
+        value must already be a key of the column's sort-key kind (a float for numeric kinds).
+        """
+        self._ensure_column(column)
+        return self._column_store.compare(column, op, value, rows)
+    
+    def column_total(self, column: int, rows: Optional[List[int]] = None) -> float:
+        """Sum of a numeric column over every row or the given rows, e.g. for a footer of the visible rows"""
+        self._ensure_column(column)
+        return self._column_store.total(column, rows)
+    
+    def filter_snapshot(self) -> FilterSnapshot:
+        """Rows, columns and stored column keys as they are now - for matching a filter off the GUI thread"""
+        columns = []
+        for col, header in enumerate(self._columns):
+            spec = self._specs[col] if self._specs else None
+            if spec is not None and spec.kind in (TableColumn.CHECK, TableColumn.ACTION):
+                continue
+            key, kind = self._row_sort_key(col)
+            columns.append(FilterColumn(
+                index=col, header=str(header), key_name=spec.key if spec else str(header),
+                text=lambda item, col=col: self._format_item(item, col),
+                key=key, kind=kind, is_age=col in self._age_columns))
+        return FilterSnapshot(list(self._data), columns, self._column_store.copy(), self._generation)
+    
+    def filter_fields(self) -> frozenset:
+        """Names a filter query can use as fields - column headers and keys, and the fields of the rows"""
+        names = list(self._columns)
+        if self._specs:
+            names.extend(spec.key for spec in self._specs)
+        for item in self._data[:FIELD_SAMPLE_ROWS]:
+            names.extend(item.keys())
+        return filter_field_names(names)
+    
     def sort_data(self, column: int, order: Qt.SortOrder):
         """Sort data by column"""
-        if column >= len(self._columns):
+        if column < 0 or column >= len(self._columns):
             return
-            
+        spec = self._specs[column] if self._specs else None
+        if spec is not None and spec.kind in (TableColumn.CHECK, TableColumn.ACTION):
+            return
+        
         column_key = self._columns[column]
-        reverse = (order == Qt.SortOrder.DescendingOrder)
+        reverse = self._sort_reverse(column, order)
         
         try:
-            self._data.sort(key=lambda item: str(item.get(column_key, "")), reverse=reverse)
-            self.clear_cache()  # Clear cache after sorting
-            self.layoutChanged.emit()
-            logging.info(f"Sorted by column {column_key}, reverse={reverse}")
+            started = time.perf_counter()
+            self._ensure_column(column)
+            self._move_rows(self._column_store.argsort(column, reverse))
+            self._sort_column, self._sort_order = column, order
+            logging.info(f"Sorted {len(self._data)} rows by column {column_key}, reverse={reverse} "
+                         f"in {(time.perf_counter() - started) * 1000:.1f}ms")
         except Exception as e:
             logging.error(f"Error sorting data: {e}")
     
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """Header click sorting (QTableView calls this when sorting is enabled)"""
+        self.sort_data(column, order)
+    
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache performance statistics"""
         total_requests = self._cache_hits + self._cache_misses
@@ -296,6 +827,9 @@ class VirtualizedResourceModel(QAbstractTableModel):
             'cache_misses': self._cache_misses,
             'hit_rate_percent': round(hit_rate, 2),
             'cache_size': len(self._formatted_cache),
+            'cache_capacity': self._cache_capacity,
+            'cache_evictions': self._cache_evictions,
+            'uncached_formats': self._uncached_formats,
             'color_cache_size': len(self._row_colors_cache)
         }
     
@@ -303,6 +837,7 @@ class VirtualizedResourceModel(QAbstractTableModel):
         """Set custom formatters for columns"""
         self._formatters = formatters
         self.clear_cache()  # Clear cache when formatters change
+        self.invalidate_sort_keys()
     
     def enable_cache(self, enabled: bool = True):
         """Enable or disable caching"""
@@ -56,7 +56,7 @@ def collect_data_files():
 hidden_imports = [
     'PyQt6', 'PyQt6.QtCore', 'PyQt6.QtGui', 'PyQt6.QtWidgets', 'PyQt6.QtSvg',
     'kubernetes', 'kubernetes.client', 'kubernetes.config', 'kubernetes.stream',
-    'yaml', 'requests', 'psutil', 'logging', 'json', 'datetime', 'threading',
+    'yaml', 'requests', 'psutil', 'orjson', 'numpy', 'logging', 'json', 'datetime', 'threading',
     'subprocess', 'tempfile', 'shutil', 'base64', 'ssl', 'socket'
 ]
 
@@ -3,11 +3,10 @@ Dynamic implementation of the Cluster Roles page with live Kubernetes data.
 """
 
 from PyQt6.QtWidgets import (QHeaderView, QWidget, QLabel)
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn
 from UI.Styles import AppStyles, AppColors
 
 class ClusterRolesPage(BaseResourcePage):
@@ -69,61 +68,15 @@ class ClusterRolesPage(BaseResourcePage):
         
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with cluster role data from live Kubernetes resources
-        """
-        # Set row height once
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Prepare data columns
-        columns = [
-            resource["name"],
-            resource["age"]
+    def get_table_columns(self, headers):
+        """ClusterRole columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn.age(),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col == 1:  # Age column
-                try:
-                    num = int(value.replace('d', ''))
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col == 1:  # Age column
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Set text color
-            item.setForeground(QColor(AppColors.TEXT_TABLE))
-            
-            # Add the item to the table
-            self.table.setItem(row, cell_col, item)
-        
-        # Create and add action button
-        action_button = self._create_action_button(row, resource["name"], resource.get("namespace", ""))
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 1, action_container)
-    
+
     # def handle_row_click(self, row, column):
     #     """Handle row selection when a table cell is clicked"""
     #     if column != self.table.columnCount() - 1:  # Skip action column
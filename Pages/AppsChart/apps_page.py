@@ -7,6 +7,7 @@ for viewing and interacting with Kubernetes application flow diagrams.
 
 import os
 import logging
+from collections.abc import Mapping
 from datetime import datetime
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QLineEdit, 
@@ -245,30 +246,19 @@ class AppsPage(QWidget):
         
         # Connect signals if not already connected
         if not hasattr(self, '_namespace_signals_connected'):
-            unified_loader.loading_completed.connect(self._on_namespaces_loaded_unified)
-            unified_loader.loading_error.connect(self._on_namespace_error_unified)
+            unified_loader.namespace_names_loaded.connect(self._on_namespaces_loaded_unified)
             self._namespace_signals_connected = True
         
-        # Load namespaces
-        self._namespace_operation_id = unified_loader.load_resources_async('namespaces')
+        # Load namespace names from metadata only
+        self._namespace_operation_id = unified_loader.load_namespace_names_async()
     
-    def _on_namespaces_loaded_unified(self, resource_type: str, result):
-        """Handle namespaces loaded from unified loader"""
-        if resource_type != 'namespaces':
-            return
-        
+    def _on_namespaces_loaded_unified(self, result):
+        """Handle namespace names loaded from unified loader"""
         if result.success:
-            # Extract namespace names from the processed results
-            namespaces = [item.get('name', '') for item in result.items if item.get('name')]
-            self.on_namespaces_loaded(namespaces)
+            self.on_namespaces_loaded(list(result.items))
         else:
             self.on_namespace_error(result.error_message or "Failed to load namespaces")
     
-    def _on_namespace_error_unified(self, resource_type: str, error_message: str):
-        """Handle namespace loading errors from unified loader"""
-        if resource_type == 'namespaces':
-            self.on_namespace_error(error_message)
-    
     def on_namespaces_loaded(self, namespaces):
         """Handle loaded namespaces"""
         self.namespace_combo.blockSignals(True)
@@ -401,7 +391,7 @@ class AppsPage(QWidget):
             # The unified resource loader now returns dictionaries with 'name' field
             resource_names = []
             for resource in resources:
-                if isinstance(resource, dict) and 'name' in resource:
+                if isinstance(resource, Mapping) and 'name' in resource:
                     resource_names.append(resource['name'])
                 elif isinstance(resource, str):
                     # Handle case where it might still be strings (backward compatibility)
@@ -2,44 +2,23 @@
 Dynamic implementation of the Horizontal Pod Autoscalers page with live Kubernetes data.
 """
 
-from PyQt6.QtWidgets import QHeaderView, QPushButton, QLabel, QWidget, QHBoxLayout
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QHeaderView, QPushButton
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppColors, AppStyles
 
-class StatusLabel(QWidget):
-    """Widget that displays a status with consistent styling and background handling."""
-    clicked = pyqtSignal()
-    
-    def __init__(self, status_text, color=None, parent=None):
-        super().__init__(parent)
-        
-        # Create layout
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Create label
-        self.label = QLabel(status_text)
-        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Set color if provided, otherwise use default color
-        if color:
-            self.label.setStyleSheet(f"color: {QColor(color).name()}; background-color: transparent;")
-        
-        # Add label to layout
-        layout.addWidget(self.label)
-        
-        # Make sure this widget has a transparent background
-        self.setStyleSheet("background-color: transparent;")
-    
-    def mousePressEvent(self, event):
-        """Emit clicked signal when widget is clicked"""
-        self.clicked.emit()
-        super().mousePressEvent(event)
+HPA_STATUS_COLORS = {
+    "Healthy": AppColors.STATUS_ACTIVE,
+    "Warning": AppColors.ACCENT_RED,
+    "Scaling": AppColors.ACCENT_BLUE,
+}
+
+
+def _status_color(resource):
+    return HPA_STATUS_COLORS.get(resource.get("status", "Unknown"))
+
 
 class HorizontalPodAutoscalersPage(BaseResourcePage):
     """
@@ -112,108 +91,21 @@ class HorizontalPodAutoscalersPage(BaseResourcePage):
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
 
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with HPA data
-        """
-        # Set row height
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Prepare data columns
-        columns = [
-            resource["name"],
-            resource["namespace"],
-            resource.get("metrics", "None"),
-            resource.get("min_pods", "1"),
-            resource.get("max_pods", "10"),
-            resource.get("current_replicas", "0"),
-            resource["age"]
-            # Status is now handled separately using StatusLabel widget
+    def get_table_columns(self, headers):
+        """HorizontalPodAutoscaler columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Namespace", align=ALIGN_CENTER),
+            TableColumn("Metrics", value=lambda resource: resource.get("metrics", "None"), align=ALIGN_CENTER),
+            TableColumn.numeric("Min Pods", key="min_replicas"),
+            TableColumn.numeric("Max Pods", key="max_replicas"),
+            TableColumn.numeric("Replicas", key="current_replicas"),
+            TableColumn.age(),
+            TableColumn.status(value=lambda resource: resource.get("status", "Unknown"), color=_status_color),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col == 3:  # Min Pods column
-                try:
-                    num = int(value)
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            elif col == 4:  # Max Pods column
-                try:
-                    num = int(value)
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            elif col == 5:  # Replicas column
-                try:
-                    num = int(value)
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            elif col == 6:  # Age column
-                try:
-                    num = int(value.replace('d', '').replace('h', '').replace('m', ''))
-                    if 'd' in value:
-                        num = num * 1440  # Convert days to minutes
-                    elif 'h' in value:
-                        num = num * 60    # Convert hours to minutes
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col in [1, 2, 3, 4, 5, 6]:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Set default text color
-            item.setForeground(QColor(AppColors.TEXT_TABLE))
-            
-            # Add item to table
-            self.table.setItem(row, cell_col, item)
-        
-        # Create status widget with proper color for HPAs
-        status_col = 8  # Status column index
-        status_text = resource.get("status", "Unknown")
-        
-        # Pick the right color
-        if status_text == "Healthy":
-            color = AppColors.STATUS_ACTIVE
-        elif status_text == "Warning":
-            color = AppColors.ACCENT_RED
-        elif status_text == "Scaling":
-            color = AppColors.ACCENT_BLUE
-        else:
-            color = AppColors.TEXT_TABLE
-        
-        # Create status widget with proper color
-        status_widget = StatusLabel(status_text, color)
-        # Connect click event to select the row
-        status_widget.clicked.connect(lambda: self.table.selectRow(row))
-        self.table.setCellWidget(row, status_col, status_widget)
-        
-        # Create and add action button
-        action_button = self._create_action_button(row, resource["name"], resource["namespace"])
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 2, action_container)  # +2 for checkbox and status
+
     # def handle_row_click(self, row, column):
     #     """Handle row selection when a table cell is clicked"""
     #     if column != self.table.columnCount() - 1:  # Skip action column
@@ -3,11 +3,10 @@ Dynamic implementation of the PodDisruptionBudgets page with live Kubernetes dat
 """
 
 from PyQt6.QtWidgets import QHeaderView, QPushButton
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER, ALIGN_LEFT
 from UI.Styles import AppStyles
 
 class PodDisruptionBudgetsPage(BaseResourcePage):
@@ -76,95 +75,19 @@ class PodDisruptionBudgetsPage(BaseResourcePage):
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
 
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with PodDisruptionBudget data extracted from raw_data
-        """
-        # Set row height
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)        
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Extract data from raw_data
-        raw_data = resource.get("raw_data", {})
-        spec = raw_data.get("spec", {})
-        status = raw_data.get("status", {})
-        
-        # Get min available
-        min_available = "N/A"
-        if spec.get("minAvailable") is not None:
-            min_available = str(spec["minAvailable"])
-        
-        # Get max unavailable
-        max_unavailable = "N/A"
-        if spec.get("maxUnavailable") is not None:
-            max_unavailable = str(spec["maxUnavailable"])
-        
-        # Get status information
-        current_healthy = str(status.get("currentHealthy", 0))
-        desired_healthy = str(status.get("desiredHealthy", 0))
-        
-        # Prepare data columns - MATCH ORIGINAL HEADERS
-        columns = [
-            resource["name"],        # Name
-            resource["namespace"],   # Namespace
-            min_available,          # Min Available
-            max_unavailable,        # Max Unavailable
-            current_healthy,        # Current Healthy
-            desired_healthy,        # Desired Healthy
-            resource["age"]         # Age
+    def get_table_columns(self, headers):
+        """PodDisruptionBudget columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name", align=ALIGN_CENTER),
+            TableColumn("Namespace"),
+            TableColumn("Min Available", key="min_available"),
+            TableColumn("Max Unavailable", key="max_unavailable"),
+            TableColumn.numeric("Current Healthy", key="current_healthy", align=ALIGN_LEFT),
+            TableColumn.numeric("Desired Healthy", key="desired_healthy", align=ALIGN_LEFT),
+            TableColumn.age(align=ALIGN_LEFT),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col in [4, 5]:  # Current/Desired Healthy columns
-                try:
-                    num = int(value)
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            elif col == 6:  # Age column
-                try:
-                    # Extract numeric part from age string
-                    if 'd' in value:
-                        num = int(value.replace('d', ''))
-                    elif 'h' in value:
-                        num = int(value.replace('h', '')) / 24  # Convert to fraction of day
-                    elif 'm' in value:
-                        num = int(value.replace('m', '')) / (24 * 60)  # Convert to fraction of day
-                    else:
-                        num = 0
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col in  (1, 2, 3, 4, 5, 6):  # Name column
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Add item to table
-            self.table.setItem(row, cell_col, item)
-        
-        # Create and add action button
-        action_button = self._create_action_button(row, resource["name"], resource["namespace"])
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 1, action_container)
 
     def handle_row_click(self, row, column):
         if column != self.table.columnCount() - 1:  # Skip action column
@@ -3,12 +3,19 @@ Dynamic implementation of the Secrets page with live Kubernetes data.
 """
 
 from PyQt6.QtWidgets import QHeaderView, QPushButton
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppStyles
+from Utils.column_extractors import raw_getter
+
+_labels = raw_getter('metadata.labels')
+
+
+def _labels_text(resource):
+    return ", ".join(f"{k}={v}" for k, v in (_labels(resource) or {}).items()) or "<none>"
+
 
 class SecretsPage(BaseResourcePage):
     """
@@ -74,93 +81,18 @@ class SecretsPage(BaseResourcePage):
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
 
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with Secret data extracted from raw_data
-        """
-        # Set row height
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Extract data from raw_data
-        raw_data = resource.get("raw_data", {})
-        metadata = raw_data.get("metadata", {})
-        
-        # Get labels (show all labels)
-        labels = "<none>"
-        if metadata.get("labels"):
-            labels_dict = metadata["labels"]
-            if labels_dict:
-                # Show all label key=value pairs
-                label_pairs = [f"{k}={v}" for k, v in labels_dict.items()]
-                labels = ", ".join(label_pairs)
-        
-        # Get keys (show all keys)
-        keys = "<none>"
-        if raw_data.get("data"):
-            data_keys = list(raw_data["data"].keys())
-            if data_keys:
-                # Show all key names
-                keys = ", ".join(data_keys)
-        
-        # Get secret type
-        secret_type = raw_data.get("type", "Opaque")
-        
-        # Prepare data columns - MATCH ORIGINAL HEADERS
-        columns = [
-            resource["name"],        # Name
-            resource["namespace"],   # Namespace
-            labels,                 # Labels
-            keys,                   # Keys
-            secret_type,           # Type
-            resource["age"]        # Age
+    def get_table_columns(self, headers):
+        """Secret columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Namespace", align=ALIGN_CENTER),
+            TableColumn("Labels", value=_labels_text, align=ALIGN_CENTER),
+            TableColumn("Keys", align=ALIGN_CENTER),
+            TableColumn("Type", align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col == 5:  # Age column
-                try:
-                    # Extract numeric part from age string
-                    if 'd' in value:
-                        num = int(value.replace('d', ''))
-                    elif 'h' in value:
-                        num = int(value.replace('h', '')) / 24  # Convert to fraction of day
-                    elif 'm' in value:
-                        num = int(value.replace('m', '')) / (24 * 60)  # Convert to fraction of day
-                    else:
-                        num = 0
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col in (1, 2, 3, 4, 5):  # Name column
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Add item to table
-            self.table.setItem(row, cell_col, item)
-        
-        # Create and add action button
-        action_button = self._create_action_button(row, resource["name"], resource["namespace"])
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 1, action_container)
 
     def handle_row_click(self, row, column):
         if column != self.table.columnCount() - 1:  # Skip action column
@@ -0,0 +1,271 @@
+"""
+Custom resource instance browser - lists the instances of any CustomResourceDefinition.
+Instances are listed page by page in the server-side Table format, so each row costs its
+metadata plus the CRD's printed columns instead of the whole object, and the rows are shown
+in the virtualized table so tens of thousands of instances stay responsive.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from PyQt6.QtWidgets import QComboBox, QLabel, QHBoxLayout, QAbstractItemView
+
+from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtual_scroll_table import VirtualScrollTable
+from Base_Components.virtualized_table_model import TableColumn
+from UI.Styles import AppStyles
+from Utils.enhanced_worker import EnhancedBaseWorker
+from Utils.thread_manager import get_thread_manager
+from Utils.resource_registry import get_resource_registry, ResourceInfo
+from Utils.unified_resource_loader import get_unified_resource_loader, PRINTED_METADATA_COLUMNS
+
+
+def get_printer_columns(crd: Dict[str, Any], version: str) -> List[str]:
+    """Names of the default-priority additionalPrinterColumns a CRD prints for one version"""
+    spec = crd.get('spec') or {}
+    columns = spec.get('additionalPrinterColumns') or []  # apiextensions.k8s.io/v1beta1 location
+    for entry in spec.get('versions') or []:
+        if entry.get('name') == version:
+            columns = entry.get('additionalPrinterColumns') or columns
+            break
+
+    # Higher priorities are only printed in wide output; name/namespace/age come from metadata
+    return [
+        column['name'] for column in columns
+        if column.get('name') and not column.get('priority')
+        and column['name'].lower() not in PRINTED_METADATA_COLUMNS
+    ]
+
+
+class PrinterColumnsWorker(EnhancedBaseWorker):
+    """Worker for reading the printer columns of a custom resource from its CRD"""
+    def __init__(self, info: ResourceInfo):
+        super().__init__(f"printer_columns_{info.qualified_name}")
+        self.info = info
+
+    def execute(self):
+        crd = get_resource_registry().get('customresourcedefinitions', self.info.qualified_name)
+        return self.info.qualified_name, get_printer_columns(crd, self.info.version)
+
+
+class CustomResourcesPage(BaseResourcePage):
+    """
+    Displays the instances of a selected custom resource with the columns its CRD prints.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.resource_type = None  # Qualified name of the selected kind, e.g. 'certificates.cert-manager.io'
+        self.kind_combo = None
+        self._printer_columns: Dict[str, List[str]] = {}  # qualified name -> printed column names
+        self._headers: List[str] = []
+        self.setup_page_ui()
+
+    def setup_page_ui(self):
+        """Set up the main UI elements for the Instances page"""
+        self._headers = self._build_headers(None)
+        super().setup_ui("Instances", self._headers)
+
+        # Rows are selected directly in the table - there are no per-row checkbox widgets
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.table.selection_changed.connect(self._on_table_selection_changed)
+        self.table.item_double_clicked.connect(self._on_row_double_clicked)
+
+        self._refresh_kinds()
+
+    def _create_table(self, headers, sortable_columns=None):
+        """Virtualized table - rows are formatted only when painted"""
+        table = VirtualScrollTable(headers)
+        table.setStyleSheet(AppStyles.TABLE_STYLE)
+        table.horizontalHeader().setStyleSheet(AppStyles.CUSTOM_HEADER_STYLE)
+        table.set_table_columns(self.get_table_columns(headers))
+        return table
+
+    def _add_select_all_to_header(self):
+        """Selection is the table's own row selection - no select-all checkbox"""
+        return
+
+    def _add_controls_to_header(self, header_layout):
+        """Add the kind selector in front of the standard filter controls"""
+        kind_layout = QHBoxLayout()
+        kind_layout.setSpacing(12)
+
+        kind_label = QLabel("Kind:")
+        kind_label.setStyleSheet("color: #ffffff; font-size: 12px; font-weight: normal;")
+
+        self.kind_combo = QComboBox()
+        self.kind_combo.setFixedWidth(260)
+        self.kind_combo.setFixedHeight(32)
+        self.kind_combo.setStyleSheet(getattr(AppStyles, 'NAMESPACE_DROPDOWN', ''))
+        self.kind_combo.currentIndexChanged.connect(self._on_kind_changed)
+
+        kind_layout.addWidget(kind_label)
+        kind_layout.addWidget(self.kind_combo)
+        kind_layout.addSpacing(16)
+        header_layout.addLayout(kind_layout)
+
+        super()._add_controls_to_header(header_layout)
+
+    # Kinds and columns
+
+    def showEvent(self, event):
+        """Pick up custom resources discovered since the page was last shown"""
+        self._refresh_kinds()
+        super().showEvent(event)
+
+    def _refresh_kinds(self):
+        """Fill the kind selector from the resource registry, keeping the current selection"""
+        if not self.kind_combo:
+            return
+
+        infos = get_resource_registry().get_custom_resources()
+        names = [info.qualified_name for info in infos]
+        if names == [self.kind_combo.itemData(i) for i in range(self.kind_combo.count())]:
+            return
+
+        self.kind_combo.blockSignals(True)
+        self.kind_combo.clear()
+        for info in infos:
+            self.kind_combo.addItem(f"{info.kind} ({info.group})", info.qualified_name)
+        self.kind_combo.setEnabled(bool(infos))
+        if not infos:
+            self.kind_combo.addItem("No custom resources")
+        selected = names.index(self.resource_type) if self.resource_type in names else 0
+        self.kind_combo.setCurrentIndex(selected)
+        self.kind_combo.blockSignals(False)
+
+        if infos and self.resource_type not in names:
+            self._select_kind(names[0], load=False)
+        elif not infos:
+            self.resource_type = None
+
+    def _on_kind_changed(self, index):
+        """Switch the page to the instances of another custom resource"""
+        qualified_name = self.kind_combo.itemData(index) if self.kind_combo else None
+        if qualified_name and qualified_name != self.resource_type:
+            self._select_kind(qualified_name, load=True)
+
+    def _select_kind(self, qualified_name: str, load: bool):
+        if self.resource_type and getattr(self, '_current_operation_id', None):
+            get_unified_resource_loader().cancel_load(self.resource_type, self._loading_namespace)
+            self._current_operation_id = None
+
+        self.resource_type = qualified_name
+        self._clear_resources()
+        self.selected_items.clear()
+        self._apply_columns()
+
+        info = get_resource_registry().resolve(qualified_name)
+        if info is not None and qualified_name not in self._printer_columns:
+            self._load_printer_columns(info)
+
+        if load:
+            self.force_load_data()
+
+    def _load_printer_columns(self, info: ResourceInfo):
+        """Read the printer columns from the CRD in the background"""
+        worker = PrinterColumnsWorker(info)
+        worker.signals.finished.connect(self._on_printer_columns_loaded)
+        worker.signals.error.connect(
+            lambda error: logging.warning(f"Could not read printer columns of {info.qualified_name}: {error}"))
+        get_thread_manager().submit_worker(worker.worker_id, worker)
+
+    def _on_printer_columns_loaded(self, result):
+        qualified_name, columns = result
+        self._printer_columns[qualified_name] = columns
+        if qualified_name == self.resource_type:
+            self._apply_columns()
+            self._render_resources_batch(self.resources)
+
+    def _build_headers(self, qualified_name: Optional[str]) -> List[str]:
+        info = get_resource_registry().resolve(qualified_name) if qualified_name else None
+        headers = ["Name"]
+        if info is None or info.namespaced:
+            headers.append("Namespace")
+        headers.extend(self._printer_columns.get(qualified_name, ()))
+        headers.append("Age")
+        return headers
+
+    def get_table_columns(self, headers):
+        """Metadata columns read the row fields - printed columns are stored under their own names"""
+        specs = []
+        for header in headers:
+            if header == "Name":
+                specs.append(TableColumn("Name", key="name"))
+            elif header == "Namespace":
+                specs.append(TableColumn("Namespace", key="namespace"))
+            elif header == "Age":
+                specs.append(TableColumn.age())
+            else:
+                specs.append(TableColumn(header, key=header))
+        return specs
+
+    def _apply_columns(self):
+        """Rebuild the table columns for the selected kind"""
+        self._headers = self._build_headers(self.resource_type)
+        self.table.set_table_columns(self.get_table_columns(self._headers))
+
+    # Search - filters the listed rows, custom kinds have no typed client to search through
+
+    def get_search_fields(self):
+        return super().get_search_fields() + self._printer_columns.get(self.resource_type, [])
+
+    def _perform_global_search(self, search_text):
+        self._is_searching = True
+        self._current_search_query = search_text
+        self._filter_resources_linear(search_text)
+
+    def _clear_search_and_reload(self):
+        self._is_searching = False
+        self._current_search_query = None
+        self._display_resources(self.resources)
+
+    def _filter_resources_linear(self, search_text):
+        """Match the name, namespace and printed columns of every listed row"""
+        if not search_text:
+            self._display_resources(self.resources)
+            return
+
+        search_lower = search_text.lower()
+        fields = ["name", "namespace"] + self._printer_columns.get(self.resource_type, [])
+        filtered = [
+            resource for resource in self.resources
+            if any(search_lower in str(resource.get(field) or "").lower() for field in fields)
+        ]
+        self._display_resources(filtered)
+
+    # Selection and details
+
+    def _on_table_selection_changed(self, rows):
+        self.selected_items = {
+            (resource.get("name"), resource.get("namespace")) for resource in self.table.get_selected_data()
+        }
+
+    def _on_row_double_clicked(self, row):
+        """Open the detail panel for an instance"""
+        resource = self.get_resource_at(row)
+        if resource is None:
+            return
+
+        parent = self.parent()
+        while parent and not hasattr(parent, 'detail_manager'):
+            parent = parent.parent()
+        if parent:
+            parent.detail_manager.show_detail(self.resource_type, resource.get("name"), resource.get("namespace"))
+
+    def load_data(self):
+        """Nothing to load until the cluster has a custom resource to show"""
+        if not self.resource_type:
+            self._show_empty_message()
+            return
+        super().load_data()
+
+    def clear_for_cluster_change(self):
+        """Forget the kinds and columns of the previous cluster"""
+        super().clear_for_cluster_change()
+        self._printer_columns.clear()
+        self.resource_type = None
+        if self.kind_combo:
+            self.kind_combo.blockSignals(True)
+            self.kind_combo.clear()
+            self.kind_combo.blockSignals(False)
@@ -3,12 +3,22 @@ Dynamic implementation of the Definitions page with live Kubernetes data.
 """
 
 from PyQt6.QtWidgets import (QHeaderView, QWidget, QLabel)
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppStyles, AppColors
+from Utils.column_extractors import raw_getter
+
+_plural = raw_getter('spec.names.plural')
+_versions = raw_getter('spec.versions')
+_scope = raw_getter('spec.scope')
+
+
+def _first_version(resource):
+    versions = _versions(resource)
+    return versions[0].get("name", "<none>") if versions else "<none>"
+
 
 class DefinitionsPage(BaseResourcePage):
     """
@@ -71,82 +81,17 @@ class DefinitionsPage(BaseResourcePage):
         
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with CustomResourceDefinition data from live Kubernetes resources
-        """
-        # Set row height once
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Extract CRD details from raw data
-        raw_data = resource.get("raw_data", {})
-        
-        # Get resource name (short name if available)
-        spec = raw_data.get("spec", {})
-        names = spec.get("names", {})
-        plural = names.get("plural", "")
-        
-        # Get group
-        group = spec.get("group", "<none>")
-        
-        # Get version
-        versions = spec.get("versions", [])
-        version = versions[0].get("name", "<none>") if versions else "<none>"
-        
-        # Get scope
-        scope = spec.get("scope", "<none>")
-        
-        # Prepare data columns
-        columns = [
-            plural,
-            group,
-            version,
-            scope,
-            resource["age"]
+    def get_table_columns(self, headers):
+        """CustomResourceDefinition columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Resource", value=lambda resource: _plural(resource) or ""),
+            TableColumn("Group", value=lambda resource: resource.get("group") or "<none>", align=ALIGN_CENTER),
+            TableColumn("Version", value=_first_version, align=ALIGN_CENTER),
+            TableColumn("Scope", value=lambda resource: _scope(resource) or "<none>", align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col == 4:  # Age column
-                try:
-                    num = int(value.replace('d', ''))
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col == 0:  # Resource column
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Set text color
-            item.setForeground(QColor(AppColors.TEXT_TABLE))
-            
-            # Add the item to the table
-            self.table.setItem(row, cell_col, item)
-        
-        # Create and add action button
-        action_button = self._create_action_button(row, resource["name"], resource.get("namespace", ""))
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 1, action_container)
-    
 
     def handle_row_click(self, row, column):
         if column != self.table.columnCount() - 1:  # Skip action column
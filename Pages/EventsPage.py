@@ -1,17 +1,89 @@
-from PyQt6.QtWidgets import (
-    QHeaderView, QWidget, QLabel, QHBoxLayout,
-    QToolButton, QMenu, QVBoxLayout, QTableWidgetItem, QApplication, QPushButton
-)
-from PyQt6.QtCore import Qt, QTimer, QSize
-from PyQt6.QtGui import QColor, QIcon
+from PyQt6.QtWidgets import QHeaderView, QMenu
+from PyQt6.QtCore import QTimer
 import logging
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
-from UI.Styles import AppStyles, AppColors, AppConstants
-from Utils.thread_manager import get_thread_manager
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
+from UI.Styles import AppStyles, AppColors
+from Utils.column_extractors import raw_getter
+from Utils.data_formatters import timestamp_to_epoch
+
+EVENT_ROW_HEIGHT = 50
+
+EVENT_TYPE_COLORS = {
+    "Normal": "#4CAF50",      # Green for normal events
+    "Warning": "#FF9800",     # Orange for warnings
+    "Error": "#F44336",       # Red for errors
+    "FailedMount": "#F44336", # Red for failed mounts
+    "Failed": "#F44336",      # Red for failed events
+    "FailedScheduling": "#F44336",  # Red for scheduling failures
+    "Unhealthy": "#FF5722",   # Deep orange for health issues
+    "BackOff": "#FF9800",     # Orange for backoff events
+    "Killing": "#FF5722",     # Deep orange for killing events
+    "Created": "#2196F3",     # Blue for creation events
+    "Started": "#4CAF50",     # Green for started events
+    "Pulled": "#4CAF50",      # Green for successful pulls
+    "Scheduled": "#4CAF50",   # Green for successful scheduling
+}
+
+_type = raw_getter('type')
+_message_field = raw_getter('message')
+_reason = raw_getter('reason')
+_involved_object = raw_getter('involvedObject')
+_source = raw_getter('source')
+_count_field = raw_getter('count')
+_last_timestamp = raw_getter('lastTimestamp')
+_event_time = raw_getter('eventTime')
+
+
+def _event_type(resource):
+    return _type(resource) or "Normal"
+
+
+def _message(resource):
+    # Full message without truncation - the cell elides it and the tooltip shows it all
+    return _message_field(resource) or _reason(resource) or "No message"
+
+
+def _message_color(resource):
+    event_type = _event_type(resource)
+    if event_type in ("Warning", "Error", "Failed", "FailedMount", "FailedScheduling"):
+        return "#F44336"  # Red for error messages
+    if event_type in ("BackOff", "Unhealthy"):
+        return "#FF9800"  # Orange for warning messages
+    return "#ffffff"
+
+
+def _involved_text(resource):
+    involved_object = _involved_object(resource) or {}
+    kind, name = involved_object.get("kind", ""), involved_object.get("name", "")
+    return f"{kind}/{name}" if kind and name else "Unknown"
+
+
+def _source_text(resource):
+    source_info = _source(resource)
+    if isinstance(source_info, dict):
+        return source_info.get("component", source_info.get("host", "Unknown"))
+    return str(source_info) if source_info else "Unknown"
+
+
+def _count(resource):
+    count = _count_field(resource)
+    return 1 if count is None else count
+
+
+def _count_color(resource):
+    count = _count(resource)
+    if count > 10:
+        return "#F44336"  # Red for high count
+    if count > 5:
+        return "#FF9800"  # Orange for medium count
+    return "#4CAF50"  # Green for low count
+
+
+def _last_seen_ts(resource):
+    return timestamp_to_epoch(_last_timestamp(resource) or _event_time(resource))
 
-from UI.Icons import resource_path
 
 class EventsPage(BaseResourcePage):
     """
@@ -38,6 +110,9 @@ class EventsPage(BaseResourcePage):
         # Create base UI - this will add a checkbox column at index 0
         layout = super().setup_ui("Events", headers, sortable_columns)
 
+        # Taller rows for better readability
+        self.table.verticalHeader().setDefaultSectionSize(EVENT_ROW_HEIGHT)
+
         # Ensure proper header visibility and styling
         header = self.table.horizontalHeader()
         header.setVisible(True)
@@ -152,212 +227,27 @@ class EventsPage(BaseResourcePage):
             
             self.load_more_complete.emit()
 
-    def populate_resource_row(self, row, resource):
-        """FIXED: Populate a single row with event data - no message truncation, add tooltips"""
-        # Set row height - increased for better readability
-        self.table.setRowHeight(row, 50)
-
-        # Extract data from resource
-        raw_data = resource.get("raw_data", {})
-
-        # Get event type
-        event_type = raw_data.get("type", "Normal")
-
-        # FIXED: Get full event message without truncation
-        message = raw_data.get("message", raw_data.get("reason", "No message"))
-
-        # Get namespace
-        namespace = resource.get("namespace", "default")
-
-        # Get involved object
-        involved_object = raw_data.get("involvedObject", {})
-        involved_kind = involved_object.get("kind", "")
-        involved_name = involved_object.get("name", "")
-        involved_text = f"{involved_kind}/{involved_name}" if involved_kind and involved_name else "Unknown"
-
-        # Get source
-        source_info = raw_data.get("source", {})
-        if isinstance(source_info, dict):
-            source = source_info.get("component", source_info.get("host", "Unknown"))
-        else:
-            source = str(source_info) if source_info else "Unknown"
-
-        # Get count
-        count = str(raw_data.get("count", 1))
-
-        # Get age from resource
-        age = resource.get("age", "Unknown")
-
-        # Get last seen with better parsing
-        last_seen = raw_data.get("lastTimestamp", raw_data.get("eventTime", ""))
-        if last_seen:
-            import datetime
-            try:
-                if 'Z' in last_seen:
-                    last_seen = last_seen.replace('Z', '+00:00')
-                last_seen_time = datetime.datetime.fromisoformat(last_seen)
-                if last_seen_time.tzinfo is None:
-                    last_seen_time = last_seen_time.replace(tzinfo=datetime.timezone.utc)
-                now = datetime.datetime.now(datetime.timezone.utc)
-                diff = now - last_seen_time
-                days = diff.days
-                hours = diff.seconds // 3600
-                minutes = (diff.seconds % 3600) // 60
-                if days > 0:
-                    last_seen_text = f"{days}d"
-                elif hours > 0:
-                    last_seen_text = f"{hours}h"
-                else:
-                    last_seen_text = f"{minutes}m"
-            except Exception:
-                last_seen_text = "Unknown"
-        else:
-            last_seen_text = "Unknown"
-
-        # FIXED: Create all items with full message (no truncation)
-        display_values = [
-            event_type,
-            message,  # Full message without truncation
-            namespace,
-            involved_text,
-            source,
-            count,
-            age,
-            last_seen_text
+    def get_table_columns(self, headers):
+        """Event columns - the checkbox column stays hidden, events have no bulk operations"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Type", value=_event_type,
+                        color=lambda resource: EVENT_TYPE_COLORS.get(_event_type(resource), "#ffffff"),
+                        align=ALIGN_CENTER),
+            TableColumn("Message", value=_message, color=_message_color),
+            TableColumn("Namespace", value=lambda resource: resource.get("namespace") or "default",
+                        color=lambda resource: "#64B5F6", align=ALIGN_CENTER),
+            TableColumn("Involved Object", value=_involved_text, color=lambda resource: "#81C784", align=ALIGN_CENTER),
+            TableColumn("Source", value=_source_text, color=lambda resource: "#FFB74D", align=ALIGN_CENTER),
+            TableColumn("Count", value=_count, sort_key=_count, color=_count_color, align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.age("Last Seen", epoch=_last_seen_ts),
+            TableColumn.action(),
         ]
 
-        # Column 0 is hidden checkbox, so start data population from column 1
-        # Populate columns 1-8 with data
-        for i, value in enumerate(display_values):
-            col = i + 1  # Skip checkbox column at index 0
-            if col >= self.table.columnCount() - 1:  # Leave room for action column
-                break
-
-            item = SortableTableWidgetItem(str(value))
-
-            # FIXED: Add tooltip for all cells to show full content
-            item.setToolTip(str(value))
-
-            # Set alignment
-            if col == 2:  # Message column (accounting for checkbox offset)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            # Enhanced color coding for different event types and columns
-            if col == 1:  # Type column - different colors for different event types
-                # Force color application with important styling
-                type_colors = {
-                    "Normal": "#4CAF50",      # Green for normal events
-                    "Warning": "#FF9800",     # Orange for warnings
-                    "Error": "#F44336",       # Red for errors
-                    "FailedMount": "#F44336", # Red for failed mounts
-                    "Failed": "#F44336",      # Red for failed events
-                    "FailedScheduling": "#F44336",  # Red for scheduling failures
-                    "Unhealthy": "#FF5722",   # Deep orange for health issues
-                    "BackOff": "#FF9800",     # Orange for backoff events
-                    "Killing": "#FF5722",     # Deep orange for killing events
-                    "Created": "#2196F3",     # Blue for creation events
-                    "Started": "#4CAF50",     # Green for started events
-                    "Pulled": "#4CAF50",      # Green for successful pulls
-                    "Scheduled": "#4CAF50",   # Green for successful scheduling
-                }
-                color = type_colors.get(event_type, "#ffffff")  # Default to white
-                item.setForeground(QColor(color))
-                # Force the color by setting data role as well
-                item.setData(Qt.ItemDataRole.ForegroundRole, QColor(color))
-
-            elif col == 2:  # Message column - inherit color from event type for warnings/errors
-                if event_type in ["Warning", "Error", "Failed", "FailedMount", "FailedScheduling"]:
-                    color = QColor("#F44336")  # Red for error messages
-                elif event_type in ["BackOff", "Unhealthy"]:
-                    color = QColor("#FF9800")  # Orange for warning messages
-                else:
-                    color = QColor("#ffffff")  # White for normal messages
-                item.setForeground(color)
-                item.setData(Qt.ItemDataRole.ForegroundRole, color)
-
-            elif col == 3:  # Namespace column
-                color = QColor("#64B5F6")  # Light blue for namespace
-                item.setForeground(color)
-                item.setData(Qt.ItemDataRole.ForegroundRole, color)
-
-            elif col == 4:  # Involved Object column
-                color = QColor("#81C784")  # Light green for objects
-                item.setForeground(color)
-                item.setData(Qt.ItemDataRole.ForegroundRole, color)
-
-            elif col == 5:  # Source column
-                color = QColor("#FFB74D")  # Light orange for source
-                item.setForeground(color)
-                item.setData(Qt.ItemDataRole.ForegroundRole, color)
-
-            elif col == 6:  # Count column
-                count_value = int(value) if str(value).isdigit() else 0
-                if count_value > 10:
-                    color = QColor("#F44336")  # Red for high count
-                elif count_value > 5:
-                    color = QColor("#FF9800")  # Orange for medium count
-                else:
-                    color = QColor("#4CAF50")  # Green for low count
-                item.setForeground(color)
-                item.setData(Qt.ItemDataRole.ForegroundRole, color)
-
-            else:  # Age and Last Seen columns
-                color = QColor("#B0BEC5")  # Light gray for timestamps
-                item.setForeground(color)
-                item.setData(Qt.ItemDataRole.ForegroundRole, color)
-
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, col, item)
-
-        # Enhanced action button in last column
-        action_column = self.table.columnCount() - 1
-        action_button = self._create_enhanced_action_button(row, resource.get("name", ""), resource.get("namespace", ""))
-        action_container = self._create_perfect_action_container(action_button)
-        self.table.setCellWidget(row, action_column, action_container)
-
-    def _create_enhanced_action_button(self, row, resource_name, resource_namespace):
-        """Create a very compact action button"""
-        button = QToolButton()
-
-        # Use custom SVG icon
-        moreaction_icon = resource_path("Icons/Moreaction_Button.svg")
-        icon = QIcon(moreaction_icon)
-        button.setIcon(icon)
-        button.setIconSize(QSize(AppConstants.SIZES["ICON_SIZE"], AppConstants.SIZES["ICON_SIZE"]))  # Even smaller icon
-
-        # Very compact button styling
-        button.setStyleSheet(f"""
-            QToolButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-                padding: 3px;
-                margin: 0px;
-                color: {AppColors.TEXT_SECONDARY};
-            }}
-            QToolButton:hover {{
-                background-color: {AppColors.HOVER_BG};
-                color: {AppColors.TEXT_LIGHT};
-            }}
-            QToolButton:pressed {{
-                background-color: {AppColors.HOVER_BG_DARKER};
-            }}
-            QToolButton::menu-indicator {{
-                image: none;
-                width: 0px;
-                height: 0px;
-            }}
-        """)
-
-        button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
-        button.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
-        button.setCursor(Qt.CursorShape.PointingHandCursor)
-        button.setFixedSize(20, 20)  # Very small size
-
-        # Create simple menu
-        menu = QMenu(button)
+    def _create_action_menu(self, row):
+        """Create the compact View Details / Delete menu for an event row"""
+        menu = QMenu(self)
         menu.setStyleSheet(f"""
             QMenu {{
                 background-color: {AppColors.BG_DARKER};
@@ -394,95 +284,26 @@ class EventsPage(BaseResourcePage):
         delete_action = menu.addAction("Delete")
         delete_action.triggered.connect(lambda: self._handle_action("Delete", row))
 
-        button.setMenu(menu)
-
         # Connect row highlighting
         menu.aboutToShow.connect(lambda: self._highlight_active_row(row, True))
         menu.aboutToHide.connect(lambda: self._highlight_active_row(row, False))
 
-        return button
-
-    def _create_perfect_action_container(self, button):
-        """Create a well-spaced action button container - FIXED: Better spacing on right"""
-        container = QWidget()
-        container.setFixedSize(40, 24)  # Increased width from 24 to 40 for better right spacing
-        container.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-                border: none;
-                margin: 0px;
-                padding: 0px;
-            }
-        """)
-
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(5, 0, 10, 0)  # Add left and right margins for better spacing
-        layout.setSpacing(0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(button)
-
-        return container
+        return menu
 
     def _handle_view_event_details(self, row):
         """Handle viewing event details"""
-        if row < len(self.resources):
+        if row < self.table.rowCount():
             # Trigger the existing detail view mechanism
             self.handle_row_click(row, 1)  # Simulate clicking on a non-action column
 
-    def _highlight_active_row(self, row, is_active):
-        """Enhanced row highlighting for better visual feedback"""
-        if row >= self.table.rowCount():
-            return
-
-        for col in range(self.table.columnCount()):
-            item = self.table.item(row, col)
-            if item:
-                if is_active:
-                    # More subtle highlight color
-                    item.setBackground(QColor(f"{AppColors.ACCENT_BLUE}15"))  # Very transparent blue
-                else:
-                    item.setBackground(QColor("transparent"))
-
-        # Also highlight any cell widgets (like the action button)
-        action_container = self.table.cellWidget(row, self.table.columnCount() - 1)
-        if action_container:
-            if is_active:
-                action_container.setStyleSheet("""
-                    QWidget {
-                        background-color: rgba(33, 150, 243, 0.08);
-                        border-radius: 4px;
-                    }
-                """)
-            else:
-                action_container.setStyleSheet("""
-                    QWidget {
-                        background-color: transparent;
-                        border: none;
-                    }
-                """)
-
     def _handle_action(self, action, row):
         """Handle action button clicks"""
-        if row >= len(self.resources):
+        resource = self.get_resource_at(row)
+        if resource is None:
             return
-        resource = self.resources[row]
         if action == "Delete":
             self.delete_resource(resource["name"], resource["namespace"])
 
-    def _parse_age_to_minutes(self, age):
-        """Parse age string to minutes for sorting"""
-        if 'm' in age:
-            return int(age.replace('m', ''))
-        elif 'h' in age:
-            return int(age.replace('h', '')) * 60
-        elif 'd' in age:
-            return int(age.replace('d', '')) * 1440
-        else:
-            try:
-                return int(age)
-            except ValueError:
-                return 0
-
     def handle_row_click(self, row, column):
         """Handle row click event to show detail page"""
         if column != self.table.columnCount() - 1:  # Not the action column
@@ -505,7 +326,3 @@ class EventsPage(BaseResourcePage):
     def _handle_select_all(self, state):
         """Override to do nothing - events don't support bulk operations"""
         pass
-
-    def _handle_checkbox_change(self, state, item_name):
-        """Override to do nothing - events don't support bulk operations"""
-        pass
\ No newline at end of file
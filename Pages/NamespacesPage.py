@@ -3,43 +3,37 @@ Dynamic implementation of the Namespaces page with live Kubernetes data using AP
 """
 
 from PyQt6.QtWidgets import (
-    QHeaderView, QWidget, QLabel, QHBoxLayout, QPushButton, QInputDialog, QMessageBox, QLayout
+    QHeaderView, QWidget, QHBoxLayout, QPushButton, QInputDialog, QMessageBox, QLayout
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import pyqtSignal, QThread, QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppStyles, AppColors
+from Utils.column_extractors import raw_getter
 from Utils.kubernetes_client import get_kubernetes_client
 from kubernetes.client.rest import ApiException
 from kubernetes import client
 import datetime
 import logging
 
-class StatusLabel(QWidget):
-    """Widget that displays a status with consistent styling and background handling."""
-    clicked = pyqtSignal()
+NAMESPACE_STATUS_COLORS = {
+    "Active": AppColors.STATUS_ACTIVE,
+    "Terminating": AppColors.STATUS_WARNING,
+}
 
-    def __init__(self, status_text, color=None, parent=None):
-        super().__init__(parent)
+_labels = raw_getter('metadata.labels')
+_phase_field = raw_getter('status.phase')
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        self.label = QLabel(status_text)
-        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+def _labels_text(resource):
+    labels = _labels(resource)
+    return ", ".join(f"{k}={v}" for k, v in labels.items()) if labels else "<none>"
 
-        if color:
-            self.label.setStyleSheet(f"color: {QColor(color).name()}; background-color: transparent;")
 
-        layout.addWidget(self.label)
-        self.setStyleSheet("background-color: transparent;")
+def _phase(resource):
+    return _phase_field(resource) or "Unknown"
 
-    def mousePressEvent(self, event):
-        self.clicked.emit()
-        super().mousePressEvent(event)
 
 class NamespaceOperationThread(QThread):
     """Thread for performing namespace operations asynchronously"""
@@ -210,64 +204,17 @@ class NamespacesPage(BaseResourcePage):
         
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
-    def populate_resource_row(self, row, resource):
-        self.table.setRowHeight(row, 40)
-        resource_name = resource["name"]
-
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-
-        raw_data = resource.get("raw_data", {})
-        labels = raw_data.get("metadata", {}).get("labels", {})
-        labels_str = ", ".join([f"{k}={v}" for k, v in labels.items()]) if labels else "<none>"
-        status = raw_data.get("status", {}).get("phase", "Unknown")
-
-        columns = [resource["name"], labels_str, resource["age"]]
-
-        for col, value in enumerate(columns):
-            cell_col = col + 1
-
-            if col == 2:
-                try:
-                    num = int(value.replace('d', '').replace('h', '').replace('m', ''))
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            else:
-                item = SortableTableWidgetItem(value)
-
-            if col == 0:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setForeground(QColor(AppColors.TEXT_TABLE))
-            self.table.setItem(row, cell_col, item)
-
-        status_col = 4
-        if status == "Active":
-            color = AppColors.STATUS_ACTIVE
-        elif status == "Terminating":
-            color = AppColors.STATUS_WARNING
-        else:
-            color = AppColors.STATUS_ERROR
-
-        status_widget = StatusLabel(status, color)
-        status_widget.clicked.connect(lambda: self.table.selectRow(row))
-        self.table.setCellWidget(row, status_col, status_widget)
-
-        # Replace the action button creation section with this:
-        action_button = self._create_action_button(row, resource["name"], "")
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-
-        # Connect the action button to handle the click properly
-        action_button.clicked.connect(lambda checked, name=resource_name: self._handle_action_button_click(name))
-
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 2, action_container)
+    def get_table_columns(self, headers):
+        """Namespace columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Labels", value=_labels_text, align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.status(value=_phase, color=lambda resource: NAMESPACE_STATUS_COLORS.get(_phase(resource),
+                                                                                              AppColors.STATUS_ERROR)),
+            TableColumn.action(),
+        ]
 
     def refresh_table(self):
         """Refresh the namespaces table using async resource loading"""
@@ -358,11 +305,19 @@ class NamespacesPage(BaseResourcePage):
                         resource_type = resource_type[:-1]
                     parent.detail_manager.show_detail(resource_type, resource_name, namespace)
 
-    def _handle_action_button_click(self, resource_name):
-        """Handle action button click to show context menu with edit and delete options"""
+    def _create_action_menu(self, row):
+        """Create the Edit / Delete menu for a namespace row"""
         from PyQt6.QtWidgets import QMenu
 
         menu = QMenu(self)
+        menu.setStyleSheet(AppStyles.MENU_STYLE)
+        menu.aboutToShow.connect(lambda: self._on_menu_show(row))
+        menu.aboutToHide.connect(lambda: self._highlight_active_row(row, False))
+
+        resource = self.get_resource_at(row)
+        if resource is None:
+            return menu
+        resource_name = resource["name"]
 
         # Add edit action
         edit_action = menu.addAction("Edit")
@@ -375,8 +330,7 @@ class NamespacesPage(BaseResourcePage):
         delete_action = menu.addAction("Delete")
         delete_action.triggered.connect(lambda: self._delete_namespace(resource_name))
 
-        # Show menu at cursor position
-        menu.exec(self.cursor().pos())
+        return menu
 
     def _delete_namespace(self, namespace_name):
         """Delete a specific namespace using Kubernetes API"""
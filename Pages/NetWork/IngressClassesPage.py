@@ -1,12 +1,22 @@
 from PyQt6.QtWidgets import (
     QHeaderView, QPushButton, QLabel, QVBoxLayout, QWidget, QHBoxLayout
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppStyles
+from Utils.column_extractors import raw_getter
+
+_controller = raw_getter('spec.controller')
+_api_version = raw_getter('apiVersion')
+_kind = raw_getter('kind')
+
+
+def _api_group(resource):
+    api_version = _api_version(resource) or "networking.k8s.io/v1"
+    return api_version.split("/")[0] if "/" in api_version else "core"
+
 
 class IngressClassesPage(BaseResourcePage):
     """
@@ -78,90 +88,19 @@ class IngressClassesPage(BaseResourcePage):
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
 
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with IngressClass data extracted from raw_data
-        """
-        # Set row height once
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Extract data from raw_data
-        raw_data = resource.get("raw_data", {})
-        spec = raw_data.get("spec", {})
-        metadata = raw_data.get("metadata", {})
-        
-        # Get controller
-        controller = spec.get("controller", "<none>")
-        
-        # Get API group from apiVersion
-        api_version = raw_data.get("apiVersion", "networking.k8s.io/v1")
-        if "/" in api_version:
-            api_group = api_version.split("/")[0]
-        else:
-            api_group = "core"
-        
-        # Get scope (IngressClasses are always Cluster scoped)
-        scope = "Cluster"
-        
-        # Get kind
-        kind = raw_data.get("kind", "IngressClass")
-        
-        # Prepare data columns - MATCH ORIGINAL HEADERS
-        columns = [
-            resource["name"],      # Name
-            controller,            # Controller  
-            api_group,            # API Group
-            scope,                # Scope
-            kind,                 # Kind
-            resource["age"]       # Age
+    def get_table_columns(self, headers):
+        """IngressClass columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Controller", value=lambda resource: _controller(resource) or "<none>", align=ALIGN_CENTER),
+            TableColumn("API Group", value=_api_group, align=ALIGN_CENTER),
+            # IngressClasses are always cluster scoped
+            TableColumn("Scope", value=lambda resource: "Cluster", align=ALIGN_CENTER),
+            TableColumn("Kind", value=lambda resource: _kind(resource) or "IngressClass", align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col == 5:  # Age column
-                try:
-                    # Extract numeric part from age string
-                    if 'd' in value:
-                        num = int(value.replace('d', ''))
-                    elif 'h' in value:
-                        num = int(value.replace('h', '')) / 24  # Convert to fraction of day
-                    elif 'm' in value:
-                        num = int(value.replace('m', '')) / (24 * 60)  # Convert to fraction of day
-                    else:
-                        num = 0
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col == 0:  # Name column
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Add item to table
-            self.table.setItem(row, cell_col, item)
-        
-        # Create and add action button
-        action_button = self._create_action_button(row, resource["name"], resource.get("namespace", ""))
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 1, action_container)
 
     def handle_row_click(self, row, column):
         if column != self.table.columnCount() - 1:  # Skip action column
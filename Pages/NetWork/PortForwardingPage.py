@@ -3,53 +3,37 @@ Updated PortForwardingPage with real port forwarding data integration
 Replaces the mock implementation with actual port forward management
 """
 
-from PyQt6.QtWidgets import (QHeaderView, QPushButton, QLabel, QVBoxLayout, 
-                            QWidget, QHBoxLayout, QMessageBox, QMenu)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QColor, QIcon
-from PyQt6.QtCore import QSize
+from PyQt6.QtWidgets import QHeaderView, QPushButton, QMessageBox, QMenu
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QIcon
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppColors, AppStyles
 from Utils.port_forward_manager import get_port_forward_manager, PortForwardConfig
 from Utils.port_forward_dialog import PortForwardDialog, ActivePortForwardsDialog
+from Utils.sort_keys import DURATION
 from functools import partial
 import time
 import logging
-from UI.Icons import resource_path
 
 
-class StatusLabel(QWidget):
-    """Widget that displays a status with consistent styling and background handling."""
-    clicked = pyqtSignal()
-    
-    def __init__(self, status_text, color=None, parent=None):
-        super().__init__(parent)
-        
-        # Create layout
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Create label
-        self.label = QLabel(status_text)
-        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Set color if provided, otherwise use default color
-        if color:
-            self.label.setStyleSheet(f"color: {QColor(color).name()}; background-color: transparent;")
-        
-        # Add label to layout
-        layout.addWidget(self.label)
-        
-        # Make sure this widget has a transparent background
-        self.setStyleSheet("background-color: transparent;")
-    
-    def mousePressEvent(self, event):
-        """Emit clicked signal when widget is clicked"""
-        self.clicked.emit()
-        super().mousePressEvent(event)
+PORT_FORWARD_STATUS_COLORS = {
+    'Active': AppColors.STATUS_ACTIVE,
+    'Inactive': AppColors.STATUS_DISCONNECTED,
+    'Starting': AppColors.STATUS_WARNING,
+    'Error': AppColors.STATUS_ERROR
+}
+
+
+def _uptime_text(resource):
+    if resource.get('status') != 'active':
+        return "N/A"
+    if not resource.get('created_at'):
+        return "Unknown"
+    uptime_seconds = time.time() - resource['created_at']
+    return f"{int(uptime_seconds // 3600)}h {int((uptime_seconds % 3600) // 60)}m"
+
 
 class PortForwardingPage(BaseResourcePage):
     """
@@ -220,119 +204,31 @@ class PortForwardingPage(BaseResourcePage):
         
         self.is_loading = False
 
-    def populate_resource_row(self, row, resource):
-        """Populate a single row with port forward data"""
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Calculate uptime
-        uptime_text = "Unknown"
-        if resource.get('created_at') and resource.get('status') == 'active':
-            uptime_seconds = time.time() - resource['created_at']
-            hours = int(uptime_seconds // 3600)
-            minutes = int((uptime_seconds % 3600) // 60)
-            uptime_text = f"{hours}h {minutes}m"
-        elif resource.get('status') != 'active':
-            uptime_text = "N/A"
-        
-        columns = [
-            resource["resource_name"],
-            resource["namespace"],
-            resource["resource_type"].upper(),
-            str(resource["local_port"]),
-            str(resource["target_port"]),
-            resource["protocol"]
-            # Status is now handled separately using StatusLabel widget
+    def get_table_columns(self, headers):
+        """Port forward columns - rows are the port forward manager's configs, not API objects"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Resource", key="resource_name"),
+            TableColumn("Namespace"),
+            TableColumn("Type", value=lambda resource: resource["resource_type"].upper(), align=ALIGN_CENTER),
+            TableColumn.numeric("Local Port", key="local_port"),
+            TableColumn.numeric("Target Port", key="target_port"),
+            TableColumn("Protocol", align=ALIGN_CENTER),
+            TableColumn("Uptime", value=_uptime_text, sort_as=DURATION, cached=False, align=ALIGN_CENTER),
+            TableColumn.status(value=lambda resource: resource["status"].title(),
+                               color=lambda resource: PORT_FORWARD_STATUS_COLORS.get(resource["status"].title())),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table - similar to ServicesPage style
-        for col, value in enumerate(columns):
-            cell_col = col + 1
-            
-            # Create sortable items for numeric columns
-            if col in [3, 4]:  # Local port, target port
-                try:
-                    num_value = int(value)
-                    item = SortableTableWidgetItem(value, num_value)
-                except ValueError:
-                    item = SortableTableWidgetItem(value)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set alignment
-            if col in [2, 3, 4, 5]:  # Type, ports, protocol
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Set default text color for all non-status columns
-            item.setForeground(QColor(AppColors.TEXT_TABLE))
-            
-            # Add the item to the table
-            self.table.setItem(row, cell_col, item)
-        
-        # Uptime column
-        uptime_item = SortableTableWidgetItem(uptime_text)
-        uptime_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        uptime_item.setFlags(uptime_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        uptime_item.setForeground(QColor(AppColors.TEXT_TABLE))
-        self.table.setItem(row, 7, uptime_item)
-        
-        # Status column with color coding
-        status_col = 8
-        status_text = resource["status"].title()
-        
-        # Map status to colors
-        status_colors = {
-            'Active': AppColors.STATUS_ACTIVE,
-            'Inactive': AppColors.STATUS_DISCONNECTED,
-            'Starting': AppColors.STATUS_WARNING,
-            'Error': AppColors.STATUS_ERROR
-        }
-        color = status_colors.get(status_text, AppColors.TEXT_TABLE)
-        
-        # Create status widget with proper color
-        status_widget = StatusLabel(status_text, color)
-        # Connect click event to select the row
-        status_widget.clicked.connect(lambda: self.table.selectRow(row))
-        self.table.setCellWidget(row, status_col, status_widget)
-        
-        # Action button
-        action_button = self._create_action_button(row, resource["resource_name"], resource["namespace"])
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, 9, action_container)
-
-    def _create_action_button(self, row, resource_name=None, resource_namespace=None):
-        """Create action button with port forward specific actions"""
-        from PyQt6.QtWidgets import QToolButton
-        
-        button = QToolButton()
-        icon = resource_path("Icons/Moreaction_Button.svg")
-        button.setIcon(QIcon(icon))
-        button.setIconSize(QSize(16, 16))
-        button.setText("")
-        button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
-        button.setFixedWidth(30)
-        button.setStyleSheet(AppStyles.HOME_ACTION_BUTTON_STYLE)
-        button.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
-        button.setCursor(Qt.CursorShape.PointingHandCursor)
-
-        # Create menu
-        menu = QMenu(button)
+
+    def _create_action_menu(self, row):
+        """Create the menu of port forward specific actions for a row"""
+        menu = QMenu(self)
         menu.setStyleSheet(AppStyles.MENU_STYLE)
+        menu.aboutToShow.connect(lambda: self._on_menu_show(row))
+        menu.aboutToHide.connect(lambda: self._highlight_active_row(row, False))
 
         # Get port forward config
-        resource = self.resources[row] if row < len(self.resources) else None
+        resource = self.get_resource_at(row)
         
         actions = []
         
@@ -358,15 +254,14 @@ class PortForwardingPage(BaseResourcePage):
                 partial(self._handle_action, action_info["text"], row)
             )
 
-        button.setMenu(menu)
-        return button
+        return menu
 
     def _handle_action(self, action, row):
         """Handle action button clicks for port forwards"""
-        if row >= len(self.resources):
+        resource = self.get_resource_at(row)
+        if resource is None:
             return
 
-        resource = self.resources[row]
         port_forward_key = resource.get("key", "")
 
         if action == "Open in Browser":
@@ -3,43 +3,58 @@ Enhanced ServicesPage with integrated port forwarding functionality
 """
 
 import logging
-from PyQt6.QtWidgets import (QHeaderView, QPushButton, QLabel, QVBoxLayout, 
-                            QWidget, QHBoxLayout, QMessageBox)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QHeaderView, QPushButton, QMessageBox
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppColors, AppStyles
+from Utils.column_extractors import raw_getter
 from kubernetes import client
 from kubernetes.client.rest import ApiException
 from Utils.port_forward_manager import get_port_forward_manager, PortForwardConfig
 from Utils.port_forward_dialog import PortForwardDialog, ActivePortForwardsDialog
 from UI.Icons import resource_path
 
-class StatusLabel(QWidget):
-    """Widget that displays a status with consistent styling and background handling."""
-    clicked = pyqtSignal()
-    
-    def __init__(self, status_text, color=None, parent=None):
-        super().__init__(parent)
-        
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        self.label = QLabel(status_text)
-        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        if color:
-            self.label.setStyleSheet(f"color: {QColor(color).name()}; background-color: transparent;")
-        
-        layout.addWidget(self.label)
-        self.setStyleSheet("background-color: transparent;")
-    
-    def mousePressEvent(self, event):
-        self.clicked.emit()
-        super().mousePressEvent(event)
+SERVICE_STATUS_COLORS = {
+    "Active": AppColors.STATUS_ACTIVE,
+    "Warning": AppColors.STATUS_WARNING,
+    "Error": AppColors.STATUS_ERROR,
+    "Pending": AppColors.STATUS_PENDING,
+}
+
+_service_type = raw_getter('spec.type')
+_cluster_ip = raw_getter('spec.clusterIP')
+_ports = raw_getter('spec.ports')
+_external_ips = raw_getter('spec.externalIPs')
+_lb_ingress = raw_getter('status.loadBalancer.ingress')
+_selector = raw_getter('spec.selector')
+
+
+def _ports_text(resource):
+    port_strs = []
+    for port in _ports(resource) or []:
+        port_str = f"{port.get('port')}/{port.get('protocol', 'TCP')}"
+        if 'targetPort' in port:
+            port_str += f"→{port.get('targetPort')}"
+        port_strs.append(port_str)
+    return ", ".join(port_strs) if port_strs else "<none>"
+
+
+def _external_ips_text(resource):
+    external_ips = list(_external_ips(resource) or [])
+    for lb in _lb_ingress(resource) or []:
+        if "ip" in lb:
+            external_ips.append(lb["ip"])
+        elif "hostname" in lb:
+            external_ips.append(lb["hostname"])
+    return ", ".join(external_ips) if external_ips else "<none>"
+
+
+def _selector_text(resource):
+    selector = _selector(resource)
+    return ", ".join(f"{k}={v}" for k, v in selector.items()) if selector else "<none>"
+
 
 class ServicesPage(BaseResourcePage):
     """
@@ -141,98 +156,22 @@ class ServicesPage(BaseResourcePage):
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
     
-    def populate_resource_row(self, row, resource):
-        """Populate a single row with Service data including status"""
-        self.table.setRowHeight(row, 40)
-        
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        spec = resource.get("raw_data", {}).get("spec", {})
-        service_type = spec.get("type", "ClusterIP")
-        cluster_ip = spec.get("clusterIP", "<none>")
-        
-        ports = spec.get("ports", [])
-        port_strs = []
-        for port in ports:
-            port_str = f"{port.get('port')}/{port.get('protocol', 'TCP')}"
-            if 'targetPort' in port:
-                port_str += f"→{port.get('targetPort')}"
-            port_strs.append(port_str)
-        port_text = ", ".join(port_strs) if port_strs else "<none>"
-        
-        external_ips = spec.get("externalIPs", [])
-        lb_status = resource.get("raw_data", {}).get("status", {}).get("loadBalancer", {}).get("ingress", [])
-        for lb in lb_status:
-            if "ip" in lb:
-                external_ips.append(lb["ip"])
-            elif "hostname" in lb:
-                external_ips.append(lb["hostname"])
-        external_ip_text = ", ".join(external_ips) if external_ips else "<none>"
-        
-        selector = spec.get("selector", {})
-        selector_text = ", ".join([f"{k}={v}" for k, v in selector.items()]) if selector else "<none>"
-        
-        status = self.determine_service_status(resource)
-        
-        columns = [
-            resource["name"],
-            resource["namespace"],
-            service_type,
-            cluster_ip,
-            port_text,
-            external_ip_text,
-            selector_text,
-            resource["age"]
+    def get_table_columns(self, headers):
+        """Service columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Namespace", align=ALIGN_CENTER),
+            TableColumn("Type", value=lambda resource: _service_type(resource) or "ClusterIP", align=ALIGN_CENTER),
+            TableColumn("Cluster IP", value=lambda resource: _cluster_ip(resource) or "<none>", align=ALIGN_CENTER),
+            TableColumn("Port", value=_ports_text, align=ALIGN_CENTER),
+            TableColumn("External IP", value=_external_ips_text, align=ALIGN_CENTER),
+            TableColumn("Selector", value=_selector_text, align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.status(value=self.determine_service_status,
+                               color=lambda resource: SERVICE_STATUS_COLORS.get(self.determine_service_status(resource))),
+            TableColumn.action(),
         ]
-        
-        for col, value in enumerate(columns):
-            cell_col = col + 1
-            if col == 7:
-                try:
-                    num = int(value.replace('d', '').replace('h', ''))
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            if col in [1, 2, 3, 4, 5, 6, 7]:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            item.setForeground(QColor(AppColors.TEXT_TABLE))
-            self.table.setItem(row, cell_col, item)
-        
-        status_col = 9
-        status_text = status
-        
-        if status_text == "Active":
-            color = AppColors.STATUS_ACTIVE
-        elif status_text == "Warning":
-            color = AppColors.STATUS_WARNING
-        elif status_text == "Error":
-            color = AppColors.STATUS_ERROR
-        elif status_text == "Pending":
-            color = AppColors.STATUS_PENDING
-        else:
-            color = AppColors.TEXT_TABLE
-        
-        status_widget = StatusLabel(status_text, color)
-        status_widget.clicked.connect(lambda: self.table.selectRow(row))
-        self.table.setCellWidget(row, status_col, status_widget)
-        
-        action_button = self._create_action_button(row, resource["name"], resource["namespace"])
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 2, action_container)
-
-    # Removed duplicate _create_action_button - now uses base class implementation
 
     def _get_service_ports(self, service_resource):
         """Extract ports from service resource"""
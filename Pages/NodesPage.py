@@ -12,9 +12,10 @@ from PyQt6.QtCore import Qt, QTimer, QRect, QRectF, pyqtSignal, QSize
 from PyQt6.QtGui import QColor, QIcon, QPainter, QPen, QLinearGradient, QPainterPath, QBrush, QCursor
 
 from UI.Styles import AppStyles, AppColors, AppConstants
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from Utils.cluster_connector import get_cluster_connector
+from Utils.sort_keys import VERSION
 from UI.Icons import resource_path
 import random
 import datetime
@@ -22,6 +23,10 @@ import re
 import logging
 import time
 
+def _status_color(resource):
+    return AppColors.STATUS_ACTIVE if resource.get("status", "Unknown").lower() == "ready" else AppColors.STATUS_DISCONNECTED
+
+
 #------------------------------------------------------------------
 # Custom Style to hide checkbox in header
 #------------------------------------------------------------------
@@ -39,36 +44,6 @@ class CustomHeaderStyle(QProxyStyle):
                 return
         super().drawControl(element, option, painter, widget)
 
-#------------------------------------------------------------------
-# StatusLabel - Same implementation as in PodsPage
-#------------------------------------------------------------------
-class StatusLabel(QWidget):
-    """Widget that displays a status with consistent styling and background handling."""
-    clicked = pyqtSignal()
-    
-    def __init__(self, status_text, color=None, parent=None):
-        super().__init__(parent)
-        
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        self.label = QLabel(status_text)
-        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        if color:
-            self.label.setStyleSheet(f"color: {QColor(color).name()}; background-color: transparent;")
-        
-        layout.addWidget(self.label)
-        self.setStyleSheet("background-color: transparent;")
-    
-    def mousePressEvent(self, event):
-        self.clicked.emit()
-        super().mousePressEvent(event)
-
-#------------------------------------------------------------------
-# Optimized GraphWidget
-#------------------------------------------------------------------
 class GraphWidget(QFrame):
     """Optimized widget for displaying resource utilization graphs"""
     def __init__(self, title, unit, color, parent=None):
@@ -413,6 +388,9 @@ class NodesPage(BaseResourcePage):
         self.mem_graph.generate_utilization_data(nodes_data)
         self.disk_graph.generate_utilization_data(nodes_data)
         
+        # Usage cells read the graphs' utilization when painted
+        self.table.refresh()
+        
         # Clear and populate table
         # self.table.setRowCount(0)
         # self.populate_table(nodes_data)
@@ -420,173 +398,51 @@ class NodesPage(BaseResourcePage):
         
         self.items_count.setText(f"{len(nodes_data)} items")
 
-    def populate_resource_row(self, row, resource):
-        """Populate a single row with Node data"""
-        self.table.setRowHeight(row, 40)
-        
-        node_name = resource.get("name", "unknown")
-        
-        # Create checkbox container (visible)
-        checkbox_container = self._create_checkbox_container(row, node_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Get utilization data
-        cpu_util = self.cpu_graph.get_node_utilization(node_name)
-        cpu_capacity = resource.get("cpu_capacity", "")
-        display_cpu = f"{cpu_capacity} ({cpu_util:.1f}%)" if cpu_capacity else f"{cpu_util:.1f}%"
-        
-        mem_util = self.mem_graph.get_node_utilization(node_name)
-        mem_capacity = resource.get("memory_capacity", "")
-        display_mem = f"{mem_capacity} ({mem_util:.1f}%)" if mem_capacity else f"{mem_util:.1f}%"
-        
-        disk_util = self.disk_graph.get_node_utilization(node_name)
-        disk_capacity = resource.get("disk_capacity", "")
-        display_disk = f"{disk_capacity} ({disk_util:.1f}%)" if disk_capacity else f"{disk_util:.1f}%"
-        
-        taints = resource.get("taints", "0")
-        
-        roles = resource.get("roles", [])
-        if isinstance(roles, list):
-            roles_text = ", ".join(roles)
-        else:
-            roles_text = str(roles)
-            
-        version = resource.get("version", "Unknown")
-        age = resource.get("age", "Unknown")
-        status = resource.get("status", "Unknown")
-        
-        # Store raw data for potential use
-        if "raw_data" not in resource:
-            resource["raw_data"] = {
-                "metadata": {"name": node_name},
-                "status": {"conditions": [{"type": status, "status": "True"}]}
-            }
-        
-        # Prepare data columns
-        columns = [
-            node_name,
-            display_cpu,
-            display_mem,
-            display_disk,
-            str(taints),
-            roles_text,
-            version,
-            age
+    def get_table_columns(self, headers):
+        """Node columns - usage comes from the graphs' utilization data"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            self._usage_column("CPU", "cpu_capacity", lambda: self.cpu_graph),
+            self._usage_column("Memory", "memory_capacity", lambda: self.mem_graph),
+            self._usage_column("Disk", "disk_capacity", lambda: self.disk_graph),
+            TableColumn.numeric("Taints"),
+            TableColumn("Roles", align=ALIGN_CENTER),
+            TableColumn("Version", value=lambda resource: resource.get("version", "Unknown"), sort_as=VERSION,
+                        align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.status("Conditions", key="status",
+                               value=lambda resource: resource.get("status", "Unknown"),
+                               color=_status_color),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1
-            
-            # Handle numeric columns for sorting
-            if col == 1:  # CPU column
-                sort_value = cpu_util
-                item = SortableTableWidgetItem(value, sort_value)
-            elif col == 2:  # Memory column
-                sort_value = mem_util
-                item = SortableTableWidgetItem(value, sort_value)
-            elif col == 3:  # Disk column
-                sort_value = disk_util
-                item = SortableTableWidgetItem(value, sort_value)
-            elif col == 4:  # Taints column
-                try:
-                    sort_value = int(taints)
-                except ValueError:
-                    sort_value = 0
-                item = SortableTableWidgetItem(value, sort_value)
-            elif col == 7:  # Age column
-                try:
-                    if 'd' in value:
-                        age_value = int(value.replace('d', '')) * 1440
-                    elif 'h' in value:
-                        age_value = int(value.replace('h', '')) * 60
-                    elif 'm' in value:
-                        age_value = int(value.replace('m', ''))
-                    else:
-                        age_value = 0
-                except ValueError:
-                    age_value = 0
-                item = SortableTableWidgetItem(value, age_value)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col in [1, 2, 3, 4, 5, 6, 7]:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, cell_col, item)
-        
-        # Add Status column as a widget
-        status_col = len(columns) + 1
-        
-        if status.lower() == "ready":
-            color = AppColors.STATUS_ACTIVE
-        else:
-            color = AppColors.STATUS_DISCONNECTED
-            
-        status_widget = StatusLabel(status, color)
-        status_widget.clicked.connect(lambda: self.table.selectRow(row))
-        self.table.setCellWidget(row, status_col, status_widget)
-        
-        # Create and add action button with proper styling
-        action_button = self._create_node_action_button(row, node_name)
-        action_button.setStyleSheet(AppStyles.HOME_ACTION_BUTTON_STYLE +
-    """
-    QToolButton::menu-indicator { image: none; width: 0px; }
-    """)
-        
-        # Create action container with proper styling
-        action_container = QWidget()
-        action_container.setFixedWidth(AppConstants.SIZES["ACTION_WIDTH"])
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        action_layout = QHBoxLayout(action_container)
-        action_layout.setContentsMargins(0, 0, 0, 0)
-        action_layout.setSpacing(0)
-        action_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        action_layout.addWidget(action_button)
-        
-        self.table.setCellWidget(row, status_col + 1, action_container)
-    
-    def _highlight_active_row(self, row, is_active):
-        """Highlight the row when its menu is active"""
-        for col in range(self.table.columnCount()):
-            item = self.table.item(row, col)
-            if item:
-                if is_active:
-                    item.setBackground(QColor(AppColors.ACCENT_BLUE + "22"))  # 13% opacity
-                else:
-                    item.setBackground(QColor("transparent"))
 
-    def _create_node_action_button(self, row, node_name):
-        """Create an action button with node-specific options"""
-        button = QToolButton()
+    @staticmethod
+    def _usage_column(header, capacity_key, graph):
+        """Capacity and utilization column, sorted by utilization"""
+        def utilization(resource):
+            return graph().get_node_utilization(resource.get("name", "unknown"))
 
-        # Use custom SVG icon instead of text
-        icon = resource_path("Icons/Moreaction_Button.svg")
-        button.setIcon(QIcon(icon))
-        button.setIconSize(QSize(AppConstants.SIZES["ICON_SIZE"], AppConstants.SIZES["ICON_SIZE"]))
+        def text(resource):
+            capacity = resource.get(capacity_key, "")
+            return f"{capacity} ({utilization(resource):.1f}%)" if capacity else f"{utilization(resource):.1f}%"
 
-        # Remove text and change to icon-only style
-        button.setText("")
-        button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
+        return TableColumn(header, value=text, sort_key=utilization, cached=False, align=ALIGN_CENTER)
 
-        button.setFixedWidth(30)
-        button.setStyleSheet(AppStyles.HOME_ACTION_BUTTON_STYLE)
-        button.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
-        button.setCursor(Qt.CursorShape.PointingHandCursor)
-
-        # Create menu
-        menu = QMenu(button)
+    def _create_action_menu(self, row):
+        """Create the menu of node-specific actions for a row"""
+        menu = QMenu(self)
         menu.setStyleSheet(AppStyles.MENU_STYLE)
 
         # Connect signals to change row appearance when menu opens/closes
-        menu.aboutToShow.connect(lambda: self._highlight_active_row(row, True))
+        menu.aboutToShow.connect(lambda: self._on_menu_show(row))
         menu.aboutToHide.connect(lambda: self._highlight_active_row(row, False))
 
+        resource = self.get_resource_at(row)
+        if resource is None:
+            return menu
+        node_name = resource.get("name", "unknown")
+
         # Add actions to menu
         detail_action = menu.addAction("Detail")
         detail_action.setIcon(QIcon(resource_path("icons/edit.png")))
@@ -601,17 +457,13 @@ class NodesPage(BaseResourcePage):
         view_metrics.setIcon(QIcon(resource_path("icons/chart.png")))
         view_metrics.triggered.connect(lambda: self._handle_node_action("View Metrics", row, node_name))
 
-        button.setMenu(menu)
-        self._item_widgets[f"action_button_{row}"] = button
-        return button
+        return menu
     
     def _handle_node_action(self, action, row, node_name):
         """Handle node-specific actions"""
-        if row >= len(self.nodes_data):
+        if self.get_resource_at(row) is None:
             return
         
-        resource = self.nodes_data[row]
-        
         if action == "Detail":
             # Show the detail view for the selected node
             parent = self.parent()
@@ -631,21 +483,12 @@ class NodesPage(BaseResourcePage):
     
     def select_node_for_graphs(self, row):
         """Select a node to show in the graphs"""
-        if row < 0 or row >= len(self.nodes_data):
+        node_data = self.get_resource_at(row) if row >= 0 else None
+        if not node_data:
             return
             
         self.selected_row = row
-        node_name = self.table.item(row, 1).text()
-        node_data = None
-        
-        # Find the node data
-        for node in self.nodes_data:
-            if node.get("name") == node_name:
-                node_data = node
-                break
-                
-        if not node_data:
-            return
+        node_name = node_data.get("name")
             
         self.table.selectRow(row)
         self.cpu_graph.set_selected_node(node_data, node_name)
@@ -2,44 +2,36 @@
 Dynamic implementation of the Persistent Volume Claims page with live Kubernetes data.
 """
 
-from PyQt6.QtWidgets import (QHeaderView, QWidget, QLabel, QHBoxLayout, QPushButton)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QHeaderView, QPushButton
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppStyles, AppColors
+from Utils.column_extractors import raw_getter
+from Utils.sort_keys import QUANTITY
+
+_storage_class_name = raw_getter('spec.storageClassName')
+_capacity_storage = raw_getter('status.capacity.storage')
+_requested_storage = raw_getter('spec.resources.requests.storage')
+_phase_field = raw_getter('status.phase')
+
+
+def _storage_class(resource):
+    return _storage_class_name(resource) or "<none>"
+
+
+def _size(resource):
+    return _capacity_storage(resource) or _requested_storage(resource) or "<none>"
+
+
+def _phase(resource):
+    return _phase_field(resource) or "Unknown"
+
+
+def _phase_color(resource):
+    return AppColors.STATUS_ACTIVE if _phase(resource) == "Bound" else AppColors.STATUS_WARNING
 
-class StatusLabel(QWidget):
-    """Widget that displays a status with consistent styling and background handling."""
-    clicked = pyqtSignal()
-    
-    def __init__(self, status_text, color=None, parent=None):
-        super().__init__(parent)
-        
-        # Create layout
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Create label
-        self.label = QLabel(status_text)
-        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Set color if provided, otherwise use default color
-        if color:
-            self.label.setStyleSheet(f"color: {QColor(color).name()}; background-color: transparent;")
-        
-        # Add label to layout
-        layout.addWidget(self.label)
-        
-        # Make sure this widget has a transparent background
-        self.setStyleSheet("background-color: transparent;")
-    
-    def mousePressEvent(self, event):
-        """Emit clicked signal when widget is clicked"""
-        self.clicked.emit()
-        super().mousePressEvent(event)
 
 class PersistentVolumeClaimsPage(BaseResourcePage):
     """
@@ -105,131 +97,20 @@ class PersistentVolumeClaimsPage(BaseResourcePage):
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
 
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with persistent volume claim data from live Kubernetes resources
-        """
-        # Set row height once
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Extract data from raw_data
-        raw_data = resource.get("raw_data", {})
-        spec = raw_data.get("spec", {})
-        status = raw_data.get("status", {})
-        metadata = raw_data.get("metadata", {})
-        
-        # Get storage class
-        storage_class = spec.get("storageClassName", "<none>")
-        if not storage_class:
-            storage_class = "<none>"
-        
-        # Get size
-        size = "<none>"
-        if status.get("capacity") and status["capacity"].get("storage"):
-            size = status["capacity"]["storage"]
-        elif spec.get("resources") and spec["resources"].get("requests") and spec["resources"]["requests"].get("storage"):
-            size = spec["resources"]["requests"]["storage"]
-        
-        # Get pods using this PVC - show placeholder to avoid blocking API calls
-        # This information would require additional API calls which can block the UI
-        pods = "<none>"
-        
-        # Get status
-        pvc_status = status.get("phase", "Unknown")
-        
-        # Prepare data columns - MATCH ORIGINAL HEADERS
-        columns = [
-            resource["name"],        # Name
-            resource["namespace"],   # Namespace
-            storage_class,          # Storage Class
-            size,                   # Size
-            pods,                   # Pods
-            resource["age"]         # Age
-            # Status is handled separately as StatusLabel widget
+    def get_table_columns(self, headers):
+        """PersistentVolumeClaim columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Namespace", align=ALIGN_CENTER),
+            TableColumn("Storage Class", value=_storage_class, align=ALIGN_CENTER),
+            TableColumn("Size", value=_size, sort_as=QUANTITY, align=ALIGN_CENTER),
+            # Listing the pods that mount a claim needs extra API calls, so the column stays a placeholder
+            TableColumn("Pods", value=lambda resource: "<none>", align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.status(value=_phase, color=_phase_color),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col == 5:  # Age column
-                try:
-                    # Extract numeric part from age string
-                    if 'd' in value:
-                        num = int(value.replace('d', ''))
-                    elif 'h' in value:
-                        num = int(value.replace('h', '')) / 24  # Convert to fraction of day
-                    elif 'm' in value:
-                        num = int(value.replace('m', '')) / (24 * 60)  # Convert to fraction of day
-                    else:
-                        num = 0
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            elif col == 4:  # Pods column - sort by number of pods
-                try:
-                    if value == "<none>":
-                        num = 0
-                    elif "+" in value and "more" in value:
-                        # Extract number from "pod1, pod2 +3 more" format
-                        parts = value.split("+")
-                        if len(parts) > 1:
-                            num = int(parts[1].split()[0]) + 2  # +2 for the two shown pods
-                        else:
-                            num = 1
-                    else:
-                        # Count commas to get number of pods
-                        num = len(value.split(","))
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col == 0:  # Name column
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Set default text color for all non-status columns
-            item.setForeground(QColor(AppColors.TEXT_TABLE))
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Add the item to the table
-            self.table.setItem(row, cell_col, item)
-        
-        # Create status widget with proper color for PVCs (column 7 - Status)
-        status_col = 7  # Status column index
-        status_text = pvc_status
-        
-        # Pick the right color
-        if status_text == "Bound":
-            color = AppColors.STATUS_ACTIVE
-        else:
-            color = AppColors.STATUS_WARNING
-        
-        # Create status widget with proper color
-        status_widget = StatusLabel(status_text, color)
-        # Connect click event to select the row
-        status_widget.clicked.connect(lambda: self.table.selectRow(row))
-        self.table.setCellWidget(row, status_col, status_widget)
-        
-        # Create and add action button
-        action_button = self._create_action_button(row, resource["name"], resource["namespace"])
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 2, action_container)  # +2 for checkbox and status
 
     def handle_row_click(self, row, column):
         if column != self.table.columnCount() - 1:  # Skip action column
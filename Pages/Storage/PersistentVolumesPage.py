@@ -2,44 +2,42 @@
 Dynamic implementation of the Persistent Volumes page with live Kubernetes data.
 """
 
-from PyQt6.QtWidgets import (QHeaderView, QWidget, QLabel, QHBoxLayout)
-from PyQt6.QtCore import Qt,pyqtSignal, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QHeaderView
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppStyles, AppColors
+from Utils.column_extractors import raw_getter
+from Utils.sort_keys import QUANTITY
+
+_storage_class_name = raw_getter('spec.storageClassName')
+_capacity_storage = raw_getter('spec.capacity.storage')
+_claim_ref = raw_getter('spec.claimRef')
+_phase_field = raw_getter('status.phase')
+
+
+def _storage_class(resource):
+    return _storage_class_name(resource) or "<none>"
+
+
+def _capacity(resource):
+    return _capacity_storage(resource) or "<none>"
+
+
+def _claim(resource):
+    claim_ref = _claim_ref(resource) or {}
+    claim = f"{claim_ref.get('namespace', '')}/{claim_ref.get('name', '')}"
+    return "<none>" if claim == "/" else claim
+
+
+def _phase(resource):
+    return _phase_field(resource) or "<none>"
+
+
+def _phase_color(resource):
+    return AppColors.STATUS_ACTIVE if _phase(resource) in ("Bound", "Available") else AppColors.STATUS_WARNING
 
-class StatusLabel(QWidget):
-    """Widget that displays a status with consistent styling and background handling."""
-    clicked = pyqtSignal()
-    
-    def __init__(self, status_text, color=None, parent=None):
-        super().__init__(parent)
-        
-        # Create layout
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Create label
-        self.label = QLabel(status_text)
-        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Set color if provided, otherwise use default color
-        if color:
-            self.label.setStyleSheet(f"color: {QColor(color).name()}; background-color: transparent;")
-        
-        # Add label to layout
-        layout.addWidget(self.label)
-        
-        # Make sure this widget has a transparent background
-        self.setStyleSheet("background-color: transparent;")
-    
-    def mousePressEvent(self, event):
-        """Emit clicked signal when widget is clicked"""
-        self.clicked.emit()
-        super().mousePressEvent(event)
 
 class PersistentVolumesPage(BaseResourcePage):
     """
@@ -104,92 +102,19 @@ class PersistentVolumesPage(BaseResourcePage):
         
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with persistent volume data from live Kubernetes resources
-        """
-        # Set row height once
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Extract data from resource
-        storage_class = resource.get("raw_data", {}).get("spec", {}).get("storageClassName", "<none>")
-        capacity = resource.get("raw_data", {}).get("spec", {}).get("capacity", {}).get("storage", "<none>")
-        
-        # Get claim information
-        claim_ref = resource.get("raw_data", {}).get("spec", {}).get("claimRef", {})
-        claim = f"{claim_ref.get('namespace', '')}/{claim_ref.get('name', '')}" if claim_ref else "<none>"
-        if claim == "/": claim = "<none>"
-        
-        # Get status
-        status = resource.get("raw_data", {}).get("status", {}).get("phase", "<none>")
-        
-        # Prepare data columns
-        columns = [
-            resource["name"],
-            storage_class,
-            capacity,
-            claim,
-            resource["age"]
-            # Status is now handled separately using StatusLabel widget
+    def get_table_columns(self, headers):
+        """PersistentVolume columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Storage Class", value=_storage_class, align=ALIGN_CENTER),
+            TableColumn("Capacity", value=_capacity, sort_as=QUANTITY, align=ALIGN_CENTER),
+            TableColumn("Claim", value=_claim, align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.status(value=_phase, color=_phase_color),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col == 4:  # Age column
-                try:
-                    num = int(value.replace('d', ''))
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col == 0:  # Name column
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Set default text color for all non-status columns
-            item.setForeground(QColor(AppColors.TEXT_TABLE))
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Add the item to the table
-            self.table.setItem(row, cell_col, item)
-        
-        # Create status widget with proper color for PVs
-        status_col = 6  # Status column index
-        status_text = status
-        
-        # Pick the right color
-        if status_text in ["Bound", "Available"]:
-            color = AppColors.STATUS_ACTIVE
-        else:
-            color = AppColors.STATUS_WARNING
-        
-        # Create status widget with proper color
-        status_widget = StatusLabel(status_text, color)
-        # Connect click event to select the row
-        status_widget.clicked.connect(lambda: self.table.selectRow(row))
-        self.table.setCellWidget(row, status_col, status_widget)
-        
-        # Create and add action button
-        action_button = self._create_action_button(row, resource["name"], resource.get("namespace", ""))
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 2, action_container)  # +2 for checkbox and status
+
     # def handle_row_click(self, row, column):
     #     """Handle row selection when a table cell is clicked"""
     #     if column != self.table.columnCount() - 1:  # Skip action column
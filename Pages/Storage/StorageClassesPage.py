@@ -3,12 +3,34 @@ Dynamic implementation of the Storage Classes page with live Kubernetes data.
 """
 
 from PyQt6.QtWidgets import (QHeaderView, QWidget, QLabel)
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppStyles, AppColors
+from Utils.column_extractors import raw_getter
+
+_provisioner_field = raw_getter('provisioner')
+_reclaim_policy_field = raw_getter('reclaimPolicy')
+_annotations = raw_getter('metadata.annotations')
+
+
+def _provisioner(resource):
+    return _provisioner_field(resource) or "<none>"
+
+
+def _reclaim_policy(resource):
+    return _reclaim_policy_field(resource) or "<none>"
+
+
+def _default_text(resource):
+    annotations = _annotations(resource) or {}
+    return "Yes" if annotations.get("storageclass.kubernetes.io/is-default-class") == "true" else "No"
+
+
+def _default_color(resource):
+    return AppColors.STATUS_ACTIVE if _default_text(resource) == "Yes" else None
+
 
 class StorageClassesPage(BaseResourcePage):
     """
@@ -73,77 +95,18 @@ class StorageClassesPage(BaseResourcePage):
         
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with storage class data from live Kubernetes resources
-        """
-        # Set row height once
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Extract data from resource
-        raw_data = resource.get("raw_data", {})
-        provisioner = raw_data.get("provisioner", "<none>")
-        reclaim_policy = raw_data.get("reclaimPolicy", "<none>")
-        
-        # Check if it's the default storage class
-        annotations = raw_data.get("metadata", {}).get("annotations", {})
-        is_default = "Yes" if annotations.get("storageclass.kubernetes.io/is-default-class") == "true" else "No"
-        
-        # Prepare data columns
-        columns = [
-            resource["name"],
-            provisioner,
-            reclaim_policy,
-            is_default,
-            resource["age"]
+    def get_table_columns(self, headers):
+        """StorageClass columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Provisioner", value=_provisioner, align=ALIGN_CENTER),
+            TableColumn("Reclaim Policy", value=_reclaim_policy, align=ALIGN_CENTER),
+            TableColumn("Default", value=_default_text, color=_default_color, align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col == 4:  # Age column
-                try:
-                    num = int(value.replace('d', ''))
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col == 0:  # Name column
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Set text color 
-            item.setForeground(QColor(AppColors.TEXT_TABLE))
-            
-            # Highlight default storage class
-            if col == 3 and value == "Yes":  # Default column
-                item.setForeground(QColor(AppColors.STATUS_ACTIVE))
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Add the item to the table
-            self.table.setItem(row, cell_col, item)
-        
-        # Create and add action button
-        action_button = self._create_action_button(row, resource["name"], resource.get("namespace", ""))
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 1, action_container)
-    
+
     def handle_row_click(self, row, column):
         if column != self.table.columnCount() - 1:  # Skip action column
             # Select the row
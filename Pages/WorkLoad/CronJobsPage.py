@@ -2,13 +2,66 @@
 Dynamic implementation of the CronJobs page with live Kubernetes data and resource operations.
 """
 
+import time
+
 from PyQt6.QtWidgets import QHeaderView, QPushButton
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppColors, AppStyles
+from Utils.column_extractors import raw_getter
+from Utils.data_formatters import timestamp_to_epoch
+
+_schedule = raw_getter('spec.schedule')
+_suspend = raw_getter('spec.suspend')
+_active = raw_getter('status.active')
+_last_schedule_time = raw_getter('status.lastScheduleTime')
+
+
+def _suspended(resource):
+    return 1 if _suspend(resource) else 0
+
+
+def _suspend_text(resource):
+    return str(bool(_suspend(resource)))
+
+
+def _suspend_color(resource):
+    return AppColors.STATUS_DISCONNECTED if _suspend(resource) else None
+
+
+def _active_count(resource):
+    return len(_active(resource) or [])
+
+
+def _active_color(resource):
+    return AppColors.STATUS_ACTIVE if _active_count(resource) > 0 else None
+
+
+def _last_schedule_minutes(resource):
+    """Minutes since the last run, or None when the CronJob never ran"""
+    epoch = timestamp_to_epoch(_last_schedule_time(resource))
+    if epoch is None:
+        return None
+    return max(0, int(time.time() - epoch) // 60)
+
+
+def _last_schedule_sort(resource):
+    minutes = _last_schedule_minutes(resource)
+    return float('inf') if minutes is None else minutes
+
+
+def _last_schedule_text(resource):
+    minutes = _last_schedule_minutes(resource)
+    if minutes is None:
+        return "Never"
+    if minutes >= 1440:
+        return f"{minutes // 1440}d ago"
+    if minutes >= 60:
+        return f"{minutes // 60}h ago"
+    return f"{minutes}m ago"
+
 
 class CronJobsPage(BaseResourcePage):
     """
@@ -80,163 +133,21 @@ class CronJobsPage(BaseResourcePage):
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
 
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with CronJob data
-        """
-        # Set row height
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Extract additional data from the raw_data field if available
-        raw_data = resource.get("raw_data", {})
-        
-        # Get CronJob details
-        schedule = ""
-        suspend = "False"
-        active = "0"
-        last_schedule = "Never"
-        
-        if raw_data:
-            spec = raw_data.get("spec", {})
-            status = raw_data.get("status", {})
-            
-            # Get schedule
-            schedule = spec.get("schedule", "")
-            
-            # Get suspend status
-            suspend = str(spec.get("suspend", False))
-            
-            # Get active jobs count
-            active_list = status.get("active", [])
-            active = str(len(active_list))
-            
-            # Get last schedule time
-            last_schedule_time = status.get("lastScheduleTime", "")
-            if last_schedule_time:
-                # Format the time relative to now
-                import datetime
-                from dateutil import parser
-                try:
-                    # Parse ISO format timestamp
-                    last_time = parser.parse(last_schedule_time)
-                    now = datetime.datetime.now(datetime.timezone.utc)
-                    diff = now - last_time
-                    
-                    # Format as human-readable
-                    days = diff.days
-                    hours = diff.seconds // 3600
-                    minutes = (diff.seconds % 3600) // 60
-                    
-                    if days > 0:
-                        last_schedule = f"{days}d ago"
-                    elif hours > 0:
-                        last_schedule = f"{hours}h ago"
-                    else:
-                        last_schedule = f"{minutes}m ago"
-                except Exception:
-                    last_schedule = "Error"
-            
-        # Prepare data columns
-        columns = [
-            resource["name"],
-            resource["namespace"],
-            schedule,
-            suspend,
-            active,
-            last_schedule,
-            resource["age"]
+    def get_table_columns(self, headers):
+        """CronJob columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Namespace", align=ALIGN_CENTER),
+            TableColumn("Schedule", value=_schedule, align=ALIGN_CENTER),
+            TableColumn("Suspend", value=_suspend_text, sort_key=_suspended, color=_suspend_color, align=ALIGN_CENTER),
+            TableColumn("Active", value=_active_count, sort_key=_active_count, color=_active_color, align=ALIGN_CENTER),
+            TableColumn("Last Schedule", value=_last_schedule_text, sort_key=_last_schedule_sort,
+                        cached=False, align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col == 3:  # Suspend column (boolean as string)
-                num = 1 if value.lower() == "true" else 0
-                item = SortableTableWidgetItem(value, num)
-            elif col == 4:  # Active column (numeric)
-                try:
-                    num = int(value)
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            elif col == 5:  # Last Schedule column
-                # Sort by time ago (rough approximation)
-                try:
-                    if value == "Never":
-                        num = 99999  # Put at end of sort
-                    elif "d ago" in value:
-                        num = int(value.replace("d ago", "")) * 1440  # days to minutes
-                    elif "h ago" in value:
-                        num = int(value.replace("h ago", "")) * 60  # hours to minutes
-                    elif "m ago" in value:
-                        num = int(value.replace("m ago", ""))  # minutes
-                    else:
-                        num = 0
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            elif col == 6:  # Age column
-                try:
-                    # Convert age string to minutes for sorting
-                    if 'd' in value:
-                        age_value = int(value.replace('d', '')) * 1440  # days to minutes
-                    elif 'h' in value:
-                        age_value = int(value.replace('h', '')) * 60  # hours to minutes
-                    elif 'm' in value:
-                        age_value = int(value.replace('m', ''))  # minutes
-                    else:
-                        age_value = 0
-                except ValueError:
-                    age_value = 0
-                item = SortableTableWidgetItem(value, age_value)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col in [1, 2, 3, 4, 5, 6]:  # Suspend, Active, LastSchedule, Age
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Set special colors for Suspend column
-            if col == 3:  # Suspend column
-                if value.lower() == "true":
-                    item.setForeground(QColor(AppColors.STATUS_DISCONNECTED))  # Red for suspended
-                else:
-                    item.setForeground(QColor(AppColors.TEXT_TABLE))  # Default color
-            # Set special colors for Active column
-            elif col == 4:  # Active column
-                try:
-                    if int(value) > 0:
-                        item.setForeground(QColor(AppColors.STATUS_ACTIVE))  # Green for active jobs
-                    else:
-                        item.setForeground(QColor(AppColors.TEXT_TABLE))  # Default for inactive
-                except ValueError:
-                    item.setForeground(QColor(AppColors.TEXT_TABLE))
-            else:
-                item.setForeground(QColor(AppColors.TEXT_TABLE))
-            
-            # Add the item to the table
-            self.table.setItem(row, cell_col, item)
-        
-        # Create and add action button with only Edit and Delete options
-        action_button = self._create_action_button(row, resource_name, resource["namespace"])
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 1, action_container)
-    
+
     # def handle_row_click(self, row, column):
     #     """Handle row selection when a table cell is clicked"""
     #     if column != self.table.columnCount() - 1:  # Skip action column
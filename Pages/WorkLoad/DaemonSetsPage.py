@@ -3,12 +3,33 @@ Dynamic implementation of the DaemonSets page with live Kubernetes data and reso
 """
 
 from PyQt6.QtWidgets import QHeaderView, QPushButton
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppColors, AppStyles
+from Utils.column_extractors import raw_getter
+
+_current_scheduled = raw_getter('status.currentNumberScheduled')
+_desired_scheduled = raw_getter('status.desiredNumberScheduled')
+_template_node_selector = raw_getter('spec.template.spec.nodeSelector')
+_spec_node_selector = raw_getter('spec.nodeSelector')
+
+
+def _pods_text(resource):
+    return f"{_current_scheduled(resource) or 0}/{_desired_scheduled(resource) or 0}"
+
+
+def _pods_ratio(resource):
+    desired = _desired_scheduled(resource) or 0
+    return (_current_scheduled(resource) or 0) / desired if desired > 0 else 0
+
+
+def _node_selector(resource):
+    # DaemonSets keep nodeSelector in spec.template.spec, older objects in spec
+    selectors = _template_node_selector(resource) or _spec_node_selector(resource)
+    return ", ".join(f"{k}={v}" for k, v in selectors.items()) if selectors else "<none>"
+
 
 class DaemonSetsPage(BaseResourcePage):
     """
@@ -79,139 +100,17 @@ class DaemonSetsPage(BaseResourcePage):
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
 
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with DaemonSet data
-        """
-        # Set row height
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Extract additional data from the raw_data field if available
-        raw_data = resource.get("raw_data", {})
-        
-        # Get pod status
-        pods_str = "0/0"
-        if raw_data:
-            status = raw_data.get("status", {})
-            current_number_scheduled = status.get("currentNumberScheduled", 0)
-            desired_number_scheduled = status.get("desiredNumberScheduled", 0)
-            pods_str = f"{current_number_scheduled}/{desired_number_scheduled}"
-        
-        # Get node selector - fix to correctly extract from template
-        node_selector = "<none>"
-        if raw_data:
-            spec = raw_data.get("spec", {})
-            
-            # DaemonSets have nodeSelector in spec.template.spec
-            template = spec.get("template", {})
-            template_spec = template.get("spec", {})
-            
-            # First try to get from template.spec.nodeSelector
-            selectors = template_spec.get("nodeSelector", {})
-            
-            # If that's empty, try to get from spec.nodeSelector directly (old format)
-            if not selectors:
-                selectors = spec.get("nodeSelector", {})
-                
-            # Format the node selectors as a string
-            if selectors:
-                node_selector = ", ".join([f"{k}={v}" for k, v in selectors.items()])
-        
-        # Parse age correctly from metadata
-        age_str = resource["age"]
-        if raw_data:
-            metadata = raw_data.get("metadata", {})
-            creation_timestamp = metadata.get("creationTimestamp")
-            if creation_timestamp:
-                import datetime
-                from dateutil import parser
-                try:
-                    # Parse creation time and calculate age
-                    creation_time = parser.parse(creation_timestamp)
-                    now = datetime.datetime.now(datetime.timezone.utc)
-                    delta = now - creation_time
-                    
-                    # Format age string
-                    days = delta.days
-                    seconds = delta.seconds
-                    hours = seconds // 3600
-                    minutes = (seconds % 3600) // 60
-                    
-                    if days > 0:
-                        age_str = f"{days}d"
-                    elif hours > 0:
-                        age_str = f"{hours}h"
-                    else:
-                        age_str = f"{minutes}m"
-                except Exception:
-                    # Keep the original age if parsing fails
-                    pass
-                
-        # Prepare data columns
-        columns = [
-            resource["name"],
-            resource["namespace"],
-            pods_str,
-            node_selector,
-            age_str
+    def get_table_columns(self, headers):
+        """DaemonSet columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Namespace", align=ALIGN_CENTER),
+            TableColumn("Pods", value=_pods_text, sort_key=_pods_ratio, align=ALIGN_CENTER),
+            TableColumn("Node Selector", value=_node_selector, align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col == 2:  # Pods column
-                try:
-                    current, desired = value.split("/")
-                    pods_value = float(current) / float(desired) if float(desired) > 0 else 0
-                except (ValueError, ZeroDivisionError):
-                    pods_value = 0
-                item = SortableTableWidgetItem(value, pods_value)
-            elif col == 4:  # Age column
-                try:
-                    # Convert age string (like "5d" or "2h") to minutes for sorting
-                    if 'd' in value:
-                        age_value = int(value.replace('d', '')) * 1440  # days to minutes
-                    elif 'h' in value:
-                        age_value = int(value.replace('h', '')) * 60  # hours to minutes
-                    elif 'm' in value:
-                        age_value = int(value.replace('m', ''))  # minutes
-                    else:
-                        age_value = 0
-                except ValueError:
-                    age_value = 0
-                item = SortableTableWidgetItem(value, age_value)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col in [1, 2, 3, 4]:  # Pods, Age
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Set text color
-            item.setForeground(QColor(AppColors.TEXT_TABLE))
-            
-            # Add the item to the table
-            self.table.setItem(row, cell_col, item)
-        
-        # Create and add action button with only Edit and Delete options
-        action_button = self._create_action_button(row, resource_name, resource["namespace"])
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 1, action_container)
 
     # def handle_row_click(self, row, column):
     #     """Handle row selection when a table cell is clicked"""
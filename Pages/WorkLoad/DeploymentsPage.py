@@ -4,59 +4,44 @@ Dynamic implementation of the Deployments page with live Kubernetes data and res
 Status display shows color-coded status, including multiple status conditions in different colors.
 """
 
-from PyQt6.QtWidgets import QHeaderView, QPushButton, QLabel, QWidget, QHBoxLayout
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QHeaderView
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppColors, AppStyles
+from Utils.column_extractors import raw_getter
 
-class MultiColorStatusLabel(QWidget):
-    """Widget that displays status conditions with different colors in a single label."""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        
-        # Create layout
-        self.layout = QHBoxLayout(self)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.layout.setSpacing(5)  # Space between different status text
-        self.layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Make sure this widget has a transparent background
-        self.setStyleSheet("background-color: transparent;")
-    
-    def set_status_text(self, status_text):
-        """Set status text, parsing multiple statuses if present."""
-        # Clear any existing labels
-        while self.layout.count():
-            item = self.layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # If no status text, show an empty label
-        if not status_text:
-            label = QLabel("<none>")
-            label.setStyleSheet(f"color: {QColor(AppColors.TEXT_TABLE).name()};")
-            self.layout.addWidget(label)
-            return
-            
-        # Parse status text - split by space
-        statuses = status_text.split()
-        
-        for status in statuses:
-            label = QLabel(status)
-            
-            # Set color based on status type
-            if status == "Available":
-                label.setStyleSheet(f"color: {QColor(AppColors.STATUS_ACTIVE).name()};")
-            elif status == "Progressing":
-                label.setStyleSheet(f"color: {QColor(AppColors.STATUS_PROGRESS).name()};")
-            else:
-                label.setStyleSheet(f"color: {QColor(AppColors.TEXT_TABLE).name()};")
-                
-            self.layout.addWidget(label)
+CONDITION_COLORS = {
+    "Available": AppColors.STATUS_ACTIVE,
+    "Progressing": AppColors.STATUS_PROGRESS,
+}
+
+_available_replicas = raw_getter('status.availableReplicas')
+_status_replicas = raw_getter('status.replicas')
+_spec_replicas = raw_getter('spec.replicas')
+_conditions = raw_getter('status.conditions')
+
+
+def _pods_text(resource):
+    return f"{_available_replicas(resource) or 0}/{_status_replicas(resource) or 0}"
+
+
+def _pods_percent(resource):
+    total = _status_replicas(resource) or 0
+    return (_available_replicas(resource) or 0) / total * 100 if total > 0 else 0
+
+
+def _true_conditions(resource):
+    return [c.get("type", "") for c in _conditions(resource) or [] if c.get("status") == "True"]
+
+
+def _condition_segments(resource):
+    """Each true condition in its own color"""
+    conditions = _true_conditions(resource)
+    if not conditions:
+        return [("<none>", AppColors.TEXT_TABLE)]
+    return [(condition, CONDITION_COLORS.get(condition, AppColors.TEXT_TABLE)) for condition in conditions]
 
 class DeploymentsPage(BaseResourcePage):
     """
@@ -127,148 +112,20 @@ class DeploymentsPage(BaseResourcePage):
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
 
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with Deployment data
-        """
-        # Set row height
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Extract additional data from the raw_data field if available
-        raw_data = resource.get("raw_data", {})
-        
-        # Get pod status
-        pods_str = "0/0"
-        if raw_data:
-            status = raw_data.get("status", {})
-            available_replicas = status.get("availableReplicas", 0)
-            replicas = status.get("replicas", 0)
-            pods_str = f"{available_replicas}/{replicas}"
-        
-        # Get replicas count
-        replicas_str = "0"
-        if raw_data:
-            spec = raw_data.get("spec", {})
-            replicas_str = str(spec.get("replicas", 0))
-        
-        # Get conditions
-        conditions_str = ""
-        if raw_data:
-            status = raw_data.get("status", {})
-            conditions = status.get("conditions", [])
-            condition_types = []
-            for condition in conditions:
-                if condition.get("status") == "True":
-                    condition_types.append(condition.get("type", ""))
-            conditions_str = " ".join(condition_types)
-        
-        # Parse age correctly from metadata
-        age_str = resource["age"]
-        if raw_data:
-            metadata = raw_data.get("metadata", {})
-            creation_timestamp = metadata.get("creationTimestamp")
-            if creation_timestamp:
-                import datetime
-                from dateutil import parser
-                try:
-                    # Parse creation time and calculate age
-                    creation_time = parser.parse(creation_timestamp)
-                    now = datetime.datetime.now(datetime.timezone.utc)
-                    delta = now - creation_time
-                    
-                    # Format age string
-                    days = delta.days
-                    seconds = delta.seconds
-                    hours = seconds // 3600
-                    minutes = (seconds % 3600) // 60
-                    
-                    if days > 0:
-                        age_str = f"{days}d"
-                    elif hours > 0:
-                        age_str = f"{hours}h"
-                    else:
-                        age_str = f"{minutes}m"
-                except Exception:
-                    # Keep the original age if parsing fails
-                    pass
-
-        # Prepare data columns - all except Conditions
-        columns = [
-            resource["name"],
-            resource["namespace"],
-            pods_str,
-            replicas_str,
-            age_str
+    def get_table_columns(self, headers):
+        """Deployment columns - Conditions paints each true condition in its own color"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Namespace", align=ALIGN_CENTER),
+            TableColumn("Pods", value=_pods_text, sort_key=_pods_percent, align=ALIGN_CENTER),
+            TableColumn("Replicas", value=lambda r: _spec_replicas(r) or 0,
+                        sort_key=lambda r: _spec_replicas(r) or 0, align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.status("Conditions", value=lambda r: " ".join(_true_conditions(r)),
+                               segments=_condition_segments),
+            TableColumn.action(),
         ]
-        
-        # Add normal columns to table (all except Conditions)
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col == 2:  # Pods column
-                try:
-                    available, total = value.split("/")
-                    # Calculate as percentage for better sorting
-                    pods_value = (float(available) / float(total)) * 100 if float(total) > 0 else 0
-                except (ValueError, IndexError, ZeroDivisionError):
-                    pods_value = 0
-                item = SortableTableWidgetItem(value, pods_value)
-            elif col == 3:  # Replicas column
-                try:
-                    replicas_value = float(value)
-                except ValueError:
-                    replicas_value = 0
-                item = SortableTableWidgetItem(value, replicas_value)
-            elif col == 4:  # Age column
-                try:
-                    # Convert age string (like "5d" or "2h") to minutes for sorting
-                    if 'd' in value:
-                        age_value = int(value.replace('d', '')) * 1440  # days to minutes
-                    elif 'h' in value:
-                        age_value = int(value.replace('h', '')) * 60  # hours to minutes
-                    elif 'm' in value:
-                        age_value = int(value.replace('m', ''))  # minutes
-                    else:
-                        age_value = 0
-                except ValueError:
-                    age_value = 0
-                item = SortableTableWidgetItem(value, age_value)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col in [1, 2, 3, 4]:  # Pods, Replicas, Age
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Set default color for regular columns
-            item.setForeground(QColor(AppColors.TEXT_TABLE))
-            
-            # Add the item to the table
-            self.table.setItem(row, cell_col, item)
-        
-        # Add the Conditions column as a special multi-color widget (cell 6)
-        conditions_widget = MultiColorStatusLabel()
-        conditions_widget.set_status_text(conditions_str)
-        self.table.setCellWidget(row, 6, conditions_widget)
-        
-        # Create and add action button with only Edit and Delete options
-        action_button = self._create_action_button(row, resource_name, resource["namespace"])
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, 7, action_container)
 
     # def handle_row_click(self, row, column):
     #     """Handle row selection when a table cell is clicked"""
@@ -3,12 +3,45 @@ Dynamic implementation of the Jobs page with live Kubernetes data and resource o
 """
 
 from PyQt6.QtWidgets import QHeaderView, QPushButton
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppColors, AppStyles
+from Utils.column_extractors import raw_getter
+
+_succeeded = raw_getter('status.succeeded')
+_spec_completions = raw_getter('spec.completions')
+_conditions = raw_getter('status.conditions')
+
+
+def _completions(resource):
+    completions = _spec_completions(resource)
+    return _succeeded(resource) or 0, 1 if completions is None else completions
+
+
+def _completions_text(resource):
+    return "%s/%s" % _completions(resource)
+
+
+def _completion_ratio(resource):
+    succeeded, total = _completions(resource)
+    return succeeded / total if total > 0 else 0
+
+
+def _true_conditions(resource):
+    return " ".join(condition.get("type", "") for condition in _conditions(resource) or []
+                    if condition.get("status") == "True")
+
+
+def _conditions_color(resource):
+    conditions = _true_conditions(resource)
+    if "Complete" in conditions:
+        return AppColors.STATUS_ACTIVE
+    if "Failed" in conditions:
+        return AppColors.STATUS_DISCONNECTED
+    return None
+
 
 class JobsPage(BaseResourcePage):
     """
@@ -78,110 +111,17 @@ class JobsPage(BaseResourcePage):
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
 
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with Job data
-        """
-        # Set row height
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Extract additional data from the raw_data field if available
-        raw_data = resource.get("raw_data", {})
-        
-        # Get job details
-        completions = "0/1"
-        conditions = ""
-        
-        if raw_data:
-            spec = raw_data.get("spec", {})
-            status = raw_data.get("status", {})
-            
-            # Get completions count
-            successful = status.get("succeeded", 0)
-            parallelism = spec.get("completions", 1)
-            completions = f"{successful}/{parallelism}"
-            
-            # Get conditions
-            condition_list = status.get("conditions", [])
-            condition_types = []
-            for condition in condition_list:
-                if condition.get("status") == "True":
-                    condition_types.append(condition.get("type", ""))
-            conditions = " ".join(condition_types)
-        
-        # Prepare data columns
-        columns = [
-            resource["name"],
-            resource["namespace"],
-            completions,
-            resource["age"],
-            conditions
+    def get_table_columns(self, headers):
+        """Job columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Namespace", align=ALIGN_CENTER),
+            TableColumn("Completions", value=_completions_text, sort_key=_completion_ratio, align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn("Conditions", value=_true_conditions, color=_conditions_color),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col == 2:  # Completions column
-                try:
-                    successful, total = value.split("/")
-                    completion_value = float(successful) / float(total) if float(total) > 0 else 0
-                except (ValueError, ZeroDivisionError):
-                    completion_value = 0
-                item = SortableTableWidgetItem(value, completion_value)
-            elif col == 3:  # Age column
-                try:
-                    # Convert age string (like "5d" or "2h") to minutes for sorting
-                    if 'd' in value:
-                        age_value = int(value.replace('d', '')) * 1440  # days to minutes
-                    elif 'h' in value:
-                        age_value = int(value.replace('h', '')) * 60  # hours to minutes
-                    elif 'm' in value:
-                        age_value = int(value.replace('m', ''))  # minutes
-                    else:
-                        age_value = 0
-                except ValueError:
-                    age_value = 0
-                item = SortableTableWidgetItem(value, age_value)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col in [1, 2, 3]:  # Completions, Age
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Set special colors for Conditions column
-            if col == 4:  # Conditions column
-                if "Complete" in value:
-                    item.setForeground(QColor(AppColors.STATUS_ACTIVE))  # Green for Complete
-                elif "Failed" in value:
-                    item.setForeground(QColor(AppColors.STATUS_DISCONNECTED))  # Red for Failed
-                else:
-                    item.setForeground(QColor(AppColors.TEXT_TABLE))  # Default text color
-            else:
-                item.setForeground(QColor(AppColors.TEXT_TABLE))
-            
-            # Add the item to the table
-            self.table.setItem(row, cell_col, item)
-        
-        # Create and add action button with only Edit and Delete options
-        action_button = self._create_action_button(row, resource_name, resource["namespace"])
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 1, action_container)
 
     # def handle_row_click(self, row, column):
     #     """Handle row selection when a table cell is clicked"""
@@ -138,134 +138,37 @@ class OverviewDataWorker(QThread):
                 return False
 
             # Helper function to safely count resources
-            def safe_count_resources(resource_type, api_call, progress_pct, progress_msg):
+            def safe_count_resources(resource_type, progress_pct, progress_msg, field_selector=None):
                 if check_timeout() or self._should_stop:
                     return 0
 
                 self.progress_update.emit(progress_pct, progress_msg)
 
                 try:
-                    resources = api_call()
-                    count = len(resources.items) if hasattr(resources, 'items') else 0
-                    logging.info(f"OverviewPage: Loaded {count} {resource_type}")
+                    # Metadata-only list - a limit=1 page and remainingItemCount instead of full objects
+                    count = unified_loader.count_resources(resource_type, field_selector=field_selector)
+                    logging.info(f"OverviewPage: Counted {count} {resource_type}")
                     return count
                 except Exception as e:
                     logging.warning(f"Error loading {resource_type}: {e}")
                     return 0
 
-            # Use direct API calls for better reliability
-            api_service = self.kube_client.service.api_service
+            from Utils.unified_resource_loader import get_unified_resource_loader
+            unified_loader = get_unified_resource_loader()
 
-            # Load deployments
-            workloads_data['deployments'] = safe_count_resources(
-                'deployments',
-                lambda: api_service.apps_v1.list_deployment_for_all_namespaces(limit=5000),
-                20, "Loading deployments..."
-            )
-
-            # Load daemonsets
-            workloads_data['daemonsets'] = safe_count_resources(
-                'daemonsets',
-                lambda: api_service.apps_v1.list_daemon_set_for_all_namespaces(limit=5000),
-                30, "Loading daemon sets..."
-            )
-
-            # Load statefulsets
-            workloads_data['statefulsets'] = safe_count_resources(
-                'statefulsets',
-                lambda: api_service.apps_v1.list_stateful_set_for_all_namespaces(limit=5000),
-                40, "Loading stateful sets..."
-            )
-
-            # Load replicasets
-            workloads_data['replicasets'] = safe_count_resources(
-                'replicasets',
-                lambda: api_service.apps_v1.list_replica_set_for_all_namespaces(limit=5000),
-                50, "Loading replica sets..."
-            )
+            workloads_data['deployments'] = safe_count_resources('deployments', 20, "Loading deployments...")
+            workloads_data['daemonsets'] = safe_count_resources('daemonsets', 30, "Loading daemon sets...")
+            workloads_data['statefulsets'] = safe_count_resources('statefulsets', 40, "Loading stateful sets...")
+            workloads_data['replicasets'] = safe_count_resources('replicasets', 50, "Loading replica sets...")
+            workloads_data['jobs'] = safe_count_resources('jobs', 60, "Loading jobs...")
+            workloads_data['cronjobs'] = safe_count_resources('cronjobs', 70, "Loading cron jobs...")
 
-            # Load jobs
-            workloads_data['jobs'] = safe_count_resources(
-                'jobs',
-                lambda: api_service.batch_v1.list_job_for_all_namespaces(limit=5000),
-                60, "Loading jobs..."
+            # Pods are usually the largest dataset - running pods are counted server-side by phase
+            workloads_data['pods_total'] = safe_count_resources('pods', 80, "Loading pods...")
+            workloads_data['pods_running'] = safe_count_resources(
+                'pods', 90, "Loading running pods...", field_selector='status.phase=Running'
             )
 
-            # Load cronjobs
-            try:
-                workloads_data['cronjobs'] = safe_count_resources(
-                    'cronjobs',
-                    lambda: api_service.batch_v1.list_cron_job_for_all_namespaces(limit=5000),
-                    70, "Loading cron jobs..."
-                )
-            except Exception:
-                # Fallback to v1beta1 if v1 not available
-                try:
-                    workloads_data['cronjobs'] = safe_count_resources(
-                        'cronjobs',
-                        lambda: api_service.batch_v1beta1.list_cron_job_for_all_namespaces(limit=5000),
-                        70, "Loading cron jobs..."
-                    )
-                except Exception as e:
-                    logging.warning(f"Error loading cronjobs: {e}")
-                    workloads_data['cronjobs'] = 0
-
-            # Load pods last as they're usually the largest dataset
-            self.progress_update.emit(80, "Loading pods...")
-
-            try:
-                if check_timeout() or self._should_stop:
-                    workloads_data['pods_total'] = 0
-                    workloads_data['pods_running'] = 0
-                else:
-                    # Use pagination for pods to handle large datasets
-                    pods_total = 0
-                    pods_running = 0
-                    continue_token = None
-                    batch_count = 0
-                    max_batches = 20  # Limit to prevent excessive API calls
-
-                    while batch_count < max_batches and not (check_timeout() or self._should_stop):
-                        try:
-                            # Fetch batch with pagination
-                            pods_batch = api_service.v1.list_pod_for_all_namespaces(
-                                limit=500, _continue=continue_token
-                            )
-
-                            if not pods_batch.items:
-                                break
-
-                            # Count pods in this batch
-                            batch_total = len(pods_batch.items)
-                            batch_running = sum(1 for pod in pods_batch.items
-                                              if pod.status and pod.status.phase == "Running")
-
-                            pods_total += batch_total
-                            pods_running += batch_running
-                            batch_count += 1
-
-                            # Update progress
-                            progress = 80 + (batch_count * 15 // max_batches)
-                            self.progress_update.emit(progress, f"Loading pods... ({pods_total} found)")
-
-                            # Check for next page
-                            continue_token = getattr(pods_batch.metadata, 'continue', None) if hasattr(pods_batch, 'metadata') else None
-                            if not continue_token:
-                                break
-
-                        except Exception as batch_e:
-                            logging.warning(f"Error in pods batch {batch_count}: {batch_e}")
-                            break
-
-                    workloads_data['pods_total'] = pods_total
-                    workloads_data['pods_running'] = pods_running
-                    logging.info(f"OverviewPage: Loaded {pods_total} pods ({pods_running} running) in {batch_count} batches")
-
-            except Exception as e:
-                logging.warning(f"Error loading pods: {e}")
-                workloads_data['pods_total'] = 0
-                workloads_data['pods_running'] = 0
-
             load_time = (time.time() - start_time) * 1000
             logging.info(f"OverviewPage: Loaded workloads summary in {load_time:.1f}ms")
             return workloads_data
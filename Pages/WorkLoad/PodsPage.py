@@ -3,48 +3,27 @@ Enhanced PodsPage with integrated port forwarding functionality
 """
 
 import logging
-from PyQt6.QtWidgets import QHeaderView, QPushButton, QLabel, QWidget, QHBoxLayout, QMessageBox
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QHeaderView, QPushButton, QMessageBox
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppColors, AppStyles
 from UI.Icons import resource_path
 
 from Utils.port_forward_manager import get_port_forward_manager, PortForwardConfig
 from Utils.port_forward_dialog import PortForwardDialog, ActivePortForwardsDialog
 
-class StatusLabel(QWidget):
-    """Widget that displays a status with consistent styling and background handling."""
-    clicked = pyqtSignal()
-    
-    def __init__(self, status_text, color=None, parent=None):
-        super().__init__(parent)
-        
-        # Create layout
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Create label
-        self.label = QLabel(status_text)
-        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Set color if provided, otherwise use default color
-        if color:
-            self.label.setStyleSheet(f"color: {QColor(color).name()}; background-color: transparent;")
-        
-        # Add label to layout
-        layout.addWidget(self.label)
-        
-        # Make sure this widget has a transparent background
-        self.setStyleSheet("background-color: transparent;")
-    
-    def mousePressEvent(self, event):
-        """Emit clicked signal when widget is clicked"""
-        self.clicked.emit()
-        super().mousePressEvent(event)
+POD_STATUS_COLORS = {
+    "Running": AppColors.STATUS_ACTIVE,
+    "Pending": AppColors.STATUS_PENDING,
+    "Failed": AppColors.STATUS_DISCONNECTED,
+    "Error": AppColors.STATUS_DISCONNECTED,
+    "CrashLoopBackOff": AppColors.STATUS_DISCONNECTED,
+    "ImagePullBackOff": AppColors.STATUS_DISCONNECTED,
+    "ErrImagePull": AppColors.STATUS_DISCONNECTED,
+    "Succeeded": AppColors.STATUS_AVAILABLE,
+}
 
 class PodsPage(BaseResourcePage):
     """
@@ -155,152 +134,26 @@ class PodsPage(BaseResourcePage):
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
         
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with Pod data from kubernetes client response,
-        using a StatusLabel for the Status column so per-status colors aren't overridden.
-        """
-        self.table.setRowHeight(row, 40)
-        name = resource["name"]
-        
-        # 1) Checkbox
-        cb = self._create_checkbox_container(row, name)
-        cb.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, cb)
-
-        # Get data from the kubernetes client response
-        raw = resource.get("raw_data", {}) or {}
-        
-        # Get container count from kubernetes API response
-        containers_count = "0"
-        if raw and raw.get("spec", {}).get("containers"):
-            containers = raw["spec"]["containers"]
-            init_containers = raw["spec"].get("initContainers", [])
-            containers_count = str(len(containers) + len(init_containers))
-        
-        # Get restart count from kubernetes API response
-        restart_count = "0"
-        if raw and raw.get("status", {}).get("containerStatuses"):
-            container_statuses = raw["status"]["containerStatuses"]
-            total_restarts = sum(container.get("restartCount", 0) for container in container_statuses)
-            restart_count = str(total_restarts)
-        
-        # Get controller reference from kubernetes API response
-        controller_by = ""
-        if raw and raw.get("metadata", {}).get("ownerReferences"):
-            owner_references = raw["metadata"]["ownerReferences"]
-            if owner_references:
-                controller_by = owner_references[0].get("kind", "")
-        
-        # Get QoS class from kubernetes API response
-        qos_class = ""
-        if raw and raw.get("status", {}).get("qosClass"):
-            qos_class = raw["status"]["qosClass"]
-        
-        # Get node name from kubernetes API response
-        node_name = ""
-        if raw and raw.get("spec", {}).get("nodeName"):
-            node_name = raw["spec"]["nodeName"]
-        
-        # Use age from resource (already formatted by the loader)
-        age_str = resource.get("age", "Unknown")
-        
-        # Determine pod status from kubernetes API response
-        pod_status = "Unknown"
-        if raw and raw.get("status"):
-            status = raw["status"]
-            pod_phase = status.get("phase", "Unknown")
-            pod_status = pod_phase
-            
-            # Check for more specific states from container statuses
-            for cs in status.get("containerStatuses", []):
-                state = cs.get("state", {})
-                if "waiting" in state:
-                    reason = state["waiting"].get("reason", "")
-                    if reason in ("CrashLoopBackOff", "ImagePullBackOff", "ErrImagePull"):
-                        pod_status = reason
-                        break
-                elif "terminated" in state:
-                    if state["terminated"].get("exitCode", 0) != 0:
-                        pod_status = "Error"
-                        break
-
-        # 2) All columns *except* Status and Actions
-        cols = [
-            name,
-            resource.get("namespace", ""),
-            containers_count,
-            restart_count,
-            controller_by,
-            node_name,
-            qos_class,
-            age_str
+    def get_table_columns(self, headers):
+        """Pod columns, read from the fields the loader extracts so sorting never decodes raw objects"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Namespace", align=ALIGN_CENTER),
+            TableColumn("Containers", value=self._container_count, sort_key=self._container_count, align=ALIGN_CENTER),
+            TableColumn.numeric("Restarts"),
+            TableColumn("Controlled By", key="controller_by", align=ALIGN_CENTER),
+            TableColumn("Node", key="node_name", align=ALIGN_CENTER),
+            TableColumn("QoS", key="qos_class", align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.status(value=lambda r: r.get("status") or "Unknown",
+                               color=lambda r: POD_STATUS_COLORS.get(r.get("status"), AppColors.TEXT_TABLE)),
+            TableColumn.action(),
         ]
-        
-        for idx, val in enumerate(cols):
-            col = idx + 1  # shift right for checkbox at col 0
-            if idx in (2, 3):  # numeric columns (containers, restarts)
-                num = int(val) if val.isdigit() else 0
-                item = SortableTableWidgetItem(val, num)
-            elif idx == 7:  # age column
-                if val and val != "Unknown":
-                    unit = val[-1]
-                    time_value = val[:-1]
-                    if time_value.isdigit():
-                        # Convert to minutes for sorting
-                        num = int(time_value) * {'d': 1440, 'h': 60, 'm': 1}.get(unit, 1)
-                        item = SortableTableWidgetItem(val, num)
-                    else:
-                        item = SortableTableWidgetItem(val)
-                else:
-                    item = SortableTableWidgetItem(val)
-            else:
-                item = SortableTableWidgetItem(val)
-            
-            # Set alignment
-            if idx in (1, 2, 3,4,5, 6, 7):  # numeric and age columns
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            else:
-                item.setTextAlignment(
-                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-                )
-            
-            # Make non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Set default text color
-            item.setForeground(QColor(AppColors.TEXT_TABLE))
-            self.table.setItem(row, col, item)
-
-        # 3) Status column as StatusLabel widget (col index 9)
-        status_col = 1 + len(cols)  # equals 9
-        
-        # Pick the right color based on pod status
-        if pod_status == "Running":
-            color = AppColors.STATUS_ACTIVE
-        elif pod_status == "Pending":
-            color = AppColors.STATUS_PENDING
-        elif pod_status in ("Failed", "Error", "CrashLoopBackOff", "ImagePullBackOff", "ErrImagePull"):
-            color = AppColors.STATUS_DISCONNECTED
-        elif pod_status == "Succeeded":
-            color = AppColors.STATUS_AVAILABLE
-        else:
-            color = AppColors.TEXT_TABLE
-
-        # Create status widget with proper color
-        status_widget = StatusLabel(pod_status, color)
-        # Connect click event to select the row
-        status_widget.clicked.connect(lambda: self.table.selectRow(row))
-        self.table.setCellWidget(row, status_col, status_widget)
-
-        # 4) Action menu (last column index 10)
-        action_btn = self._create_action_button(row, name, resource.get("namespace", ""))
-        action_btn.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_btn)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, status_col + 1, action_container)
 
-    # Removed duplicate _create_action_button - now uses base class implementation
+    @staticmethod
+    def _container_count(resource):
+        return (resource.get("containers") or 0) + (resource.get("init_containers") or 0)
 
     def _get_pod_exposed_ports(self, pod_resource):
         """Extract exposed ports from pod resource"""
@@ -3,12 +3,29 @@ Dynamic implementation of the ReplicaSets page with live Kubernetes data and res
 """
 
 from PyQt6.QtWidgets import QHeaderView, QPushButton
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppColors, AppStyles
+from Utils.column_extractors import raw_getter
+
+_spec_replicas = raw_getter('spec.replicas')
+_status_replicas = raw_getter('status.replicas')
+_ready_replicas = raw_getter('status.readyReplicas')
+
+
+def _desired(resource):
+    return _spec_replicas(resource) or 0
+
+
+def _current(resource):
+    return _status_replicas(resource) or 0
+
+
+def _ready(resource):
+    return _ready_replicas(resource) or 0
+
 
 class ReplicaSetsPage(BaseResourcePage):
     """
@@ -79,94 +96,18 @@ class ReplicaSetsPage(BaseResourcePage):
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
 
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with ReplicaSet data
-        """
-        # Set row height
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Extract additional data from the raw_data field if available
-        raw_data = resource.get("raw_data", {})
-        
-        # Get status info
-        desired = "0"
-        current = "0"
-        ready = "0"
-        
-        if raw_data:
-            spec = raw_data.get("spec", {})
-            status = raw_data.get("status", {})
-            
-            desired = str(spec.get("replicas", 0))
-            current = str(status.get("replicas", 0))
-            ready = str(status.get("readyReplicas", 0))
-        
-        # Prepare data columns
-        columns = [
-            resource["name"],
-            resource["namespace"],
-            desired,
-            current,
-            ready,
-            resource["age"]
+    def get_table_columns(self, headers):
+        """ReplicaSet columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Namespace", align=ALIGN_CENTER),
+            TableColumn("Desired", value=_desired, sort_key=_desired, align=ALIGN_CENTER),
+            TableColumn("Current", value=_current, sort_key=_current, align=ALIGN_CENTER),
+            TableColumn("Ready", value=_ready, sort_key=_ready, align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col >= 2 and col <= 4:  # Desired, Current, Ready columns
-                try:
-                    num = int(value)
-                except ValueError:
-                    num = 0
-                item = SortableTableWidgetItem(value, num)
-            elif col == 5:  # Age column
-                try:
-                    # Convert age string (like "5d" or "2h") to minutes for sorting
-                    if 'd' in value:
-                        age_value = int(value.replace('d', '')) * 1440  # days to minutes
-                    elif 'h' in value:
-                        age_value = int(value.replace('h', '')) * 60  # hours to minutes
-                    elif 'm' in value:
-                        age_value = int(value.replace('m', ''))  # minutes
-                    else:
-                        age_value = 0
-                except ValueError:
-                    age_value = 0
-                item = SortableTableWidgetItem(value, age_value)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col >= 1 and col <= 5:  # Desired, Current, Ready, Age
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Set default text color
-            item.setForeground(QColor(AppColors.TEXT_TABLE))
-            
-            # Add the item to the table
-            self.table.setItem(row, cell_col, item)
-        
-        # Create and add action button with only Edit and Delete options
-        action_button = self._create_action_button(row, resource_name, resource["namespace"])
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 1, action_container)
 
     # def handle_row_click(self, row, column):
     #     """Handle row selection when a table cell is clicked"""
@@ -3,12 +3,30 @@ Dynamic implementation of the StatefulSets page with live Kubernetes data and re
 """
 
 from PyQt6.QtWidgets import QHeaderView, QPushButton
-from PyQt6.QtCore import Qt,QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import QTimer
 
-from Base_Components.base_components import SortableTableWidgetItem
 from Base_Components.base_resource_page import BaseResourcePage
+from Base_Components.virtualized_table_model import TableColumn, ALIGN_CENTER
 from UI.Styles import AppColors, AppStyles
+from Utils.column_extractors import raw_getter
+
+_current_replicas = raw_getter('status.currentReplicas')
+_status_replicas = raw_getter('status.replicas')
+_spec_replicas = raw_getter('spec.replicas')
+
+
+def _pods_text(resource):
+    return f"{_current_replicas(resource) or 0}/{_status_replicas(resource) or 0}"
+
+
+def _pods_ratio(resource):
+    replicas = _status_replicas(resource) or 0
+    return (_current_replicas(resource) or 0) / replicas if replicas > 0 else 0
+
+
+def _replicas(resource):
+    return _spec_replicas(resource) or 0
+
 
 class StatefulSetsPage(BaseResourcePage):
     """
@@ -78,102 +96,18 @@ class StatefulSetsPage(BaseResourcePage):
         # Ensure full width utilization after configuration
         QTimer.singleShot(100, self._ensure_full_width_utilization)
 
-    def populate_resource_row(self, row, resource):
-        """
-        Populate a single row with StatefulSet data
-        """
-        # Set row height
-        self.table.setRowHeight(row, 40)
-        
-        # Create checkbox for row selection
-        resource_name = resource["name"]
-        checkbox_container = self._create_checkbox_container(row, resource_name)
-        checkbox_container.setStyleSheet(AppStyles.CHECKBOX_STYLE)
-        self.table.setCellWidget(row, 0, checkbox_container)
-        
-        # Extract additional data from the raw_data field if available
-        raw_data = resource.get("raw_data", {})
-        
-        # Get pod status
-        pods_str = "0/0"
-        if raw_data:
-            status = raw_data.get("status", {})
-            current_replicas = status.get("currentReplicas", 0)
-            replicas = status.get("replicas", 0)
-            pods_str = f"{current_replicas}/{replicas}"
-        
-        # Get replicas count
-        replicas_str = "0"
-        if raw_data:
-            spec = raw_data.get("spec", {})
-            replicas_str = str(spec.get("replicas", 0))
-        
-        # Prepare data columns
-        columns = [
-            resource["name"],
-            resource["namespace"],
-            pods_str,
-            replicas_str,
-            resource["age"]
+    def get_table_columns(self, headers):
+        """StatefulSet columns"""
+        return [
+            TableColumn.checkbox(),
+            TableColumn("Name"),
+            TableColumn("Namespace", align=ALIGN_CENTER),
+            TableColumn("Pods", value=_pods_text, sort_key=_pods_ratio, align=ALIGN_CENTER),
+            TableColumn("Replicas", value=_replicas, sort_key=_replicas, align=ALIGN_CENTER),
+            TableColumn.age(),
+            TableColumn.action(),
         ]
-        
-        # Add columns to table
-        for col, value in enumerate(columns):
-            cell_col = col + 1  # Adjust for checkbox column
-            
-            # Handle numeric columns for sorting
-            if col == 2:  # Pods column
-                try:
-                    current, desired = value.split("/")
-                    pods_value = float(current) / float(desired) if float(desired) > 0 else 0
-                except (ValueError, ZeroDivisionError):
-                    pods_value = 0
-                item = SortableTableWidgetItem(value, pods_value)
-            elif col == 3:  # Replicas column
-                try:
-                    replicas_value = float(value)
-                except ValueError:
-                    replicas_value = 0
-                item = SortableTableWidgetItem(value, replicas_value)
-            elif col == 4:  # Age column
-                try:
-                    # Convert age string (like "5d" or "2h") to minutes for sorting
-                    if 'd' in value:
-                        age_value = int(value.replace('d', '')) * 1440  # days to minutes
-                    elif 'h' in value:
-                        age_value = int(value.replace('h', '')) * 60  # hours to minutes
-                    elif 'm' in value:
-                        age_value = int(value.replace('m', ''))  # minutes
-                    else:
-                        age_value = 0
-                except ValueError:
-                    age_value = 0
-                item = SortableTableWidgetItem(value, age_value)
-            else:
-                item = SortableTableWidgetItem(value)
-            
-            # Set text alignment
-            if col in [1, 2, 3, 4]:  # Pods, Replicas, Age
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            else:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            
-            # Make cells non-editable
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            
-            # Set text color
-            item.setForeground(QColor(AppColors.TEXT_TABLE))
-            
-            # Add the item to the table
-            self.table.setItem(row, cell_col, item)
-        
-        # Create and add action button with only Edit and Delete options
-        action_button = self._create_action_button(row, resource_name, resource["namespace"])
-        action_button.setStyleSheet(AppStyles.ACTION_BUTTON_STYLE)
-        action_container = self._create_action_container(row, action_button)
-        action_container.setStyleSheet(AppStyles.ACTION_CONTAINER_STYLE)
-        self.table.setCellWidget(row, len(columns) + 1, action_container)
-    
+
     # def handle_row_click(self, row, column):
     #     """Handle row selection when a table cell is clicked"""
     #     if column != self.table.columnCount() - 1:  # Skip action column
@@ -5,16 +5,21 @@ Split from kubernetes_client.py for better architecture
 
 import logging
 import threading
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from kubernetes import client, config
 from kubernetes.config.config_exception import ConfigException
 
+from Utils.performance_config import API_CONNECTION_POOL_SIZE
+from Utils.cancellation import install_cancellable_pools
+from Utils.rate_limiter import ClientRateLimiter, install_rate_limiter
+
 
 class ThreadSafeAPIClient:
     """Thread-safe wrapper for Kubernetes API clients with proper error isolation"""
     
-    def __init__(self, api_class):
+    def __init__(self, api_class, api_client_provider: Optional[Callable[[], client.ApiClient]] = None):
         self.api_class = api_class
+        self.api_client_provider = api_client_provider  # Shared pooled ApiClient for every API group
         self._instance = None
         self._lock = threading.RLock()  # Use RLock for better thread safety
         self._initialization_failed = False
@@ -49,7 +54,10 @@ class ThreadSafeAPIClient:
                     raise self._initialization_error
                 
                 logging.debug(f"Creating API client instance: {self.api_class.__name__} (attempt {self._creation_attempts})")
-                self._instance = self.api_class()
+                if self.api_client_provider:
+                    self._instance = self.api_class(self.api_client_provider())
+                else:
+                    self._instance = self.api_class()
                 logging.debug(f"Successfully initialized {self.api_class.__name__}")
                 return self._instance
                 
@@ -97,28 +105,115 @@ class KubernetesAPIService:
         self._api_clients: Dict[str, ThreadSafeAPIClient] = {}
         self._cached_clients = False
         self._cached_context = None
+        
+        # One pooled ApiClient per cluster, shared by every typed API object
+        self._configuration: Optional[client.Configuration] = None
+        self._shared_api_client: Optional[client.ApiClient] = None
+        self._rate_limiter: Optional[ClientRateLimiter] = None  # Throttles every request of the shared ApiClient
+        self._shared_api_client_lock = threading.Lock()
+        
         self._setup_lazy_clients()
     
     def _setup_lazy_clients(self):
         """Initialize thread-safe API clients"""
+        api_classes = {
+            'CoreV1Api': client.CoreV1Api,
+            'AppsV1Api': client.AppsV1Api,
+            'NetworkingV1Api': client.NetworkingV1Api,
+            'StorageV1Api': client.StorageV1Api,
+            'RbacAuthorizationV1Api': client.RbacAuthorizationV1Api,
+            'BatchV1Api': client.BatchV1Api,
+            'AutoscalingV1Api': client.AutoscalingV1Api,
+            'AutoscalingV2Api': client.AutoscalingV2Api,
+            'PolicyV1Api': client.PolicyV1Api,
+            'SchedulingV1Api': client.SchedulingV1Api,
+            'NodeV1Api': client.NodeV1Api,
+            'AdmissionregistrationV1Api': client.AdmissionregistrationV1Api,
+            'CoordinationV1Api': client.CoordinationV1Api,
+            'ApiextensionsV1Api': client.ApiextensionsV1Api,
+            'CustomObjectsApi': client.CustomObjectsApi,
+            'VersionApi': client.VersionApi,
+        }
         self._api_clients = {
-            'CoreV1Api': ThreadSafeAPIClient(client.CoreV1Api),
-            'AppsV1Api': ThreadSafeAPIClient(client.AppsV1Api),
-            'NetworkingV1Api': ThreadSafeAPIClient(client.NetworkingV1Api),
-            'StorageV1Api': ThreadSafeAPIClient(client.StorageV1Api),
-            'RbacAuthorizationV1Api': ThreadSafeAPIClient(client.RbacAuthorizationV1Api),
-            'BatchV1Api': ThreadSafeAPIClient(client.BatchV1Api),
-            'AutoscalingV1Api': ThreadSafeAPIClient(client.AutoscalingV1Api),
-            'AutoscalingV2Api': ThreadSafeAPIClient(client.AutoscalingV2Api),
-            'PolicyV1Api': ThreadSafeAPIClient(client.PolicyV1Api),
-            'SchedulingV1Api': ThreadSafeAPIClient(client.SchedulingV1Api),
-            'NodeV1Api': ThreadSafeAPIClient(client.NodeV1Api),
-            'AdmissionregistrationV1Api': ThreadSafeAPIClient(client.AdmissionregistrationV1Api),
-            'CoordinationV1Api': ThreadSafeAPIClient(client.CoordinationV1Api),
-            'ApiextensionsV1Api': ThreadSafeAPIClient(client.ApiextensionsV1Api),
-            'CustomObjectsApi': ThreadSafeAPIClient(client.CustomObjectsApi),
-            'VersionApi': ThreadSafeAPIClient(client.VersionApi),
+            name: ThreadSafeAPIClient(api_class, self.get_shared_api_client)
+            for name, api_class in api_classes.items()
+        }
+    
+    def get_shared_api_client(self) -> client.ApiClient:
+        """Get the pooled ApiClient for the current cluster, creating it on first use"""
+        with self._shared_api_client_lock:
+            if self._shared_api_client is None:
+                configuration = self._configuration or client.Configuration.get_default_copy()
+                self._shared_api_client = client.ApiClient(configuration)
+                # Cancelled workers shut down the sockets of their in-flight requests
+                install_cancellable_pools(self._shared_api_client.rest_client.pool_manager)
+                # One token bucket per cluster - a new cluster starts with a full bucket
+                self._rate_limiter = ClientRateLimiter()
+                install_rate_limiter(self._shared_api_client, self._rate_limiter)
+                logging.debug(f"Created shared ApiClient with a connection pool of {configuration.connection_pool_maxsize}")
+            return self._shared_api_client
+    
+    def _close_shared_api_client(self):
+        """Drop the pooled ApiClient so the next cluster gets fresh connections"""
+        with self._shared_api_client_lock:
+            api_client = self._shared_api_client
+            self._shared_api_client = None
+        
+        if api_client is None:
+            return
+        try:
+            api_client.rest_client.pool_manager.clear()
+            api_client.close()
+        except Exception as e:
+            logging.debug(f"Error closing shared ApiClient: {e}")
+    
+    def get_server_host(self) -> Optional[str]:
+        """API server URL of the loaded kubeconfig context"""
+        return self._configuration.host if self._configuration else None
+    
+    def get_rate_limiter_stats(self) -> Dict[str, Any]:
+        """Client-side rate limiter statistics for the current cluster (queue depth, delays, 429s)"""
+        limiter = self._rate_limiter
+        return limiter.get_stats() if limiter else {}
+    
+    def get_connection_pool_stats(self) -> Dict[str, Any]:
+        """Connection pool statistics for the shared ApiClient (opened, reused, in use, idle)"""
+        stats = {
+            'maxsize': API_CONNECTION_POOL_SIZE,
+            'hosts': 0,
+            'requests': 0,
+            'connections_opened': 0,
+            'connections_reused': 0,
+            'connections_in_use': 0,
+            'connections_idle': 0,
         }
+        
+        api_client = self._shared_api_client
+        if api_client is None:
+            return stats
+        
+        try:
+            pools = api_client.rest_client.pool_manager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                
+                # Slots still in the queue are idle connections or never-opened placeholders
+                queued = list(pool.pool.queue) if pool.pool else []
+                idle = sum(1 for conn in queued if conn is not None)
+                
+                stats['hosts'] += 1
+                stats['requests'] += pool.num_requests
+                stats['connections_opened'] += pool.num_connections
+                stats['connections_idle'] += idle
+                stats['connections_in_use'] += max(0, pool.pool.maxsize - len(queued)) if pool.pool else 0
+            
+            stats['connections_reused'] = max(0, stats['requests'] - stats['connections_opened'])
+        except Exception as e:
+            logging.debug(f"Error reading connection pool stats: {e}")
+        
+        return stats
     
     def load_kube_config(self, context_name: Optional[str] = None):
         """Load kubernetes configuration with connection optimization"""
@@ -133,8 +228,9 @@ class KubernetesAPIService:
             # Configure API client settings for better performance and reliability
             configuration = client.Configuration.get_default_copy()
             
-            # Connection pooling settings for better performance
-            configuration.connection_pool_maxsize = 10  # Increase connection pool size
+            # Connection pooling settings for better performance - sized to worker concurrency
+            # so connections are kept alive and reused instead of discarded when the pool is full
+            configuration.connection_pool_maxsize = API_CONNECTION_POOL_SIZE
             
             # Timeout settings for better reliability with slow clusters
             configuration.socket_timeout = 15  # 15 seconds socket timeout (reduced for faster failure detection)
@@ -152,10 +248,12 @@ class KubernetesAPIService:
             logging.debug("Applied optimized Kubernetes API client configuration")
             
             # Reset clients when context changes
-            if self._cached_context != context_name:
+            if self._cached_context != context_name or self._configuration is None:
                 self.reset_clients()
                 self._cached_context = context_name
                 self._cached_clients = True
+            
+            self._configuration = configuration
                 
             return True
             
@@ -175,6 +273,8 @@ class KubernetesAPIService:
             except Exception as e:
                 logging.error(f"Error resetting {client_name}: {e}")
         
+        self._close_shared_api_client()
+        self._configuration = None
         self._cached_clients = False
         self._cached_context = None
     
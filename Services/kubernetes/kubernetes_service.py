@@ -16,6 +16,9 @@ from .metrics_service import create_kubernetes_metrics_service
 from .events_service import create_kubernetes_events_service
 from Utils.thread_manager import get_thread_manager
 from Utils.enhanced_worker import EnhancedBaseWorker
+from Utils.informer_cache import get_informer_cache, shutdown_informer_cache
+from Utils.resource_registry import get_resource_registry
+from Utils.access_review import get_access_review_cache
 
 
 @dataclass
@@ -56,6 +59,27 @@ class AsyncIssuesWorker(EnhancedBaseWorker):
         return self.events_service.get_cluster_issues(self.cluster_name)
 
 
+class ResourceDiscoveryWorker(EnhancedBaseWorker):
+    """Worker for refreshing the resource registry from API discovery"""
+    def __init__(self, cluster_name, server):
+        super().__init__(f"resource_discovery_{cluster_name}")
+        self.cluster_name = cluster_name
+        self.server = server
+
+    def execute(self):
+        return get_resource_registry().use_cluster(self.cluster_name, self.server)
+
+
+class AccessReviewWorker(EnhancedBaseWorker):
+    """Worker for reviewing what the current user may list on a cluster"""
+    def __init__(self, cluster_name):
+        super().__init__(f"access_review_{cluster_name}")
+        self.cluster_name = cluster_name
+
+    def execute(self):
+        return get_access_review_cache().probe(self.cluster_name)
+
+
 class KubernetesService(QObject):
     """Main Kubernetes service coordinator"""
     
@@ -155,7 +179,21 @@ class KubernetesService(QObject):
             # Update current cluster
             self.current_cluster = cluster_name
             
-            # Cache system removed
+            # Informers bound to other clusters now point at stale API clients
+            get_informer_cache().retain_only(cluster_name)
+            
+            # Resource types from the discovery cache, refreshed in the background once it is stale
+            server = self.api_service.get_server_host()
+            if not get_resource_registry().select_cluster(cluster_name, server):
+                get_thread_manager().submit_worker(
+                    f"resource_discovery_{cluster_name}", ResourceDiscoveryWorker(cluster_name, server)
+                )
+            
+            # Permissions reviewed once per cluster, so forbidden lists are skipped instead of failing
+            if not get_access_review_cache().select_cluster(cluster_name):
+                get_thread_manager().submit_worker(
+                    f"access_review_{cluster_name}", AccessReviewWorker(cluster_name)
+                )
             
             # Start polling
             self.start_polling()
@@ -185,7 +223,8 @@ class KubernetesService(QObject):
                 old_cluster = self.current_cluster
                 self.current_cluster = None
                 
-                # Cache system removed
+                # Stop list+watch informers for the old cluster
+                get_informer_cache().stop_cluster(old_cluster)
                 
                 logging.info(f"Disconnected from cluster: {old_cluster}")
                 
@@ -407,7 +446,7 @@ class KubernetesService(QObject):
             self.log_service.cleanup()
             self.metrics_service.cleanup()
             self.events_service.cleanup()
-            # Cache system removed
+            shutdown_informer_cache()
             self.api_service.cleanup()
             
             # Clear active workers
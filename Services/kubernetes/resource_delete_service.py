@@ -7,9 +7,13 @@ import logging
 import time
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from kubernetes import client
 from kubernetes.client.rest import ApiException
 from Utils.kubernetes_client import get_kubernetes_client
+from Utils.resource_registry import get_resource_registry
+
+
+# Allow graceful shutdown and ensure dependent resources are deleted
+DELETE_OPTIONS = {'gracePeriodSeconds': 30, 'propagationPolicy': 'Foreground'}
 
 
 @dataclass
@@ -52,181 +56,7 @@ class KubernetesResourceDeleteService:
     
     def __init__(self):
         self.kube_client = get_kubernetes_client()
-        self._delete_method_mapping = self._build_delete_method_mapping()
-    
-    def _build_delete_method_mapping(self) -> Dict[str, Dict[str, any]]:
-        """Build mapping of resource types to their delete methods"""
-        return {
-            # Core v1 resources (namespaced)
-            'pods': {
-                'api': self.kube_client.v1,
-                'method': 'delete_namespaced_pod',
-                'namespaced': True
-            },
-            'services': {
-                'api': self.kube_client.v1,
-                'method': 'delete_namespaced_service',
-                'namespaced': True
-            },
-            'configmaps': {
-                'api': self.kube_client.v1,
-                'method': 'delete_namespaced_config_map',
-                'namespaced': True
-            },
-            'secrets': {
-                'api': self.kube_client.v1,
-                'method': 'delete_namespaced_secret',
-                'namespaced': True
-            },
-            'endpoints': {
-                'api': self.kube_client.v1,
-                'method': 'delete_namespaced_endpoints',
-                'namespaced': True
-            },
-            'events': {
-                'api': self.kube_client.v1,
-                'method': 'delete_namespaced_event',
-                'namespaced': True
-            },
-            'persistentvolumeclaims': {
-                'api': self.kube_client.v1,
-                'method': 'delete_namespaced_persistent_volume_claim',
-                'namespaced': True
-            },
-            'resourcequotas': {
-                'api': self.kube_client.v1,
-                'method': 'delete_namespaced_resource_quota',
-                'namespaced': True
-            },
-            'limitranges': {
-                'api': self.kube_client.v1,
-                'method': 'delete_namespaced_limit_range',
-                'namespaced': True
-            },
-            'serviceaccounts': {
-                'api': self.kube_client.v1,
-                'method': 'delete_namespaced_service_account',
-                'namespaced': True
-            },
-            
-            # Core v1 resources (cluster-scoped)
-            'nodes': {
-                'api': self.kube_client.v1,
-                'method': 'delete_node',
-                'namespaced': False
-            },
-            'namespaces': {
-                'api': self.kube_client.v1,
-                'method': 'delete_namespace',
-                'namespaced': False
-            },
-            'persistentvolumes': {
-                'api': self.kube_client.v1,
-                'method': 'delete_persistent_volume',
-                'namespaced': False
-            },
-            
-            # Apps v1 resources
-            'deployments': {
-                'api': self.kube_client.apps_v1,
-                'method': 'delete_namespaced_deployment',
-                'namespaced': True
-            },
-            'replicasets': {
-                'api': self.kube_client.apps_v1,
-                'method': 'delete_namespaced_replica_set',
-                'namespaced': True
-            },
-            'daemonsets': {
-                'api': self.kube_client.apps_v1,
-                'method': 'delete_namespaced_daemon_set',
-                'namespaced': True
-            },
-            'statefulsets': {
-                'api': self.kube_client.apps_v1,
-                'method': 'delete_namespaced_stateful_set',
-                'namespaced': True
-            },
-            
-            # Networking v1 resources
-            'ingresses': {
-                'api': self.kube_client.networking_v1,
-                'method': 'delete_namespaced_ingress',
-                'namespaced': True
-            },
-            'networkpolicies': {
-                'api': self.kube_client.networking_v1,
-                'method': 'delete_namespaced_network_policy',
-                'namespaced': True
-            },
-            'ingressclasses': {
-                'api': self.kube_client.networking_v1,
-                'method': 'delete_ingress_class',
-                'namespaced': False
-            },
-            
-            # Storage v1 resources
-            'storageclasses': {
-                'api': self.kube_client.storage_v1,
-                'method': 'delete_storage_class',
-                'namespaced': False
-            },
-            
-            # Batch v1 resources
-            'jobs': {
-                'api': self.kube_client.batch_v1,
-                'method': 'delete_namespaced_job',
-                'namespaced': True
-            },
-            'cronjobs': {
-                'api': self.kube_client.batch_v1,
-                'method': 'delete_namespaced_cron_job',
-                'namespaced': True
-            },
-            
-            # RBAC v1 resources
-            'roles': {
-                'api': self.kube_client.rbac_v1,
-                'method': 'delete_namespaced_role',
-                'namespaced': True
-            },
-            'rolebindings': {
-                'api': self.kube_client.rbac_v1,
-                'method': 'delete_namespaced_role_binding',
-                'namespaced': True
-            },
-            'clusterroles': {
-                'api': self.kube_client.rbac_v1,
-                'method': 'delete_cluster_role',
-                'namespaced': False
-            },
-            'clusterrolebindings': {
-                'api': self.kube_client.rbac_v1,
-                'method': 'delete_cluster_role_binding',
-                'namespaced': False
-            },
-            
-            # Policy v1 resources
-            'poddisruptionbudgets': {
-                'api': self.kube_client.policy_v1,
-                'method': 'delete_namespaced_pod_disruption_budget',
-                'namespaced': True
-            },
-            
-            # Autoscaling v1/v2 resources
-            'horizontalpodautoscalers': {
-                'api': self.kube_client.autoscaling_v1,
-                'method': 'delete_namespaced_horizontal_pod_autoscaler',
-                'namespaced': True
-            },
-            
-            # Custom Resources
-            'customresourcedefinitions': {
-                'api': self.kube_client.apiextensions_v1,
-                'method': 'delete_custom_resource_definition',
-                'namespaced': False
-            }
-        }
+        self.registry = get_resource_registry()
     
     def delete_resource(self, resource_type: str, resource_name: str, namespace: Optional[str] = None) -> DeleteResult:
         """
@@ -243,9 +73,9 @@ class KubernetesResourceDeleteService:
         start_time = time.time()
         
         try:
-            # Get delete method configuration
-            delete_config = self._delete_method_mapping.get(resource_type.lower())
-            if not delete_config:
+            # Resolve the resource type - built-in or custom - from API discovery
+            info = self.registry.resolve(resource_type)
+            if info is None or not info.supports('delete'):
                 return DeleteResult(
                     success=False,
                     resource_name=resource_name,
@@ -256,7 +86,7 @@ class KubernetesResourceDeleteService:
                 )
             
             # Validate namespace requirement
-            if delete_config['namespaced'] and not namespace:
+            if info.namespaced and not namespace:
                 return DeleteResult(
                     success=False,
                     resource_name=resource_name,
@@ -267,28 +97,13 @@ class KubernetesResourceDeleteService:
                 )
             
             # Execute delete operation
-            api_client = delete_config['api']
-            delete_method = getattr(api_client, delete_config['method'])
-            
-            # Create delete options
-            delete_options = client.V1DeleteOptions(
-                grace_period_seconds=30,  # Allow graceful shutdown
-                propagation_policy='Foreground'  # Ensure dependent resources are deleted
+            self.registry.delete(
+                info.resource_type,
+                resource_name,
+                namespace if info.namespaced else None,
+                body=DELETE_OPTIONS
             )
             
-            # Call appropriate delete method
-            if delete_config['namespaced']:
-                delete_method(
-                    name=resource_name,
-                    namespace=namespace,
-                    body=delete_options
-                )
-            else:
-                delete_method(
-                    name=resource_name,
-                    body=delete_options
-                )
-            
             execution_time = (time.time() - start_time) * 1000
             logging.info(f"Successfully deleted {resource_type} '{resource_name}' in {execution_time:.1f}ms")
             
@@ -378,11 +193,12 @@ class KubernetesResourceDeleteService:
     
     def is_delete_supported(self, resource_type: str) -> bool:
         """Check if delete operation is supported for the resource type"""
-        return resource_type.lower() in self._delete_method_mapping
+        info = self.registry.resolve(resource_type)
+        return info is not None and info.supports('delete')
     
     def get_supported_resource_types(self) -> List[str]:
         """Get list of all supported resource types for deletion"""
-        return list(self._delete_method_mapping.keys())
+        return self.registry.resource_types(verb='delete')
 
 
 # Global service instance
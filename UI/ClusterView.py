@@ -68,6 +68,7 @@ from Pages.AccessControl.RoleBindingsPage import RoleBindingsPage
 
 # Custom Resource pages
 from Pages.CustomResources.DefinitionsPage import DefinitionsPage
+from Pages.CustomResources.CustomResourcesPage import CustomResourcesPage
 
 # Apps page
 from Pages.AppsChartPage import AppsPage
@@ -133,6 +134,7 @@ PAGE_CONFIG = {
 
     # Custom Resource pages
     'Definitions': DefinitionsPage,
+    'Instances': CustomResourcesPage,
     
     # Apps page
     'AppsChart': AppsPage,
@@ -155,7 +157,7 @@ DROPDOWN_MENUS = {
     "Storage": ["Persistent Volume Claims", "Persistent Volumes", "Storage Classes"],
     "Access Control": ["Service Accounts", "Cluster Roles", "Roles",
                        "Cluster Role Bindings", "Role Bindings"],
-    "Custom Resources": ["Definitions"],
+    "Custom Resources": ["Definitions", "Instances"],
     # "Helm": ["Releases", "Charts"]
 }
 
@@ -676,10 +678,11 @@ class ClusterView(QWidget):
 
     def _handle_special_event_detail(self, page, row: int) -> bool:
         """Handle special case for Events page detail view"""
-        if not (hasattr(page, 'resources') and row < len(page.resources)):
+        # Rows are in the table's sort order - ask the page which event is shown there
+        event = page.get_resource_at(row) if hasattr(page, 'get_resource_at') else None
+        if event is None:
             return False
 
-        event = page.resources[row]
         raw_data = event.get("raw_data", {})
 
         # Get event identifier
@@ -921,6 +924,10 @@ class ClusterView(QWidget):
 
                 if page_name in self.pages:
                     page = self.pages[page_name]
+                    if getattr(page, 'resource_type', None):
+                        # Do not serve the edited resource from the result cache
+                        from Utils.unified_resource_loader import get_unified_resource_loader
+                        get_unified_resource_loader().invalidate_cache(page.resource_type)
                     if hasattr(page, 'force_load_data'):
                         page.force_load_data()
                     elif hasattr(page, 'load_data'):
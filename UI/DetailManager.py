@@ -91,8 +91,12 @@ class DetailManager(QObject):
             'replicationcontrollers': 'replicationcontroller',
         }
         
-        resource_type_singular = plural_to_singular_mapping.get(resource_type.lower(), 
-                                                              resource_type.rstrip('s') if resource_type.endswith('s') else resource_type)
+        if '.' in resource_type:
+            # Qualified custom resource types ('plural.group') are resolved by the registry as they are
+            resource_type_singular = resource_type
+        else:
+            resource_type_singular = plural_to_singular_mapping.get(resource_type.lower(),
+                                                                  resource_type.rstrip('s') if resource_type.endswith('s') else resource_type)
         
         # Ensure detail page is created
         detail_page = self._ensure_detail_page()
@@ -6,6 +6,8 @@ from PyQt6.QtGui import QIcon, QFont, QColor, QAction, QPixmap
 
 from UI.Styles import AppColors, AppStyles
 from UI.Icons import Icons
+from Utils.access_review import get_access_review_cache
+from Utils.resource_registry import get_resource_registry
 import logging
 
 class NavMenuDropdown(QMenu):
@@ -101,6 +103,7 @@ class NavIconButton(QToolButton):
 
         # Track signal connections to prevent multiple connections
         self._dropdown_connections = []
+        self._menu_actions = {}  # Menu item -> its action, for greying out forbidden resources
 
         # Store the fallback icon text (emoji)
         self.icon_text = getattr(Icons, icon_id.upper(), "⚙️") if isinstance(icon_id, str) else "⚙️"
@@ -368,12 +371,14 @@ class NavIconButton(QToolButton):
                 menu_items = ["Service Accounts", "Cluster Roles", "Roles",
                               "Cluster Role Bindings", "Role Bindings"]
             elif self.item_text == "Custom Resources":
-                menu_items = ["Definitions"]
+                menu_items = ["Definitions", "Instances"]
             else:
                 menu_items = []
 
+            self._menu_actions = {}
             for item in menu_items:
                 action = self.dropdown_menu.addAction(item)
+                self._menu_actions[item] = action
                 action.triggered.connect(lambda checked=False, item_name=item:
                                          self.parent_window.handle_dropdown_selection(item_name))
 
@@ -405,6 +410,8 @@ class NavIconButton(QToolButton):
             else:
                 pos = self.mapToGlobal(QPoint(40, 0))
 
+            self._update_menu_access()
+
             # Clear any existing aboutToHide connections for this dropdown
             try:
                 self.dropdown_menu.aboutToHide.disconnect()
@@ -423,6 +430,16 @@ class NavIconButton(QToolButton):
             self.dropdown_open = False
             self.update_style()
 
+    def _update_menu_access(self):
+        """Grey out resources the access review found the user cannot list anywhere"""
+        access = get_access_review_cache()
+        registry = get_resource_registry()
+        for item, action in self._menu_actions.items():
+            info = registry.resolve(item.replace(" ", "").lower())
+            forbidden = info is not None and access.listable_anywhere(info.resource_type) is False
+            action.setEnabled(not forbidden)
+            action.setToolTip("No permission to list this resource" if forbidden else "")
+
     def dropdown_closed(self):
         """Handle dropdown close event"""
         try:
@@ -416,7 +416,7 @@ class AppStyles:
         }}
     """
     TABLE_STYLE = f"""
-        QTableWidget {{
+        QTableView {{
             background-color: {AppColors.CARD_BG};
             border: none;
             gridline-color: transparent;
@@ -426,7 +426,7 @@ class AppStyles:
             alternate-background-color: transparent;
         }}
         
-        QTableWidget::item {{
+        QTableView::item {{
             padding: 10px 8px;
             border: none;
             outline: none;
@@ -434,17 +434,17 @@ class AppStyles:
             background-color: transparent;
         }}
         
-        QTableWidget::item:hover {{
+        QTableView::item:hover {{
             background-color: rgba(53, 132, 228, 0.10);
         }}
         
-        QTableWidget::item:selected {{
+        QTableView::item:selected {{
             background-color: rgba(53, 132, 228, 0.15);
             color: {AppColors.TEXT_LIGHT};
             border: none;
         }}
         
-        QTableWidget::item:selected:hover {{
+        QTableView::item:selected:hover {{
             background-color: rgba(53, 132, 228, 0.20);
         }}
         
@@ -0,0 +1,272 @@
+"""
+Access Review Cache - What the current user may list on each cluster, asked once
+Restricted users used to discover their permissions by failing: a 403 per namespace on every
+"All Namespaces" load and an "Access denied" on every refresh. At connect time one
+SelfSubjectAccessReview tells cluster-wide readers they can list everything, and everyone else
+gets a SelfSubjectRulesReview per namespace. The answers are cached per cluster, 403s seen
+later are remembered for a while, and the loader and sidebar skip what is known to be forbidden.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
+
+from Utils.raw_json import list_raw, get_list_items, MetadataListMethod
+from Utils.resource_registry import get_resource_registry, ResourceInfo
+
+
+ACCESS_REVIEW_TIMEOUT = 10  # Seconds per review request
+ACCESS_REVIEW_TTL = 600  # Reconnecting within this window reuses a cluster's probe results
+ACCESS_PROBE_CONCURRENCY = 4  # Rules reviews in flight at once (they still pass the rate limiter)
+ACCESS_PROBE_MAX_NAMESPACES = 500  # Namespaces reviewed at connect time - the rest stay unknown
+RECORDED_FORBIDDEN_TTL = 300  # Seconds a 403 seen by a request is trusted before the request is tried again
+
+WILDCARD = '*'
+
+
+def rule_allows(rule: Dict[str, Any], verb: str, info: ResourceInfo) -> bool:
+    """Whether one resourceRules entry grants a verb on every object of a resource type"""
+    if rule.get('resourceNames'):
+        return False  # Rules limited to named objects never grant list/watch
+    verbs = rule.get('verbs') or ()
+    groups = rule.get('apiGroups') or ()
+    resources = rule.get('resources') or ()
+    return ((WILDCARD in verbs or verb in verbs)
+            and (WILDCARD in groups or info.group in groups)
+            and (WILDCARD in resources or info.resource_type in resources))
+
+
+class ClusterAccess:
+    """Review results of one cluster"""
+
+    def __init__(self):
+        self.probed_at = 0.0
+        self.rules: Dict[str, Tuple[List[Dict[str, Any]], bool]] = {}  # namespace -> (resourceRules, incomplete)
+        self.reviews: Dict[Tuple[str, str, str], bool] = {}  # (verb, qualified name or '*', namespace or '') -> allowed
+        self.forbidden_at: Dict[Tuple[str, str, str], float] = {}  # Review keys denied by a request -> when
+
+
+class AccessReviewCache:
+    """
+    Per-cluster cache of what the current user may do.
+    Answers are True, False or None (unknown) - unknown combinations are simply requested.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clusters: Dict[str, ClusterAccess] = {}
+        self._cluster: Optional[str] = None
+        self.stats = {
+            'access_reviews': 0,
+            'rules_reviews': 0,
+            'forbidden_recorded': 0,
+            'skipped_requests': 0,
+            'failures': 0,
+        }
+
+    def select_cluster(self, cluster_name: str) -> bool:
+        """Make a cluster current - returns True when its probe results are still fresh"""
+        with self._lock:
+            self._cluster = cluster_name
+            access = self._clusters.setdefault(cluster_name, ClusterAccess())
+            return time.time() - access.probed_at < ACCESS_REVIEW_TTL
+
+    def _current(self) -> Optional[ClusterAccess]:
+        return self._clusters.get(self._cluster) if self._cluster else None
+
+    # Probing (blocking - call from a worker thread)
+
+    def probe(self, cluster_name: str, namespaces: Optional[List[str]] = None):
+        """Review the user's permissions on a cluster: one access review, then a rules review per namespace"""
+        self.select_cluster(cluster_name)
+        started = time.time()
+        access = ClusterAccess()
+        registry = get_resource_registry()
+
+        try:
+            if self._review_access(registry, 'list', WILDCARD, WILDCARD):
+                # Reads everything cluster-wide - there is nothing to skip
+                access.reviews[('list', WILDCARD, '')] = True
+            else:
+                access.reviews[('list', WILDCARD, '')] = False
+                if namespaces is None:
+                    namespaces = self._list_namespace_names(registry)
+                if len(namespaces) > ACCESS_PROBE_MAX_NAMESPACES:
+                    logging.info(f"Access review: Reviewing the first {ACCESS_PROBE_MAX_NAMESPACES} of {len(namespaces)} namespaces")
+                    namespaces = namespaces[:ACCESS_PROBE_MAX_NAMESPACES]
+
+                with ThreadPoolExecutor(max_workers=ACCESS_PROBE_CONCURRENCY, thread_name_prefix="access-review") as executor:
+                    for namespace, result in zip(namespaces, executor.map(
+                            lambda namespace: self._review_rules(registry, namespace), namespaces)):
+                        if result is not None:
+                            access.rules[namespace] = result
+        except Exception as e:
+            self.stats['failures'] += 1
+            logging.warning(f"Access review: Could not review permissions on {cluster_name}: {e}")
+            return
+
+        access.probed_at = time.time()
+        with self._lock:
+            previous = self._clusters.get(cluster_name)
+            if previous is not None:
+                # 403s recorded while the probe ran stay known - older ones are answered by the probe
+                for key, recorded_at in previous.forbidden_at.items():
+                    if recorded_at >= started:
+                        access.reviews.setdefault(key, False)
+                        access.forbidden_at[key] = recorded_at
+            self._clusters[cluster_name] = access
+
+        logging.info(f"Access review: {cluster_name} probed - "
+                     f"{'cluster-wide read access' if access.reviews[('list', WILDCARD, '')] else f'{len(access.rules)} namespaces reviewed'}")
+
+    def _review_access(self, registry, verb: str, group: str, resource: str, namespace: Optional[str] = None) -> bool:
+        attributes = {'verb': verb, 'group': group, 'resource': resource}
+        if namespace:
+            attributes['namespace'] = namespace
+        body = {
+            'apiVersion': 'authorization.k8s.io/v1',
+            'kind': 'SelfSubjectAccessReview',
+            'spec': {'resourceAttributes': attributes},
+        }
+        self.stats['access_reviews'] += 1
+        response = registry.create('selfsubjectaccessreviews', body, request_timeout=ACCESS_REVIEW_TIMEOUT)
+        return bool((response.get('status') or {}).get('allowed'))
+
+    def _review_rules(self, registry, namespace: str) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+        body = {
+            'apiVersion': 'authorization.k8s.io/v1',
+            'kind': 'SelfSubjectRulesReview',
+            'spec': {'namespace': namespace},
+        }
+        try:
+            self.stats['rules_reviews'] += 1
+            response = registry.create('selfsubjectrulesreviews', body, request_timeout=ACCESS_REVIEW_TIMEOUT)
+        except Exception as e:
+            self.stats['failures'] += 1
+            logging.debug(f"Access review: Rules review failed for namespace {namespace}: {e}")
+            return None
+        status = response.get('status') or {}
+        return status.get('resourceRules') or [], bool(status.get('incomplete'))
+
+    @staticmethod
+    def _list_namespace_names(registry) -> List[str]:
+        list_method = registry.list_method('namespaces', MetadataListMethod)
+        try:
+            body = list_raw(list_method, _request_timeout=ACCESS_REVIEW_TIMEOUT)
+        except Exception as e:
+            logging.debug(f"Access review: Cannot list namespaces: {e}")
+            return []
+        return [(item.get('metadata') or {}).get('name') for item in get_list_items(body)
+                if (item.get('metadata') or {}).get('name')]
+
+    # Lookups (never send a request)
+
+    def can(self, verb: str, resource_type: str, namespace: Optional[str] = None) -> Optional[bool]:
+        """Whether the user may use a verb on a resource type in a namespace, or cluster-wide without one
+
+        None means unknown - the request should be tried.
+        """
+        info = get_resource_registry().resolve(resource_type)
+        with self._lock:
+            access = self._current()
+            if info is None or access is None:
+                return None
+            if access.reviews.get((verb, WILDCARD, '')):
+                return True
+            if not info.namespaced:
+                namespace = None
+
+            key = (verb, info.qualified_name, namespace or '')
+            recorded_at = access.forbidden_at.get(key)
+            if recorded_at is not None and time.time() - recorded_at > RECORDED_FORBIDDEN_TTL:
+                # The 403 may have been transient, or access granted since - try the request again
+                del access.forbidden_at[key]
+                access.reviews.pop(key, None)
+            known = access.reviews.get(key)
+            if known is not None:
+                return known
+
+            if namespace is None:
+                # Cluster-wide grants appear in every namespace's rules - a complete review without one rules them out
+                for rules, incomplete in access.rules.values():
+                    if not incomplete and not any(rule_allows(rule, verb, info) for rule in rules):
+                        return False
+                return None
+
+            reviewed = access.rules.get(namespace)
+            if reviewed is None:
+                return None
+            rules, incomplete = reviewed
+            if any(rule_allows(rule, verb, info) for rule in rules):
+                return True
+            return None if incomplete else False
+
+    def listable_namespaces(self, resource_type: str, namespaces: List[str]) -> List[str]:
+        """Namespaces a resource type is not known to be forbidden in"""
+        allowed = [namespace for namespace in namespaces if self.can('list', resource_type, namespace) is not False]
+        skipped = len(namespaces) - len(allowed)
+        if skipped:
+            self.stats['skipped_requests'] += skipped
+            logging.debug(f"Access review: Skipping {skipped} namespaces where {resource_type} cannot be listed")
+        return allowed
+
+    def listable_anywhere(self, resource_type: str) -> Optional[bool]:
+        """Whether a resource type can be listed cluster-wide or in any reviewed namespace"""
+        cluster_wide = self.can('list', resource_type)
+        info = get_resource_registry().resolve(resource_type)
+        if cluster_wide is not False or info is None or not info.namespaced:
+            return cluster_wide
+
+        with self._lock:
+            access = self._current()
+            if access is None or not access.probed_at or not access.rules:
+                return None
+            namespaces = list(access.rules)
+        answers = [self.can('list', resource_type, namespace) for namespace in namespaces]
+        if any(answers):
+            return True
+        return None if None in answers else False
+
+    def record_forbidden(self, verb: str, resource_type: str, namespace: Optional[str] = None):
+        """Remember a 403 so the same request is not sent again on this cluster"""
+        info = get_resource_registry().resolve(resource_type)
+        with self._lock:
+            access = self._current()
+            if info is None or access is None:
+                return
+            if not info.namespaced:
+                namespace = None
+            key = (verb, info.qualified_name, namespace or '')
+            access.reviews[key] = False
+            access.forbidden_at[key] = time.time()
+            self.stats['forbidden_recorded'] += 1
+
+    def note_skipped(self):
+        """Count a request skipped because it was known to be forbidden"""
+        self.stats['skipped_requests'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            access = self._current()
+            return {
+                **self.stats,
+                'cluster': self._cluster,
+                'probed_at': access.probed_at if access else 0,
+                'namespaces_reviewed': len(access.rules) if access else 0,
+            }
+
+
+# Singleton management
+_access_review_cache_instance = None
+_access_review_cache_lock = threading.Lock()
+
+def get_access_review_cache() -> AccessReviewCache:
+    """Get or create the access review cache singleton"""
+    global _access_review_cache_instance
+    if _access_review_cache_instance is None:
+        with _access_review_cache_lock:
+            if _access_review_cache_instance is None:
+                _access_review_cache_instance = AccessReviewCache()
+    return _access_review_cache_instance
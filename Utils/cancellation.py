@@ -0,0 +1,180 @@
+"""
+Cancellation tokens that reach into the HTTP layer
+A cancelled worker used to keep blocking in its list call until the request timeout, holding a
+thread pool slot and a pooled connection. Requests made while a token is bound to the thread
+register the connection they check out of the shared pool; cancelling the token shuts those
+sockets down, so the blocked read fails at once and the connection is discarded.
+"""
+
+import logging
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Any
+
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class RequestCancelled(Exception):
+    """Raised in place of a request (or a retry) made after its token was cancelled"""
+
+    def __init__(self, message: str = "Operation cancelled"):
+        super().__init__(message)
+
+
+_local = threading.local()
+
+_stats_lock = threading.Lock()
+_stats = {
+    'requests_aborted': 0,
+    'retries_aborted': 0,
+    'throttle_waits_aborted': 0,
+    'seconds_reclaimed': 0.0,
+}
+
+
+def _record_abort(key: str, seconds: float):
+    with _stats_lock:
+        _stats[key] += 1
+        _stats['seconds_reclaimed'] += max(0.0, seconds)
+
+
+def get_cancellation_stats() -> Dict[str, Any]:
+    """Requests, retry and throttling waits aborted by cancellation, and the blocking time that freed up"""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats['seconds_reclaimed'] = round(stats['seconds_reclaimed'], 1)
+    return stats
+
+
+def current_token() -> Optional['CancellationToken']:
+    """Token bound to the calling thread, if any"""
+    return getattr(_local, 'token', None)
+
+
+class CancellationToken:
+    """
+    Cancellation state of one unit of work, shared by every thread working on it.
+    request_timeout is the longest a request may block - an aborted request is credited with
+    the part of it that had not run out yet.
+    """
+
+    def __init__(self, request_timeout: Optional[float] = None):
+        self.request_timeout = request_timeout
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._connections: Dict[Any, float] = {}  # checked-out connection -> time it was checked out
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise RequestCancelled()
+
+    def wait(self, seconds: float, stat: str = 'retries_aborted') -> bool:
+        """Sleep for a retry or throttling delay - returns True as soon as the token is cancelled"""
+        started = time.monotonic()
+        if self._event.wait(seconds):
+            _record_abort(stat, seconds - (time.monotonic() - started))
+            return True
+        return False
+
+    def cancel(self):
+        """Cancel the token and shut down the sockets of its in-flight requests"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            connections = list(self._connections.items())
+            self._connections.clear()
+
+        now = time.monotonic()
+        aborted = 0
+        for conn, checked_out in connections:
+            if self._abort_connection(conn):
+                aborted += 1
+                remaining = (self.request_timeout or 0) - (now - checked_out)
+                _record_abort('requests_aborted', remaining)
+        if aborted:
+            logging.debug(f"Cancellation aborted {aborted} in-flight request(s)")
+
+    @staticmethod
+    def _abort_connection(conn) -> bool:
+        sock = getattr(conn, 'sock', None)
+        if sock is None:
+            return False
+        try:
+            # The plain socket shutdown - the TLS layer is left to the thread blocked reading it
+            socket.socket.shutdown(sock, socket.SHUT_RDWR)
+            return True
+        except OSError as e:
+            logging.debug(f"Could not abort request connection: {e}")
+            return False
+
+    def track(self, conn):
+        """Register a connection checked out for a request of this token"""
+        with self._lock:
+            if not self._event.is_set():
+                self._connections[conn] = time.monotonic()
+                return
+        # Cancelled while the connection was being checked out
+        raise RequestCancelled()
+
+    def untrack(self, conn):
+        with self._lock:
+            self._connections.pop(conn, None)
+
+    @contextmanager
+    def bind(self):
+        """Make requests of the calling thread abortable through this token"""
+        previous = getattr(_local, 'token', None)
+        _local.token = self
+        try:
+            yield self
+        finally:
+            _local.token = previous
+
+
+class _CancellableConnectionPoolMixin:
+    """Connection pool that registers checked-out connections with the thread's cancellation token"""
+
+    def _get_conn(self, timeout=None):
+        token = current_token()
+        if token is not None:
+            # Stops urllib3's own retries of an aborted request from opening new connections
+            token.raise_if_cancelled()
+        conn = super()._get_conn(timeout=timeout)
+        if token is not None:
+            try:
+                token.track(conn)
+            except RequestCancelled:
+                super()._put_conn(conn)
+                raise
+            conn._cancellation_token = token
+        return conn
+
+    def _put_conn(self, conn):
+        token = getattr(conn, '_cancellation_token', None)
+        if token is not None:
+            token.untrack(conn)
+            conn._cancellation_token = None
+        super()._put_conn(conn)
+
+
+class CancellableHTTPConnectionPool(_CancellableConnectionPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class CancellableHTTPSConnectionPool(_CancellableConnectionPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+def install_cancellable_pools(pool_manager):
+    """Make the pools a urllib3 PoolManager creates abortable - call before its first request"""
+    pool_manager.pool_classes_by_scheme = {
+        'http': CancellableHTTPConnectionPool,
+        'https': CancellableHTTPSConnectionPool,
+    }
@@ -0,0 +1,451 @@
+"""
+Column Extractors - Declarative per-resource-type columns for processed rows
+Each resource type lists its columns as a path into the API object plus an optional reducer. The
+specs are compiled once per type into a tuple of getter closures, and the same compiled extractor
+fills rows in the unified loader, the processing workers and the process-pool extractor, so a
+column is defined in exactly one place. Adding a column is one ColumnSpec line.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Callable, Tuple
+
+
+NONE_TEXT = '<none>'
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """One processed-row field: value = reduce(object at path), with default replacing None"""
+    field: str
+    path: Optional[str] = None  # Dotted path into the raw API object, '' for the whole object, None for no lookup
+    reduce: Optional[Callable[[Any], Any]] = None  # Called with None when the path is missing
+    default: Any = None
+    searchable: bool = False
+
+
+def compile_path(path: Optional[str]) -> Callable[[Any], Any]:
+    """Compile a dotted path ('status.containerStatuses') into a getter over nested mappings"""
+    if path is None:
+        return lambda obj: None
+    if path == '':
+        return lambda obj: obj
+
+    keys = tuple(path.split('.'))
+    if len(keys) == 1:
+        key = keys[0]
+
+        def get_one(obj):
+            try:
+                return obj.get(key)
+            except AttributeError:
+                return None
+        return get_one
+
+    if len(keys) == 2:
+        first, second = keys
+
+        def get_two(obj):
+            try:
+                obj = obj.get(first)
+                return obj.get(second) if obj is not None else None
+            except AttributeError:
+                return None
+        return get_two
+
+    def get_path(obj):
+        try:
+            for key in keys:
+                if obj is None:
+                    return None
+                obj = obj.get(key)
+            return obj
+        except AttributeError:
+            return None
+    return get_path
+
+
+def raw_getter(path: str) -> Callable[[Any], Any]:
+    """Getter for a dotted path into a processed row's raw API object - for table columns not extracted up front"""
+    get = compile_path(path)
+    return lambda row: get(row.get('raw_data') or {})
+
+
+# Reducers - each accepts None for a missing value
+
+def count(values) -> int:
+    return len(values) if values else 0
+
+
+def or_none(value) -> Any:
+    return value if value else NONE_TEXT
+
+
+def join_keys(mapping) -> str:
+    return ', '.join(mapping.keys()) if mapping else NONE_TEXT
+
+
+def join_selector(selector) -> str:
+    return ', '.join(f"{key}={value}" for key, value in selector.items()) if selector else NONE_TEXT
+
+
+def join_names(entries) -> str:
+    return ', '.join(entry['name'] for entry in entries if entry.get('name')) if entries else NONE_TEXT
+
+
+def str_or_none(value) -> str:
+    return str(value) if value is not None else NONE_TEXT
+
+
+def object_ref(ref) -> str:
+    return f"{ref.get('kind')}/{ref.get('name')}" if ref else NONE_TEXT
+
+
+def format_capacity(raw_value) -> str:
+    """Format Kubernetes capacity values to human-readable format"""
+    if not raw_value:
+        return ''
+
+    if 'Ki' in raw_value:
+        # Convert from Ki to GB
+        ki_value = int(raw_value.replace('Ki', ''))
+        gb_value = ki_value / (1024 * 1024)
+        return f"{gb_value:.1f}GB"
+    elif 'Gi' in raw_value:
+        # Convert from Gi to GB
+        gi_value = int(raw_value.replace('Gi', ''))
+        return f"{gi_value}GB"
+    else:
+        return raw_value
+
+
+def pod_status(status) -> str:
+    """Pod phase, refined by container states that need attention"""
+    if not status:
+        return 'Unknown'
+
+    pod_status = status.get('phase') or 'Unknown'
+    for cs in status.get('containerStatuses') or []:
+        state = cs.get('state')
+        if state:
+            if state.get('waiting'):
+                reason = state['waiting'].get('reason')
+                if reason in ("CrashLoopBackOff", "ImagePullBackOff", "ErrImagePull"):
+                    return reason
+            elif state.get('terminated'):
+                if state['terminated'].get('exitCode') != 0:
+                    return "Error"
+    return pod_status
+
+
+def owner_kind(owner_references) -> str:
+    return owner_references[0].get('kind', '') if owner_references else ''
+
+
+def ready_ratio(container_statuses) -> str:
+    if not container_statuses:
+        return '0/0'
+    ready_count = sum(1 for cs in container_statuses if cs.get('ready'))
+    return f"{ready_count}/{len(container_statuses)}"
+
+
+def restart_count(container_statuses) -> int:
+    if not container_statuses:
+        return 0
+    return sum(cs.get('restartCount') or 0 for cs in container_statuses)
+
+
+def service_external_ip(service) -> Optional[str]:
+    spec = service.get('spec')
+    status = service.get('status')
+    if spec and spec.get('externalIPs'):
+        return ', '.join(spec['externalIPs'])
+
+    if spec and spec.get('type') == 'LoadBalancer' and status and status.get('loadBalancer'):
+        ingress = status['loadBalancer'].get('ingress')
+        if ingress:
+            ips = [ing['ip'] for ing in ingress if ing.get('ip')]
+            if ips:
+                return ', '.join(ips)
+    return None
+
+
+def workload_replicas(workload) -> str:
+    spec = workload.get('spec')
+    status = workload.get('status')
+    replicas = spec.get('replicas', 1) if spec else 1
+    ready_replicas = status.get('readyReplicas', 0) if status else 0
+    return f"{ready_replicas}/{replicas}"
+
+
+def process_node_conditions(conditions) -> tuple:
+    """Process raw node condition dicts and return (status, conditions_text)"""
+    node_status = 'Unknown'
+    conditions_list = []
+
+    if conditions:
+        for condition in conditions:
+            condition_type = condition.get('type')
+            condition_status = condition.get('status')
+            if condition_type == 'Ready':
+                node_status = 'Ready' if condition_status == 'True' else 'NotReady'
+
+            # Format condition for display: Type=Status
+            condition_display = f"{condition_type}={condition_status}"
+
+            # Add reason if available for non-True conditions
+            if condition_status != 'True' and condition.get('reason'):
+                condition_display += f" ({condition['reason']})"
+
+            conditions_list.append(condition_display)
+
+    conditions_text = ", ".join(conditions_list) if conditions_list else "Unknown"
+    return node_status, conditions_text
+
+
+def extract_node_roles(labels) -> list:
+    """Extract node roles from Kubernetes labels"""
+    roles = []
+    if labels:
+        for label_key in labels:
+            if 'node-role.kubernetes.io/' in label_key:
+                role = label_key.replace('node-role.kubernetes.io/', '')
+                if role:
+                    roles.append(role)
+    return roles if roles else ['<none>']
+
+
+def _endpoint_addresses(subsets) -> List[str]:
+    return [addr['ip'] for subset in subsets or [] for addr in subset.get('addresses') or [] if addr.get('ip')]
+
+
+def _endpoint_ports(subsets) -> str:
+    ports = []
+    for subset in subsets or []:
+        for port in subset.get('ports') or []:
+            port_info = f"{port.get('port', 'unknown')}"
+            if port.get('protocol'):
+                port_info += f"/{port['protocol']}"
+            if port.get('name'):
+                port_info += f" ({port['name']})"
+            ports.append(port_info)
+    return ', '.join(ports) if ports else NONE_TEXT
+
+
+def _endpoint_list(subsets) -> str:
+    addresses = _endpoint_addresses(subsets)
+    if not addresses:
+        return NONE_TEXT
+    return ', '.join(addresses[:3]) + ('...' if len(addresses) > 3 else '')
+
+
+def _crd_established(conditions) -> str:
+    established = any(c.get('type') == 'Established' and c.get('status') == 'True' for c in conditions or [])
+    return 'True' if established else 'False'
+
+
+_WORKLOAD_COLUMNS = [
+    ColumnSpec('replicas', '', workload_replicas),
+    ColumnSpec('ready_replicas', 'status.readyReplicas', default=0),
+    ColumnSpec('total_replicas', 'spec.replicas', default=1),
+]
+
+_WEBHOOK_COLUMNS = [
+    ColumnSpec('webhooks_count', 'webhooks', count),
+    ColumnSpec('webhooks', 'webhooks', join_names, searchable=True),
+]
+
+COLUMN_SPECS: Dict[str, List[ColumnSpec]] = {
+    'pods': [
+        ColumnSpec('status', 'status', pod_status, searchable=True),
+        ColumnSpec('ready', 'status.containerStatuses', ready_ratio),
+        ColumnSpec('restarts', 'status.containerStatuses', restart_count),
+        ColumnSpec('node_name', 'spec.nodeName', searchable=True),
+        ColumnSpec('host_ip', 'status.hostIP'),
+        ColumnSpec('pod_ip', 'status.podIP', searchable=True),
+        ColumnSpec('containers', 'spec.containers', count),
+        ColumnSpec('init_containers', 'spec.initContainers', count),
+        ColumnSpec('controller_by', 'metadata.ownerReferences', owner_kind, searchable=True),
+        ColumnSpec('qos_class', 'status.qosClass', default=''),
+    ],
+    'nodes': [
+        ColumnSpec('status', 'status.conditions', lambda c: process_node_conditions(c)[0], searchable=True),
+        ColumnSpec('conditions', 'status.conditions', lambda c: process_node_conditions(c)[1]),
+        ColumnSpec('roles', 'metadata.labels', extract_node_roles, searchable=True),
+        ColumnSpec('version', 'status.nodeInfo.kubeletVersion', default='Unknown', searchable=True),
+        ColumnSpec('os', 'status.nodeInfo.operatingSystem', default='Unknown'),
+        ColumnSpec('kernel', 'status.nodeInfo.kernelVersion', default='Unknown'),
+        ColumnSpec('taints', 'spec.taints', lambda taints: str(count(taints))),
+        ColumnSpec('cpu_capacity', 'status.capacity.cpu', default=''),
+        ColumnSpec('memory_capacity', 'status.capacity.memory', format_capacity),
+        ColumnSpec('disk_capacity', 'status.capacity.ephemeral-storage', format_capacity),
+        ColumnSpec('pods_capacity', 'status.capacity.pods', default=''),
+        # Usage is filled in by the metrics refresh
+        ColumnSpec('cpu_usage', default=0.0),
+        ColumnSpec('memory_usage', default=0.0),
+        ColumnSpec('disk_usage', default=0.0),
+    ],
+    'services': [
+        ColumnSpec('type', 'spec.type', default='Unknown', searchable=True),
+        ColumnSpec('cluster_ip', 'spec.clusterIP', searchable=True),
+        ColumnSpec('external_ip', '', service_external_ip, searchable=True),
+        ColumnSpec('ports', 'spec.ports', count),
+    ],
+    'deployments': _WORKLOAD_COLUMNS,
+    'replicasets': _WORKLOAD_COLUMNS,
+    'statefulsets': _WORKLOAD_COLUMNS,
+    'daemonsets': _WORKLOAD_COLUMNS,
+    'replicationcontrollers': [
+        ColumnSpec('replicas', 'status.replicas', default=0),
+        ColumnSpec('desired_replicas', 'spec.replicas', default=0),
+        ColumnSpec('selector', 'spec.selector', join_selector, searchable=True),
+    ],
+    'configmaps': [
+        ColumnSpec('keys', 'data', join_keys, searchable=True),
+        ColumnSpec('data_count', 'data', count),
+    ],
+    'secrets': [
+        ColumnSpec('type', 'type', default='Opaque', searchable=True),
+        ColumnSpec('keys', 'data', join_keys, searchable=True),
+        ColumnSpec('data_count', 'data', count),
+    ],
+    'resourcequotas': [
+        ColumnSpec('hard_limits', 'spec.hard', count),
+        ColumnSpec('used_resources', 'status.used', count),
+        ColumnSpec('resources', 'spec.hard', join_keys, searchable=True),
+    ],
+    'limitranges': [
+        ColumnSpec('limits_count', 'spec.limits', count),
+        ColumnSpec('types', 'spec.limits',
+                   lambda limits: ', '.join(set(l['type'] for l in limits if l.get('type'))) if limits else NONE_TEXT,
+                   searchable=True),
+    ],
+    'horizontalpodautoscalers': [
+        ColumnSpec('min_replicas', 'spec.minReplicas', default=1),
+        ColumnSpec('max_replicas', 'spec.maxReplicas', default=1),
+        ColumnSpec('current_replicas', 'status.currentReplicas', default=0),
+        ColumnSpec('target_ref', 'spec.scaleTargetRef', object_ref, searchable=True),
+    ],
+    'poddisruptionbudgets': [
+        ColumnSpec('min_available', 'spec.minAvailable', str_or_none),
+        ColumnSpec('max_unavailable', 'spec.maxUnavailable', str_or_none),
+        ColumnSpec('current_healthy', 'status.currentHealthy', default=0),
+        ColumnSpec('desired_healthy', 'status.desiredHealthy', default=0),
+    ],
+    'priorityclasses': [
+        ColumnSpec('value', 'value', default=0),
+        ColumnSpec('global_default', 'globalDefault', default=False),
+        ColumnSpec('description', 'description', or_none, searchable=True),
+    ],
+    'runtimeclasses': [
+        ColumnSpec('handler', 'handler', or_none, searchable=True),
+    ],
+    'leases': [
+        ColumnSpec('holder_identity', 'spec.holderIdentity', or_none, searchable=True),
+        ColumnSpec('holder', 'spec.holderIdentity', or_none),  # For compatibility with LeasesPage
+        ColumnSpec('lease_duration', 'spec.leaseDurationSeconds', lambda d: f"{d}s" if d else NONE_TEXT),
+    ],
+    'mutatingwebhookconfigurations': _WEBHOOK_COLUMNS,
+    'validatingwebhookconfigurations': _WEBHOOK_COLUMNS,
+    'serviceaccounts': [
+        ColumnSpec('secrets_count', 'secrets', count),
+        ColumnSpec('image_pull_secrets_count', 'imagePullSecrets', count),
+        ColumnSpec('automount_token', 'automountServiceAccountToken', default=True),
+    ],
+    'endpoints': [
+        ColumnSpec('endpoints_count', 'subsets', lambda subsets: len(_endpoint_addresses(subsets))),
+        ColumnSpec('endpoints', 'subsets', _endpoint_list, searchable=True),
+        ColumnSpec('ports', 'subsets', _endpoint_ports),
+    ],
+    'roles': [ColumnSpec('rules_count', 'rules', count)],
+    'clusterroles': [ColumnSpec('rules_count', 'rules', count)],
+    'rolebindings': [
+        ColumnSpec('subjects_count', 'subjects', count),
+        ColumnSpec('role_ref', 'roleRef',
+                   lambda ref: f"{ref['kind']}/{ref['name']}" if ref and ref.get('kind') and ref.get('name') else NONE_TEXT,
+                   searchable=True),
+    ],
+    'customresourcedefinitions': [
+        ColumnSpec('group', 'spec.group', or_none, searchable=True),
+        ColumnSpec('scope', 'spec.scope', default='Namespaced'),
+        ColumnSpec('established', 'status.conditions', _crd_established),
+    ],
+}
+COLUMN_SPECS['clusterrolebindings'] = COLUMN_SPECS['rolebindings']
+
+# Row fields every processed row has, searched for every resource type
+BASE_SEARCH_FIELDS = ('name', 'namespace')
+
+_CompiledColumn = Tuple[str, Callable[[Any], Any], Optional[Callable[[Any], Any]], Any]
+
+_extractors: Dict[str, Callable[[Dict[str, Any], Any], None]] = {}
+_extractors_lock = threading.Lock()
+
+
+def _compile_extractor(resource_type: str) -> Callable[[Dict[str, Any], Any], None]:
+    columns: Tuple[_CompiledColumn, ...] = tuple(
+        (spec.field, compile_path(spec.path), spec.reduce, spec.default)
+        for spec in COLUMN_SPECS.get(resource_type, ())
+    )
+
+    def extract(item: Dict[str, Any], row):
+        try:
+            for field, get, reduce, default in columns:
+                value = get(item)
+                if reduce is not None:
+                    value = reduce(value)
+                row[field] = default if value is None else value
+        except Exception as e:
+            # One malformed field must not drop the row - fill what can be extracted
+            logging.debug(f"Error extracting {resource_type} columns: {e}")
+            _extract_guarded(columns, item, row)
+
+    return extract
+
+
+def get_column_extractor(resource_type: str) -> Callable[[Dict[str, Any], Any], None]:
+    """Compiled extractor that writes the type's columns for an API object into a row"""
+    extractor = _extractors.get(resource_type)
+    if extractor is None:
+        with _extractors_lock:
+            extractor = _extractors.get(resource_type)
+            if extractor is None:
+                extractor = _extractors[resource_type] = _compile_extractor(resource_type)
+    return extractor
+
+
+def register_columns(resource_type: str, specs: List[ColumnSpec]):
+    """Add or replace the columns of a resource type"""
+    with _extractors_lock:
+        COLUMN_SPECS[resource_type] = list(specs)
+        _extractors.pop(resource_type, None)
+
+
+def has_columns(resource_type: str) -> bool:
+    return resource_type in COLUMN_SPECS
+
+
+def _extract_guarded(columns: Tuple[_CompiledColumn, ...], item: Dict[str, Any], row):
+    for field, get, reduce, default in columns:
+        try:
+            value = get(item)
+            if reduce is not None:
+                value = reduce(value)
+        except Exception:
+            value = None
+        row[field] = default if value is None else value
+
+
+def extract_columns(resource_type: str, item: Dict[str, Any]) -> Dict[str, Any]:
+    """The type's columns for one API object, as a new dict"""
+    row: Dict[str, Any] = {}
+    get_column_extractor(resource_type)(item, row)
+    return row
+
+
+def get_searchable_fields(resource_type: str) -> List[str]:
+    """Row fields the search index covers for a resource type"""
+    fields = list(BASE_SEARCH_FIELDS)
+    fields.extend(spec.field for spec in COLUMN_SPECS.get(resource_type, ()) if spec.searchable)
+    return fields
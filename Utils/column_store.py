@@ -0,0 +1,154 @@
+"""
+Column Store - column-oriented sort keys of a table model's rows
+Each column a table sorts, filters or totals is kept as one vector parallel to the model's rows.
+Numeric, quantity, duration and age columns are NumPy float arrays when NumPy is installed (Python
+double arrays otherwise), so sorting, comparisons and totals over them run without touching the rows.
+Text and version columns are lists of their typed keys, with short text keys interned.
+"""
+
+import logging
+import operator
+from array import array
+from typing import Any, Callable, Dict, List, Optional
+
+from Utils.resource_row import intern_string
+from Utils.sort_keys import NUMERIC, QUANTITY, DURATION, MISSING_NUMBER
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+    logging.debug("numpy not available - numeric columns are stored as Python arrays")
+
+NUMERIC_KINDS = (NUMERIC, QUANTITY, DURATION)
+
+COMPARISONS: Dict[str, Callable[[Any, Any], Any]] = {
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+
+def _numeric_vector(values) -> Any:
+    if NUMPY_AVAILABLE:
+        return np.fromiter(values, dtype=np.float64)
+    return array('d', values)
+
+
+class ColumnStore:
+    """
+    Typed per-column values of a row list, kept in step with it by the model.
+    Columns are added on first use with the function that computes a row's key.
+    """
+
+    def __init__(self):
+        self._vectors: Dict[int, Any] = {}
+        self._keys: Dict[int, Callable[[Any], Any]] = {}
+        self._numeric = set()
+
+    def __contains__(self, column: int) -> bool:
+        return column in self._vectors
+
+    def is_numeric(self, column: int) -> bool:
+        return column in self._numeric
+
+    def add_column(self, column: int, rows: List[Any], key: Callable[[Any], Any], kind: str):
+        """Compute a column's key for every row"""
+        self._keys[column] = key
+        if kind in NUMERIC_KINDS:
+            self._numeric.add(column)
+            self._vectors[column] = _numeric_vector(key(row) for row in rows)
+        else:
+            self._numeric.discard(column)
+            self._vectors[column] = [intern_string(key(row)) for row in rows]
+
+    def values(self, column: int) -> Any:
+        return self._vectors[column]
+
+    def copy(self) -> 'ColumnStore':
+        """Store with its own copy of every column - for reading while this one keeps changing"""
+        store = ColumnStore()
+        store._keys = dict(self._keys)
+        store._numeric = set(self._numeric)
+        store._vectors = {column: vector.copy() if NUMPY_AVAILABLE and column in self._numeric else vector[:]
+                          for column, vector in self._vectors.items()}
+        return store
+
+    def clear(self):
+        self._vectors.clear()
+        self._keys.clear()
+        self._numeric.clear()
+
+    # Row changes - applied in the same order the model applies them to its rows
+
+    def append(self, rows: List[Any]):
+        if not rows:
+            return
+        for column, vector in self._vectors.items():
+            key = self._keys[column]
+            if column not in self._numeric:
+                vector.extend(intern_string(key(row)) for row in rows)
+            elif NUMPY_AVAILABLE:
+                self._vectors[column] = np.concatenate((vector, _numeric_vector(key(row) for row in rows)))
+            else:
+                vector.extend(key(row) for row in rows)
+
+    def update(self, index: int, row: Any):
+        for column, vector in self._vectors.items():
+            value = self._keys[column](row)
+            vector[index] = value if column in self._numeric else intern_string(value)
+
+    def delete(self, first: int, last: int):
+        """Remove rows first..last inclusive"""
+        for column, vector in self._vectors.items():
+            if NUMPY_AVAILABLE and column in self._numeric:
+                self._vectors[column] = np.delete(vector, np.s_[first:last + 1])
+            else:
+                del vector[first:last + 1]
+
+    def permute(self, order: List[int]):
+        """Reorder every column so position i holds what was at order[i]"""
+        for column, vector in self._vectors.items():
+            if NUMPY_AVAILABLE and column in self._numeric:
+                self._vectors[column] = vector[np.asarray(order, dtype=np.intp)]
+            elif column in self._numeric:
+                self._vectors[column] = array('d', (vector[index] for index in order))
+            else:
+                self._vectors[column] = [vector[index] for index in order]
+
+    # Column operations
+
+    def argsort(self, column: int, reverse: bool = False) -> List[int]:
+        """Stable row order of a column - equal keys keep their current order in both directions"""
+        vector = self._vectors[column]
+        if NUMPY_AVAILABLE and column in self._numeric:
+            return np.argsort(-vector if reverse else vector, kind='stable').tolist()
+        return sorted(range(len(vector)), key=vector.__getitem__, reverse=reverse)
+
+    def compare(self, column: int, op: str, value: Any, rows: Optional[List[int]] = None) -> List[int]:
+        """Rows whose key compares to value with op ('=', '!=', '<', '<=', '>', '>='), optionally within rows"""
+        compare = COMPARISONS[op]
+        vector = self._vectors[column]
+        if NUMPY_AVAILABLE and column in self._numeric:
+            if rows is None:
+                return np.flatnonzero(compare(vector, value)).tolist()
+            candidates = np.asarray(rows, dtype=np.intp)
+            return candidates[compare(vector[candidates], value)].tolist()
+        indexes = range(len(vector)) if rows is None else rows
+        return [index for index in indexes if compare(vector[index], value)]
+
+    def total(self, column: int, rows: Optional[List[int]] = None) -> float:
+        """Sum of a numeric column over all rows or the given rows - values that could not be read count as 0"""
+        if column not in self._numeric:
+            raise ValueError(f"Column {column} is not numeric")
+        vector = self._vectors[column]
+        if NUMPY_AVAILABLE:
+            selected = vector if rows is None else vector[np.asarray(rows, dtype=np.intp)]
+            return float(selected[selected != MISSING_NUMBER].sum())
+        selected = vector if rows is None else (vector[index] for index in rows)
+        return float(sum(value for value in selected if value != MISSING_NUMBER))
@@ -31,56 +31,59 @@ class HighPerformanceFormatters:
     _MEMORY_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)([KMGTPE]?i?)$')
     
     @staticmethod
-    def format_age(timestamp_str: str) -> str:
-        """Format age for display"""
+    def timestamp_to_epoch(timestamp: Any) -> Optional[float]:
+        """Epoch seconds of an ISO timestamp, datetime or epoch number (None when unparseable)"""
+        if timestamp is None or timestamp == '' or timestamp == 'Unknown':
+            return None
+        if isinstance(timestamp, (int, float)):
+            return float(timestamp)
         try:
-            # Handle various timestamp formats
-            if not timestamp_str or timestamp_str == 'Unknown':
-                return 'Unknown'
-            
-            # Parse timestamp
-            if isinstance(timestamp_str, str):
-                # ISO format timestamp
-                if 'T' in timestamp_str:
-                    created = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                else:
-                    created = datetime.fromtimestamp(float(timestamp_str), tz=timezone.utc)
+            if isinstance(timestamp, datetime):
+                created = timestamp
+            elif isinstance(timestamp, str) and 'T' not in timestamp:
+                return float(timestamp)
             else:
-                created = timestamp_str
+                created = datetime.fromisoformat(str(timestamp).replace('Z', '+00:00'))
             
             # Ensure timezone aware
             if created.tzinfo is None:
                 created = created.replace(tzinfo=timezone.utc)
-            
-            # Calculate age
-            now = datetime.now(timezone.utc)
-            age_delta = now - created
-            
-            # Format efficiently
-            days = age_delta.days
-            hours = age_delta.seconds // 3600
-            minutes = (age_delta.seconds % 3600) // 60
-            seconds = age_delta.seconds % 60
-            
-            # Return most significant unit
-            if days > 365:
-                years = days // 365
-                return f"{years}y"
-            elif days > 30:
-                months = days // 30
-                return f"{months}mo"
-            elif days > 0:
-                return f"{days}d"
-            elif hours > 0:
-                return f"{hours}h"
-            elif minutes > 0:
-                return f"{minutes}m"
-            else:
-                return f"{seconds}s"
-                
-        except Exception as e:
-            logging.debug(f"Error formatting age for '{timestamp_str}': {e}")
+            return created.timestamp()
+        except (TypeError, ValueError) as e:
+            logging.debug(f"Error parsing timestamp '{timestamp}': {e}")
+            return None
+    
+    @staticmethod
+    def format_age_seconds(age_seconds: Optional[float]) -> str:
+        """Format an age in seconds by its most significant unit"""
+        if age_seconds is None:
+            return 'Unknown'
+        
+        seconds = max(0, int(age_seconds))
+        days, seconds = divmod(seconds, 86400)
+        hours, seconds = divmod(seconds, 3600)
+        minutes = seconds // 60
+        
+        if days > 365:
+            return f"{days // 365}y"
+        elif days > 30:
+            return f"{days // 30}mo"
+        elif days > 0:
+            return f"{days}d"
+        elif hours > 0:
+            return f"{hours}h"
+        elif minutes > 0:
+            return f"{minutes}m"
+        else:
+            return "<1m"
+    
+    @staticmethod
+    def format_age(timestamp_str: str) -> str:
+        """Format age for display"""
+        epoch = HighPerformanceFormatters.timestamp_to_epoch(timestamp_str)
+        if epoch is None:
             return 'Unknown'
+        return HighPerformanceFormatters.format_age_seconds(time.time() - epoch)
     
     @staticmethod
     def format_age_from_datetime(dt: Optional[datetime]) -> str:
@@ -417,6 +420,18 @@ def format_age(timestamp: Optional[Union[str, datetime]]) -> str:
         return _formatter_instance.format_age(str(timestamp))
 
 
+def timestamp_to_epoch(timestamp: Any) -> Optional[float]:
+    """Epoch seconds of a Kubernetes timestamp - what rows store instead of a formatted age"""
+    return _formatter_instance.timestamp_to_epoch(timestamp)
+
+
+def format_age_from_epoch(epoch: Optional[float], now: Optional[float] = None) -> str:
+    """Format the age of an epoch timestamp as of now - called when a cell is painted"""
+    if epoch is None:
+        return 'Unknown'
+    return _formatter_instance.format_age_seconds((now or time.time()) - epoch)
+
+
 def parse_cpu_value(cpu_str: str) -> ResourceUsage:
     """Parse CPU value"""
     return _formatter_instance.parse_cpu_value(cpu_str)
@@ -4,10 +4,13 @@ import logging
 import weakref
 import time
 
+from Utils.cancellation import CancellationToken
+
 class WorkerSignals(QObject):
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
     progress = pyqtSignal(str)
+    partial = pyqtSignal(object)
     cancelled = pyqtSignal()
 
 class EnhancedBaseWorker(QRunnable):
@@ -20,9 +23,12 @@ class EnhancedBaseWorker(QRunnable):
         self._completed = threading.Event()
         self._start_time = time.time()
         self._timeout = 30  # 30 second timeout
+        # Shared with every thread doing HTTP work for this worker - cancelling aborts its requests
+        self.cancel_token = CancellationToken(request_timeout=self._timeout)
         
     def cancel(self):
         self._cancelled.set()
+        self.cancel_token.cancel()
         if not self._completed.is_set():
             self.signals.cancelled.emit()
         
@@ -63,6 +69,13 @@ class EnhancedBaseWorker(QRunnable):
                 self.signals.progress.emit(progress)
             except RuntimeError:
                 pass
+    
+    def safe_emit_partial(self, result):
+        if not self.is_cancelled():
+            try:
+                self.signals.partial.emit(result)
+            except RuntimeError:
+                pass
             
     def run(self):
         self._started.set()
@@ -70,7 +83,8 @@ class EnhancedBaseWorker(QRunnable):
             if self.is_cancelled():
                 return
                 
-            result = self.execute()
+            with self.cancel_token.bind():
+                result = self.execute()
             
             if not self.is_cancelled() and not self.is_timed_out():
                 self.safe_emit_finished(result)
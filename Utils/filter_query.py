@@ -0,0 +1,356 @@
+"""
+Filter Query - structured filters over the rows of a resource table
+A query is whitespace-separated terms that must all match:
+
+    status!=Running ns:kube-system restarts>5 label:app=web node~ip-10-* age>2d nginx
+
+    field=value, field!=value     cell text equals value (case-insensitive)
+    field~pattern, field!~pattern cell text matches a glob (* and ?), or contains the text without wildcards
+    field>value, >=, <, <=        the column's typed sort key compares - numbers, quantities, durations, versions
+    ns:name, status:Running       field:value is field=value
+    label:key=value, label:key    rows with the label value (or glob with ~), or with the label at all
+    text                          the name, namespace or another searchable field contains text
+    -term                         rows the term does not match
+
+Fields are column headers, case, spaces and underscores ignored ("controlledby" for "Controlled By"),
+or row fields. Given the table's field names, a token naming none of them ("nginx:1.25", "http://x")
+is a plain text term. Age columns compare durations - "age>2d" is older than two days.
+Terms compile against a FilterSnapshot of the table, so matching can run off the GUI thread.
+Label and text terms are answered from indexes built once per row generation and shared by its snapshots.
+"""
+
+import re
+import shlex
+import time
+from dataclasses import dataclass, field
+from fnmatch import translate
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from Utils.column_store import COMPARISONS, NUMERIC_KINDS, ColumnStore
+from Utils.search_index import ResourceSearchIndex
+from Utils.sort_keys import (NATURAL, NUMERIC, MISSING_NUMBER, duration_key, numeric_key,
+                             get_sort_key_function, missing_key)
+
+FIELD = 'field'  # Column or row field terms
+TEXT = 'text'    # Free text - one of the snapshot's search fields contains the value
+LABEL = 'label'  # Label terms - field holds the label key
+
+_TERM = re.compile(r'^(?P<field>[A-Za-z_][\w.\-]*?)(?P<op>!=|>=|<=|!~|=|~|>|<|:)(?P<value>.*)$')
+_LABEL_TERM = re.compile(r'^(?P<key>[^=!~]+?)(?:(?P<op>!=|!~|=|~)(?P<value>.*))?$')
+_WILDCARDS = re.compile(r'[*?\[]')
+
+DEFAULT_SEARCH_FIELDS = ('name', 'namespace')
+
+_FIELD_ALIASES = {'ns': 'namespace'}
+_LABEL_FIELDS = ('label', 'labels')
+_ORDERED_OPS = ('<', '<=', '>', '>=')
+# An age compares against a creation time - older is earlier
+_AGE_OPS = {'<': '>', '<=': '>=', '>': '<', '>=': '<=', '=': '='}
+
+_CHECK_EVERY = 4096  # Rows scanned between cancellation checks
+FIELD_SAMPLE_ROWS = 100  # Rows whose keys tell which row fields a query may name
+
+
+class FilterQueryError(ValueError):
+    """A query that cannot be parsed, or names a field or value the table cannot compare"""
+
+
+@dataclass(frozen=True)
+class FilterTerm:
+    """One term of a query - op is '=', '~' or an ordered comparison, negated terms match the other rows"""
+    field: str
+    op: str
+    value: str
+    negate: bool = False
+    kind: str = FIELD  # FIELD, TEXT or LABEL
+
+
+@dataclass
+class FilterColumn:
+    """How a query reads one table column - text and key never raise"""
+    index: int
+    header: str
+    key_name: str
+    text: Callable[[Any], str]  # row -> display text
+    key: Callable[[Any], Any]   # row -> typed sort key
+    kind: str                   # Sort-key kind of key
+    is_age: bool = False        # key is an epoch and values are durations
+
+
+@dataclass
+class FilterSnapshot:
+    """
+    A table's rows, columns and stored column keys at one moment - read-only once taken.
+    indexes holds the label and search indexes of these rows, built on first use; snapshots of the
+    same row generation can share one dict.
+    """
+    rows: List[Any]
+    columns: List[FilterColumn]
+    store: ColumnStore
+    generation: int = 0
+    search_fields: Tuple[str, ...] = DEFAULT_SEARCH_FIELDS
+    indexes: Dict[Any, Any] = field(default_factory=dict)
+    _by_name: Dict[str, FilterColumn] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        for column in self.columns:
+            self._by_name.setdefault(_normalize_field(column.header), column)
+        for column in self.columns:
+            self._by_name.setdefault(_normalize_field(column.key_name), column)
+
+    def find_column(self, name: str) -> Optional[FilterColumn]:
+        return self._by_name.get(_normalize_field(name))
+
+    def label_index(self, check_cancelled: Optional[Callable[[], None]] = None) -> 'LabelIndex':
+        index = self.indexes.get(LABEL)
+        if index is None:
+            index = self.indexes[LABEL] = LabelIndex(self.rows, check_cancelled)
+        return index
+
+    def search_index(self, check_cancelled: Optional[Callable[[], None]] = None) -> ResourceSearchIndex:
+        key = (TEXT, self.search_fields)
+        index = self.indexes.get(key)
+        if index is None:
+            index = ResourceSearchIndex(max_results=len(self.rows))
+            index.build_index(self.rows, list(self.search_fields), check_cancelled)
+            self.indexes[key] = index
+        return index
+
+
+class LabelIndex:
+    """Row positions by label key and by label key and value - valid for one row generation"""
+
+    def __init__(self, rows: List[Any], check_cancelled: Optional[Callable[[], None]] = None):
+        self._by_key: Dict[str, List[int]] = {}
+        self._by_value: Dict[tuple, List[int]] = {}
+        for position, row in enumerate(rows):
+            if check_cancelled and not position % _CHECK_EVERY:
+                check_cancelled()
+            labels = row.get('labels')
+            if not labels:
+                continue
+            for key, value in labels.items():
+                self._by_key.setdefault(key, []).append(position)
+                self._by_value.setdefault((key, str(value)), []).append(position)
+
+    def with_key(self, key: str) -> List[int]:
+        return self._by_key.get(key, [])
+
+    def with_value(self, key: str, value: str) -> List[int]:
+        return self._by_value.get((key, value), [])
+
+    def matching(self, key: str, pattern: str) -> List[int]:
+        """Rows whose value of a label matches a glob, or contains the text without wildcards"""
+        test = _text_test(pattern)
+        positions = [position for (label, value), rows in self._by_value.items()
+                     if label == key and test(value.casefold()) for position in rows]
+        return sorted(positions)
+
+
+def _normalize_field(name: str) -> str:
+    name = re.sub(r'[\s_\-]', '', str(name).casefold())
+    return _FIELD_ALIASES.get(name, name)
+
+
+def filter_field_names(names: Iterable[Any]) -> FrozenSet[str]:
+    """Field names a query may use, for parse_filter_query - column headers and keys, row fields"""
+    return frozenset(_normalize_field(name) for name in names if name)
+
+
+def parse_filter_query(text: str, fields: Optional[FrozenSet[str]] = None) -> List[FilterTerm]:
+    """
+    Terms of a query - raises FilterQueryError for unbalanced quotes and terms without a value.
+    With fields (filter_field_names), field terms must name one of them or be read as text.
+    """
+    try:
+        tokens = shlex.split(text or "")
+    except ValueError as e:
+        raise FilterQueryError(f"Invalid filter: {e}") from None
+    return [_parse_term(token, fields) for token in tokens if token not in ('', '-')]
+
+
+def _parse_term(token: str, fields: Optional[FrozenSet[str]] = None) -> FilterTerm:
+    negate = token.startswith('-')
+    if negate:
+        token = token[1:]
+
+    match = _TERM.match(token)
+    if not match:
+        return FilterTerm(TEXT, '~', token, negate, kind=TEXT)
+    name, op, value = match.group('field', 'op', 'value')
+    if fields is not None and name.lower() not in _LABEL_FIELDS and _normalize_field(name) not in fields:
+        return FilterTerm(TEXT, '~', token, negate, kind=TEXT)
+
+    if name.lower() in _LABEL_FIELDS and op == ':':
+        label = _LABEL_TERM.match(value)
+        if not label:
+            raise FilterQueryError(f"Invalid label filter: {token}")
+        key, op, value = label.group('key', 'op', 'value')
+        if op is None:
+            return FilterTerm(key, 'has', '', negate, kind=LABEL)
+        if not value:
+            raise FilterQueryError(f"Missing value in {token}")
+        # != and !~ are the negations of = and ~, for labels and fields alike
+        return FilterTerm(key, op.lstrip('!'), value, negate != op.startswith('!'), kind=LABEL)
+
+    if not value:
+        raise FilterQueryError(f"Missing value in {token}")
+    if op == ':':
+        op = '='
+    elif op in ('!=', '!~'):
+        op, negate = op[1:], not negate
+    return FilterTerm(name, op, value, negate)
+
+
+def is_structured_query(text: str, fields: Optional[FrozenSet[str]] = None) -> bool:
+    """True for queries with field, label or negated terms - plain words are a name search"""
+    try:
+        terms = parse_filter_query(text, fields)
+    except FilterQueryError:
+        return True  # Reported by the filter, not searched for as text
+    return any(term.kind != TEXT or term.negate for term in terms)
+
+
+def _text_test(pattern: str) -> Callable[[str], bool]:
+    """casefolded text -> True when it matches a glob, or contains the text without wildcards"""
+    pattern = pattern.casefold()
+    if _WILDCARDS.search(pattern):
+        return re.compile(translate(pattern)).match
+    return lambda text: pattern in text
+
+
+def _scan(positions, rows: List[Any], test: Callable[[Any], bool],
+          check_cancelled: Optional[Callable[[], None]]) -> List[int]:
+    matched = []
+    for count, position in enumerate(positions):
+        if check_cancelled and not count % _CHECK_EVERY:
+            check_cancelled()
+        if test(rows[position]):
+            matched.append(position)
+    return matched
+
+
+def _within(positions: List[int], candidates: Optional[List[int]]) -> List[int]:
+    if candidates is None:
+        return list(positions)
+    allowed = set(positions)
+    return [position for position in candidates if position in allowed]
+
+
+def _term_cost(term: FilterTerm) -> int:
+    """Indexed terms first so text scans see the fewest rows"""
+    if term.kind in (LABEL, TEXT):
+        return 0
+    return 1 if term.op in _ORDERED_OPS or term.op == '=' else 2
+
+
+def match_rows(terms: List[FilterTerm], snapshot: FilterSnapshot,
+               check_cancelled: Optional[Callable[[], None]] = None) -> List[int]:
+    """
+    Positions of the snapshot rows every term matches, in row order.
+    check_cancelled is called between terms and while scanning rows, and raises to stop the match.
+    """
+    rows = snapshot.rows
+    candidates = None  # Every row
+    for term in sorted(terms, key=_term_cost):
+        if check_cancelled:
+            check_cancelled()
+        if term.kind == LABEL:
+            matched = _within(_label_positions(term, snapshot.label_index(check_cancelled)), candidates)
+        elif term.kind == TEXT:
+            matched = _within(snapshot.search_index(check_cancelled).find_term(term.value), candidates)
+        else:
+            matched = _match_term(term, snapshot, candidates, check_cancelled)
+        if term.negate:
+            excluded = set(matched)
+            matched = [position for position in (range(len(rows)) if candidates is None else candidates)
+                       if position not in excluded]
+        candidates = matched
+        if not candidates:
+            break
+    return list(range(len(rows))) if candidates is None else candidates
+
+
+def _label_positions(term: FilterTerm, label_index: LabelIndex) -> List[int]:
+    if term.op == 'has':
+        return label_index.with_key(term.field)
+    if term.op == '~':
+        return label_index.matching(term.field, term.value)
+    return label_index.with_value(term.field, term.value)
+
+
+def _match_term(term: FilterTerm, snapshot: FilterSnapshot, candidates: Optional[List[int]],
+                check_cancelled: Optional[Callable[[], None]]) -> List[int]:
+    rows = snapshot.rows
+    positions = range(len(rows)) if candidates is None else candidates
+
+    column = snapshot.find_column(term.field)
+    if column is None:
+        return _match_row_field(term, rows, positions, check_cancelled)
+
+    typed = column.is_age or column.kind in NUMERIC_KINDS
+    if term.op in _ORDERED_OPS or (term.op == '=' and typed and not column.is_age):
+        return _compare_column(term, column, snapshot, candidates)
+
+    if term.op == '=':
+        value = term.value.casefold()
+        return _scan(positions, rows, lambda row: column.text(row).casefold() == value, check_cancelled)
+    test = _text_test(term.value)
+    return _scan(positions, rows, lambda row: test(column.text(row).casefold()), check_cancelled)
+
+
+def _compare_column(term: FilterTerm, column: FilterColumn, snapshot: FilterSnapshot,
+                    candidates: Optional[List[int]]) -> List[int]:
+    """Vectorized comparison of a column's stored keys"""
+    op = term.op
+    if column.is_age:
+        seconds = duration_key(term.value)
+        if seconds == MISSING_NUMBER:
+            raise FilterQueryError(f"'{term.value}' is not a duration for {column.header}")
+        op, value = _AGE_OPS[op], time.time() - seconds
+    else:
+        value = get_sort_key_function(column.kind)(term.value)
+        if value == MISSING_NUMBER:
+            raise FilterQueryError(f"'{term.value}' is not a {column.kind} value for {column.header}")
+
+    store = snapshot.store
+    if column.index not in store:
+        store.add_column(column.index, snapshot.rows, column.key, column.kind)
+    matched = store.compare(column.index, op, value, candidates)
+    if store.is_numeric(column.index):
+        # Rows whose value could not be read are not older, larger or smaller than anything
+        matched = store.compare(column.index, '>', MISSING_NUMBER, matched)
+    return matched
+
+
+def _match_row_field(term: FilterTerm, rows: List[Any], positions,
+                     check_cancelled: Optional[Callable[[], None]]) -> List[int]:
+    """Terms on a row field that is not a column - an unknown field is an error, not an empty table"""
+    name = term.field
+    if rows and not any(name in row for row in rows[:FIELD_SAMPLE_ROWS]):
+        raise FilterQueryError(f"Unknown field: {name}")
+
+    def text(row) -> str:
+        value = row.get(name)
+        if value is None:
+            return ""
+        if isinstance(value, (list, tuple)):
+            return ", ".join(str(v) for v in value)
+        return str(value)
+
+    if term.op in _ORDERED_OPS:
+        # Numbers compare as numbers, anything else as natural text
+        kind = NUMERIC if numeric_key(term.value) != MISSING_NUMBER else NATURAL
+        to_key, compare = get_sort_key_function(kind), COMPARISONS[term.op]
+        value, missing = to_key(term.value), missing_key(kind)
+
+        def test(row) -> bool:
+            key = to_key(row.get(name))
+            return key != missing and compare(key, value)
+        return _scan(positions, rows, test, check_cancelled)
+    if term.op == '=':
+        value = term.value.casefold()
+        return _scan(positions, rows, lambda row: text(row).casefold() == value, check_cancelled)
+    test = _text_test(term.value)
+    return _scan(positions, rows, lambda row: test(text(row).casefold()), check_cancelled)
+
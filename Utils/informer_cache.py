@@ -0,0 +1,430 @@
+"""
+Informer Cache - Shared list+watch store for Kubernetes resources
+Lists each (cluster, resource type) once and keeps the result current with a watch,
+so page switches are served from memory instead of re-listing from the API server.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Any, Callable, Tuple
+
+from kubernetes.client.rest import ApiException
+
+from Utils.raw_json import RawWatch, list_raw, get_list_items, get_list_resource_version, get_list_continue
+
+
+# Informer tuning
+LIST_PAGE_SIZE = 500  # Items per list page during the initial sync
+WATCH_TIMEOUT_SECONDS = 240  # Server-side watch timeout before the watch is resumed
+WATCH_RETRY_DELAY = 2.0  # Seconds to wait before resuming a dropped watch
+MAX_WATCH_RETRY_DELAY = 30.0  # Upper bound for the watch resume backoff
+FAILED_RETRY_SECONDS = 300  # How long a failed informer is kept before a new attempt
+MAX_WATCH_FAILURES = 5  # Failed watch resumes in a row before the store is no longer served
+MAX_STALENESS_SECONDS = 120  # How long a failing watch may leave the store unconfirmed before it is relisted
+HTTP_GONE = 410  # resourceVersion too old - a relist is required
+
+
+def _get_field(obj: Any, snake_name: str, camel_name: str = None) -> Any:
+    """Read a field from either a kubernetes model object or a raw dict"""
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(camel_name or snake_name)
+    return getattr(obj, snake_name, None)
+
+
+def get_object_uid(obj: Any) -> Optional[str]:
+    """Get metadata.uid from a kubernetes model object or raw dict"""
+    return _get_field(_get_field(obj, 'metadata'), 'uid')
+
+
+def get_object_resource_version(obj: Any) -> Optional[str]:
+    """Get metadata.resourceVersion from a kubernetes model object or raw dict"""
+    return _get_field(_get_field(obj, 'metadata'), 'resource_version', 'resourceVersion')
+
+
+def get_object_namespace(obj: Any) -> Optional[str]:
+    """Get metadata.namespace from a kubernetes model object or raw dict"""
+    return _get_field(_get_field(obj, 'metadata'), 'namespace')
+
+
+class ResourceInformer:
+    """
+    List+watch informer for a single resource type on a single cluster.
+    Keeps an in-memory store of raw object dicts keyed by metadata.uid and resumes the watch from the
+    last seen resourceVersion (including bookmarks) instead of relisting.
+    """
+
+    def __init__(self, cluster: str, resource_type: str, list_func: Callable,
+                 list_kwargs: Optional[Dict[str, Any]] = None):
+        self.cluster = cluster
+        self.resource_type = resource_type
+        self.list_func = list_func
+        self.list_kwargs = dict(list_kwargs or {})
+
+        self._store: Dict[str, Any] = {}
+        self._store_lock = threading.RLock()
+        self._resource_version: Optional[str] = None
+
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._failed = threading.Event()
+        self._stale = threading.Event()  # Watch kept failing - relisting, the store is not served meanwhile
+        self._thread: Optional[threading.Thread] = None
+        self._watch: Optional[RawWatch] = None
+
+        self.last_error: Optional[str] = None
+        self.failed_at = 0.0
+        self.last_sync_time = 0.0
+        self.last_watch_time = 0.0  # Last list, watch event, bookmark or cleanly ended watch
+        self._watch_failures = 0
+        self._failing_since = 0.0
+
+        # Statistics for diagnostics
+        self.stats = {
+            'lists': 0,
+            'watch_restarts': 0,
+            'events_applied': 0,
+            'bookmarks': 0,
+        }
+
+    def start(self):
+        """Start the list+watch loop in a background thread"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"informer-{self.cluster}-{self.resource_type}",
+            daemon=True
+        )
+        self._thread.start()
+        logging.info(f"Informer started for {self.resource_type} on cluster {self.cluster}")
+
+    def stop(self):
+        """Stop the informer and release the watch"""
+        self._stopped.set()
+        if self._watch:
+            try:
+                self._watch.stop()
+            except Exception:
+                pass
+        self._synced.clear()
+        logging.info(f"Informer stopped for {self.resource_type} on cluster {self.cluster}")
+
+    def is_synced(self) -> bool:
+        """True once the initial list has been loaded into the store and the watch keeps it current"""
+        return self._synced.is_set()
+
+    def is_stale(self) -> bool:
+        """True while the watch kept failing and the store is being relisted"""
+        return self._stale.is_set()
+
+    def has_failed(self) -> bool:
+        """True if the informer could not list the resource (e.g. forbidden)"""
+        return self._failed.is_set()
+
+    @property
+    def resource_version(self) -> Optional[str]:
+        """Last resourceVersion observed from a list, watch event or bookmark"""
+        return self._resource_version
+
+    def wait_for_sync(self, timeout: float, cancelled: Optional[Callable[[], bool]] = None) -> bool:
+        """Block until the store is synced, the informer fails or went stale, or the timeout expires"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self._synced.wait(0.1):
+                return True
+            if self._failed.is_set() or self._stale.is_set() or self._stopped.is_set():
+                return False
+            if cancelled and cancelled():
+                return False
+        return self._synced.is_set()
+
+    def list_items(self, namespace: Optional[str] = None) -> List[Any]:
+        """Return a snapshot of the store, optionally filtered by namespace"""
+        with self._store_lock:
+            if not namespace:
+                return list(self._store.values())
+            return [obj for obj in self._store.values() if get_object_namespace(obj) == namespace]
+
+    def __len__(self):
+        with self._store_lock:
+            return len(self._store)
+
+    def _run(self):
+        """Main informer loop: list once, then watch and resume until stopped"""
+        retry_delay = WATCH_RETRY_DELAY
+
+        while not self._stopped.is_set():
+            try:
+                if not self._resource_version:
+                    self._list()
+
+                # Watch ended by the server timeout - resume from the same resourceVersion
+                self._watch_from_resource_version()
+                self._mark_watched()
+                retry_delay = WATCH_RETRY_DELAY
+                continue
+
+            except ApiException as api_error:
+                if api_error.status == HTTP_GONE:
+                    # Our resourceVersion was compacted away - relist is unavoidable
+                    logging.info(f"Informer {self.resource_type}: resourceVersion expired, relisting")
+                    self._resource_version = None
+                    continue
+
+                if not self._synced.is_set() and api_error.status in (401, 403, 404):
+                    # The initial list is not permitted/available - give up so callers fall back
+                    self._mark_failed(f"API Error {api_error.status}: {api_error.reason}")
+                    return
+
+                logging.warning(f"Informer {self.resource_type}: watch error {api_error.status}, resuming in {retry_delay:.0f}s")
+
+            except Exception as e:
+                if self._stopped.is_set():
+                    break
+
+                if not self._synced.is_set() and self.stats['lists'] == 0:
+                    self._mark_failed(str(e))
+                    return
+
+                logging.warning(f"Informer {self.resource_type}: watch dropped ({e}), resuming in {retry_delay:.0f}s")
+
+            self.stats['watch_restarts'] += 1
+            self._record_watch_failure()
+            if self._stopped.wait(retry_delay):
+                break
+            retry_delay = min(retry_delay * 2, MAX_WATCH_RETRY_DELAY)
+
+    def _mark_watched(self):
+        """The store was confirmed current by a list, a watch event or a cleanly ended watch"""
+        self.last_watch_time = time.time()
+        self._watch_failures = 0
+        self._failing_since = 0.0
+
+    def _record_watch_failure(self):
+        """Count a failed watch resume - a store the watch cannot keep current stops being served and is relisted"""
+        now = time.time()
+        self._watch_failures += 1
+        if not self._failing_since:
+            self._failing_since = now
+
+        if not self._synced.is_set():
+            return
+        if self._watch_failures < MAX_WATCH_FAILURES and now - self._failing_since < MAX_STALENESS_SECONDS:
+            return
+
+        logging.warning(f"Informer {self.resource_type}: watch failed {self._watch_failures} times in "
+                        f"{now - self._failing_since:.0f}s, relisting")
+        self._stale.set()
+        self._synced.clear()
+        self._resource_version = None
+
+    def _mark_failed(self, error: str):
+        """Record a permanent failure so waiters stop blocking"""
+        self.last_error = error
+        self.failed_at = time.time()
+        self._failed.set()
+        logging.info(f"Informer {self.resource_type} on {self.cluster} unavailable: {error}")
+
+    def _list(self):
+        """Paginated list that atomically replaces the store"""
+        new_store: Dict[str, Any] = {}
+        continue_token = None
+        resource_version = None
+
+        while not self._stopped.is_set():
+            kwargs = dict(self.list_kwargs)
+            kwargs['limit'] = LIST_PAGE_SIZE
+            kwargs['_request_timeout'] = 60
+            if continue_token:
+                kwargs['_continue'] = continue_token
+
+            body = list_raw(self.list_func, **kwargs)
+
+            for obj in get_list_items(body):
+                uid = get_object_uid(obj)
+                if uid:
+                    new_store[uid] = obj
+
+            resource_version = get_list_resource_version(body) or resource_version
+            continue_token = get_list_continue(body)
+            if not continue_token:
+                break
+
+        if self._stopped.is_set():
+            return
+
+        with self._store_lock:
+            self._store = new_store
+            self._resource_version = resource_version
+
+        self.stats['lists'] += 1
+        self.last_sync_time = time.time()
+        self._mark_watched()
+        self._stale.clear()
+        self._synced.set()
+        logging.info(f"Informer {self.resource_type}: listed {len(new_store)} objects at resourceVersion {resource_version}")
+
+    def _watch_from_resource_version(self):
+        """Stream watch events from the last known resourceVersion into the store"""
+        self._watch = RawWatch()
+
+        kwargs = dict(self.list_kwargs)
+        kwargs.update({
+            'resource_version': self._resource_version,
+            'allow_watch_bookmarks': True,
+            'timeout_seconds': WATCH_TIMEOUT_SECONDS,
+            '_request_timeout': WATCH_TIMEOUT_SECONDS + 30,
+        })
+
+        for event in self._watch.stream(self.list_func, **kwargs):
+            if self._stopped.is_set():
+                break
+
+            event_type = event.get('type')
+            raw_object = event.get('raw_object') or {}
+
+            if event_type == 'ERROR':
+                code = raw_object.get('code') if isinstance(raw_object, dict) else None
+                raise ApiException(status=code or 500, reason=raw_object.get('message', 'watch error'))
+
+            if event_type == 'BOOKMARK':
+                # Bookmarks only carry a resourceVersion - remember it so resumes stay cheap
+                resource_version = (raw_object.get('metadata') or {}).get('resourceVersion')
+                if resource_version:
+                    self._resource_version = resource_version
+                self.stats['bookmarks'] += 1
+                self._mark_watched()
+                continue
+
+            self._apply_event(event_type, raw_object)
+            self._mark_watched()
+
+    def _apply_event(self, event_type: str, obj: Any):
+        """Apply a single ADDED/MODIFIED/DELETED delta to the store"""
+        uid = get_object_uid(obj)
+        if not uid:
+            return
+
+        with self._store_lock:
+            if event_type == 'DELETED':
+                self._store.pop(uid, None)
+            elif event_type in ('ADDED', 'MODIFIED'):
+                self._store[uid] = obj
+            else:
+                return
+
+            resource_version = get_object_resource_version(obj)
+            if resource_version:
+                self._resource_version = resource_version
+
+        self.stats['events_applied'] += 1
+
+
+class InformerCache:
+    """
+    Registry of informers keyed by (cluster, resource type).
+    Only one cluster is active at a time because the API clients are global;
+    informers for other clusters are stopped when the cluster changes.
+    """
+
+    def __init__(self):
+        self._informers: Dict[Tuple[str, str], ResourceInformer] = {}
+        self._lock = threading.RLock()
+        self._active_cluster: Optional[str] = None
+
+    def get_informer(self, cluster: str, resource_type: str, list_func: Callable,
+                     list_kwargs: Optional[Dict[str, Any]] = None) -> ResourceInformer:
+        """Get the running informer for (cluster, resource_type), starting one if needed"""
+        with self._lock:
+            if self._active_cluster != cluster:
+                self._stop_informers(lambda key: key[0] != cluster)
+                self._active_cluster = cluster
+
+            key = (cluster, resource_type)
+            informer = self._informers.get(key)
+
+            if informer and informer.has_failed():
+                if time.time() - informer.failed_at < FAILED_RETRY_SECONDS:
+                    return informer
+                informer = None  # Allow a fresh attempt, e.g. after RBAC changes
+
+            if informer is None:
+                informer = ResourceInformer(cluster, resource_type, list_func, list_kwargs)
+                self._informers[key] = informer
+                informer.start()
+
+            return informer
+
+    def peek_informer(self, cluster: str, resource_type: str) -> Optional[ResourceInformer]:
+        """Return an existing informer without starting one"""
+        with self._lock:
+            return self._informers.get((cluster, resource_type))
+
+    def stop_cluster(self, cluster: str):
+        """Stop all informers for a cluster"""
+        with self._lock:
+            self._stop_informers(lambda key: key[0] == cluster)
+            if self._active_cluster == cluster:
+                self._active_cluster = None
+
+    def retain_only(self, cluster: str):
+        """Stop informers for every cluster except the given one"""
+        with self._lock:
+            self._stop_informers(lambda key: key[0] != cluster)
+            self._active_cluster = cluster
+
+    def stop_all(self):
+        """Stop every informer"""
+        with self._lock:
+            self._stop_informers(lambda key: True)
+            self._active_cluster = None
+
+    def _stop_informers(self, predicate: Callable[[Tuple[str, str]], bool]):
+        """Stop and forget the informers whose key matches the predicate"""
+        for key in [key for key in self._informers if predicate(key)]:
+            informer = self._informers.pop(key)
+            try:
+                informer.stop()
+            except Exception as e:
+                logging.debug(f"Error stopping informer {key}: {e}")
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get statistics for all informers"""
+        with self._lock:
+            return {
+                f"{cluster}/{resource_type}": {
+                    **informer.stats,
+                    'objects': len(informer),
+                    'synced': informer.is_synced(),
+                    'stale': informer.is_stale(),
+                    'failed': informer.has_failed(),
+                    'resource_version': informer.resource_version,
+                }
+                for (cluster, resource_type), informer in self._informers.items()
+            }
+
+
+# Singleton management
+_informer_cache_instance = None
+_informer_cache_lock = threading.Lock()
+
+def get_informer_cache() -> InformerCache:
+    """Get or create the informer cache singleton"""
+    global _informer_cache_instance
+    with _informer_cache_lock:
+        if _informer_cache_instance is None:
+            _informer_cache_instance = InformerCache()
+        return _informer_cache_instance
+
+def shutdown_informer_cache():
+    """Stop all informers"""
+    global _informer_cache_instance
+    with _informer_cache_lock:
+        if _informer_cache_instance is not None:
+            _informer_cache_instance.stop_all()
+            _informer_cache_instance = None
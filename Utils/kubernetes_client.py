@@ -13,6 +13,15 @@ from PyQt6.QtCore import QObject, pyqtSignal
 from Services.kubernetes.kubernetes_service import get_kubernetes_service, KubeCluster
 from Utils.enhanced_worker import EnhancedBaseWorker
 from Utils.thread_manager import get_thread_manager
+from Utils.resource_registry import get_resource_registry
+
+
+# Helm pages reuse the detail view, but releases and charts are not Kubernetes API resources
+HELM_RESOURCE_TYPES = {'chart', 'charts', 'helmrelease', 'helmreleases'}
+
+# Objects opened without a namespace are looked up in these namespaces
+COMMON_NAMESPACES = ["default", "kube-system", "kube-public"]
+COMMON_NAMESPACE_SEARCH_TYPES = {'pods', 'services', 'deployments', 'replicasets'}
 
 
 class ResourceUpdateWorker(EnhancedBaseWorker):
@@ -292,101 +301,21 @@ class KubernetesClient(QObject):
     def _update_resource_sync(self, resource_type: str, resource_name: str, namespace: str, resource_data: dict):
         """Synchronous resource update - used by worker"""
         try:
-            # Convert dict to proper Kubernetes object
-            resource_body = resource_data
-            
-            # Map resource type to appropriate API call
-            result = None
-            
-            if resource_type.lower() == "pod":
-                result = self.v1.patch_namespaced_pod(
-                    name=resource_name,
-                    namespace=namespace,
-                    body=resource_body
-                )
-            elif resource_type.lower() == "service":
-                result = self.v1.patch_namespaced_service(
-                    name=resource_name,
-                    namespace=namespace,
-                    body=resource_body
-                )
-            elif resource_type.lower() == "deployment":
-                result = self.apps_v1.patch_namespaced_deployment(
-                    name=resource_name,
-                    namespace=namespace,
-                    body=resource_body
-                )
-            elif resource_type.lower() == "configmap":
-                result = self.v1.patch_namespaced_config_map(
-                    name=resource_name,
-                    namespace=namespace,
-                    body=resource_body
-                )
-            elif resource_type.lower() == "secret":
-                result = self.v1.patch_namespaced_secret(
-                    name=resource_name,
-                    namespace=namespace,
-                    body=resource_body
-                )
-            elif resource_type.lower() == "statefulset":
-                result = self.apps_v1.patch_namespaced_stateful_set(
-                    name=resource_name,
-                    namespace=namespace,
-                    body=resource_body
-                )
-            elif resource_type.lower() == "daemonset":
-                result = self.apps_v1.patch_namespaced_daemon_set(
-                    name=resource_name,
-                    namespace=namespace,
-                    body=resource_body
-                )
-            elif resource_type.lower() == "replicaset":
-                result = self.apps_v1.patch_namespaced_replica_set(
-                    name=resource_name,
-                    namespace=namespace,
-                    body=resource_body
-                )
-            elif resource_type.lower() == "ingress":
-                result = self.networking_v1.patch_namespaced_ingress(
-                    name=resource_name,
-                    namespace=namespace,
-                    body=resource_body
-                )
-            elif resource_type.lower() == "networkpolicy":
-                result = self.networking_v1.patch_namespaced_network_policy(
-                    name=resource_name,
-                    namespace=namespace,
-                    body=resource_body
-                )
-            # Non-namespaced resources
-            elif resource_type.lower() == "node":
-                result = self.v1.patch_node(
-                    name=resource_name,
-                    body=resource_body
-                )
-            elif resource_type.lower() == "namespace":
-                result = self.v1.patch_namespace(
-                    name=resource_name,
-                    body=resource_body
-                )
-            elif resource_type.lower() == "serviceaccount":
-                result = self.v1.patch_namespaced_service_account(
-                    name=resource_name,
-                    namespace=namespace,
-                    body=resource_body
-                )
-            else:
+            info = self._resolve_cluster_resource(resource_type)
+            if info is None or not info.supports('patch'):
                 return {
                     "success": False,
                     "message": f"Resource type '{resource_type}' is not supported for updates"
                 }
             
+            result = get_resource_registry().patch(info.resource_type, resource_name, namespace, resource_data)
+            
             if result:
                 logging.info(f"Successfully updated {resource_type}/{resource_name}")
                 return {
                     "success": True,
                     "message": f"Successfully updated {resource_type}/{resource_name}",
-                    "resource": result.to_dict() if hasattr(result, 'to_dict') else str(result)
+                    "resource": result
                 }
             else:
                 return {
@@ -403,6 +332,12 @@ class KubernetesClient(QObject):
                 "message": error_message
             }
     
+    def _resolve_cluster_resource(self, resource_type: str):
+        """ResourceInfo of a Kubernetes resource type, or None for unknown and Helm (non-API) types"""
+        if not resource_type or resource_type.lower() in HELM_RESOURCE_TYPES:
+            return None
+        return get_resource_registry().resolve(resource_type)
+    
     def _extract_readable_error(self, error) -> str:
         """Extract readable error message from Kubernetes API exceptions"""
         try:
@@ -575,135 +510,32 @@ class KubernetesClient(QObject):
     def get_resource_detail_async(self, resource_type: str, resource_name: str, namespace: str = None):
         """Get resource detail asynchronously - backward compatibility"""
         try:
-            # Map resource type to appropriate API call
+            registry = get_resource_registry()
+            info = self._resolve_cluster_resource(resource_type)
             resource_detail = None
             
-            if resource_type.lower() == "pod":
-                if namespace:
-                    resource_detail = self.v1.read_namespaced_pod(name=resource_name, namespace=namespace)
-                else:
-                    # Search efficiently in common namespaces instead of all namespaces
-                    common_namespaces = ["default", "kube-system", "kube-public"]
-                    for ns in common_namespaces:
-                        try:
-                            resource_detail = self.v1.read_namespaced_pod(name=resource_name, namespace=ns)
-                            break
-                        except Exception as ns_error:
-                            # Only log if it's not a simple "not found" error
-                            if "404" not in str(ns_error) and "not found" not in str(ns_error).lower():
-                                logging.debug(f"Error searching for {resource_name} in namespace {ns}: {ns_error}")
-                            continue
-            elif resource_type.lower() == "service":
-                if namespace:
-                    resource_detail = self.v1.read_namespaced_service(name=resource_name, namespace=namespace)
-                else:
-                    # Search efficiently in common namespaces instead of all namespaces
-                    common_namespaces = ["default", "kube-system", "kube-public"]
-                    for ns in common_namespaces:
-                        try:
-                            resource_detail = self.v1.read_namespaced_service(name=resource_name, namespace=ns)
-                            break
-                        except Exception as ns_error:
-                            if "404" not in str(ns_error) and "not found" not in str(ns_error).lower():
-                                logging.debug(f"Error searching for service {resource_name} in namespace {ns}: {ns_error}")
-                            continue
-            elif resource_type.lower() == "deployment":
-                if namespace:
-                    resource_detail = self.apps_v1.read_namespaced_deployment(name=resource_name, namespace=namespace)
-                else:
-                    # Search efficiently in common namespaces instead of all namespaces
-                    common_namespaces = ["default", "kube-system", "kube-public"]
-                    for ns in common_namespaces:
-                        try:
-                            resource_detail = self.apps_v1.read_namespaced_deployment(name=resource_name, namespace=ns)
-                            break
-                        except Exception as ns_error:
-                            if "404" not in str(ns_error) and "not found" not in str(ns_error).lower():
-                                logging.debug(f"Error searching for deployment {resource_name} in namespace {ns}: {ns_error}")
-                            continue
-            elif resource_type.lower() == "replicaset":
-                if namespace:
-                    resource_detail = self.apps_v1.read_namespaced_replica_set(name=resource_name, namespace=namespace)
-                else:
-                    # Search efficiently in common namespaces instead of all namespaces
-                    common_namespaces = ["default", "kube-system", "kube-public"]
-                    for ns in common_namespaces:
-                        try:
-                            resource_detail = self.apps_v1.read_namespaced_replica_set(name=resource_name, namespace=ns)
-                            break
-                        except Exception as ns_error:
-                            if "404" not in str(ns_error) and "not found" not in str(ns_error).lower():
-                                logging.debug(f"Error searching for replicaset {resource_name} in namespace {ns}: {ns_error}")
-                            continue
-            elif resource_type.lower() == "node":
-                resource_detail = self.v1.read_node(name=resource_name)
-            elif resource_type.lower() == "namespace":
-                resource_detail = self.v1.read_namespace(name=resource_name)
-            elif resource_type.lower() == "configmap":
-                if namespace:
-                    resource_detail = self.v1.read_namespaced_config_map(name=resource_name, namespace=namespace)
-            elif resource_type.lower() == "secret":
-                if namespace:
-                    resource_detail = self.v1.read_namespaced_secret(name=resource_name, namespace=namespace)
-            elif resource_type.lower() == "ingress":
-                if namespace:
-                    resource_detail = self.networking_v1.read_namespaced_ingress(name=resource_name, namespace=namespace)
-            elif resource_type.lower() == "persistentvolume":
-                resource_detail = self.v1.read_persistent_volume(name=resource_name)
-            elif resource_type.lower() == "persistentvolumeclaim":
-                if namespace:
-                    resource_detail = self.v1.read_namespaced_persistent_volume_claim(name=resource_name, namespace=namespace)
-            elif resource_type.lower() == "replicationcontroller":
-                if namespace:
-                    resource_detail = self.v1.read_namespaced_replication_controller(name=resource_name, namespace=namespace)
-            elif resource_type.lower() == "limitrange":
-                if namespace:
-                    resource_detail = self.v1.read_namespaced_limit_range(name=resource_name, namespace=namespace)
-            elif resource_type.lower() == "resourcequota":
-                if namespace:
-                    resource_detail = self.v1.read_namespaced_resource_quota(name=resource_name, namespace=namespace)
-            elif resource_type.lower() == "serviceaccount":
-                if namespace:
-                    resource_detail = self.v1.read_namespaced_service_account(name=resource_name, namespace=namespace)
-            elif resource_type.lower() == "endpoint":
-                if namespace:
-                    resource_detail = self.v1.read_namespaced_endpoints(name=resource_name, namespace=namespace)
-            elif resource_type.lower() == "lease":
-                if namespace:
-                    resource_detail = self.coordination_v1.read_namespaced_lease(name=resource_name, namespace=namespace)
-            elif resource_type.lower() == "horizontalpodautoscaler":
-                if namespace:
-                    resource_detail = self.autoscaling_v2.read_namespaced_horizontal_pod_autoscaler(name=resource_name, namespace=namespace)
-            elif resource_type.lower() == "poddisruptionbudget":
-                if namespace:
-                    resource_detail = self.policy_v1.read_namespaced_pod_disruption_budget(name=resource_name, namespace=namespace)
-            elif resource_type.lower() == "priorityclass":
-                resource_detail = self.scheduling_v1.read_priority_class(name=resource_name)
-            elif resource_type.lower() == "runtimeclass":
-                resource_detail = self.node_v1.read_runtime_class(name=resource_name)
-            elif resource_type.lower() == "mutatingwebhookconfiguration":
-                resource_detail = self.admissionregistration_v1.read_mutating_webhook_configuration(name=resource_name)
-            elif resource_type.lower() == "validatingwebhookconfiguration":
-                resource_detail = self.admissionregistration_v1.read_validating_webhook_configuration(name=resource_name)
-            elif resource_type.lower() == "role":
-                if namespace:
-                    resource_detail = self.rbac_v1.read_namespaced_role(name=resource_name, namespace=namespace)
-            elif resource_type.lower() == "clusterrole":
-                resource_detail = self.rbac_v1.read_cluster_role(name=resource_name)
-            elif resource_type.lower() == "rolebinding":
-                if namespace:
-                    resource_detail = self.rbac_v1.read_namespaced_role_binding(name=resource_name, namespace=namespace)
-            elif resource_type.lower() == "clusterrolebinding":
-                resource_detail = self.rbac_v1.read_cluster_role_binding(name=resource_name)
-            elif resource_type.lower() == "customresourcedefinition":
-                resource_detail = self.apiextensions_v1.read_custom_resource_definition(name=resource_name)
+            if info is None:
+                pass
+            elif not info.namespaced:
+                resource_detail = registry.get(info.resource_type, resource_name)
+            elif namespace:
+                resource_detail = registry.get(info.resource_type, resource_name, namespace)
+            elif info.resource_type in COMMON_NAMESPACE_SEARCH_TYPES:
+                # Search efficiently in common namespaces instead of all namespaces
+                for ns in COMMON_NAMESPACES:
+                    try:
+                        resource_detail = registry.get(info.resource_type, resource_name, ns)
+                        break
+                    except Exception as ns_error:
+                        # Only log if it's not a simple "not found" error
+                        if "404" not in str(ns_error) and "not found" not in str(ns_error).lower():
+                            logging.debug(f"Error searching for {info.resource_type} {resource_name} in namespace {ns}: {ns_error}")
+                        continue
             
             if resource_detail:
-                # Convert to dictionary format for compatibility
-                detail_dict = self.v1.api_client.sanitize_for_serialization(resource_detail)
                 # Emit signal with the resource detail
-                self.resource_detail_loaded.emit(detail_dict)
-                return detail_dict
+                self.resource_detail_loaded.emit(resource_detail)
+                return resource_detail
             else:
                 logging.debug(f"Resource {resource_type}/{resource_name} not found - may not exist or be accessible")
                 return None
@@ -851,6 +683,14 @@ class KubernetesClient(QObject):
         """Get cache statistics - backward compatibility"""
         return self.service.get_cache_stats()
     
+    def get_connection_pool_stats(self) -> Dict[str, Any]:
+        """Get shared API connection pool statistics for diagnostics"""
+        return self.service.api_service.get_connection_pool_stats()
+    
+    def get_rate_limiter_stats(self) -> Dict[str, Any]:
+        """Get client-side API rate limiter statistics for diagnostics"""
+        return self.service.api_service.get_rate_limiter_stats()
+    
     def get_pods_for_node_async(self, node_name: str):
         """Get pods running on a specific node asynchronously"""
         try:
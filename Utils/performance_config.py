@@ -2,6 +2,8 @@
 Performance Configuration - Centralized settings for optimal performance
 """
 
+import os
+
 # Table Rendering Performance
 TABLE_BATCH_SIZE = 25  # Smaller batches for responsive UI
 TABLE_PROGRESSIVE_THRESHOLD = 250  # When to use progressive rendering
@@ -28,6 +30,7 @@ RESOURCE_FETCH_TIMEOUT = 45000  # Extended timeout for heavy loads
 MAX_CACHED_RESOURCES = 1000  # Maximum resources to keep in memory
 CACHE_CLEANUP_INTERVAL = 300  # 5 minutes between cache cleanups
 AGE_CACHE_SIZE = 5000  # Maximum age format cache entries
+TABLE_CELL_CACHE_SIZE = 20000  # Formatted table cells kept per model, by row identity and resourceVersion
 
 # UI Responsiveness
 PROCESS_EVENTS_FREQUENCY = 200  # Process UI events every N operations
@@ -37,6 +40,22 @@ SCROLL_DEBOUNCE_MS = 100  # 100ms debounce for scrolling
 # Thread Management - Optimized for heavy loads
 MAX_CONCURRENT_WORKERS = 6  # Increased workers for parallel processing
 WORKER_TIMEOUT_MS = 45000   # Extended timeout for heavy calculations
+WORKER_POOL_THREADS = 4  # Threads in the shared worker pool (EnhancedThreadPoolManager)
+
+# Kubernetes API connection pooling - one pooled ApiClient is shared by every API group
+API_REQUESTS_PER_WORKER = 8  # Highest per-worker fan-out (ResourceConfig.max_concurrent_requests)
+API_LONG_LIVED_CONNECTIONS = 8  # Informer watches and log streams holding a connection open
+API_CONNECTION_POOL_SIZE = WORKER_POOL_THREADS * API_REQUESTS_PER_WORKER + API_LONG_LIVED_CONNECTIONS
+
+# Client-side rate limiting of every request to one cluster (client-go style QPS and burst)
+API_QPS = 50  # Sustained requests per second
+API_BURST = 100  # Requests allowed at once after an idle period
+API_THROTTLE_RETRIES = 3  # Retries of a request the API server answered with 429 Too Many Requests
+API_MAX_RETRY_AFTER = 30  # Upper bound in seconds on an honored Retry-After
+
+# Process-pool row extraction for very large lists (opt-in via ResourceConfig.use_process_pool)
+PROCESS_POOL_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))  # Leave a core for the UI thread
+PROCESS_POOL_MIN_ITEMS = 10000  # Smaller lists are cheaper to process in a thread than to ship
 
 # Performance Profiles
 PERFORMANCE_PROFILES = {
@@ -0,0 +1,136 @@
+"""
+Client-side rate limiting of Kubernetes API requests
+Every request to a cluster goes through the shared ApiClient's REST client, so one token bucket
+there (client-go style QPS and burst) bounds the combined load of pages, pollers, analyzers and
+the metrics service. 429 responses from API Priority and Fairness pause the whole bucket for the
+Retry-After the server asked for before the request is retried.
+"""
+
+import functools
+import logging
+import threading
+import time
+from typing import Dict, Optional, Any
+
+from kubernetes.client.rest import ApiException
+
+from Utils.cancellation import current_token, RequestCancelled
+from Utils.performance_config import API_QPS, API_BURST, API_THROTTLE_RETRIES, API_MAX_RETRY_AFTER
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """Seconds from the Retry-After header of a 429 ApiException (capped), or None"""
+    if not isinstance(error, ApiException) or error.status != 429:
+        return None
+
+    value = (error.headers or {}).get('Retry-After')
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return 1.0  # APF always sends seconds - anything else is a generic overload signal
+    return min(max(seconds, 0.0), API_MAX_RETRY_AFTER)
+
+
+class ClientRateLimiter:
+    """
+    Token bucket shared by every request to one cluster.
+    Each request reserves a token, going into debt when the bucket is empty, and waits until
+    the debt is paid back at qps - the same reservation model as client-go's token bucket.
+    """
+
+    def __init__(self, qps: float = API_QPS, burst: int = API_BURST):
+        self.qps = float(qps)
+        self.burst = max(1, int(burst))
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiting = 0
+        self._stats = {
+            'requests': 0,
+            'delayed_requests': 0,
+            'wait_seconds': 0.0,
+            'throttled_responses': 0,
+        }
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.qps)
+        self._updated = now
+
+    def acquire(self):
+        """Block until the calling request may be sent - raises RequestCancelled if its worker is cancelled"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            delay = max(-self._tokens / self.qps, self._paused_until - now, 0.0)
+            self._stats['requests'] += 1
+            if delay <= 0:
+                return
+            self._stats['delayed_requests'] += 1
+            self._stats['wait_seconds'] += delay
+            self._waiting += 1
+
+        try:
+            # A Retry-After received while waiting extends the wait
+            while delay > 0:
+                token = current_token()
+                if token is not None:
+                    if token.wait(delay, stat='throttle_waits_aborted'):
+                        with self._lock:
+                            self._tokens += 1  # Hand the reservation back
+                        raise RequestCancelled()
+                else:
+                    time.sleep(delay)
+                with self._lock:
+                    delay = self._paused_until - time.monotonic()
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def pause(self, seconds: float):
+        """Hold every request back for a server-requested Retry-After"""
+        with self._lock:
+            self._stats['throttled_responses'] += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        logging.warning(f"API server is throttling requests - pausing for {seconds:.1f}s")
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests currently waiting for a token"""
+        return self._waiting
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            stats = dict(self._stats)
+            stats.update({
+                'qps': self.qps,
+                'burst': self.burst,
+                'queue_depth': self._waiting,
+                'tokens_available': max(0.0, round(min(self.burst, self._tokens + (now - self._updated) * self.qps), 1)),
+                'paused_seconds': round(max(0.0, self._paused_until - now), 1),
+            })
+        stats['wait_seconds'] = round(stats['wait_seconds'], 1)
+        return stats
+
+
+def install_rate_limiter(api_client, limiter: ClientRateLimiter, max_retries: int = API_THROTTLE_RETRIES):
+    """Route every request of an ApiClient through a rate limiter, retrying 429 responses after Retry-After"""
+    rest_client = api_client.rest_client
+    request = rest_client.request
+
+    @functools.wraps(request)
+    def rate_limited_request(*args, **kwargs):
+        for attempt in range(max_retries + 1):
+            limiter.acquire()
+            try:
+                return request(*args, **kwargs)
+            except ApiException as e:
+                retry_after = get_retry_after(e)
+                if retry_after is None or attempt == max_retries:
+                    raise
+                limiter.pause(retry_after)
+
+    # RESTClientObject's GET/POST/... helpers call self.request, so the instance attribute catches them all
+    rest_client.request = rate_limited_request
@@ -0,0 +1,215 @@
+"""
+Raw JSON helpers - list and watch Kubernetes resources without OpenAPI models
+Lists are requested with _preload_content=False and the response bytes are decoded once,
+so items stay plain camelCase dicts from the API server all the way to the UI.
+List pages that only show printed columns can request the server-side Table format instead,
+and counts or name lists can request metadata only (PartialObjectMetadataList).
+"""
+
+import json
+import logging
+from typing import Dict, List, Optional, Any, Callable
+
+from kubernetes import watch
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+    logging.debug("orjson not available - using the standard json decoder")
+
+
+def loads(data: Any) -> Any:
+    """Decode JSON bytes or text with the fastest available decoder"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def _encode_default(obj: Any) -> Any:
+    """Encode objects with a to_dict() (compact resource rows) as dicts and anything else as a string"""
+    to_dict = getattr(obj, 'to_dict', None)
+    if callable(to_dict):
+        return to_dict()
+    return str(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object as compact JSON bytes with the fastest available encoder"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_encode_default)
+    return json.dumps(obj, default=_encode_default, separators=(',', ':')).encode('utf-8')
+
+
+def decode_response(response: Any) -> Dict[str, Any]:
+    """Read and decode an HTTP response returned with _preload_content=False"""
+    try:
+        return loads(response.data) or {}
+    finally:
+        release_conn = getattr(response, 'release_conn', None)
+        if release_conn:
+            release_conn()
+
+
+def list_raw(list_func: Callable, **kwargs) -> Dict[str, Any]:
+    """Call a kubernetes list_* method and return the decoded List body as a dict"""
+    kwargs['_preload_content'] = False
+    return decode_response(list_func(**kwargs))
+
+
+def list_raw_bytes(list_func: Callable, **kwargs) -> bytes:
+    """Call a kubernetes list_* method and return the undecoded List body"""
+    kwargs['_preload_content'] = False
+    response = list_func(**kwargs)
+    try:
+        return response.data
+    finally:
+        release_conn = getattr(response, 'release_conn', None)
+        if release_conn:
+            release_conn()
+
+
+def decode_list_head(body: bytes) -> Dict[str, Any]:
+    """Decode kind, apiVersion and metadata of an encoded List body without its items
+    
+    The API server writes metadata before items, so only the head needs decoding to follow
+    the continue token; bodies in any other shape are decoded whole.
+    """
+    end = body.find(b',"items":')
+    if end != -1:
+        try:
+            return loads(body[:end] + b'}')
+        except ValueError:
+            pass
+    head = loads(body) or {}
+    head.pop('items', None)
+    return head
+
+
+def get_list_items(body: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Items of a decoded List body, or the row objects of a Table body"""
+    if body.get('kind') == 'Table':
+        return get_table_items(body)
+    return body.get('items') or []
+
+
+def get_table_items(body: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Rows of a decoded Table body as PartialObjectMetadata dicts with a 'cells' map of column name to value"""
+    column_names = [column.get('name') for column in body.get('columnDefinitions') or []]
+    
+    items = []
+    for row in body.get('rows') or []:
+        item = dict(row.get('object') or {})
+        item['cells'] = dict(zip(column_names, row.get('cells') or []))
+        items.append(item)
+    return items
+
+
+def get_list_resource_version(body: Dict[str, Any]) -> Optional[str]:
+    """metadata.resourceVersion of a decoded List body"""
+    return (body.get('metadata') or {}).get('resourceVersion')
+
+
+def get_list_continue(body: Dict[str, Any]) -> Optional[str]:
+    """metadata.continue token of a decoded List body"""
+    return (body.get('metadata') or {}).get('continue')
+
+
+def get_list_remaining_count(body: Dict[str, Any]) -> Optional[int]:
+    """metadata.remainingItemCount of a decoded List page (absent for filtered lists)"""
+    return (body.get('metadata') or {}).get('remainingItemCount')
+
+
+# Ask for the Table / metadata-only renderings and fall back to a plain List from servers without them
+TABLE_ACCEPT = 'application/json;as=Table;v=1;g=meta.k8s.io,application/json'
+PARTIAL_METADATA_ACCEPT = 'application/json;as=PartialObjectMetadataList;v=1;g=meta.k8s.io,application/json'
+
+
+class FormattedListMethod:
+    """Stand-in for a typed list_* method that asks the API server for a different list rendering
+    
+    Accepts the same keyword arguments the loader passes to the generated list methods
+    and lists cluster-wide unless a namespace is given. The generated methods cannot
+    send a custom Accept header, so the request goes through ApiClient.call_api.
+    """
+    
+    accept = 'application/json'
+    extra_query_params = ()
+    
+    _QUERY_PARAMS = {
+        'field_selector': 'fieldSelector',
+        'label_selector': 'labelSelector',
+        'limit': 'limit',
+        '_continue': 'continue',
+        'resource_version': 'resourceVersion',
+        'timeout_seconds': 'timeoutSeconds',
+        'watch': 'watch',
+        'allow_watch_bookmarks': 'allowWatchBookmarks',
+    }
+    
+    def __init__(self, api_client, api_path: str, plural: str):
+        self.api_client = api_client
+        self.api_path = api_path.rstrip('/')
+        self.plural = plural
+    
+    def __call__(self, namespace: Optional[str] = None, _preload_content: bool = True,
+                 _request_timeout=None, **kwargs):
+        unexpected = set(kwargs) - set(self._QUERY_PARAMS)
+        if unexpected:
+            raise TypeError(f"Got unexpected keyword arguments {sorted(unexpected)} for a list of {self.plural}")
+        
+        path_params = {}
+        if namespace:
+            resource_path = f"{self.api_path}/namespaces/{{namespace}}/{self.plural}"
+            path_params['namespace'] = namespace
+        else:
+            resource_path = f"{self.api_path}/{self.plural}"
+        
+        query_params = list(self.extra_query_params)
+        for key, value in kwargs.items():
+            if value is not None:
+                query_params.append((self._QUERY_PARAMS[key], value))
+        
+        return self.api_client.call_api(
+            resource_path, 'GET',
+            path_params,
+            query_params,
+            {'Accept': self.accept},
+            response_type='object',
+            auth_settings=['BearerToken'],
+            _return_http_data_only=True,
+            _preload_content=_preload_content,
+            _request_timeout=_request_timeout,
+        )
+
+
+class TableListMethod(FormattedListMethod):
+    """List in the server-side Table format - printed columns plus each row's object metadata"""
+    
+    accept = TABLE_ACCEPT
+    extra_query_params = (('includeObject', 'Metadata'),)
+
+
+class MetadataListMethod(FormattedListMethod):
+    """List as a PartialObjectMetadataList - items carry only apiVersion, kind and metadata"""
+    
+    accept = PARTIAL_METADATA_ACCEPT
+
+
+class RawWatch(watch.Watch):
+    """Watch that yields event objects as decoded dicts instead of OpenAPI models"""
+
+    def unmarshal_event(self, data, return_type):
+        event = loads(data)
+        event['raw_object'] = event['object']
+
+        if event.get('type') != 'ERROR':
+            metadata = (event['object'] or {}).get('metadata') or {}
+            if metadata.get('resourceVersion'):
+                self.resource_version = metadata['resourceVersion']
+
+        return event
@@ -0,0 +1,567 @@
+"""
+Resource Registry - Resource types of the connected cluster, resolved from API discovery
+Every resource type (plural, singular, kind or short name, built-in or custom) resolves in one
+dict lookup to a ResourceInfo with its group/version path and scope, and from there to dynamic
+list/get/patch/delete calls, or to the matching method of the generated kubernetes client.
+Aggregated discovery (/api and /apis, one request each) is cached on disk per cluster and
+revalidated with its ETag, so reconnecting to a cluster with a fresh cache sends no request.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Tuple
+
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+from Utils.raw_json import loads, dumps, decode_response, FormattedListMethod
+
+
+# Discovery cache tuning
+DISCOVERY_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".orchetrix", "cache", "discovery")
+DISCOVERY_FRESH_SECONDS = 600  # Reconnects within this window trust the disk cache without a request
+DISCOVERY_REQUEST_TIMEOUT = 15
+DISCOVERY_CACHE_VERSION = 1
+
+# Aggregated discovery (GA in 1.30, beta since 1.26); older servers answer with the legacy documents
+AGGREGATED_DISCOVERY_ACCEPT = (
+    'application/json;g=apidiscovery.k8s.io;v=v2;as=APIGroupDiscoveryList,'
+    'application/json;g=apidiscovery.k8s.io;v=v2beta1;as=APIGroupDiscoveryList,'
+    'application/json'
+)
+DISCOVERY_ROOTS = ('/api', '/apis')
+
+ALL_VERBS = ('create', 'delete', 'deletecollection', 'get', 'list', 'patch', 'update', 'watch')
+
+
+@dataclass(frozen=True)
+class ResourceInfo:
+    """One resource type served by the cluster"""
+    resource_type: str  # Plural resource name, e.g. 'pods'
+    kind: str
+    group: str  # '' for the core group
+    version: str
+    namespaced: bool
+    verbs: Tuple[str, ...] = ALL_VERBS
+    short_names: Tuple[str, ...] = ()
+    singular: str = ''
+
+    @property
+    def api_path(self) -> str:
+        return f"/apis/{self.group}/{self.version}" if self.group else f"/api/{self.version}"
+
+    @property
+    def api_version(self) -> str:
+        return f"{self.group}/{self.version}" if self.group else self.version
+
+    @property
+    def qualified_name(self) -> str:
+        """'plural.group' - also the name of the CRD that defines a custom resource"""
+        return f"{self.resource_type}.{self.group}" if self.group else self.resource_type
+
+    @property
+    def builtin(self) -> bool:
+        """Served by kube-apiserver itself - only these accept strategic merge patches"""
+        return self.group in BUILTIN_GROUPS
+
+    def supports(self, verb: str) -> bool:
+        return verb in self.verbs
+
+    def object_path(self, name: Optional[str] = None, namespace: Optional[str] = None) -> str:
+        path = self.api_path
+        if self.namespaced and namespace:
+            path += f"/namespaces/{namespace}"
+        path += f"/{self.resource_type}"
+        return f"{path}/{name}" if name else path
+
+
+# Built-in resource types, known before discovery completes and for clusters it fails on:
+# (plural, kind, group, version, namespaced, short names)
+BUILTIN_RESOURCES = [
+    ('pods', 'Pod', '', 'v1', True, ('po',)),
+    ('nodes', 'Node', '', 'v1', False, ('no',)),
+    ('services', 'Service', '', 'v1', True, ('svc',)),
+    ('configmaps', 'ConfigMap', '', 'v1', True, ('cm',)),
+    ('secrets', 'Secret', '', 'v1', True, ()),
+    ('namespaces', 'Namespace', '', 'v1', False, ('ns',)),
+    ('events', 'Event', '', 'v1', True, ('ev',)),
+    ('endpoints', 'Endpoints', '', 'v1', True, ('ep',)),
+    ('persistentvolumes', 'PersistentVolume', '', 'v1', False, ('pv',)),
+    ('persistentvolumeclaims', 'PersistentVolumeClaim', '', 'v1', True, ('pvc',)),
+    ('replicationcontrollers', 'ReplicationController', '', 'v1', True, ('rc',)),
+    ('limitranges', 'LimitRange', '', 'v1', True, ('limits',)),
+    ('resourcequotas', 'ResourceQuota', '', 'v1', True, ('quota',)),
+    ('serviceaccounts', 'ServiceAccount', '', 'v1', True, ('sa',)),
+    ('deployments', 'Deployment', 'apps', 'v1', True, ('deploy',)),
+    ('replicasets', 'ReplicaSet', 'apps', 'v1', True, ('rs',)),
+    ('daemonsets', 'DaemonSet', 'apps', 'v1', True, ('ds',)),
+    ('statefulsets', 'StatefulSet', 'apps', 'v1', True, ('sts',)),
+    ('ingresses', 'Ingress', 'networking.k8s.io', 'v1', True, ('ing',)),
+    ('networkpolicies', 'NetworkPolicy', 'networking.k8s.io', 'v1', True, ('netpol',)),
+    ('ingressclasses', 'IngressClass', 'networking.k8s.io', 'v1', False, ()),
+    ('storageclasses', 'StorageClass', 'storage.k8s.io', 'v1', False, ('sc',)),
+    ('jobs', 'Job', 'batch', 'v1', True, ()),
+    ('cronjobs', 'CronJob', 'batch', 'v1', True, ('cj',)),
+    ('roles', 'Role', 'rbac.authorization.k8s.io', 'v1', True, ()),
+    ('rolebindings', 'RoleBinding', 'rbac.authorization.k8s.io', 'v1', True, ()),
+    ('clusterroles', 'ClusterRole', 'rbac.authorization.k8s.io', 'v1', False, ()),
+    ('clusterrolebindings', 'ClusterRoleBinding', 'rbac.authorization.k8s.io', 'v1', False, ()),
+    ('horizontalpodautoscalers', 'HorizontalPodAutoscaler', 'autoscaling', 'v2', True, ('hpa',)),
+    ('poddisruptionbudgets', 'PodDisruptionBudget', 'policy', 'v1', True, ('pdb',)),
+    ('priorityclasses', 'PriorityClass', 'scheduling.k8s.io', 'v1', False, ('pc',)),
+    ('runtimeclasses', 'RuntimeClass', 'node.k8s.io', 'v1', False, ()),
+    ('mutatingwebhookconfigurations', 'MutatingWebhookConfiguration', 'admissionregistration.k8s.io', 'v1', False, ()),
+    ('validatingwebhookconfigurations', 'ValidatingWebhookConfiguration', 'admissionregistration.k8s.io', 'v1', False, ()),
+    ('leases', 'Lease', 'coordination.k8s.io', 'v1', True, ()),
+    ('customresourcedefinitions', 'CustomResourceDefinition', 'apiextensions.k8s.io', 'v1', False, ('crd', 'crds')),
+]
+
+# Review resources only accept create - known up front so permissions can be probed before discovery
+BUILTIN_REVIEW_RESOURCES = [
+    ('selfsubjectaccessreviews', 'SelfSubjectAccessReview', 'authorization.k8s.io', 'v1'),
+    ('selfsubjectrulesreviews', 'SelfSubjectRulesReview', 'authorization.k8s.io', 'v1'),
+]
+
+BUILTIN_GROUPS = frozenset(
+    {group for _, _, group, _, _, _ in BUILTIN_RESOURCES} |
+    {'authentication.k8s.io', 'authorization.k8s.io', 'certificates.k8s.io', 'discovery.k8s.io',
+     'events.k8s.io', 'flowcontrol.apiserver.k8s.io', 'resource.k8s.io', 'storagemigration.k8s.io',
+     'internal.apiserver.k8s.io'}
+)
+
+# Names pages use that are not a plural, singular, kind or short name of their resource
+RESOURCE_ALIASES = {
+    'endpoint': 'endpoints',
+}
+
+
+def _builtin_infos() -> List[ResourceInfo]:
+    return [
+        ResourceInfo(plural, kind, group, version, namespaced, ALL_VERBS, short_names, kind.lower())
+        for plural, kind, group, version, namespaced, short_names in BUILTIN_RESOURCES
+    ] + [
+        ResourceInfo(plural, kind, group, version, False, ('create',), (), kind.lower())
+        for plural, kind, group, version in BUILTIN_REVIEW_RESOURCES
+    ]
+
+
+def _snake_case(name: str) -> str:
+    return re.sub(r'(?<=[a-z0-9])([A-Z])', r'_\1', name).lower()
+
+
+def _api_class_name(info: ResourceInfo) -> str:
+    """Generated client class of a group/version - ('rbac.authorization.k8s.io', 'v1') -> RbacAuthorizationV1Api"""
+    group = info.group[:-len('.k8s.io')] if info.group.endswith('.k8s.io') else info.group
+    prefix = ''.join(part.capitalize() for part in group.split('.')) if group else 'Core'
+    return f"{prefix}{info.version.capitalize()}Api"
+
+
+# Discovery document parsing
+
+def parse_aggregated_discovery(document: Dict[str, Any]) -> List[ResourceInfo]:
+    """Resources of an APIGroupDiscoveryList, at each group's preferred (first listed) version"""
+    infos = []
+    for group_entry in document.get('items') or []:
+        group = (group_entry.get('metadata') or {}).get('name') or ''
+        seen = set()
+        for version_entry in group_entry.get('versions') or []:
+            version = version_entry.get('version')
+            for resource in version_entry.get('resources') or []:
+                plural = resource.get('resource')
+                if not plural or plural in seen:
+                    continue
+                seen.add(plural)
+                response_kind = resource.get('responseKind') or {}
+                infos.append(ResourceInfo(
+                    resource_type=plural,
+                    kind=response_kind.get('kind') or '',
+                    group=group,
+                    version=version,
+                    namespaced=resource.get('scope') == 'Namespaced',
+                    verbs=tuple(resource.get('verbs') or ()),
+                    short_names=tuple(resource.get('shortNames') or ()),
+                    singular=resource.get('singularResource') or '',
+                ))
+    return infos
+
+
+def parse_resource_list(document: Dict[str, Any]) -> List[ResourceInfo]:
+    """Resources of a legacy APIResourceList (/api/v1, /apis/<group>/<version>)"""
+    group, _, version = (document.get('groupVersion') or '').rpartition('/')
+    infos = []
+    for resource in document.get('resources') or []:
+        name = resource.get('name') or ''
+        if not name or '/' in name:
+            continue  # Subresources (pods/log, deployments/scale)
+        infos.append(ResourceInfo(
+            resource_type=name,
+            kind=resource.get('kind') or '',
+            group=group,
+            version=version,
+            namespaced=bool(resource.get('namespaced')),
+            verbs=tuple(resource.get('verbs') or ()),
+            short_names=tuple(resource.get('shortNames') or ()),
+            singular=resource.get('singularName') or '',
+        ))
+    return infos
+
+
+class ResourceRegistry:
+    """
+    Resource types of the current cluster.
+    Starts with the built-in types and adds everything discovery reports, including
+    custom resources. Lookups never block on discovery.
+    """
+
+    def __init__(self, cache_dir: str = DISCOVERY_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._lock = threading.RLock()
+        self._discovery_lock = threading.Lock()
+        self._cluster: Optional[str] = None
+        self._by_name: Dict[str, ResourceInfo] = {}
+        self._by_type: Dict[str, ResourceInfo] = {}
+        self._discovered_at = 0.0
+        self._set_resources(_builtin_infos())
+
+        self.stats = {
+            'discoveries': 0,
+            'not_modified': 0,
+            'disk_hits': 0,
+            'legacy_discoveries': 0,
+            'failures': 0,
+        }
+
+    # Lookups
+
+    def _set_resources(self, infos: List[ResourceInfo]):
+        """Index built-in and discovered resources by every name they can be referred to by"""
+        by_type: Dict[str, ResourceInfo] = {info.resource_type: info for info in _builtin_infos()}
+        for info in infos:
+            current = by_type.get(info.resource_type)
+            # Two groups can serve the same plural (events, events.events.k8s.io) - keep the core/built-in one
+            if current is None or current.group == info.group or (current.group not in BUILTIN_GROUPS and info.builtin):
+                by_type[info.resource_type] = info
+
+        by_name: Dict[str, ResourceInfo] = {}
+        for info in by_type.values():
+            for name in (info.kind.lower(), info.singular, *info.short_names):
+                if name:
+                    by_name.setdefault(name, info)
+        for info in infos:
+            # Shadowed types stay reachable by their qualified name
+            if info.group:
+                by_name.setdefault(f"{info.resource_type}.{info.group}", info)
+        for info in by_type.values():
+            if info.group:
+                by_name[f"{info.resource_type}.{info.group}"] = info
+        by_name.update(by_type)
+        for alias, resource_type in RESOURCE_ALIASES.items():
+            if resource_type in by_type:
+                by_name.setdefault(alias, by_type[resource_type])
+
+        with self._lock:
+            self._by_type = by_type
+            self._by_name = by_name
+
+    def resolve(self, name: Optional[str]) -> Optional[ResourceInfo]:
+        """ResourceInfo for a plural, singular, kind, short name or 'plural.group', or None"""
+        if not name:
+            return None
+        info = self._by_name.get(name)
+        if info is None:
+            info = self._by_name.get(name.lower())
+        return info
+
+    def is_namespaced(self, resource_type: str) -> bool:
+        """Scope of a resource type - unknown types are treated as namespaced"""
+        info = self.resolve(resource_type)
+        return info.namespaced if info else True
+
+    def resource_types(self, verb: Optional[str] = None) -> List[str]:
+        """Plural names of every known resource type, optionally only those supporting a verb"""
+        return sorted(t for t, info in self._by_type.items() if verb is None or info.supports(verb))
+
+    def get_custom_resources(self) -> List[ResourceInfo]:
+        """Discovered resource types that are not served by kube-apiserver itself, shadowed ones included"""
+        custom = {info.qualified_name: info for info in self._by_name.values() if not info.builtin}
+        return sorted(custom.values(), key=lambda info: (info.kind.lower(), info.group))
+
+    # Dynamic calls
+
+    def _api_client(self):
+        from Utils.kubernetes_client import get_kubernetes_client
+        return get_kubernetes_client().service.api_service.get_shared_api_client()
+
+    def _require(self, resource_type: str, verb: str) -> ResourceInfo:
+        info = self.resolve(resource_type)
+        if info is None:
+            raise ValueError(f"Unknown resource type '{resource_type}'")
+        if not info.supports(verb):
+            raise ValueError(f"Resource type '{info.resource_type}' does not support {verb}")
+        return info
+
+    def list_method(self, resource_type: str, method_class=FormattedListMethod) -> Optional[FormattedListMethod]:
+        """List (and watch) method for any resource type - cluster-wide unless called with a namespace"""
+        info = self.resolve(resource_type)
+        if info is None:
+            return None
+        return method_class(self._api_client(), info.api_path, info.resource_type)
+
+    def _call(self, method: str, path: str, body: Any = None, content_type: Optional[str] = None,
+              request_timeout: Optional[float] = None, headers: Optional[Dict[str, str]] = None):
+        header_params = {'Accept': 'application/json'}
+        if content_type:
+            header_params['Content-Type'] = content_type
+        if headers:
+            header_params.update(headers)
+        return self._api_client().call_api(
+            path, method,
+            header_params=header_params,
+            body=body,
+            response_type='object',
+            auth_settings=['BearerToken'],
+            _return_http_data_only=True,
+            _preload_content=False,
+            _request_timeout=request_timeout,
+        )
+
+    def get(self, resource_type: str, name: str, namespace: Optional[str] = None,
+            request_timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Read one object as a decoded camelCase dict"""
+        info = self._require(resource_type, 'get')
+        return decode_response(self._call('GET', info.object_path(name, namespace), request_timeout=request_timeout))
+
+    def create(self, resource_type: str, body: Dict[str, Any], namespace: Optional[str] = None,
+               request_timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Create one object (or submit a review) and return the decoded response"""
+        info = self._require(resource_type, 'create')
+        return decode_response(self._call('POST', info.object_path(None, namespace), body, 'application/json', request_timeout))
+
+    def patch(self, resource_type: str, name: str, namespace: Optional[str], body: Dict[str, Any],
+              request_timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Patch one object - strategic merge for built-in types, JSON merge for custom resources"""
+        info = self._require(resource_type, 'patch')
+        content_type = 'application/strategic-merge-patch+json' if info.builtin else 'application/merge-patch+json'
+        return decode_response(self._call('PATCH', info.object_path(name, namespace), body, content_type, request_timeout))
+
+    def delete(self, resource_type: str, name: str, namespace: Optional[str] = None,
+               body: Optional[Dict[str, Any]] = None, request_timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Delete one object, with optional DeleteOptions"""
+        info = self._require(resource_type, 'delete')
+        return decode_response(self._call('DELETE', info.object_path(name, namespace), body, request_timeout=request_timeout))
+
+    def typed_method(self, resource_type: str, verb: str, all_namespaces: bool = False):
+        """Bound method of the generated client (returns OpenAPI models), or None when it has none
+
+        e.g. ('pods', 'list', all_namespaces=True) -> CoreV1Api().list_pod_for_all_namespaces
+        """
+        info = self.resolve(resource_type)
+        if info is None:
+            return None
+
+        kind = _snake_case(info.kind)
+        if not info.namespaced:
+            method_name = f"{verb}_{kind}"
+        elif all_namespaces:
+            method_name = f"{verb}_{kind}_for_all_namespaces"
+        else:
+            method_name = f"{verb}_namespaced_{kind}"
+
+        api_class = getattr(client, _api_class_name(info), None)
+        if api_class is None:
+            return None
+        # API objects only hold the ApiClient, so binding to the current cluster's one is free
+        return getattr(api_class(self._api_client()), method_name, None)
+
+    # Discovery
+
+    def _cache_path(self, cluster_name: str, server: Optional[str]) -> str:
+        key = hashlib.sha1(f"{cluster_name}\0{server or ''}".encode('utf-8')).hexdigest()[:20]
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _read_cache(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, 'rb') as cache_file:
+                entry = loads(cache_file.read())
+            if entry.get('version') == DISCOVERY_CACHE_VERSION:
+                return entry
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.debug(f"Resource registry: Ignoring unreadable discovery cache {path}: {e}")
+        return None
+
+    def _write_cache(self, path: str, entry: Dict[str, Any]):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'wb') as cache_file:
+                cache_file.write(dumps(entry))
+            os.replace(temp_path, path)
+        except Exception as e:
+            logging.debug(f"Resource registry: Could not write discovery cache: {e}")
+
+    def select_cluster(self, cluster_name: str, server: Optional[str] = None) -> bool:
+        """Switch to a cluster's cached resource types without a request
+
+        Falls back to the built-in types when there is no cache. Returns True when the
+        cache is fresh and discovery can be skipped.
+        """
+        with self._discovery_lock:
+            now = time.time()
+            if self._cluster == cluster_name and now - self._discovered_at < DISCOVERY_FRESH_SECONDS:
+                return True
+
+            entry = self._read_cache(self._cache_path(cluster_name, server))
+            if entry:
+                self._apply_entry(cluster_name, entry)
+            else:
+                self._cluster = cluster_name
+                self._discovered_at = 0.0
+                self._set_resources([])
+            fresh = entry is not None and now - entry.get('fetched_at', 0) < DISCOVERY_FRESH_SECONDS
+            if fresh:
+                self.stats['disk_hits'] += 1
+            return fresh
+
+    def use_cluster(self, cluster_name: str, server: Optional[str] = None, force: bool = False) -> str:
+        """Load the resource types of a cluster (blocking - call from a worker thread)
+
+        Uses the disk cache without a request while it is fresh, revalidates it with the
+        ETags of the discovery documents otherwise. Returns where the registry came from:
+        'memory', 'disk', 'not_modified', 'discovery', 'legacy' or 'builtin'.
+        """
+        with self._discovery_lock:
+            now = time.time()
+            if not force and self._cluster == cluster_name and now - self._discovered_at < DISCOVERY_FRESH_SECONDS:
+                return 'memory'
+
+            path = self._cache_path(cluster_name, server)
+            entry = self._read_cache(path)
+            if entry and not force and now - entry.get('fetched_at', 0) < DISCOVERY_FRESH_SECONDS:
+                self._apply_entry(cluster_name, entry)
+                self.stats['disk_hits'] += 1
+                return 'disk'
+
+            if self._cluster != cluster_name:
+                # Never resolve against the previous cluster's types while discovery runs
+                if entry:
+                    self._apply_entry(cluster_name, entry)
+                else:
+                    self._cluster = cluster_name
+                    self._discovered_at = 0.0
+                    self._set_resources([])
+
+            try:
+                entry, source = self._discover(entry)
+            except Exception as e:
+                self.stats['failures'] += 1
+                logging.warning(f"Resource registry: Discovery failed for {cluster_name}: {e}")
+                # A stale registry beats the built-in one - keep using it until discovery recovers
+                return 'disk' if entry else 'builtin'
+
+            entry['fetched_at'] = now
+            self._write_cache(path, entry)
+            self._apply_entry(cluster_name, entry)
+            return source
+
+    def _apply_entry(self, cluster_name: str, entry: Dict[str, Any]):
+        infos = [ResourceInfo(**{**fields, 'verbs': tuple(fields['verbs']), 'short_names': tuple(fields['short_names'])})
+                 for fields in entry.get('resources') or []]
+        self._set_resources(infos)
+        with self._lock:
+            self._cluster = cluster_name
+            self._discovered_at = entry.get('fetched_at', time.time())
+        logging.info(f"Resource registry: {len(self._by_type)} resource types for {cluster_name} "
+                     f"({len(self.get_custom_resources())} custom)")
+
+    def _discover(self, cached: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], str]:
+        """Fetch /api and /apis, sending the cached ETags; legacy discovery for servers without aggregation"""
+        etags = dict((cached or {}).get('etags') or {})
+        documents = dict((cached or {}).get('documents') or {})
+        changed = False
+
+        for root in DISCOVERY_ROOTS:
+            headers = {'Accept': AGGREGATED_DISCOVERY_ACCEPT}
+            if etags.get(root) and root in documents:
+                headers['If-None-Match'] = etags[root]
+            try:
+                response = self._call('GET', root, headers=headers, request_timeout=DISCOVERY_REQUEST_TIMEOUT)
+            except ApiException as e:
+                if e.status == 304:
+                    continue
+                raise
+
+            etag = response.headers.get('ETag') if response.headers else None
+            document = decode_response(response)
+            if document.get('kind') != 'APIGroupDiscoveryList':
+                self.stats['legacy_discoveries'] += 1
+                return {'version': DISCOVERY_CACHE_VERSION, 'resources': self._legacy_discovery()}, 'legacy'
+
+            documents[root] = document
+            etags[root] = etag
+            changed = True
+
+        infos = []
+        for root in DISCOVERY_ROOTS:
+            infos.extend(parse_aggregated_discovery(documents.get(root) or {}))
+
+        if changed:
+            self.stats['discoveries'] += 1
+        else:
+            self.stats['not_modified'] += 1
+        return {
+            'version': DISCOVERY_CACHE_VERSION,
+            'etags': etags,
+            'documents': documents,
+            'resources': [asdict(info) for info in infos],
+        }, 'discovery' if changed else 'not_modified'
+
+    def _legacy_discovery(self) -> List[Dict[str, Any]]:
+        """One request per group version - only for API servers older than aggregated discovery"""
+        group_versions = ['v1']
+        groups = decode_response(self._call('GET', '/apis', request_timeout=DISCOVERY_REQUEST_TIMEOUT))
+        for group in groups.get('groups') or []:
+            preferred = (group.get('preferredVersion') or {}).get('groupVersion')
+            if preferred:
+                group_versions.append(preferred)
+
+        infos = []
+        for group_version in group_versions:
+            path = '/api/v1' if group_version == 'v1' else f"/apis/{group_version}"
+            try:
+                document = decode_response(self._call('GET', path, request_timeout=DISCOVERY_REQUEST_TIMEOUT))
+            except ApiException as e:
+                # Unavailable aggregated API servers (a broken metrics-server) must not fail discovery
+                logging.debug(f"Resource registry: Skipping {group_version}: {e.status}")
+                continue
+            infos.extend(parse_resource_list(document))
+        return [asdict(info) for info in infos]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'cluster': self._cluster,
+            'resource_types': len(self._by_type),
+            'custom_resource_types': len(self.get_custom_resources()),
+            'discovered_at': self._discovered_at,
+        }
+
+
+# Singleton management
+_resource_registry_instance = None
+_resource_registry_lock = threading.Lock()
+
+def get_resource_registry() -> ResourceRegistry:
+    """Get or create the resource registry singleton"""
+    global _resource_registry_instance
+    if _resource_registry_instance is None:
+        with _resource_registry_lock:
+            if _resource_registry_instance is None:
+                _resource_registry_instance = ResourceRegistry()
+    return _resource_registry_instance
@@ -0,0 +1,230 @@
+"""
+Resource Row - Compact processed row for resource list pages
+Rows keep their common fields in __slots__ with interned namespace, node and label strings, and hold
+the API object as the undecoded JSON bytes it arrived as. The object is decoded only when something
+reads raw_data (detail panel, YAML view, a page column that needs spec/status), through a small
+shared LRU so repeated reads while a row is painted decode it once.
+Rows store the creation time as epoch seconds; 'age' is formatted from it whenever it is read.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Dict, Optional, Any, Iterator
+
+from Utils.raw_json import loads, dumps
+from Utils.data_formatters import format_age_from_epoch
+
+
+DECODED_RAW_CACHE_SIZE = 256  # Decoded API objects kept for rows being painted or inspected
+INTERN_MAX_LENGTH = 64  # Longer field values are rarely repeated across rows
+
+_SLOT_KEYS = ('name', 'namespace', 'created_ts', 'created', 'labels', 'resource_type', 'uid', 'resource_version')
+DERIVED_KEYS = ('age',)  # Computed from the slots on every read, never stored
+
+_decoded_raw: "OrderedDict[int, tuple]" = OrderedDict()
+_decoded_raw_lock = threading.Lock()
+
+
+def intern_string(value: Any) -> Any:
+    """Share one copy of short strings that repeat across rows (namespaces, node names, statuses)"""
+    if type(value) is str and len(value) <= INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def intern_labels(labels: Optional[Dict[str, str]]) -> Dict[str, str]:
+    if not labels:
+        return {}
+    return {intern_string(key): intern_string(value) for key, value in labels.items()}
+
+
+def _decode_raw(raw: bytes) -> Dict[str, Any]:
+    """Decode raw object bytes, reusing the result for recently read rows"""
+    key = id(raw)
+    with _decoded_raw_lock:
+        entry = _decoded_raw.get(key)
+        # The entry holds a reference to its bytes, so a matching id is always the same object
+        if entry is not None and entry[0] is raw:
+            _decoded_raw.move_to_end(key)
+            return entry[1]
+
+    decoded = loads(raw)
+    with _decoded_raw_lock:
+        _decoded_raw[key] = (raw, decoded)
+        while len(_decoded_raw) > DECODED_RAW_CACHE_SIZE:
+            _decoded_raw.popitem(last=False)
+    return decoded
+
+
+def clear_decoded_raw_cache():
+    with _decoded_raw_lock:
+        _decoded_raw.clear()
+
+
+class ResourceRow(MutableMapping):
+    """
+    Processed resource row with the dict interface pages already use (row['name'], row.get(...)).
+    Common fields live in slots, resource-specific fields in a small dict, and annotations are
+    read from the raw object on demand instead of being copied into every row.
+    """
+
+    __slots__ = _SLOT_KEYS + ('_raw', '_fields')
+
+    def __init__(self, name: str, namespace: Optional[str], created_ts: Optional[float], created: Optional[str],
+                 labels: Optional[Dict[str, str]], resource_type: str, uid: Optional[str],
+                 resource_version: Optional[str]):
+        self.name = name
+        self.namespace = intern_string(namespace)
+        self.created_ts = created_ts
+        self.created = created
+        self.labels = intern_labels(labels)
+        self.resource_type = intern_string(resource_type)
+        self.uid = uid
+        self.resource_version = resource_version
+        self._raw = None
+        self._fields: Dict[str, Any] = {}
+
+    @classmethod
+    def from_dict(cls, row: Dict[str, Any], encode_raw: bool = True) -> 'ResourceRow':
+        """Compact an existing dict row, e.g. one restored from a snapshot"""
+        compact = cls(*(row.get(key) for key in _SLOT_KEYS))
+        for key, value in row.items():
+            if key == 'raw_data':
+                compact.set_raw(value, encode=encode_raw)
+            elif key == 'annotations' and row.get('raw_data'):
+                continue  # Read back from the raw object on demand
+            elif key in DERIVED_KEYS:
+                continue
+            elif key not in _SLOT_KEYS:
+                compact[key] = value
+        return compact
+
+    def set_raw(self, obj: Any, encode: bool = True):
+        """Attach the API object - encoded to bytes, or by reference when it is shared (informer store)"""
+        if encode and isinstance(obj, dict):
+            obj = dumps(obj)
+        self._raw = obj
+
+    @property
+    def raw_data(self) -> Optional[Dict[str, Any]]:
+        raw = self._raw
+        if isinstance(raw, (bytes, bytearray)):
+            return _decode_raw(raw)
+        return raw
+
+    @property
+    def raw_size(self) -> int:
+        """Bytes held for the undecoded object (0 when it is kept decoded)"""
+        return len(self._raw) if isinstance(self._raw, (bytes, bytearray)) else 0
+
+    def _annotations(self) -> Dict[str, str]:
+        raw_data = self.raw_data or {}
+        return (raw_data.get('metadata') or {}).get('annotations') or {}
+
+    @property
+    def age(self) -> str:
+        """Age as of now - never stale, and only formatted for rows something reads"""
+        return format_age_from_epoch(self.created_ts)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _SLOT_KEYS:
+            return getattr(self, key)
+        if key == 'age':
+            return self.age
+        if key == 'raw_data':
+            if self._raw is None:
+                raise KeyError(key)
+            return self.raw_data
+        if key == 'annotations' and key not in self._fields:
+            return self._annotations()
+        return self._fields[key]
+
+    def __setitem__(self, key: str, value: Any):
+        if key in DERIVED_KEYS:
+            return  # Derived from created_ts
+        if key in _SLOT_KEYS:
+            setattr(self, key, intern_string(value) if key in ('namespace', 'resource_type') else value)
+        elif key == 'raw_data':
+            self._raw = value
+        else:
+            self._fields[key] = intern_string(value)
+
+    def __delitem__(self, key: str):
+        if key in DERIVED_KEYS:
+            raise KeyError(key)
+        if key in _SLOT_KEYS:
+            setattr(self, key, None)
+        elif key == 'raw_data':
+            self._raw = None
+        else:
+            del self._fields[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _SLOT_KEYS
+        yield from DERIVED_KEYS
+        if 'annotations' not in self._fields:
+            yield 'annotations'
+        yield from self._fields
+        if self._raw is not None:
+            yield 'raw_data'
+
+    def __len__(self) -> int:
+        return len(_SLOT_KEYS) + len(DERIVED_KEYS) + len(self._fields) + ('annotations' not in self._fields) + (self._raw is not None)
+
+    def __contains__(self, key: object) -> bool:
+        if key in _SLOT_KEYS or key in DERIVED_KEYS or key == 'annotations':
+            return True
+        if key == 'raw_data':
+            return self._raw is not None
+        return key in self._fields
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ResourceRow):
+            # Compare the undecoded bytes instead of decoding both objects
+            return self._raw == other._raw and self.to_dict(include_raw=False) == other.to_dict(include_raw=False)
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def copy(self) -> 'ResourceRow':
+        """Shallow copy sharing the raw bytes and labels"""
+        row = ResourceRow.__new__(ResourceRow)
+        for key in _SLOT_KEYS:
+            setattr(row, key, getattr(self, key))
+        row._raw = self._raw
+        row._fields = dict(self._fields)
+        return row
+
+    def to_tuple(self) -> tuple:
+        """Flat tuple of the row for cheap pickling between processes"""
+        return tuple(getattr(self, key) for key in _SLOT_KEYS) + (self._raw, tuple(self._fields.items()))
+
+    @classmethod
+    def from_tuple(cls, values: tuple) -> 'ResourceRow':
+        """Rebuild a row from to_tuple()
+
+        Strings are not interned again: rows unpickled from one chunk already share the strings
+        the sending process interned, because pickle writes each shared object once.
+        """
+        row = cls.__new__(cls)
+        for key, value in zip(_SLOT_KEYS, values):
+            object.__setattr__(row, key, value)
+        row._raw = values[-2]
+        row._fields = dict(values[-1])
+        return row
+
+    def to_dict(self, include_raw: bool = True) -> Dict[str, Any]:
+        """Plain dict of the row (annotations and raw_data decoded) for serialization"""
+        row = {key: getattr(self, key) for key in _SLOT_KEYS}
+        row.update(self._fields)
+        if include_raw:
+            row.setdefault('annotations', self._annotations())
+            if self._raw is not None:
+                raw = self._raw
+                row['raw_data'] = loads(raw) if isinstance(raw, (bytes, bytearray)) else raw
+        return row
+
+    def __repr__(self) -> str:
+        return f"ResourceRow({self.resource_type}/{self.namespace or ''}/{self.name})"
@@ -0,0 +1,189 @@
+"""
+Result Cache - Stale-while-revalidate cache of resource list results
+Keeps the last LoadResult per (cluster, resource type, namespace, query) in an LRU so page
+switches render instantly from memory while a background load revalidates the rows.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Any, Tuple
+
+
+# Result cache tuning
+MAX_CACHED_ITEMS = 50000  # Rows kept across all cached results before LRU eviction
+MAX_CACHED_RESULTS = 64  # Cached (cluster, resource type, namespace, query) results
+MAX_STALE_SECONDS = 900  # Older results are dropped instead of shown while revalidating
+MEMORY_PRESSURE_MB = 1024  # Process RSS above which the least recently used half is evicted
+
+CacheKey = Tuple[str, str, str, str]
+
+
+@dataclass
+class CachedResult:
+    """A cached LoadResult with the list resourceVersion it was built from"""
+    result: Any
+    resource_version: Optional[str]
+    stored_at: float
+    ttl_seconds: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    def is_fresh(self) -> bool:
+        """Fresh results are served without revalidating against the API server"""
+        return self.age < self.ttl_seconds
+
+    @property
+    def item_count(self) -> int:
+        return len(self.result.items)
+
+
+class ResultCache:
+    """
+    LRU cache of LoadResults bounded by result count and total row count.
+    Fresh entries are served as-is; stale entries are served with from_cache=True while the
+    caller revalidates, and refreshed in place when the list resourceVersion has not changed.
+    """
+
+    def __init__(self, max_items: int = MAX_CACHED_ITEMS, max_results: int = MAX_CACHED_RESULTS,
+                 max_stale_seconds: float = MAX_STALE_SECONDS):
+        self.max_items = max_items
+        self.max_results = max_results
+        self.max_stale_seconds = max_stale_seconds
+
+        self._entries: "OrderedDict[CacheKey, CachedResult]" = OrderedDict()
+        self._total_items = 0
+        self._lock = threading.RLock()
+
+        self._stats = {
+            'hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'unchanged_revalidations': 0,
+            'evictions': 0,
+        }
+
+    @staticmethod
+    def make_key(cluster: Optional[str], resource_type: str, namespace: Optional[str],
+                 query: Optional[str] = None) -> CacheKey:
+        return (cluster or '', resource_type, namespace or '', query or '')
+
+    def get(self, key: CacheKey) -> Optional[CachedResult]:
+        """Get a cached result, or None when missing or too stale to show"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+
+            if entry.age > self.max_stale_seconds:
+                self._remove(key)
+                self._stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats['hits' if entry.is_fresh() else 'stale_hits'] += 1
+            return entry
+
+    def put(self, key: CacheKey, result: Any, resource_version: Optional[str], ttl_seconds: float):
+        """Store a completed LoadResult, evicting least recently used results over the limits"""
+        if ttl_seconds <= 0:
+            return
+
+        # Pages mutate the item list they receive - the cache keeps its own list of the same rows
+        cached = replace(result, items=list(result.items))
+        with self._lock:
+            self._remove(key)
+            entry = CachedResult(cached, resource_version, time.time(), ttl_seconds)
+            self._entries[key] = entry
+            self._total_items += entry.item_count
+            self._evict_over_limits()
+
+    def touch(self, key: CacheKey) -> bool:
+        """Mark a result fresh again after revalidation found nothing changed"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            entry.stored_at = time.time()
+            self._entries.move_to_end(key)
+            self._stats['unchanged_revalidations'] += 1
+            return True
+
+    def as_cached_result(self, entry: CachedResult) -> Any:
+        """Copy of the cached LoadResult marked from_cache, safe to hand to a page"""
+        metadata = dict(entry.result.metadata or {})
+        metadata.update({'cache_age': round(entry.age, 1), 'stale': not entry.is_fresh()})
+        return replace(entry.result, items=list(entry.result.items), from_cache=True,
+                       load_time_ms=0, metadata=metadata)
+
+    def invalidate(self, cluster: Optional[str] = None, resource_type: Optional[str] = None,
+                   namespace: Optional[str] = None) -> int:
+        """Drop cached results matching every given field (all namespaces when namespace is None)"""
+        with self._lock:
+            keys = [
+                key for key in self._entries
+                if (cluster is None or key[0] == cluster)
+                and (resource_type is None or key[1] == resource_type)
+                and (namespace is None or key[2] == namespace)
+            ]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def evict_older_than(self, max_age: float) -> int:
+        """Drop results stored more than max_age seconds ago"""
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry.age > max_age]
+            for key in keys:
+                self._remove(key)
+            self._stats['evictions'] += len(keys)
+            return len(keys)
+
+    def trim(self, fraction: float = 0.5) -> int:
+        """Evict the least recently used fraction of results under memory pressure"""
+        with self._lock:
+            count = int(len(self._entries) * fraction + 0.5)
+            for _ in range(count):
+                self._evict_lru()
+            return count
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_items = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['stale_hits'] + self._stats['misses']
+            stats = dict(self._stats)
+            stats.update({
+                'results': len(self._entries),
+                'items': self._total_items,
+                'hit_rate': (self._stats['hits'] + self._stats['stale_hits']) / lookups if lookups else 0.0,
+            })
+            return stats
+
+    def _remove(self, key: CacheKey):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_items -= entry.item_count
+
+    def _evict_lru(self):
+        if not self._entries:
+            return
+        key = next(iter(self._entries))
+        self._remove(key)
+        self._stats['evictions'] += 1
+        logging.debug(f"Result cache: evicted {key[1]} ({key[2] or 'all namespaces'}) on {key[0]}")
+
+    def _evict_over_limits(self):
+        # Always keep the most recent result, even when it alone exceeds the row budget
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_results or self._total_items > self.max_items
+        ):
+            self._evict_lru()
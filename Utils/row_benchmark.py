@@ -0,0 +1,275 @@
+"""
+Row Benchmark - Memory and throughput of pod row processing
+Builds a synthetic PodList shaped like a real API response and decodes it once like the loader does.
+The memory benchmark processes every pod through ResourceLoadWorker and measures what dict rows and
+compact ResourceRows keep alive once the response body is released. The throughput benchmark compares
+the in-thread chunked path with the opt-in process pool.
+
+The sort benchmark times storing each kind of typed column key, sorting rows by it and totalling it.
+The search benchmark times indexing pod rows for search and answering a name typed one key at a time.
+
+Run with:  python -m Utils.row_benchmark [pod count]
+           python -m Utils.row_benchmark --pool [pod count]
+           python -m Utils.row_benchmark --sort [row count]
+           python -m Utils.row_benchmark --search [pod count]
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Any, Callable
+
+from Utils.raw_json import loads, dumps
+
+
+def make_pod_list(count: int) -> bytes:
+    """Encoded PodList of `count` pods with realistic labels, annotations, spec and status"""
+    pods = []
+    for i in range(count):
+        namespace = f"team-{i % 20}"
+        app = f"service-{i % 150}"
+        pods.append({
+            'apiVersion': 'v1',
+            'kind': 'Pod',
+            'metadata': {
+                'name': f"{app}-7d9f8b6c5-{i:05d}",
+                'namespace': namespace,
+                'uid': f"5f0c8e2a-1b3c-4d5e-8f90-{i:012d}",
+                'resourceVersion': str(100000 + i),
+                'creationTimestamp': '2026-01-15T10:00:00Z',
+                'labels': {'app': app, 'pod-template-hash': '7d9f8b6c5', 'tier': 'backend', 'team': namespace},
+                'annotations': {
+                    'kubectl.kubernetes.io/restartedAt': '2026-01-15T09:59:00Z',
+                    'prometheus.io/scrape': 'true',
+                    'prometheus.io/port': '9090',
+                },
+                'ownerReferences': [{'apiVersion': 'apps/v1', 'kind': 'ReplicaSet',
+                                     'name': f"{app}-7d9f8b6c5", 'uid': f"rs-{i % 150}", 'controller': True}],
+            },
+            'spec': {
+                'nodeName': f"node-{i % 50}",
+                'serviceAccountName': 'default',
+                'containers': [{
+                    'name': app,
+                    'image': f"registry.example.com/{app}:1.4.{i % 7}",
+                    'ports': [{'containerPort': 8080, 'protocol': 'TCP'}],
+                    'env': [{'name': f"ENV_{k}", 'value': f"value-{k}"} for k in range(8)],
+                    'resources': {'requests': {'cpu': '100m', 'memory': '128Mi'},
+                                  'limits': {'cpu': '500m', 'memory': '512Mi'}},
+                    'volumeMounts': [{'name': 'kube-api-access', 'mountPath': '/var/run/secrets/kubernetes.io/serviceaccount'}],
+                }],
+                'volumes': [{'name': 'kube-api-access', 'projected': {'sources': [{'serviceAccountToken': {'path': 'token'}}]}}],
+            },
+            'status': {
+                'phase': 'Running',
+                'podIP': f"10.{i % 250}.{(i // 250) % 250}.{i % 200}",
+                'hostIP': f"192.168.0.{i % 50}",
+                'startTime': '2026-01-15T10:00:05Z',
+                'conditions': [{'type': t, 'status': 'True', 'lastTransitionTime': '2026-01-15T10:00:10Z'}
+                               for t in ('Initialized', 'Ready', 'ContainersReady', 'PodScheduled')],
+                'containerStatuses': [{'name': app, 'ready': True, 'restartCount': i % 3, 'started': True,
+                                       'image': f"registry.example.com/{app}:1.4.{i % 7}",
+                                       'state': {'running': {'startedAt': '2026-01-15T10:00:08Z'}}}],
+            },
+        })
+    return dumps({'apiVersion': 'v1', 'kind': 'PodList', 'metadata': {'resourceVersion': '200000'}, 'items': pods})
+
+
+def measure_rows(body: bytes, compact_rows: bool) -> Dict[str, Any]:
+    """Process a PodList body and report the memory retained by the rows alone"""
+    from Utils.unified_resource_loader import ResourceLoadWorker, ResourceConfig
+
+    config = ResourceConfig(resource_type='pods', compact_rows=compact_rows)
+    worker = ResourceLoadWorker(config, None)
+
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    items = loads(body)['items']
+    rows: List[Any] = [worker._process_single_item(item) for item in items]
+    process_seconds = time.perf_counter() - start
+    del items
+    gc.collect()
+
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    return {
+        'rows': len(rows),
+        'retained_mb': retained / 1024 / 1024,
+        'bytes_per_row': retained / max(1, len(rows)),
+        'process_ms': process_seconds * 1000,
+    }
+
+
+class FakeListResponse:
+    """Stand-in for an HTTP response returned with _preload_content=False"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def release_conn(self):
+        pass
+
+
+def make_paged_list(count: int, page_size: int) -> Callable:
+    """A list_* method serving a synthetic PodList in pages of page_size, like a paginating API server"""
+    items = loads(make_pod_list(count))['items']
+    pages = {}
+    for page, start in enumerate(range(0, count, page_size)):
+        remaining = max(0, count - start - page_size)
+        metadata = {'resourceVersion': '200000'}
+        if remaining:
+            metadata.update({'continue': f"page-{page + 1}", 'remainingItemCount': remaining})
+        token = f"page-{page}" if page else None
+        pages[token] = dumps({'apiVersion': 'v1', 'kind': 'PodList', 'metadata': metadata,
+                              'items': items[start:start + page_size]})
+
+    def list_pods(limit=None, _continue=None, _preload_content=True, **kwargs):
+        return FakeListResponse(pages[_continue])
+    return list_pods
+
+
+def measure_throughput(list_pods: Callable, use_process_pool: bool, workers: int) -> Dict[str, Any]:
+    """List and process every page through the loader, with or without the process pool"""
+    from Utils.unified_resource_loader import ResourceLoadWorker, ResourceConfig
+    from Utils.row_process_pool import get_row_process_pool, extract_list_rows
+
+    config = ResourceConfig(resource_type='pods', progressive_loading=False, use_process_pool=use_process_pool,
+                            process_pool_workers=workers, process_pool_min_items=0)
+    worker = ResourceLoadWorker(config, None)
+
+    if use_process_pool:
+        # Spawn the workers and import the extractor before timing
+        pool = get_row_process_pool(workers)
+        for future in [pool._get_executor().submit(extract_list_rows, 'pods', b'{"items":[]}') for _ in range(workers)]:
+            future.result()
+
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    items = worker._list_all_pages(list_pods, {}, stream=False, track_version=False)
+    rows = worker._process_items_chunked(items) + worker._pool_rows
+    seconds = time.perf_counter() - start
+
+    return {
+        'rows': len(rows),
+        'seconds': seconds,
+        'rows_per_second': len(rows) / seconds,
+        # CPU this process spent, mostly holding the GIL - what the UI thread competes with
+        'main_cpu_seconds': time.process_time() - cpu_start,
+    }
+
+
+def main_throughput(count: int = 50000):
+    from Utils.performance_config import PROCESS_POOL_WORKERS
+    from Utils.row_process_pool import shutdown_row_process_pool
+
+    list_pods = make_paged_list(count, page_size=500)
+    print(f"{count} pods in pages of 500, {PROCESS_POOL_WORKERS} worker processes on {os.cpu_count()} CPUs")
+    try:
+        for label, use_process_pool in (('thread', False), ('process pool', True)):
+            stats = measure_throughput(list_pods, use_process_pool, PROCESS_POOL_WORKERS)
+            print(f"  {label:<13} {stats['seconds']:6.2f} s  {stats['rows_per_second']:9.0f} rows/s  "
+                  f"{stats['main_cpu_seconds']:6.2f} s CPU in the main process")
+    finally:
+        shutdown_row_process_pool()
+
+
+def measure_sort(values: List[Any], kind: str) -> Dict[str, Any]:
+    """Store a column's typed keys once, then sort and total it the way the table model does"""
+    from Utils.column_store import ColumnStore
+    from Utils.sort_keys import get_sort_key_function
+
+    store = ColumnStore()
+    start = time.perf_counter()
+    store.add_column(0, values, get_sort_key_function(kind), kind)
+    keys_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    order = store.argsort(0)
+    store.argsort(0, reverse=True)
+    sort_ms = (time.perf_counter() - start) * 1000 / 2
+
+    total_ms = None
+    if store.is_numeric(0):
+        start = time.perf_counter()
+        store.total(0, order[::2])
+        total_ms = (time.perf_counter() - start) * 1000
+    return {'rows': len(order), 'keys_ms': keys_ms, 'sort_ms': sort_ms, 'total_ms': total_ms}
+
+
+def main_sort(count: int = 100000):
+    import random
+    from Utils.column_store import NUMPY_AVAILABLE
+    from Utils.sort_keys import NATURAL, NUMERIC, QUANTITY, DURATION, VERSION
+
+    rng = random.Random(0)
+    columns = {
+        NATURAL: [f"service-{rng.randrange(150)}-7d9f8b6c5-{rng.randrange(100000):05d}" for _ in range(count)],
+        NUMERIC: [rng.randrange(200) for _ in range(count)],
+        QUANTITY: [f"{rng.randrange(1, 1024)}{rng.choice(('Ki', 'Mi', 'Gi', 'm', ''))}" for _ in range(count)],
+        DURATION: [f"{rng.randrange(48)}h {rng.randrange(60)}m" for _ in range(count)],
+        VERSION: [f"v1.{rng.randrange(20, 31)}.{rng.randrange(12)}" for _ in range(count)],
+    }
+    print(f"{count} rows per column, numeric columns {'in NumPy arrays' if NUMPY_AVAILABLE else 'in Python arrays'}")
+    for kind, values in columns.items():
+        stats = measure_sort(values, kind)
+        total = f"  {stats['total_ms']:6.1f} ms to total half the rows" if stats['total_ms'] is not None else ""
+        print(f"  {kind:<9} {stats['keys_ms']:7.0f} ms to build keys  {stats['sort_ms']:6.0f} ms per sort{total}")
+
+
+def measure_search(rows: List[Any], queries: List[str]) -> Dict[str, Any]:
+    """Index the rows once, then match each query the way a table filter does on every keystroke"""
+    from Utils.column_store import ColumnStore
+    from Utils.column_extractors import get_searchable_fields
+    from Utils.filter_query import FilterSnapshot, match_rows, parse_filter_query
+
+    fields = tuple(get_searchable_fields('pods')) + ('labels',)
+    snapshot = FilterSnapshot(rows, [], ColumnStore(), search_fields=fields)
+    start = time.perf_counter()
+    snapshot.search_index()
+    index_ms = (time.perf_counter() - start) * 1000
+
+    query_ms, matches = [], []
+    for query in queries:
+        start = time.perf_counter()
+        matches.append(len(match_rows(parse_filter_query(query), snapshot)))
+        query_ms.append((time.perf_counter() - start) * 1000)
+    return {'rows': len(rows), 'index_ms': index_ms, 'query_ms': query_ms, 'matches': matches}
+
+
+def main_search(count: int = 50000):
+    from Utils.unified_resource_loader import ResourceLoadWorker, ResourceConfig
+
+    worker = ResourceLoadWorker(ResourceConfig(resource_type='pods'), None)
+    rows = [worker._process_single_item(item) for item in loads(make_pod_list(count))['items']]
+    name = rows[len(rows) // 2]['name']
+    stats = measure_search(rows, [name[:length] for length in range(1, len(name) + 1)])
+    print(f"{count} pods, {stats['index_ms']:.0f} ms to index for search")
+    print(f"  typing '{name}': {max(stats['query_ms']):.1f} ms slowest keystroke, "
+          f"{sum(stats['query_ms']) / len(stats['query_ms']):.1f} ms average, {stats['matches'][-1]} match")
+
+
+def main(count: int = 10000):
+    body = make_pod_list(count)
+    print(f"{count} pods, {len(body) / 1024 / 1024:.1f} MB of JSON")
+    for label, compact_rows in (('dict rows', False), ('compact rows', True)):
+        stats = measure_rows(body, compact_rows)
+        print(f"  {label:<13} {stats['retained_mb']:7.1f} MB retained  "
+              f"{stats['bytes_per_row']:8.0f} B/row  {stats['process_ms']:7.0f} ms to process")
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if args and args[0] == '--pool':
+        main_throughput(int(args[1]) if len(args) > 1 else 50000)
+    elif args and args[0] == '--sort':
+        main_sort(int(args[1]) if len(args) > 1 else 100000)
+    elif args and args[0] == '--search':
+        main_search(int(args[1]) if len(args) > 1 else 50000)
+    else:
+        main(int(args[0]) if args else 10000)
@@ -0,0 +1,129 @@
+"""
+Row Process Pool - Extract rows of very large resource lists in worker processes
+Decoding and row extraction are pure Python and hold the GIL, so a 30k+ item list pins one core and
+starves the UI thread. Worker processes receive list pages as the undecoded response bytes, run the
+same per-item extraction as ResourceLoadWorker and send back compact row tuples.
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Any
+
+from Utils.raw_json import loads, get_list_items
+from Utils.resource_row import ResourceRow
+
+
+# Row extractors of the current worker process, one per resource type
+_extractors: Dict[str, Any] = {}
+
+
+def _init_worker():
+    """Keep worker processes quiet - the main process logs the outcome of every chunk"""
+    logging.getLogger().setLevel(logging.WARNING)
+
+
+def extract_list_rows(resource_type: str, body: bytes) -> List[tuple]:
+    """Worker process entry point: decode one encoded List page into row tuples"""
+    extractor = _extractors.get(resource_type)
+    if extractor is None:
+        from Utils.unified_resource_loader import ResourceLoadWorker, ResourceConfig
+        extractor = ResourceLoadWorker(
+            ResourceConfig(resource_type=resource_type, compact_rows=True), None
+        )
+        _extractors[resource_type] = extractor
+
+    rows = []
+    for item in get_list_items(loads(body)):
+        row = extractor._process_single_item(item)
+        if row is not None:
+            rows.append(row.to_tuple())
+    return rows
+
+
+class RowProcessPool:
+    """
+    Lazily started pool of extractor processes.
+    Uses the spawn start method: forking a process that runs Qt and network threads is unsafe.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._broken = False
+
+    @property
+    def available(self) -> bool:
+        return not self._broken
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                )
+                logging.info(f"Row process pool started with {self.max_workers} workers")
+            return self._executor
+
+    def submit_page(self, resource_type: str, body: bytes) -> Optional[Future]:
+        """Queue an encoded List page for extraction, or None when the pool cannot be used"""
+        if self._broken:
+            return None
+        try:
+            return self._get_executor().submit(extract_list_rows, resource_type, body)
+        except (BrokenProcessPool, RuntimeError, OSError) as e:
+            self._mark_broken(e)
+            return None
+
+    def collect(self, future: Future, timeout: Optional[float] = None) -> Optional[List[ResourceRow]]:
+        """Rows of a submitted page, or None when it failed and the caller should extract it itself"""
+        try:
+            return [ResourceRow.from_tuple(values) for values in future.result(timeout=timeout)]
+        except BrokenProcessPool as e:
+            self._mark_broken(e)
+        except TimeoutError:
+            future.cancel()
+            logging.warning("Row process pool: page extraction timed out")
+        except Exception as e:
+            logging.warning(f"Row process pool: page extraction failed: {e}")
+        return None
+
+    def _mark_broken(self, error: Exception):
+        logging.warning(f"Row process pool unavailable, processing in threads instead: {error}")
+        self._broken = True
+        self.shutdown(wait=False)
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+
+
+# Singleton management
+_row_process_pool_instance = None
+_row_process_pool_lock = threading.Lock()
+
+def get_row_process_pool(max_workers: int) -> RowProcessPool:
+    """Get the shared row process pool, restarting it when a different size is requested"""
+    global _row_process_pool_instance
+    with _row_process_pool_lock:
+        pool = _row_process_pool_instance
+        if pool is None or (pool.available and pool.max_workers != max(1, max_workers)):
+            if pool is not None:
+                pool.shutdown()
+            _row_process_pool_instance = pool = RowProcessPool(max_workers)
+        return pool
+
+def shutdown_row_process_pool():
+    """Stop the extractor processes"""
+    global _row_process_pool_instance
+    with _row_process_pool_lock:
+        if _row_process_pool_instance is not None:
+            _row_process_pool_instance.shutdown()
+            _row_process_pool_instance = None
@@ -1,15 +1,27 @@
 """
 Resource Search Index - Efficient search for large datasets
-Provides indexed search to replace O(n) linear search patterns
+Provides indexed search to replace O(n) linear search patterns.
+Words of the indexed fields map to the rows holding them. A query term matches the rows with a field
+containing it, like the plain substring search of the API and linear fallbacks: the words a term
+starts are one bisected run of the sorted vocabulary, words containing it elsewhere come from a scan
+of the vocabulary (narrowed by the scans for the shorter terms typed before it), and terms spanning
+several words are checked against the field text of the rows holding all of their words.
 """
 
 import re
 import threading
+from bisect import bisect_left
 import time
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, List, Set, Optional, Any, Callable, Tuple
 from dataclasses import dataclass
 import logging
 
+from Utils.column_extractors import compile_path, get_searchable_fields
+
+_WORDS = re.compile(r'\w+')
+_CHECK_EVERY = 4096  # Rows indexed between cancellation checks
+_CONTAINING_CACHE_SIZE = 64  # Vocabulary scans kept to narrow the scans of longer terms
+
 
 @dataclass
 class SearchResult:
@@ -26,11 +38,15 @@ class ResourceSearchIndex:
     Builds an inverted index for fast text search across large datasets.
     """
     
-    def __init__(self, max_results: int = 1000):
+    def __init__(self, max_results: int = 1000, resource_type: Optional[str] = None):
         self.max_results = max_results
-        self.index: Dict[str, Set[int]] = {}  # term -> set of row indices
+        self.resource_type = resource_type
+        self.index: Dict[str, Set[int]] = {}  # word -> set of row indices
+        self._vocabulary: Optional[List[str]] = None  # Sorted words of the index, rebuilt after changes
+        self._containing: Dict[str, List[str]] = {}  # term -> vocabulary words containing it, per vocabulary
         self.resources: List[Dict] = []
         self.searchable_fields: List[str] = []
+        self._field_getters: List[Tuple[str, Callable[[Any], Any]]] = []
         self._lock = threading.RLock()
         self._last_build = 0
         
@@ -44,17 +60,47 @@ class ResourceSearchIndex:
         
         logging.debug("ResourceSearchIndex initialized")
     
-    def build_index(self, resources: List[Dict], searchable_fields: List[str]):
-        """Build search index for resources"""
+    def build_index(self, resources: List[Dict], searchable_fields: Optional[List[str]] = None,
+                    check_cancelled: Optional[Callable[[], None]] = None):
+        """
+        Build search index for resources, over the resource type's searchable columns by default.
+        check_cancelled is called while indexing and raises to abandon the build.
+        """
         build_start = time.time()
         
+        if searchable_fields is None:
+            searchable_fields = get_searchable_fields(self.resource_type) if self.resource_type else ['name', 'namespace']
+        
         with self._lock:
             self.resources = resources
             self.searchable_fields = searchable_fields
+            self._field_getters = [(field, compile_path(field)) for field in searchable_fields]
             self.index.clear()
+            self._vocabulary = None
             
+            # Namespaces, statuses, nodes and labels repeat across rows - group rows by value, then
+            # split each distinct value once and add its rows to the words in bulk
+            rows_by_value: Dict[str, List[int]] = {}
             for i, resource in enumerate(resources):
-                self._index_resource(i, resource)
+                if check_cancelled and not i % _CHECK_EVERY:
+                    check_cancelled()
+                for field, get_value in self._field_getters:
+                    value = get_value(resource)
+                    if value:
+                        text = value if type(value) is str else str(value)
+                        rows = rows_by_value.get(text)
+                        if rows is None:
+                            rows_by_value[text] = [i]
+                        elif rows[-1] != i:
+                            rows.append(i)
+            
+            for text, rows in rows_by_value.items():
+                for term in self._extract_terms(text.lower()):
+                    postings = self.index.get(term)
+                    if postings is None:
+                        self.index[term] = set(rows)
+                    else:
+                        postings.update(rows)
             
             self._last_build = time.time()
             self.stats['builds'] += 1
@@ -68,43 +114,21 @@ class ResourceSearchIndex:
     
     def _index_resource(self, row_index: int, resource: Dict):
         """Index a single resource"""
-        for field in self.searchable_fields:
-            value = self._get_nested_value(resource, field)
-            if value:
-                terms = self._extract_terms(str(value).lower())
-                for term in terms:
-                    if term not in self.index:
-                        self.index[term] = set()
-                    self.index[term].add(row_index)
-    
-    def _get_nested_value(self, resource: Dict, field: str) -> Optional[str]:
-        """Get nested value from resource using dot notation"""
-        keys = field.split('.')
-        value = resource
-        
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return None
-        
-        return value
+        for field, get_value in self._field_getters:
+            value = get_value(resource)
+            if not value:
+                continue
+            for term in self._extract_terms(str(value).lower()):
+                rows = self.index.get(term)
+                if rows is None:
+                    self.index[term] = {row_index}
+                else:
+                    rows.add(row_index)
+        self._vocabulary = None
     
     def _extract_terms(self, text: str) -> List[str]:
-        """Extract searchable terms from text"""
-        # Split on word boundaries and filter out empty strings
-        terms = re.findall(r'\w+', text)
-        
-        # Include both full terms and prefixes for partial matching
-        all_terms = set(terms)
-        
-        # Add prefixes for terms longer than 2 characters
-        for term in terms:
-            if len(term) > 2:
-                for i in range(3, len(term) + 1):
-                    all_terms.add(term[:i])
-        
-        return list(all_terms)
+        """Extract searchable terms from text - whole words, parts of words are matched at search time"""
+        return list(set(_WORDS.findall(text)))
     
     def search(self, query: str, max_results: Optional[int] = None) -> List[SearchResult]:
         """
@@ -170,8 +194,8 @@ class ResourceSearchIndex:
         phrases = re.findall(r'"([^"]*)"', query)
         remaining_query = re.sub(r'"[^"]*"', '', query)
         
-        # Extract individual terms
-        terms = re.findall(r'\w+', remaining_query)
+        # Extract individual terms - punctuation stays part of a term, as in "web-7f"
+        terms = remaining_query.split()
         
         # Combine phrases and terms
         all_terms = phrases + terms
@@ -198,20 +222,58 @@ class ResourceSearchIndex:
         return matching_indices
     
     def _get_term_matches(self, term: str) -> Set[int]:
-        """Get all resource indices that match a term (including partial matches)"""
-        matches = set()
+        """Get all resource indices with a field containing the term"""
+        words = _WORDS.findall(term)
+        if len(words) == 1 and words[0] == term:
+            return self._rows_with_word_containing(term)
+        
+        if not words:
+            candidates = range(len(self.resources))  # Punctuation only - nothing indexed to narrow by
+        else:
+            candidates = self._rows_with_word_containing(words[0])
+            for word in words[1:]:
+                candidates &= self._rows_with_word_containing(word)
+        return {row for row in candidates if self._row_contains(row, term)}
+    
+    def _rows_with_word_containing(self, term: str) -> Set[int]:
+        """Rows holding an indexed word that contains a single-word term"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.index)
+            self._containing.clear()
+        vocabulary = self._vocabulary
         
-        # Exact matches
-        if term in self.index:
-            matches.update(self.index[term])
+        matches = set()
+        # The words a term starts are one run of the sorted vocabulary, beginning with the term itself
+        position = bisect_left(vocabulary, term)
+        while position < len(vocabulary) and vocabulary[position].startswith(term):
+            matches.update(self.index[vocabulary[position]])
+            position += 1
         
-        # Prefix matches for partial search
-        for indexed_term in self.index:
-            if indexed_term.startswith(term):
-                matches.update(self.index[indexed_term])
+        # Words containing it further in are scanned for - within the words a shorter part of it was found in
+        candidates = vocabulary
+        for previous, previous_words in self._containing.items():
+            if previous in term and len(previous_words) < len(candidates):
+                candidates = previous_words
+        containing = self._containing.get(term)
+        if containing is None:
+            containing = [word for word in candidates if term in word]
+            if len(self._containing) >= _CONTAINING_CACHE_SIZE:
+                self._containing.pop(next(iter(self._containing)))
+            self._containing[term] = containing
+        for word in containing:
+            if not word.startswith(term):
+                matches.update(self.index[word])
         
         return matches
     
+    def _row_contains(self, row_index: int, term: str) -> bool:
+        resource = self.resources[row_index]
+        for field, get_value in self._field_getters:
+            value = get_value(resource)
+            if value and term in str(value).lower():
+                return True
+        return False
+    
     def _calculate_score(self, resource: Dict, query_terms: List[str], 
                         original_query: str) -> tuple[float, List[str]]:
         """Calculate relevance score for a resource"""
@@ -228,8 +290,8 @@ class ResourceSearchIndex:
             'type': 2.0
         }
         
-        for field in self.searchable_fields:
-            value = self._get_nested_value(resource, field)
+        for field, get_value in self._field_getters:
+            value = get_value(resource)
             if not value:
                 continue
             
@@ -266,6 +328,22 @@ class ResourceSearchIndex:
         
         return normalized_score, matched_fields
     
+    def find(self, query: str) -> List[int]:
+        """Indices of the resources matching every query term, in row order - unscored, for filtering a table"""
+        with self._lock:
+            query_terms = self._extract_query_terms(query.lower())
+            if not query_terms:
+                return list(range(len(self.resources)))
+            return sorted(self._find_matching_indices(query_terms))
+    
+    def find_term(self, term: str) -> List[int]:
+        """Indices of the resources with a field containing the term, spaces included, in row order"""
+        term = term.lower()
+        with self._lock:
+            if not term.strip():
+                return list(range(len(self.resources)))
+            return sorted(self._get_term_matches(term))
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get search index statistics"""
         with self._lock:
@@ -298,13 +376,16 @@ class ResourceSearchIndex:
         
         for term in terms_to_clean:
             del self.index[term]
+        self._vocabulary = None
     
     def clear(self):
         """Clear the entire search index"""
         with self._lock:
             self.index.clear()
+            self._vocabulary = None
             self.resources.clear()
             self.searchable_fields.clear()
+            self._field_getters.clear()
             self.stats = {
                 'builds': 0,
                 'searches': 0, 
@@ -323,7 +404,7 @@ def get_search_index(resource_type: str) -> ResourceSearchIndex:
     """Get or create a search index for a resource type"""
     with _indexes_lock:
         if resource_type not in _search_indexes:
-            _search_indexes[resource_type] = ResourceSearchIndex()
+            _search_indexes[resource_type] = ResourceSearchIndex(resource_type=resource_type)
         return _search_indexes[resource_type]
 
 
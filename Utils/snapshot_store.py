@@ -0,0 +1,274 @@
+"""
+Snapshot Store - Last processed rows per cluster persisted to disk for instant warm starts
+Rows are kept in a SQLite database under ~/.orchetrix as zlib-compressed JSON, one snapshot per
+(kube context, resource type, namespace), and are only trusted for the API server they came from.
+Rows are stored without their API object and annotations - those can hold secret values, and the
+live load that replaces snapshot rows fetches every object again.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any
+
+from Utils.raw_json import loads, dumps
+
+
+# Snapshot store tuning
+SNAPSHOT_DIR = os.path.join(os.path.expanduser("~"), ".orchetrix", "cache")
+SNAPSHOT_DB_NAME = "snapshots.db"
+MAX_SNAPSHOT_BYTES_PER_CLUSTER = 32 * 1024 * 1024  # Compressed bytes kept per kube context
+MAX_SNAPSHOT_AGE_SECONDS = 7 * 24 * 3600  # Older snapshots are dropped instead of shown
+SNAPSHOT_COMPRESSION_LEVEL = 3  # zlib level - fast, most of the gain on repetitive JSON
+SNAPSHOT_SCHEMA_VERSION = 4  # 2: rows store created_ts epoch seconds instead of a formatted age, 3: pod rows carry controller_by and qos_class, 4: rows without raw_data
+
+UNSTORED_FIELDS = ('raw_data', 'annotations')  # May carry secret data - never written to disk
+
+
+def _stored_row(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Row as it is persisted - without the fields in UNSTORED_FIELDS"""
+    to_dict = getattr(item, 'to_dict', None)
+    row = to_dict(include_raw=False) if callable(to_dict) else item
+    return {key: value for key, value in row.items() if key not in UNSTORED_FIELDS}
+
+
+class SnapshotStore:
+    """
+    SQLite-backed store of processed resource rows.
+    Reads happen on the calling worker thread; writes go through a single background thread
+    so completed loads are never held up by disk I/O.
+    """
+
+    def __init__(self, path: Optional[str] = None,
+                 max_bytes_per_cluster: int = MAX_SNAPSHOT_BYTES_PER_CLUSTER):
+        self.path = path or os.path.join(SNAPSHOT_DIR, SNAPSHOT_DB_NAME)
+        self.max_bytes_per_cluster = max_bytes_per_cluster
+
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._failed = False
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot-writer")
+
+    def _get_connection(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use - a broken or unwritable store only disables snapshots"""
+        if self._connection is not None or self._failed:
+            return self._connection
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                " context TEXT NOT NULL,"
+                " resource_type TEXT NOT NULL,"
+                " namespace TEXT NOT NULL,"
+                " server TEXT NOT NULL,"
+                " schema_version INTEGER NOT NULL,"
+                " resource_version TEXT,"
+                " saved_at REAL NOT NULL,"
+                " item_count INTEGER NOT NULL,"
+                " size_bytes INTEGER NOT NULL,"
+                " payload BLOB NOT NULL,"
+                " PRIMARY KEY (context, resource_type, namespace))"
+            )
+            # Older schemas stored full API objects - remove them from the file, not just the table
+            if connection.execute("DELETE FROM snapshots WHERE schema_version != ?", (SNAPSHOT_SCHEMA_VERSION,)).rowcount:
+                connection.commit()
+                connection.execute("VACUUM")
+            connection.commit()
+            self._connection = connection
+        except Exception as e:
+            logging.warning(f"Snapshot store unavailable at {self.path}: {e}")
+            self._failed = True
+
+        return self._connection
+
+    def load(self, context: str, server: str, resource_type: str,
+             namespace: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Load a snapshot as {'items', 'resource_version', 'saved_at'}, or None when missing or untrusted"""
+        if not context or not server:
+            return None
+
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return None
+
+            try:
+                row = connection.execute(
+                    "SELECT server, schema_version, resource_version, saved_at, payload FROM snapshots"
+                    " WHERE context = ? AND resource_type = ? AND namespace = ?",
+                    (context, resource_type, namespace or '')
+                ).fetchone()
+            except Exception as e:
+                logging.debug(f"Snapshot read failed for {resource_type} on {context}: {e}")
+                return None
+
+            if row is None:
+                return None
+
+            stored_server, schema_version, resource_version, saved_at, payload = row
+            if stored_server != server:
+                # The context now points at a different API server - nothing stored for it applies
+                logging.info(f"Discarding snapshots for {context}: API server changed")
+                self._delete_context(connection, context)
+                return None
+            if schema_version != SNAPSHOT_SCHEMA_VERSION or time.time() - saved_at > MAX_SNAPSHOT_AGE_SECONDS:
+                self._delete(connection, context, resource_type, namespace)
+                return None
+
+        try:
+            items = loads(zlib.decompress(payload))
+        except Exception as e:
+            logging.debug(f"Corrupt snapshot for {resource_type} on {context}: {e}")
+            return None
+
+        return {'items': items, 'resource_version': resource_version, 'saved_at': saved_at}
+
+    def save_async(self, context: str, server: str, resource_type: str, namespace: Optional[str],
+                   items: List[Dict[str, Any]], resource_version: Optional[str] = None):
+        """Persist rows on the writer thread"""
+        if not context or not server or self._failed:
+            return
+        try:
+            self._writer.submit(self._save, context, server, resource_type, namespace, list(items), resource_version)
+        except RuntimeError:
+            pass  # Store is shutting down
+
+    def _save(self, context: str, server: str, resource_type: str, namespace: Optional[str],
+              items: List[Dict[str, Any]], resource_version: Optional[str]):
+        try:
+            payload = zlib.compress(dumps([_stored_row(item) for item in items]), SNAPSHOT_COMPRESSION_LEVEL)
+        except Exception as e:
+            logging.debug(f"Could not serialize {resource_type} snapshot: {e}")
+            return
+
+        if len(payload) > self.max_bytes_per_cluster:
+            logging.debug(f"{resource_type} snapshot ({len(payload)} bytes) exceeds the per-cluster cap - not stored")
+            return
+
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return
+
+            try:
+                # Rows from a different API server under the same context name are invalid now
+                connection.execute("DELETE FROM snapshots WHERE context = ? AND server != ?", (context, server))
+                connection.execute(
+                    "INSERT OR REPLACE INTO snapshots"
+                    " (context, resource_type, namespace, server, schema_version, resource_version,"
+                    "  saved_at, item_count, size_bytes, payload)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (context, resource_type, namespace or '', server, SNAPSHOT_SCHEMA_VERSION,
+                     resource_version, time.time(), len(items), len(payload), sqlite3.Binary(payload))
+                )
+                self._enforce_cluster_cap(connection, context)
+                connection.commit()
+            except Exception as e:
+                logging.debug(f"Snapshot write failed for {resource_type} on {context}: {e}")
+                connection.rollback()
+
+    def _enforce_cluster_cap(self, connection: sqlite3.Connection, context: str):
+        """Drop the oldest snapshots of a context until it fits the per-cluster size cap"""
+        rows = connection.execute(
+            "SELECT resource_type, namespace, size_bytes FROM snapshots WHERE context = ? ORDER BY saved_at DESC",
+            (context,)
+        ).fetchall()
+
+        total_bytes = 0
+        for resource_type, namespace, size_bytes in rows:
+            total_bytes += size_bytes
+            if total_bytes > self.max_bytes_per_cluster:
+                connection.execute(
+                    "DELETE FROM snapshots WHERE context = ? AND resource_type = ? AND namespace = ?",
+                    (context, resource_type, namespace)
+                )
+
+    def invalidate(self, context: str, resource_type: Optional[str] = None):
+        """Drop the snapshots of a context, or of one resource type in it"""
+        def delete():
+            with self._lock:
+                connection = self._get_connection()
+                if connection is None:
+                    return
+                try:
+                    if resource_type:
+                        connection.execute(
+                            "DELETE FROM snapshots WHERE context = ? AND resource_type = ?", (context, resource_type)
+                        )
+                    else:
+                        connection.execute("DELETE FROM snapshots WHERE context = ?", (context,))
+                    connection.commit()
+                except Exception as e:
+                    logging.debug(f"Snapshot invalidation failed for {context}: {e}")
+
+        try:
+            self._writer.submit(delete)
+        except RuntimeError:
+            pass
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot count, rows and compressed bytes per context"""
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return {}
+            rows = connection.execute(
+                "SELECT context, COUNT(*), SUM(item_count), SUM(size_bytes) FROM snapshots GROUP BY context"
+            ).fetchall()
+        return {
+            context: {'snapshots': count, 'items': items or 0, 'bytes': size or 0}
+            for context, count, items, size in rows
+        }
+
+    def close(self):
+        self._writer.shutdown(wait=True)
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _delete(self, connection: sqlite3.Connection, context: str, resource_type: str, namespace: Optional[str]):
+        try:
+            connection.execute(
+                "DELETE FROM snapshots WHERE context = ? AND resource_type = ? AND namespace = ?",
+                (context, resource_type, namespace or '')
+            )
+            connection.commit()
+        except Exception as e:
+            logging.debug(f"Snapshot delete failed: {e}")
+
+    def _delete_context(self, connection: sqlite3.Connection, context: str):
+        try:
+            connection.execute("DELETE FROM snapshots WHERE context = ?", (context,))
+            connection.commit()
+        except Exception as e:
+            logging.debug(f"Snapshot delete failed: {e}")
+
+
+# Singleton instance
+_snapshot_store_instance = None
+_snapshot_store_lock = threading.Lock()
+
+def get_snapshot_store() -> SnapshotStore:
+    """Get or create the snapshot store singleton"""
+    global _snapshot_store_instance
+    with _snapshot_store_lock:
+        if _snapshot_store_instance is None:
+            _snapshot_store_instance = SnapshotStore()
+        return _snapshot_store_instance
+
+def shutdown_snapshot_store():
+    """Flush pending writes and close the snapshot database"""
+    global _snapshot_store_instance
+    with _snapshot_store_lock:
+        if _snapshot_store_instance is not None:
+            _snapshot_store_instance.close()
+            _snapshot_store_instance = None
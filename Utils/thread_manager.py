@@ -4,8 +4,10 @@ import weakref
 import logging
 import time
 
+from Utils.performance_config import WORKER_POOL_THREADS
+
 class EnhancedThreadPoolManager(QObject):
-    def __init__(self, max_threads=4):  # Reduced from 8 to 4 for better performance
+    def __init__(self, max_threads=WORKER_POOL_THREADS):  # Reduced from 8 to 4 for better performance
         super().__init__()
         self.thread_pool = QThreadPool()
         self.thread_pool.setMaxThreadCount(max_threads)
@@ -8,43 +8,94 @@ import logging
 import time
 import threading
 # Use unified thread manager instead of separate ThreadPoolExecutor
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any, Callable, Union, Set
-from collections import defaultdict
+from collections import defaultdict, deque
 
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer, Qt, QMetaObject
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, QTimer, Qt, QMetaObject
 from PyQt6.QtWidgets import QApplication
 
 from kubernetes.client.rest import ApiException
 from Utils.kubernetes_client import get_kubernetes_client
 from Utils.error_handler import get_error_handler, safe_execute, log_performance
 from Utils.enhanced_worker import EnhancedBaseWorker
+from Utils.cancellation import RequestCancelled, get_cancellation_stats
+from Utils.rate_limiter import get_retry_after
 from Utils.thread_manager import get_thread_manager
+from Utils.informer_cache import get_informer_cache, shutdown_informer_cache
+from Utils.raw_json import (
+    loads, list_raw, list_raw_bytes, decode_list_head, get_list_items, get_list_continue,
+    get_list_remaining_count, get_list_resource_version, TableListMethod, MetadataListMethod
+)
+from Utils.result_cache import ResultCache, MEMORY_PRESSURE_MB
+from Utils.snapshot_store import get_snapshot_store, shutdown_snapshot_store
+from Utils.resource_delta import compute_delta
+from Utils.column_extractors import get_column_extractor
+from Utils.resource_row import ResourceRow, clear_decoded_raw_cache
+from Utils.resource_registry import get_resource_registry
+from Utils.access_review import get_access_review_cache
+from Utils.data_formatters import timestamp_to_epoch, format_age_from_epoch
+from Utils.row_process_pool import get_row_process_pool, shutdown_row_process_pool
+from Utils.performance_config import PROCESS_POOL_WORKERS, PROCESS_POOL_MIN_ITEMS
 
 
-# For cluster-scoped resources, return the original all-namespaces method
-cluster_scoped_resources = {
-    'nodes', 'namespaces', 'persistentvolumes', 'storageclasses',
-    'ingressclasses', 'clusterroles', 'clusterrolebindings',
-    'customresourcedefinitions', 'priorityclasses', 'runtimeclasses',
-    'mutatingwebhookconfigurations', 'validatingwebhookconfigurations'
+# List pages that only show server-printed columns are listed in the Table format:
+# resource type -> {printed column: row fields it fills}
+# The full object is fetched by the detail panel when a row is opened.
+TABLE_FORMAT_RESOURCES = {
+    'serviceaccounts': {},
+    'limitranges': {},
+    'resourcequotas': {},
+    'endpoints': {'Endpoints': ('endpoints',)},
+    'roles': {},
+    'clusterroles': {},
+    'leases': {'Holder': ('holder', 'holder_identity')},
+    'priorityclasses': {'Value': ('value',), 'Global-Default': ('global_default',)},
+    'runtimeclasses': {'Handler': ('handler',)},
+    'mutatingwebhookconfigurations': {'Webhooks': ('webhooks', 'webhooks_count')},
+    'validatingwebhookconfigurations': {'Webhooks': ('webhooks', 'webhooks_count')},
+    'horizontalpodautoscalers': {
+        'Reference': ('target_ref',),
+        'Targets': ('metrics',),
+        'MinPods': ('min_pods', 'min_replicas'),
+        'MaxPods': ('max_pods', 'max_replicas'),
+        'Replicas': ('current_replicas',),
+    },
 }
 
+# Resource types that are listed on demand only - never kept in an informer store or written to disk
+SENSITIVE_RESOURCES = frozenset({'secrets'})
+
+# Printed columns every row already has from its object metadata
+PRINTED_METADATA_COLUMNS = frozenset({'name', 'namespace', 'age', 'created at'})
+
+METADATA_PAGE_SIZE = 1000  # Items per page for metadata-only lists (a few hundred bytes each)
+CUSTOM_RESOURCE_PAGE_SIZE = 1000  # Items per page for custom resource Table rows (metadata plus a few cells)
+
 @dataclass
 class ResourceConfig:
     """Configuration for resource loading operations"""
     resource_type: str
-    api_method: str
     namespace: Optional[str] = None
     batch_size: int = 50  # Increased for heavy data handling
     timeout_seconds: int = 45  # Longer timeout for heavy data
-    enable_streaming: bool = False  # Keep disabled for stability
-    enable_pagination: bool = True  # Enable for heavy data handling
+    enable_streaming: bool = False  # Prefetch the next page while the current one is processed
+    enable_pagination: bool = True  # Follow limit/_continue tokens instead of one unbounded list
     max_concurrent_requests: int = 3  # Slightly increased for heavy data
     enable_chunking: bool = True  # New: Enable data chunking for heavy loads
     chunk_size: int = 100  # New: Process data in chunks of 100 items
-    progressive_loading: bool = True  # New: Enable progressive loading
+    progressive_loading: bool = True  # Emit a partial LoadResult for every page as it arrives
+    page_size: int = 500  # Items per list page when paginating
+    first_page_size: int = 100  # Smaller first page so progressive loads show rows quickly
+    use_informer: bool = False  # Serve from a shared list+watch store instead of re-listing
+    use_table_format: bool = False  # List printed columns + object metadata instead of full objects
+    cache_ttl_seconds: int = 30  # Serve the cached result this long before revalidating (0 disables)
+    enable_snapshot: bool = True  # Persist rows to disk and show them on the next start until live data arrives
+    compact_rows: bool = True  # Slotted rows holding the API object as undecoded bytes instead of dicts
+    use_process_pool: bool = False  # Extract rows of very large lists in worker processes (needs compact_rows)
+    process_pool_workers: int = PROCESS_POOL_WORKERS
+    process_pool_min_items: int = PROCESS_POOL_MIN_ITEMS  # List size from which the process pool is used
 
 
 @dataclass
@@ -60,425 +111,105 @@ class LoadResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-class SearchResourceLoadWorker(EnhancedBaseWorker):
-    """Worker specifically for search operations across all resources"""
+class ResourceLoadWorker(EnhancedBaseWorker):
+    """High-performance worker for loading Kubernetes resources"""
     
-    def __init__(self, config: ResourceConfig, loader_instance, search_query: str):
-        super().__init__(f"search_resource_load_{config.resource_type}")
+    def __init__(self, config: ResourceConfig, loader_instance, cached_result: Optional[LoadResult] = None):
+        super().__init__(f"resource_load_{config.resource_type}")
         self.config = config
         self.loader = loader_instance
-        self.search_query = search_query.lower() if search_query else ""
         self._start_time = time.time()
+        self._load_source = 'api'
+        self._resource_version = None
+        # Stale cached result being revalidated - unchanged rows are reused instead of re-processed
+        self._cached_result = cached_result
+        self._cached_resource_version = cached_result.metadata.get('resource_version') if cached_result else None
+        self._reusable_rows: Dict[str, Dict[str, Any]] = {}
+        self._unchanged = False
+        self._streamed_items: Optional[List[Dict[str, Any]]] = None  # Rows already sent as partial results
+        self._pool_rows: List[Any] = []  # Rows of later pages extracted by the process pool (non-streamed loads)
+        self._extract_columns = get_column_extractor(config.resource_type)
+        self._pages_streamed = 0
+        self._last_page_time = self._start_time
+        # Long paginated lists keep the worker alive as long as pages keep arriving
+        self._timeout = max(self._timeout, config.timeout_seconds + 15)
+        self.cancel_token.request_timeout = config.timeout_seconds + 10  # The list request timeout
+    
+    def is_timed_out(self):
+        """Time out only when no page has arrived within the worker timeout"""
+        return (time.time() - self._last_page_time) > self._timeout
     
     def execute(self) -> LoadResult:
-        """Execute search across all resources with filtering"""
+        """Execute resource loading with performance optimizations"""
         start_time = time.time()
         
         try:
-            # Load directly from API (no caching)
+            if self._cached_result is None and self.config.enable_snapshot:
+                self._use_snapshot()
             
-            # Load from API with comprehensive search
-            items = self._load_and_filter_from_api()
+            if self._cached_result is not None:
+                self._reusable_rows = {row['uid']: row for row in self._cached_result.items if row.get('uid')}
+            
+            if self._known_forbidden():
+                get_access_review_cache().note_skipped()
+                logging.debug(f"Skipping {self.config.resource_type} list - known to be forbidden")
+                return self._access_denied_result(start_time)
+            
+            # Load from the shared informer store, or directly from the Kubernetes API
+            items = self._load_from_api()
             
             if self.is_cancelled():
                 return LoadResult(
                     success=False, 
                     resource_type=self.config.resource_type,
-                    error_message="Search operation cancelled"
+                    error_message="Operation cancelled"
                 )
             
-            # Process search results using the parent loader's processing logic
-            processed_items = self._process_search_items(items)
-            
-            load_time = (time.time() - start_time) * 1000
-            
-            return LoadResult(
-                success=True,
-                resource_type=self.config.resource_type,
-                items=processed_items,
-                total_count=len(processed_items),
-                load_time_ms=load_time,
-                from_cache=False,
-                metadata={'search_query': self.search_query}
-            )
-            
-        except ApiException as api_error:
-            # Handle Kubernetes API exceptions during search
-            if api_error.status == 404:
-                logging.info(f"Resource type {self.config.resource_type} not available for search in this cluster")
+            if self._unchanged or (self._cached_resource_version and self._resource_version == self._cached_resource_version):
+                # Same list snapshot as the cached result - nothing to re-process or re-render
+                logging.info(f"Unified Resource Loader: {self.config.resource_type} unchanged since resourceVersion {self._resource_version}")
                 return LoadResult(
                     success=True,
                     resource_type=self.config.resource_type,
-                    items=[],
-                    total_count=0,
+                    items=self._cached_result.items,
+                    total_count=len(self._cached_result.items),
                     load_time_ms=(time.time() - start_time) * 1000,
-                    from_cache=False,
-                    metadata={'search_query': self.search_query}
-                )
-            else:
-                error_message = f"Search API Error {api_error.status}: {api_error.reason}"
-                return LoadResult(
-                    success=False,
-                    resource_type=self.config.resource_type,
-                    error_message=f"Search failed: {error_message}",
-                    load_time_ms=(time.time() - start_time) * 1000
-                )
-        except Exception as e:
-            error_handler = get_error_handler()
-            error_message = error_handler.format_connection_error(str(e), self.config.resource_type)
-            
-            return LoadResult(
-                success=False,
-                resource_type=self.config.resource_type,
-                error_message=f"Search failed: {error_message}",
-                load_time_ms=(time.time() - start_time) * 1000
-            )
-    
-    
-    def _load_and_filter_from_api(self) -> List[Any]:
-        """Load from API and filter by search query"""
-        # Use the same loading mechanism as the parent class
-        if not self.config.namespace:
-            # Search all namespaces
-            all_items = self._load_from_multiple_namespaces_with_search()
-        else:
-            # Search specific namespace
-            all_items = self._load_from_single_namespace_with_search()
-        
-        # Filter results by search query
-        if self.search_query:
-            filtered_items = []
-            for item in all_items:
-                if self._item_matches_search(item):
-                    filtered_items.append(item)
-            return filtered_items
-        
-        return all_items
-    
-    def _load_from_single_namespace_with_search(self) -> List[Any]:
-        """Load from single namespace for search"""
-        kube_client = get_kubernetes_client()
-        api_client = self.loader._get_api_client(kube_client, self.config.resource_type)
-        
-        # Get the correct namespaced API method
-        namespaced_method_name = self.loader._get_namespaced_api_method(self.config.resource_type)
-        api_method = getattr(api_client, namespaced_method_name)
-        
-        kwargs = {
-            # 'namespace': self.config.namespace,
-            'timeout_seconds': self.config.timeout_seconds,
-            '_request_timeout': self.config.timeout_seconds + 5,
-            'limit': 200  # Larger limit for search
-        }
-            # Only add namespace if NOT cluster-scoped
-        if self.config.resource_type not in cluster_scoped_resources:
-            kwargs['namespace'] = self.config.namespace
-
-        response = api_method(**kwargs)
-        return response.items if hasattr(response, 'items') else []
-    
-    def _load_from_multiple_namespaces_with_search(self) -> List[Any]:
-        """Load from multiple namespaces for comprehensive search"""
-        all_items = []
-        
-        try:
-            kube_client = get_kubernetes_client()
-            api_client = self.loader._get_api_client(kube_client, self.config.resource_type)
-            
-            # Handle cluster-scoped resources differently
-            if self.config.resource_type in cluster_scoped_resources:
-                # For cluster-scoped resources (like nodes), use cluster-wide API method
-                cluster_method_name = self.loader._get_api_method(self.config.resource_type)
-                api_method = getattr(api_client, cluster_method_name)
-                
-                kwargs = {
-                    'timeout_seconds': 30,
-                    '_request_timeout': 35,
-                    'limit': 100
-                }
-                
-                response = api_method(**kwargs)
-                if hasattr(response, 'items'):
-                    all_items.extend(response.items)
-                    
-                logging.info(f"Search loaded {len(all_items)} cluster-scoped {self.config.resource_type}")
-                return all_items
-            
-            # For namespaced resources, search across namespaces
-            namespaces_response = get_kubernetes_client().v1.list_namespace(limit=100)
-            namespace_names = [ns.metadata.name for ns in namespaces_response.items]
-            
-            namespaced_method_name = self.loader._get_namespaced_api_method(self.config.resource_type)
-            api_method = getattr(api_client, namespaced_method_name)
-            
-            for namespace in namespace_names:
-                if self.is_cancelled():
-                    break
-                    
-                try:
-                    kwargs = {
-                        'namespace': namespace,
-                        'timeout_seconds': 30,
-                        '_request_timeout': 35,
-                        'limit': 100
+                    from_cache=True,
+                    metadata={
+                        'source': self._load_source,
+                        'resource_version': self._resource_version,
+                        'unchanged': True,
                     }
-
-                    response = api_method(**kwargs)
-                    if hasattr(response, 'items'):
-                        all_items.extend(response.items)
-                        
-                except ApiException as api_error:
-                    # Handle API exceptions gracefully during search
-                    if api_error.status == 404:
-                        logging.debug(f"Resource {self.config.resource_type} not found in namespace {namespace} during search")
-                    elif api_error.status == 403:
-                        logging.debug(f"Access denied for {self.config.resource_type} in namespace {namespace} during search")
-                    continue
-                except Exception as e:
-                    # Continue with other namespaces silently
-                    logging.debug(f"Search error in namespace {namespace}: {e}")
-                    continue
-            
-            logging.info(f"Search loaded {len(all_items)} {self.config.resource_type} from {len(namespace_names)} namespaces")
-            return all_items
-            
-        except Exception as e:
-            logging.warning(f"Error in multi-namespace search: {e}")
-            # Fallback to default namespace
-            return self._load_from_single_namespace_with_search()
-    
-    def _item_matches_search(self, item: Any) -> bool:
-        """Check if item matches the search query"""
-        if not self.search_query:
-            return True
-        
-        try:
-            # Search in name
-            if hasattr(item, 'metadata') and item.metadata:
-                name = getattr(item.metadata, 'name', '').lower()
-                if self.search_query in name:
-                    return True
-                
-                # Search in namespace
-                namespace = getattr(item.metadata, 'namespace', '').lower()
-                if self.search_query in namespace:
-                    return True
-                
-                # Search in labels
-                labels = getattr(item.metadata, 'labels', {}) or {}
-                for key, value in labels.items():
-                    if (self.search_query in key.lower() or 
-                        self.search_query in str(value).lower()):
-                        return True
-            
-            # Search in spec fields (for certain resources)
-            if hasattr(item, 'spec') and item.spec:
-                # Convert spec to string and search
-                spec_str = str(item.spec).lower()
-                if self.search_query in spec_str:
-                    return True
-            
-        except Exception:
-            pass
-        
-        return False
-    
-    
-    def _process_search_items(self, items: List[Any]) -> List[Dict[str, Any]]:
-        """Process search results using simplified processing for speed"""
-        if not items:
-            return []
-        
-        processed_items = []
-        
-        for item in items:
-            if self.is_cancelled():
-                break
-            
-            try:
-                # Use basic processing for search results (faster)
-                processed_item = self._process_single_search_item(item)
-                if processed_item:
-                    processed_items.append(processed_item)
-            except Exception as e:
-                logging.debug(f"Error processing search item: {e}")
-                continue
-        
-        return processed_items
-    
-    def _process_single_search_item(self, item: Any) -> Optional[Dict[str, Any]]:
-        """Process a single search result item (simplified for speed)"""
-        try:
-            # Extract basic fields efficiently
-            metadata = item.metadata
-            name = metadata.name
-            namespace = getattr(metadata, 'namespace', None)
-            creation_timestamp = metadata.creation_timestamp
-            
-            # Calculate age using the unified method
-            age = self._format_age_fast(creation_timestamp)
-            
-            # Build basic resource data
-            resource_data = {
-                'name': name,
-                'namespace': namespace or '',
-                'age': age,
-                'created': creation_timestamp.isoformat() if creation_timestamp else None,
-                'resource_type': self.config.resource_type,
-                'search_matched': True,  # Mark as search result
-                'labels': metadata.labels or {},
-                'annotations': metadata.annotations or {},
-                'uid': metadata.uid if hasattr(metadata, 'uid') else None,
-            }
-            
-            # Add resource-specific fields efficiently
-            self._add_basic_resource_fields(resource_data, item)
-            
-            # Add raw_data for UI components that need detailed information - CRITICAL for proper display
-            try:
-                kube_client = get_kubernetes_client()
-                if hasattr(kube_client, 'v1') and hasattr(kube_client.v1, 'api_client'):
-                    resource_data['raw_data'] = kube_client.v1.api_client.sanitize_for_serialization(item)
-                else:
-                    # No fallback - skip items that can't be serialized to avoid dummy data
-                    logging.warning(f"Skipping item {name} - unable to serialize raw data")
-                    return None
-            except Exception as e:
-                logging.debug(f"Error serializing search raw data: {e}")
-                resource_data['raw_data'] = {}
-            
-            return resource_data
-            
-        except Exception as e:
-            logging.debug(f"Error processing single search item: {e}")
-            return None
-    
-    def _add_basic_resource_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add basic resource-specific fields for search results"""
-        try:
-            # Add status and basic info based on resource type
-            if self.config.resource_type == 'pods':
-                if hasattr(item, 'status') and item.status:
-                    processed_item['status'] = item.status.phase or 'Unknown'
-                    if item.status.container_statuses:
-                        ready_containers = sum(1 for cs in item.status.container_statuses if cs.ready)
-                        total_containers = len(item.status.container_statuses)
-                        processed_item['ready'] = f"{ready_containers}/{total_containers}"
-                        processed_item['containers_count'] = str(total_containers)
-                        
-                        # Calculate restart count
-                        restart_count = sum(cs.restart_count for cs in item.status.container_statuses if cs.restart_count)
-                        processed_item['restart_count'] = str(restart_count)
-                    else:
-                        processed_item['containers_count'] = "0"
-                        processed_item['restart_count'] = "0"
-                
-                # Add additional pod-specific fields that PodsPage expects
-                processed_item['controller_by'] = ""  # Default empty, could be enhanced
-                processed_item['qos_class'] = ""      # Default empty, could be enhanced
-                
-                # Add node name if available
-                if hasattr(item, 'spec') and item.spec and hasattr(item.spec, 'node_name'):
-                    processed_item['node_name'] = item.spec.node_name or ""
-                else:
-                    processed_item['node_name'] = ""
-                
-            elif self.config.resource_type in ['deployments', 'replicasets', 'daemonsets', 'statefulsets']:
-                if hasattr(item, 'status') and item.status:
-                    replicas = getattr(item.status, 'replicas', 0) or 0
-                    ready_replicas = getattr(item.status, 'ready_replicas', 0) or 0
-                    available_replicas = getattr(item.status, 'available_replicas', ready_replicas) or ready_replicas
-                    processed_item['ready'] = f"{available_replicas}/{replicas}"
-                    processed_item['status'] = 'Ready' if ready_replicas == replicas and replicas > 0 else 'Not Ready'
-                    
-                    # Add fields that DeploymentPage expects
-                    processed_item['pods_str'] = f"{available_replicas}/{replicas}"
-                    processed_item['replicas_str'] = str(replicas)
-                
-                # Add spec replicas if available
-                if hasattr(item, 'spec') and item.spec:
-                    spec_replicas = getattr(item.spec, 'replicas', 0) or 0
-                    processed_item['replicas_str'] = str(spec_replicas)
-                
-            elif self.config.resource_type == 'services':
-                if hasattr(item, 'spec') and item.spec:
-                    processed_item['type'] = item.spec.type or 'Unknown'
-                    processed_item['cluster_ip'] = item.spec.cluster_ip or 'None'
-                    processed_item['service_type'] = item.spec.type or 'Unknown'
-                    
-                    # Add ports information
-                    ports = []
-                    if hasattr(item.spec, 'ports') and item.spec.ports:
-                        for port in item.spec.ports:
-                            port_info = f"{port.port}"
-                            if hasattr(port, 'target_port') and port.target_port:
-                                port_info += f":{port.target_port}"
-                            if hasattr(port, 'protocol') and port.protocol:
-                                port_info += f"/{port.protocol}"
-                            ports.append(port_info)
-                    processed_item['port_text'] = ",".join(ports)
-                    
-                    # Add selector information
-                    selector_parts = []
-                    if hasattr(item.spec, 'selector') and item.spec.selector:
-                        for key, value in item.spec.selector.items():
-                            selector_parts.append(f"{key}={value}")
-                    processed_item['selector_text'] = ",".join(selector_parts)
-                    
-                    # Add external IP information
-                    processed_item['external_ip_text'] = ""  # Default empty, could be enhanced
-            
-            elif self.config.resource_type == 'nodes':
-                # Use the unified loader's node field processing for consistency
-                self.loader._add_node_fields(processed_item, item)
-            
-        except Exception as e:
-            logging.debug(f"Error adding basic resource fields: {e}")
-    
-    def _generate_cache_key(self) -> str:
-        """Generate cache key for search results - FIXED to include cluster"""
-        # FIXED: Include cluster information in search cache key
-        try:
-            kube_client = get_kubernetes_client()
-            cluster_name = kube_client.current_cluster if kube_client else 'unknown-cluster'
-        except:
-            cluster_name = 'unknown-cluster'
-            
-        namespace_key = f"ns_{self.config.namespace}" if self.config.namespace else "all_namespaces"
-        return f"{cluster_name}_{self.config.resource_type}_{namespace_key}"
-
-
-class ResourceLoadWorker(EnhancedBaseWorker):
-    """High-performance worker for loading Kubernetes resources"""
-    
-    def __init__(self, config: ResourceConfig, loader_instance):
-        super().__init__(f"resource_load_{config.resource_type}")
-        self.config = config
-        self.loader = loader_instance
-        self._start_time = time.time()
-    
-    def execute(self) -> LoadResult:
-        """Execute resource loading with performance optimizations"""
-        start_time = time.time()
-        
-        try:
-            # Load directly from API (no caching)
-            
-            # Load from Kubernetes API with optimizations
-            items = self._load_from_api()
-            
-            if self.is_cancelled():
-                return LoadResult(
-                    success=False, 
-                    resource_type=self.config.resource_type,
-                    error_message="Operation cancelled"
                 )
             
-            # Process results with chunking for heavy data  
-            processed_items = self._process_items_chunked(items) if self.config.enable_chunking else self._process_items(items)
+            if self._streamed_items is not None:
+                # Items were processed page by page while streaming to the UI
+                processed_items = self._streamed_items
+            else:
+                # Process results with chunking for heavy data  
+                processed_items = self._process_items_chunked(items) if self.config.enable_chunking else self._process_items(items)
+                if self._pool_rows:
+                    # Pages after the first were extracted by the process pool
+                    processed_items.extend(self._pool_rows)
             
             load_time = (time.time() - start_time) * 1000
-            logging.info(f"Unified Resource Loader: Loaded {len(processed_items)} {self.config.resource_type} in {load_time:.1f}ms")
+            logging.info(f"Unified Resource Loader: Loaded {len(processed_items)} {self.config.resource_type} in {load_time:.1f}ms (source: {self._load_source})")
+            
+            metadata = {
+                'source': self._load_source,
+                'resource_version': self._resource_version,
+                'streamed': self._streamed_items is not None,
+                'pages': self._pages_streamed,
+                'format': 'table' if self.config.use_table_format and self._load_source == 'api' else 'object',
+            }
+            
+            # Pages showing the cached rows can apply only what changed instead of re-rendering everything
+            if self._cached_result is not None and self._cached_resource_version and self._streamed_items is None:
+                delta = compute_delta(self._cached_result.items, processed_items)
+                if delta is not None:
+                    metadata['delta'] = delta
+                    metadata['delta_base'] = self._cached_resource_version
+                    logging.info(f"Unified Resource Loader: {self.config.resource_type} delta {delta.summary()}")
             
             return LoadResult(
                 success=True,
@@ -486,9 +217,17 @@ class ResourceLoadWorker(EnhancedBaseWorker):
                 items=processed_items,
                 total_count=len(processed_items),
                 load_time_ms=load_time,
-                from_cache=False
+                from_cache=False,
+                metadata=metadata
             )
             
+        except RequestCancelled:
+            return LoadResult(
+                success=False,
+                resource_type=self.config.resource_type,
+                error_message="Operation cancelled",
+                load_time_ms=(time.time() - start_time) * 1000
+            )
         except ApiException as api_error:
             # Handle Kubernetes API exceptions gracefully
             if api_error.status == 404:
@@ -503,14 +242,10 @@ class ResourceLoadWorker(EnhancedBaseWorker):
                     from_cache=False
                 )
             elif api_error.status == 403:
-                # Forbidden - insufficient permissions
+                # Forbidden - insufficient permissions, remembered so the next refresh does not ask again
                 logging.warning(f"Insufficient permissions to access {self.config.resource_type}")
-                return LoadResult(
-                    success=False,
-                    resource_type=self.config.resource_type,
-                    error_message=f"Access denied to {self.config.resource_type} - check cluster permissions",
-                    load_time_ms=(time.time() - start_time) * 1000
-                )
+                get_access_review_cache().record_forbidden('list', self.config.resource_type, self.config.namespace)
+                return self._access_denied_result(start_time)
             else:
                 error_message = f"API Error {api_error.status}: {api_error.reason}"
                 logging.error(f"API error loading {self.config.resource_type}: {error_message}")
@@ -546,12 +281,50 @@ class ResourceLoadWorker(EnhancedBaseWorker):
             )
     
     
+    def _known_forbidden(self) -> bool:
+        """Whether the list this worker would send is known to be forbidden
+        
+        "All Namespaces" loads of namespaced types are never skipped - they fall back to the readable namespaces.
+        """
+        if self.config.use_informer:
+            return False
+        namespace = self.config.namespace
+        if not namespace and get_resource_registry().is_namespaced(self.config.resource_type):
+            return False
+        return get_access_review_cache().can('list', self.config.resource_type, namespace) is False
+    
+    def _access_denied_result(self, start_time: float) -> LoadResult:
+        return LoadResult(
+            success=False,
+            resource_type=self.config.resource_type,
+            error_message=f"Access denied to {self.config.resource_type} - check cluster permissions",
+            load_time_ms=(time.time() - start_time) * 1000
+        )
+    
+    def _use_snapshot(self):
+        """Show the rows persisted by a previous session while the live list is loaded"""
+        snapshot = self.loader._load_snapshot_result(self.config.resource_type, self.config.namespace)
+        if snapshot is None or self.is_cancelled():
+            return
+        
+        self._cached_result = snapshot
+        # Snapshot rows are stored without their API objects - the live list always replaces them,
+        # reusing their processed fields, instead of being confirmed or diffed against them
+        self._cached_resource_version = None
+        self.loader._emit_cached_result(self.config.resource_type, snapshot)
+        
+        # Reconcile in one piece so streamed pages do not replace the snapshot rows
+        self.config = replace(self.config, progressive_loading=False)
+    
     def _load_from_api(self) -> List[Any]:
         """Load resources from Kubernetes API with performance optimizations"""
         kube_client = get_kubernetes_client()
         
-        # Get the appropriate API client
-        api_client = self._get_api_client(kube_client)
+        # Serve from the shared informer store when it is available
+        if self.config.use_informer:
+            informer_items = self._load_from_informer(kube_client)
+            if informer_items is not None:
+                return informer_items
         
         # Build method parameters for optimal performance and heavy data handling
         kwargs = {
@@ -559,221 +332,404 @@ class ResourceLoadWorker(EnhancedBaseWorker):
             '_request_timeout': self.config.timeout_seconds + 10  # Request timeout with buffer
         }
         
-        # For heavy data scenarios, add pagination support
-        if self.config.enable_pagination and self.config.resource_type == 'nodes':
-            kwargs['limit'] = min(self.config.chunk_size, 1000)  # Limit for heavy data
-        
         # Handle cluster scoped vs namespaced resources
-        # Use the global cluster_scoped_resources set instead of redefining
+        is_cluster_scoped = not get_resource_registry().is_namespaced(self.config.resource_type)
         
-        is_cluster_scoped = self.config.resource_type in cluster_scoped_resources
+        # Optimize field selection for better performance with heavy data
+        if self.config.resource_type in ['pods', 'nodes', 'services']:
+            # Only get essential fields to reduce network overhead for heavy data
+            field_selector = self._get_field_selector()
+            if field_selector:
+                kwargs['field_selector'] = field_selector
         
         # Handle "All Namespaces" case efficiently
         if not self.config.namespace and not is_cluster_scoped:
-            # For "All Namespaces", use optimized multi-namespace approach
-            return self._load_from_multiple_namespaces(api_client, kwargs)
+            # Cluster-wide paginated list, or a per-namespace fan-out without cluster-wide RBAC
+            return self._load_from_all_namespaces(kwargs)
         elif self.config.namespace and not is_cluster_scoped:
             # Specific namespace
             kwargs['namespace'] = self.config.namespace
         
         # Get the API method
-        api_method = getattr(api_client, self.config.api_method)
-        
-        # Enable streaming for large datasets
-        if self.config.enable_streaming:
-            kwargs['watch'] = False  # We handle our own streaming
+        api_method = self._get_list_method()
+        if api_method is None:
+            raise ValueError(f"Unknown resource type '{self.config.resource_type}'")
+        
+        # Execute paginated API calls with retry logic - each list body is decoded once into raw dicts
+        return self._list_all_pages(api_method, kwargs)
+    
+    def _get_list_method(self):
+        """List method of the resource type, in the Table format for pages that only show printed columns"""
+        if self.config.use_table_format:
+            return get_resource_registry().list_method(self.config.resource_type, TableListMethod)
+        return get_resource_registry().list_method(self.config.resource_type)
+    
+    def _load_from_informer(self, kube_client) -> Optional[List[Any]]:
+        """Get items from the cluster-wide informer store, or None to fall back to a direct list"""
+        cluster_name = getattr(kube_client, 'current_cluster', None)
+        if not cluster_name:
+            return None
         
-        # Optimize field selection for better performance with heavy data
-        if self.config.resource_type in ['pods', 'nodes', 'services']:
-            # Only get essential fields to reduce network overhead for heavy data
+        try:
+            list_method = get_resource_registry().list_method(self.config.resource_type)
+            if list_method is None:
+                return None
+            list_kwargs = {}
             field_selector = self._get_field_selector()
             if field_selector:
-                kwargs['field_selector'] = field_selector
-        
-        # For nodes, further optimize by reducing unnecessary data
-        if self.config.resource_type == 'nodes':
-            # Skip some heavy fields that aren't displayed in UI
-            logging.debug(f"Unified Resource Loader: Optimizing node API call for heavy data - using limit: {kwargs.get('limit', 'no limit')}")
-        
-        # Execute API call with retry logic
-        response = self._execute_with_retry(api_method, **kwargs)
-        
-        return response.items if hasattr(response, 'items') else []
+                list_kwargs['field_selector'] = field_selector
+            
+            informer = get_informer_cache().get_informer(
+                cluster_name, self.config.resource_type, list_method, list_kwargs
+            )
+            
+            if not informer.wait_for_sync(self.config.timeout_seconds, cancelled=self.is_cancelled):
+                if informer.has_failed():
+                    logging.debug(f"Informer unavailable for {self.config.resource_type}: {informer.last_error} - using direct list")
+                return None
+            
+            is_namespaced = get_resource_registry().is_namespaced(self.config.resource_type)
+            namespace = self.config.namespace if is_namespaced else None
+            
+            self._load_source = 'informer'
+            self._resource_version = informer.resource_version
+            return informer.list_items(namespace)
+            
+        except Exception as e:
+            logging.debug(f"Informer lookup failed for {self.config.resource_type}: {e}")
+            return None
     
     def _execute_with_retry(self, api_method, max_retries=3, **kwargs):
-        """Execute API call with exponential backoff retry logic"""
-        import time
+        """Execute API call with exponential backoff retry logic - cancellation aborts the request and its retries"""
         import random
         
         last_exception = None
         
-        for attempt in range(max_retries):
-            try:
-                response = api_method(**kwargs)
-                if attempt > 0:
-                    logging.info(f"API call succeeded on attempt {attempt + 1}")
-                return response
-                
-            except Exception as e:
-                last_exception = e
-                error_str = str(e).lower()
+        # Page prefetch and namespace fan-out threads make their requests through here too
+        with self.cancel_token.bind():
+            for attempt in range(max_retries):
+                self.cancel_token.raise_if_cancelled()
                 
-                # Don't retry on certain errors
-                if any(err in error_str for err in ['unauthorized', 'forbidden', 'not found']):
-                    logging.debug(f"Non-retryable error, failing immediately: {e}")
-                    raise
-                
-                # Calculate exponential backoff with jitter
-                if attempt < max_retries - 1:
-                    delay = (2 ** attempt) + random.uniform(0, 1)
-                    logging.warning(f"API call failed (attempt {attempt + 1}/{max_retries}), retrying in {delay:.1f}s: {e}")
-                    time.sleep(delay)
+                try:
+                    response = api_method(**kwargs)
+                    if attempt > 0:
+                        logging.info(f"API call succeeded on attempt {attempt + 1}")
+                    return response
                     
-                    # Check if cancelled during delay
-                    if self.is_cancelled():
-                        raise Exception("Operation cancelled during retry")
-                else:
-                    logging.error(f"API call failed after {max_retries} attempts: {e}")
+                except Exception as e:
+                    # An aborted request fails with whatever its shut-down socket raised
+                    if isinstance(e, RequestCancelled) or self.cancel_token.cancelled:
+                        raise RequestCancelled() from e
+                    
+                    last_exception = e
+                    error_str = str(e).lower()
+                    
+                    # Don't retry on certain errors
+                    if isinstance(e, ApiException) and e.status in (400, 401, 403, 404, 410):
+                        raise
+                    if any(err in error_str for err in ['unauthorized', 'forbidden', 'not found']):
+                        logging.debug(f"Non-retryable error, failing immediately: {e}")
+                        raise
+                    
+                    # Calculate exponential backoff with jitter
+                    if attempt < max_retries - 1:
+                        # A server still throttling after the rate limiter's own retries says how long to wait
+                        delay = get_retry_after(e)
+                        if delay is None:
+                            delay = (2 ** attempt) + random.uniform(0, 1)
+                        logging.warning(f"API call failed (attempt {attempt + 1}/{max_retries}), retrying in {delay:.1f}s: {e}")
+                        
+                        # Cancellation ends the delay at once
+                        if self.cancel_token.wait(delay):
+                            raise RequestCancelled("Operation cancelled during retry")
+                    else:
+                        logging.error(f"API call failed after {max_retries} attempts: {e}")
         
         # Re-raise the last exception if all retries failed
         raise last_exception
     
-    def _load_from_multiple_namespaces(self, api_client, base_kwargs) -> List[Any]:
-        """Load resources from multiple namespaces efficiently for 'All Namespaces' option"""
+    def _load_from_all_namespaces(self, base_kwargs) -> List[Any]:
+        """Load a namespaced resource from every namespace for the 'All Namespaces' option"""
+        cluster_wide_method = self._get_list_method()
+        access = get_access_review_cache()
+        
+        if cluster_wide_method is not None and access.can('list', self.config.resource_type) is not False:
+            try:
+                return self._list_all_pages(cluster_wide_method, base_kwargs)
+            except ApiException as api_error:
+                if api_error.status != 403:
+                    raise
+                # Namespace-scoped RBAC - list each namespace we are allowed to read instead
+                access.record_forbidden('list', self.config.resource_type)
+                logging.info(f"No cluster-wide list access for {self.config.resource_type} - loading namespace by namespace")
+        elif cluster_wide_method is not None:
+            access.note_skipped()
+        
+        return self._load_from_multiple_namespaces(base_kwargs)
+    
+    def _list_all_pages(self, api_method, base_kwargs, stream: bool = True, track_version: bool = True) -> List[Any]:
+        """Follow limit/_continue pagination until the list is complete, streaming each page"""
+        stream = stream and self.config.progressive_loading
+        
+        if not self.config.enable_pagination:
+            body = self._execute_with_retry(list_raw, list_func=api_method, **base_kwargs)
+            if track_version and self._snapshot_unchanged(body):
+                return []
+            items = get_list_items(body)
+            if stream:
+                self._stream_items(items)
+            return items
+        
         all_items = []
+        first_page_size = self.config.first_page_size if stream else self.config.page_size
+        body = self._fetch_page(api_method, base_kwargs, first_page_size, None)
+        
+        # Every page of a paginated list belongs to the snapshot of the first page
+        if track_version and self._snapshot_unchanged(body):
+            return []
+        
+        # Very large lists hand every page after the first to the extractor processes
+        process_pool = self._get_process_pool(body)
+        
+        # Prefetch the next page while the current one is processed and handed to the UI
+        prefetcher = None
+        if stream and self.config.enable_streaming and process_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"page-prefetch-{self.config.resource_type}")
         
         try:
-            # Get namespaces first (with caching)
-            namespaces_response = get_kubernetes_client().v1.list_namespace(limit=100)
-            namespace_names = [ns.metadata.name for ns in namespaces_response.items]
+            while True:
+                continue_token = get_list_continue(body)
+                next_page = None
+                if continue_token and prefetcher and not self.is_cancelled():
+                    next_page = prefetcher.submit(self._fetch_page, api_method, base_kwargs, self.config.page_size, continue_token)
+                
+                items = get_list_items(body)
+                all_items.extend(items)
+                if stream:
+                    self._stream_items(items, get_list_remaining_count(body))
+                
+                # Cancellation stops the remaining pages
+                if not continue_token or self.is_cancelled():
+                    break
+                
+                if process_pool is not None:
+                    self._list_pages_in_pool(process_pool, api_method, base_kwargs, continue_token, stream)
+                    break
+                
+                if next_page is not None:
+                    body = next_page.result()
+                else:
+                    body = self._fetch_page(api_method, base_kwargs, self.config.page_size, continue_token)
+        finally:
+            if prefetcher:
+                prefetcher.shutdown(wait=False, cancel_futures=True)
+        
+        return all_items
+    
+    def _get_process_pool(self, first_page: Dict[str, Any]):
+        """The row process pool when the list behind this first page is large enough to use it"""
+        if not self.config.use_process_pool or not self.config.compact_rows:
+            return None
+        if self.config.resource_type == 'nodes':
+            return None  # Node rows merge metrics collected in this process
+        
+        # Only unfiltered lists report their size up front
+        remaining_count = get_list_remaining_count(first_page)
+        if remaining_count is None or len(get_list_items(first_page)) + remaining_count < self.config.process_pool_min_items:
+            return None
+        
+        pool = get_row_process_pool(self.config.process_pool_workers)
+        return pool if pool.available else None
+    
+    def _list_pages_in_pool(self, pool, api_method, base_kwargs, continue_token: str, stream: bool):
+        """Fetch the remaining pages undecoded and extract their rows in the process pool, in list order"""
+        pending = deque()  # (future, page body, remaining count)
+        max_pending = pool.max_workers * 2  # Bounds the undecoded pages held in memory
+        
+        def collect(future, body, remaining_count):
+            rows = pool.collect(future, timeout=self.config.timeout_seconds) if future is not None else None
+            if rows is None:
+                # The pool could not extract this page - do it here
+                items = get_list_items(loads(body))
+                rows = self._process_items_chunked(items) if self.config.enable_chunking else self._process_items(items)
+            if stream:
+                self._emit_page_rows(rows, remaining_count)
+            else:
+                self._pool_rows.extend(rows)
+        
+        try:
+            while continue_token and not self.is_cancelled():
+                body = self._fetch_page(api_method, base_kwargs, self.config.page_size, continue_token, raw=True)
+                head = decode_list_head(body)
+                continue_token = get_list_continue(head)
+                pending.append((pool.submit_page(self.config.resource_type, body), body, get_list_remaining_count(head)))
+                
+                # Hand finished pages on while later pages are still downloading
+                while pending and (len(pending) >= max_pending or pending[0][0] is None or pending[0][0].done()):
+                    collect(*pending.popleft())
             
-            # Prioritize important namespaces and limit total namespaces for performance
-            important_namespaces = ["default", "kube-system", "kube-public"]
-            other_namespaces = [ns for ns in namespace_names if ns not in important_namespaces]
+            while pending and not self.is_cancelled():
+                collect(*pending.popleft())
+        finally:
+            for future, _, _ in pending:
+                if future is not None:
+                    future.cancel()
+    
+    def _snapshot_unchanged(self, body: Dict[str, Any]) -> bool:
+        """Record the list resourceVersion and report whether it matches the cached result being revalidated"""
+        self._resource_version = get_list_resource_version(body)
+        self._unchanged = bool(self._cached_resource_version) and self._resource_version == self._cached_resource_version
+        return self._unchanged
+    
+    def _fetch_page(self, api_method, base_kwargs, limit: int, continue_token: Optional[str], raw: bool = False):
+        """Fetch one list page, resuming from the server-provided token if the continue token expired
+        
+        Returns the decoded body, or the undecoded bytes when raw is set.
+        """
+        fetch = list_raw_bytes if raw else list_raw
+        kwargs = dict(base_kwargs)
+        kwargs['limit'] = limit
+        if continue_token:
+            kwargs['_continue'] = continue_token
+        
+        try:
+            body = self._execute_with_retry(fetch, list_func=api_method, **kwargs)
+            self._last_page_time = time.time()
+            return body
+        except ApiException as api_error:
+            if api_error.status != 410 or not continue_token:
+                raise
             
-            # Limit to first 20 namespaces to prevent excessive API calls
-            selected_namespaces = important_namespaces + other_namespaces[:17]  # Total of 20
+            # The list snapshot was compacted - the Status body carries a token to continue inconsistently
+            try:
+                fresh_token = get_list_continue(loads(api_error.body or '{}'))
+            except Exception:
+                fresh_token = None
+            if not fresh_token:
+                raise
             
-            # Get the correct namespaced API method for multi-namespace loading
-            namespaced_method_name = self.loader._get_namespaced_api_method(self.config.resource_type)
-            api_method = getattr(api_client, namespaced_method_name)
+            logging.warning(f"Continue token expired while listing {self.config.resource_type} - continuing from a newer snapshot")
+            kwargs['_continue'] = fresh_token
+            return self._execute_with_retry(fetch, list_func=api_method, **kwargs)
+    
+    def _load_from_multiple_namespaces(self, base_kwargs) -> List[Any]:
+        """Fan out across every readable namespace with bounded concurrency, streaming each namespace as it arrives"""
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        all_items = []
+        # Namespaces the access review ruled out are not asked at all
+        namespace_names = get_access_review_cache().listable_namespaces(
+            self.config.resource_type, self._get_namespace_names()
+        )
+        
+        # The same list method lists one namespace when called with it
+        api_method = self._get_list_method()
+        
+        max_workers = max(1, min(self.config.max_concurrent_requests, len(namespace_names)))
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"ns-fanout-{self.config.resource_type}")
+        
+        try:
+            futures = [
+                executor.submit(self._load_namespace_items, api_method, base_kwargs, namespace)
+                for namespace in namespace_names
+            ]
             
-            for namespace in selected_namespaces:
+            for future in as_completed(futures):
                 if self.is_cancelled():
                     break
-                    
-                try:
-                    # Create kwargs for this namespace
-                    ns_kwargs = base_kwargs.copy()
-                    ns_kwargs['namespace'] = namespace
-                    ns_kwargs['limit'] = 50  # Limit per namespace for performance
-                    
-                    # Execute API call for this namespace
-                    response = api_method(**ns_kwargs)
-                    if hasattr(response, 'items'):
-                        all_items.extend(response.items)
-                        
-                except ApiException as api_error:
-                    # Handle API exceptions gracefully - log but continue
-                    if api_error.status == 404:
-                        logging.debug(f"Resource {self.config.resource_type} not found in namespace {namespace} - skipping")
-                    elif api_error.status == 403:
-                        logging.debug(f"Access denied for {self.config.resource_type} in namespace {namespace} - skipping")
-                    else:
-                        logging.warning(f"API error loading {self.config.resource_type} from namespace {namespace}: {api_error.reason}")
-                    continue
-                except Exception as ns_error:
-                    # Continue with other namespaces silently for better performance
-                    logging.debug(f"Error loading {self.config.resource_type} from namespace {namespace}: {ns_error}")
-                    continue
-            
-            if all_items:
-                logging.info(f"Loaded {len(all_items)} {self.config.resource_type} from {len(selected_namespaces)} namespaces")
-            return all_items
+                
+                items = future.result()
+                all_items.extend(items)
+                if self.config.progressive_loading:
+                    self._stream_items(items)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        logging.info(f"Loaded {len(all_items)} {self.config.resource_type} from {len(namespace_names)} namespaces")
+        return all_items
+    
+    def _load_namespace_items(self, api_method, base_kwargs, namespace: str) -> List[Any]:
+        """Load every page of a resource in one namespace, skipping namespaces we cannot read"""
+        if self.is_cancelled():
+            return []
+        
+        try:
+            ns_kwargs = dict(base_kwargs)
+            ns_kwargs['namespace'] = namespace
+            return self._list_all_pages(api_method, ns_kwargs, stream=False, track_version=False)
             
+        except ApiException as api_error:
+            # Handle API exceptions gracefully - log but continue
+            if api_error.status == 404:
+                logging.debug(f"Resource {self.config.resource_type} not found in namespace {namespace} - skipping")
+            elif api_error.status == 403:
+                get_access_review_cache().record_forbidden('list', self.config.resource_type, namespace)
+                logging.debug(f"Access denied for {self.config.resource_type} in namespace {namespace} - skipping")
+            else:
+                logging.warning(f"API error loading {self.config.resource_type} from namespace {namespace}: {api_error.reason}")
+        except Exception as ns_error:
+            logging.debug(f"Error loading {self.config.resource_type} from namespace {namespace}: {ns_error}")
+        
+        return []
+    
+    def _get_namespace_names(self) -> List[str]:
+        """Names of all namespaces, or the kubeconfig context namespace when namespaces cannot be listed"""
+        kube_client = get_kubernetes_client()
+        
+        try:
+            return self.loader.list_resource_names('namespaces')
+        except ApiException as api_error:
+            if api_error.status != 403:
+                raise
+            logging.info("No permission to list namespaces - using the context namespace")
+        
+        try:
+            from kubernetes import config as kube_config
+            contexts, _ = kube_config.list_kube_config_contexts()
+            for context in contexts:
+                if context.get('name') == kube_client.current_cluster:
+                    return [(context.get('context') or {}).get('namespace') or 'default']
         except Exception as e:
-            logging.warning(f"Error loading from multiple namespaces, falling back to specific namespaces: {e}")
-            # Fallback to loading from default namespace only
-            try:
-                fallback_kwargs = base_kwargs.copy()
-                fallback_kwargs['namespace'] = 'default'
-                fallback_kwargs['limit'] = 100
-                
-                namespaced_method_name = self.loader._get_namespaced_api_method(self.config.resource_type)
-                api_method = getattr(api_client, namespaced_method_name)
-                response = api_method(**fallback_kwargs)
-                return response.items if hasattr(response, 'items') else []
-            except Exception as fallback_error:
-                logging.error(f"Fallback namespace loading also failed: {fallback_error}")
-                return []
+            logging.debug(f"Could not read the context namespace: {e}")
+        
+        return ['default']
     
-    def _get_api_client(self, kube_client):
-        """Get the appropriate API client for the resource type"""
-        api_mapping = {
-            # Core v1 resources
-            'pods': kube_client.v1,
-            'nodes': kube_client.v1,
-            'services': kube_client.v1,
-            'configmaps': kube_client.v1,
-            'secrets': kube_client.v1,
-            'namespaces': kube_client.v1,
-            'events': kube_client.v1,
-            'endpoints': kube_client.v1,
-            'persistentvolumes': kube_client.v1,
-            'persistentvolumeclaims': kube_client.v1,
-            'replicationcontrollers': kube_client.v1,
-            'limitranges': kube_client.v1,
-            'resourcequotas': kube_client.v1,
-            'serviceaccounts': kube_client.v1,
-            
-            # Apps v1 resources
-            'deployments': kube_client.apps_v1,
-            'replicasets': kube_client.apps_v1,
-            'daemonsets': kube_client.apps_v1,
-            'statefulsets': kube_client.apps_v1,
-            
-            # Networking v1 resources  
-            'ingresses': kube_client.networking_v1,
-            'networkpolicies': kube_client.networking_v1,
-            'ingressclasses': kube_client.networking_v1,
-            
-            # Storage v1 resources
-            'storageclasses': kube_client.storage_v1,
-            
-            # Batch v1 resources
-            'jobs': kube_client.batch_v1,
-            'cronjobs': kube_client.batch_v1,
-            
-            # RBAC v1 resources
-            'roles': kube_client.rbac_v1,
-            'rolebindings': kube_client.rbac_v1,
-            'clusterroles': kube_client.rbac_v1,
-            'clusterrolebindings': kube_client.rbac_v1,
-            
-            # Autoscaling v2 resources
-            'horizontalpodautoscalers': kube_client.autoscaling_v2,
-            
-            # Policy v1 resources
-            'poddisruptionbudgets': kube_client.policy_v1,
-            
-            # Scheduling v1 resources
-            'priorityclasses': kube_client.scheduling_v1,
-            
-            # Node v1 resources
-            'runtimeclasses': kube_client.node_v1,
-            
-            # Admission registration v1 resources
-            'mutatingwebhookconfigurations': kube_client.admissionregistration_v1,
-            'validatingwebhookconfigurations': kube_client.admissionregistration_v1,
-            
-            # Coordination v1 resources
-            'leases': kube_client.coordination_v1,
-            
-            # Custom Resources
-            'customresourcedefinitions': kube_client.apiextensions_v1,
-        }
+    def _stream_items(self, raw_items: List[Any], remaining_count: Optional[int] = None):
+        """Process one page or namespace of items and send it to the UI as a partial LoadResult"""
+        if self._streamed_items is None:
+            self._streamed_items = []
+        
+        self._last_page_time = time.time()
+        if not raw_items or self.is_cancelled():
+            return
         
-        return api_mapping.get(self.config.resource_type, kube_client.v1)
+        processed_items = self._process_items_chunked(raw_items) if self.config.enable_chunking else self._process_items(raw_items)
+        self._emit_page_rows(processed_items, remaining_count)
+    
+    def _emit_page_rows(self, processed_items: List[Any], remaining_count: Optional[int] = None):
+        """Send the processed rows of one page to the UI as a partial LoadResult"""
+        self._streamed_items.extend(processed_items)
+        self._pages_streamed += 1
+        
+        # remainingItemCount is only reported for unfiltered lists
+        expected_total = len(self._streamed_items) + remaining_count if remaining_count is not None else 0
+        
+        self.safe_emit_partial(LoadResult(
+            success=True,
+            resource_type=self.config.resource_type,
+            items=processed_items,
+            total_count=len(self._streamed_items),
+            load_time_ms=(time.time() - self._start_time) * 1000,
+            from_cache=False,
+            metadata={
+                'source': 'api',
+                'partial': True,
+                'page': self._pages_streamed,
+                'namespace': self.config.namespace,
+                'expected_total': expected_total,
+            }
+        ))
     
     def _get_field_selector(self) -> str:
         """Get optimized field selector for common resources"""
@@ -859,10 +815,11 @@ class ResourceLoadWorker(EnhancedBaseWorker):
                 if self.is_cancelled():
                     break
                     
+                item_name = (item.get('metadata') or {}).get('name')
                 try:
                     # Pass pre-loaded metrics for nodes
                     if self.config.resource_type == 'nodes':
-                        node_name = getattr(getattr(item, 'metadata', None), 'name', None)
+                        node_name = item_name
                         node_metrics = all_node_metrics.get(node_name) if node_name else None
                         processed_item = self._process_single_item(item, preloaded_metrics=node_metrics)
                     else:
@@ -871,10 +828,9 @@ class ResourceLoadWorker(EnhancedBaseWorker):
                     if processed_item:  # Only add valid items
                         processed_items.append(processed_item)
                     else:
-                        logging.warning(f"❌ [SKIPPED] Processed item is None/empty for {self.config.resource_type} {getattr(getattr(item, 'metadata', None), 'name', 'unknown')}")
+                        logging.warning(f"❌ [SKIPPED] Processed item is None/empty for {self.config.resource_type} {item_name or 'unknown'}")
                 except Exception as e:
-                    item_name = getattr(getattr(item, 'metadata', None), 'name', 'unknown')
-                    logging.warning(f"Error processing {self.config.resource_type} {item_name}: {e}")
+                    logging.warning(f"Error processing {self.config.resource_type} {item_name or 'unknown'}: {e}")
                     continue
             
             chunk_time = (time.time() - chunk_start_time) * 1000
@@ -904,592 +860,104 @@ class ResourceLoadWorker(EnhancedBaseWorker):
         
         return processed_batch
     
-    def _process_single_item(self, item: Any, preloaded_metrics: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
-        """Process a single Kubernetes resource item"""
-        try:
-            # Extract common fields efficiently
-            metadata = item.metadata
-            if not metadata:
-                logging.error(f"❌ [PROCESS] Item has no metadata: {item}")
-                return None
-                
-            name = metadata.name
-            if not name:
-                logging.error(f"❌ [PROCESS] Item has no name in metadata: {metadata}")
-                return None
-                
-            namespace = getattr(metadata, 'namespace', None)
-            creation_timestamp = metadata.creation_timestamp
-            
-            # Calculate age efficiently using cached formatter
-            age = self._format_age_fast(creation_timestamp)
-            
-            # Build base item dictionary
-            processed_item = {
-                'name': name,
-                'namespace': namespace,
-                'age': age,
-                'created': creation_timestamp,
-                'labels': metadata.labels or {},
-                'annotations': metadata.annotations or {},
-                'resource_type': self.config.resource_type,
-                'uid': metadata.uid,
-            }
-            
-            # Add resource-specific fields for performance
-            self._add_resource_specific_fields(processed_item, item, preloaded_metrics)
-            
-            # Add raw_data for UI components that need detailed information
-            # Serialize the raw Kubernetes object for components that need it
-            try:
-                kube_client = get_kubernetes_client()
-                if hasattr(kube_client, 'v1') and hasattr(kube_client.v1, 'api_client'):
-                    processed_item['raw_data'] = kube_client.v1.api_client.sanitize_for_serialization(item)
-                else:
-                    # No fallback - set empty raw_data to avoid dummy data
-                    processed_item['raw_data'] = {}
-            except Exception as e:
-                logging.debug(f"Error serializing raw data: {e}")
-                processed_item['raw_data'] = {}
-            
-            return processed_item
-            
-        except Exception as e:
-            logging.error(f"❌ [PROCESS ERROR] Error processing single {self.config.resource_type} item: {e}")
-            import traceback
-            logging.error(f"Full traceback: {traceback.format_exc()}")
-            return None
-    
-    def _add_resource_specific_fields(self, processed_item: Dict[str, Any], item: Any, preloaded_metrics: Optional[Dict[str, Any]] = None):
-        """Add resource-specific fields efficiently"""
-        resource_type = self.config.resource_type
-        
-        if resource_type == 'pods':
-            self._add_pod_fields(processed_item, item)
-        elif resource_type == 'nodes':
-            logging.debug(f"Unified Resource Loader: Adding node-specific fields for {processed_item.get('name', 'unknown')}")
-            self._add_node_fields(processed_item, item, preloaded_metrics)
-        elif resource_type == 'services':
-            self._add_service_fields(processed_item, item)
-        elif resource_type in ['deployments', 'replicasets', 'statefulsets', 'daemonsets']:
-            self._add_workload_fields(processed_item, item)
-        elif resource_type == 'replicationcontrollers':
-            self._add_replicationcontroller_fields(processed_item, item)
-        elif resource_type == 'configmaps':
-            self._add_configmap_fields(processed_item, item)
-        elif resource_type == 'secrets':
-            self._add_secret_fields(processed_item, item)
-        elif resource_type == 'resourcequotas':
-            self._add_resourcequota_fields(processed_item, item)
-        elif resource_type == 'limitranges':
-            self._add_limitrange_fields(processed_item, item)
-        elif resource_type == 'horizontalpodautoscalers':
-            self._add_hpa_fields(processed_item, item)
-        elif resource_type == 'poddisruptionbudgets':
-            self._add_pdb_fields(processed_item, item)
-        elif resource_type == 'priorityclasses':
-            self._add_priorityclass_fields(processed_item, item)
-        elif resource_type == 'runtimeclasses':
-            self._add_runtimeclass_fields(processed_item, item)
-        elif resource_type == 'leases':
-            self._add_lease_fields(processed_item, item)
-        elif resource_type == 'mutatingwebhookconfigurations':
-            self._add_mutatingwebhook_fields(processed_item, item)
-        elif resource_type == 'validatingwebhookconfigurations':
-            self._add_validatingwebhook_fields(processed_item, item)
-        elif resource_type == 'serviceaccounts':
-            self._add_serviceaccount_fields(processed_item, item)
-        elif resource_type == 'endpoints':
-            self._add_endpoints_fields(processed_item, item)
-        elif resource_type in ['roles', 'clusterroles']:
-            self._add_role_fields(processed_item, item)
-        elif resource_type in ['rolebindings', 'clusterrolebindings']:
-            self._add_rolebinding_fields(processed_item, item)
-        elif resource_type == 'customresourcedefinitions':
-            self._add_crd_fields(processed_item, item)
-    
-    def _add_pod_fields(self, processed_item: Dict[str, Any], pod: Any):
-        """Add pod-specific fields efficiently"""
-        status = pod.status
-        spec = pod.spec
-        
-        # Enhanced status determination with more detail
-        pod_status = 'Unknown'
-        if status:
-            pod_status = status.phase or 'Unknown'
-            
-            # Check for more specific container states
-            if status.container_statuses:
-                for cs in status.container_statuses:
-                    if cs.state:
-                        if cs.state.waiting:
-                            reason = cs.state.waiting.reason
-                            if reason in ("CrashLoopBackOff", "ImagePullBackOff", "ErrImagePull"):
-                                pod_status = reason
-                                break
-                        elif cs.state.terminated:
-                            if cs.state.terminated.exit_code != 0:
-                                pod_status = "Error"
-                                break
-        
-        processed_item.update({
-            'status': pod_status,
-            'ready': self._get_pod_ready_status(status),
-            'restarts': self._get_pod_restart_count(status),
-            'node_name': spec.node_name if spec else None,
-            'host_ip': status.host_ip if status else None,
-            'pod_ip': status.pod_ip if status else None,
-            'containers': len(spec.containers) if spec and spec.containers else 0,
-            'init_containers': len(spec.init_containers) if spec and spec.init_containers else 0,
-        })
-    
-    def _add_node_fields(self, processed_item: Dict[str, Any], node: Any, preloaded_metrics: Optional[Dict[str, Any]] = None):
-        """Add node-specific fields efficiently - optimized for heavy data"""
-        status = node.status
-        
-        # Quick exit for invalid nodes
-        if not status:
-            processed_item.update({
-                'status': 'Unknown',
-                'conditions': 'Unknown',
-                'roles': ['<none>'],
-                'version': 'Unknown',
-                'os': 'Unknown',
-                'kernel': 'Unknown',
-                'taints': '0',
-                'cpu_usage': 0.0,
-                'memory_usage': 0.0,
-                'disk_usage': 0.0,
-                'cpu_capacity': '',
-                'memory_capacity': '',
-                'disk_capacity': ''
-            })
-            return
-        
-        # Process node conditions using helper method from the loader class
-        node_status, conditions_text = HighPerformanceResourceLoader._process_node_conditions(status.conditions if status else None)
-        
-        # Extract node roles using helper method from the loader class
-        roles = HighPerformanceResourceLoader._extract_node_roles(node.metadata.labels if node.metadata else None)
-        
-        # Get taints count
-        taints_count = 0
-        if node.spec and node.spec.taints:
-            taints_count = len(node.spec.taints)
-        
-        # Format capacity information using helper method from the loader class
-        memory_capacity = ''
-        disk_capacity = ''
-        if status and status.capacity:
-            memory_capacity = HighPerformanceResourceLoader._format_capacity(status.capacity.get('memory', ''))
-            disk_capacity = HighPerformanceResourceLoader._format_capacity(status.capacity.get('ephemeral-storage', ''))
-        
-        # Don't simulate disk usage - leave as None to be filled by real metrics
-        estimated_disk_usage = None
-        
-        processed_item.update({
-            'status': node_status,
-            'conditions': conditions_text,
-            'roles': roles,
-            'version': status.node_info.kubelet_version if status and status.node_info else 'Unknown',
-            'os': status.node_info.operating_system if status and status.node_info else 'Unknown',
-            'kernel': status.node_info.kernel_version if status and status.node_info else 'Unknown',
-            'taints': str(taints_count),
-            'cpu_usage': None,  # Will be filled by metrics if available
-            'memory_usage': None,  # Will be filled by metrics if available
-            'disk_usage': estimated_disk_usage,  # Estimated usage, will be replaced by real metrics if available
-        })
-        
-        # Add capacity information
-        if status and status.capacity:
-            processed_item.update({
-                'cpu_capacity': status.capacity.get('cpu', ''),
-                'memory_capacity': memory_capacity,
-                'disk_capacity': disk_capacity,
-                'pods_capacity': status.capacity.get('pods', ''),
-            })
-        
-        # Set default metrics values (no real metrics loading to avoid blocking)
-        processed_item.update({
-            'cpu_usage': 0.0,
-            'memory_usage': 0.0,
-            'disk_usage': 0.0
-        })
-        
-        # Skip metrics loading for now to avoid 3+ minute delay
-        # Metrics will be loaded separately in background
-    
-    def _add_service_fields(self, processed_item: Dict[str, Any], service: Any):
-        """Add service-specific fields efficiently"""
-        spec = service.spec
-        status = service.status
-        
-        processed_item.update({
-            'type': spec.type if spec else 'Unknown',
-            'cluster_ip': spec.cluster_ip if spec else None,
-            'external_ip': self._get_service_external_ip(spec, status),
-            'ports': len(spec.ports) if spec and spec.ports else 0,
-        })
-    
-    def _add_workload_fields(self, processed_item: Dict[str, Any], workload: Any):
-        """Add workload-specific fields efficiently"""
-        spec = workload.spec
-        status = workload.status
-        
-        # Get replicas info
-        replicas = getattr(spec, 'replicas', 1) if spec else 1
-        ready_replicas = getattr(status, 'ready_replicas', 0) if status else 0
-        
-        processed_item.update({
-            'replicas': f"{ready_replicas}/{replicas}",
-            'ready_replicas': ready_replicas,
-            'total_replicas': replicas,
-        })
-    
-    def _format_age_fast(self, creation_timestamp) -> str:
-        """Fast age calculation with comprehensive timestamp handling"""
-        if not creation_timestamp:
-            return 'Unknown'
-        
-        try:
-            # Handle different timestamp formats
-            if hasattr(creation_timestamp, 'timestamp'):
-                # Kubernetes datetime object
-                created = datetime.fromtimestamp(creation_timestamp.timestamp(), tz=timezone.utc)
-            elif isinstance(creation_timestamp, str):
-                # ISO string format
-                if creation_timestamp.endswith('Z'):
-                    created = datetime.fromisoformat(creation_timestamp.replace('Z', '+00:00'))
-                else:
-                    created = datetime.fromisoformat(creation_timestamp)
-                # Ensure timezone aware
-                if created.tzinfo is None:
-                    created = created.replace(tzinfo=timezone.utc)
-            elif isinstance(creation_timestamp, datetime):
-                # Already a datetime object
-                created = creation_timestamp
-                if created.tzinfo is None:
-                    created = created.replace(tzinfo=timezone.utc)
-            else:
-                # Try to convert to string and parse
-                created = datetime.fromisoformat(str(creation_timestamp).replace('Z', '+00:00'))
-            
-            # Calculate age
-            now = datetime.now(timezone.utc)
-            age_delta = now - created
-            
-            days = age_delta.days
-            hours = age_delta.seconds // 3600
-            minutes = (age_delta.seconds % 3600) // 60
-            
-            # Format age
-            if days > 365:
-                years = days // 365
-                return f"{years}y"
-            elif days > 30:
-                months = days // 30
-                return f"{months}mo"
-            elif days > 0:
-                return f"{days}d"
-            elif hours > 0:
-                return f"{hours}h"
-            elif minutes > 0:
-                return f"{minutes}m"
-            else:
-                return "<1m"
-                
-        except Exception as e:
-            logging.warning(f"Error calculating age for timestamp {creation_timestamp}: {e}")
-            return 'Unknown'
-    
-    def _get_pod_ready_status(self, status) -> str:
-        """Get pod ready status efficiently"""
-        if not status or not status.container_statuses:
-            return '0/0'
-        
-        ready_count = sum(1 for cs in status.container_statuses if cs.ready)
-        total_count = len(status.container_statuses)
-        
-        return f"{ready_count}/{total_count}"
-    
-    def _get_pod_restart_count(self, status) -> int:
-        """Get pod restart count efficiently"""
-        if not status or not status.container_statuses:
-            return 0
-        
-        return sum(cs.restart_count for cs in status.container_statuses if cs.restart_count)
-    
-    def _get_service_external_ip(self, spec, status) -> Optional[str]:
-        """Get service external IP efficiently"""
-        if spec and spec.external_i_ps:
-            return ', '.join(spec.external_i_ps)
-        
-        if spec and spec.type == 'LoadBalancer' and status and status.load_balancer:
-            if status.load_balancer.ingress:
-                ips = [ing.ip for ing in status.load_balancer.ingress if ing.ip]
-                if ips:
-                    return ', '.join(ips)
-        
-        return None
-    
-    def _add_replicationcontroller_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add ReplicationController-specific fields"""
-        try:
-            spec = item.spec
-            status = item.status if hasattr(item, 'status') else None
-            
-            replicas = getattr(spec, 'replicas', 0) if spec else 0
-            ready_replicas = getattr(status, 'replicas', 0) if status else 0
-            
-            processed_item.update({
-                'replicas': ready_replicas,
-                'desired_replicas': replicas,
-                'selector': ', '.join([f"{k}={v}" for k, v in (spec.selector or {}).items()]) if spec and spec.selector else '<none>',
-            })
-        except Exception as e:
-            logging.debug(f"Error processing ReplicationController fields: {e}")
-    
-    def _add_configmap_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add ConfigMap-specific fields"""
-        try:
-            data = item.data or {}
-            processed_item.update({
-                'keys': ', '.join(data.keys()) if data else '<none>',
-                'data_count': len(data),
-            })
-        except Exception as e:
-            logging.debug(f"Error processing ConfigMap fields: {e}")
-    
-    def _add_secret_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add Secret-specific fields"""
-        try:
-            data = item.data or {}
-            secret_type = getattr(item, 'type', 'Opaque')
-            processed_item.update({
-                'type': secret_type,
-                'keys': ', '.join(data.keys()) if data else '<none>',
-                'data_count': len(data),
-            })
-        except Exception as e:
-            logging.debug(f"Error processing Secret fields: {e}")
-    
-    def _add_resourcequota_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add ResourceQuota-specific fields"""
+    def _process_single_item(self, item: Dict[str, Any], preloaded_metrics: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Process a single Kubernetes resource item (raw camelCase dict from the API)"""
         try:
-            spec = item.spec
-            status = item.status if hasattr(item, 'status') else None
-            
-            # Get hard limits from spec
-            hard_limits = spec.hard if spec and hasattr(spec, 'hard') else {}
-            used_resources = status.used if status and hasattr(status, 'used') else {}
+            # Extract common fields efficiently
+            metadata = item.get('metadata')
+            if not metadata:
+                logging.error(f"❌ [PROCESS] Item has no metadata: {item}")
+                return None
+                
+            name = metadata.get('name')
+            if not name:
+                logging.error(f"❌ [PROCESS] Item has no name in metadata: {metadata}")
+                return None
+                
+            namespace = metadata.get('namespace')
+            creation_timestamp = metadata.get('creationTimestamp')
+            resource_version = metadata.get('resourceVersion')
+            
+            # Objects unchanged since the cached result keep their processed row
+            cached_row = self._reusable_rows.get(metadata.get('uid'))
+            if cached_row is not None and resource_version and cached_row.get('resource_version') == resource_version:
+                reused_row = cached_row.copy()
+                if not self.config.compact_rows:
+                    reused_row['age'] = format_age_from_epoch(reused_row.get('created_ts'))
+                if 'raw_data' not in reused_row:
+                    # Rows restored from a snapshot have no API object
+                    if self.config.compact_rows:
+                        reused_row.set_raw(item, encode=self._load_source != 'informer')
+                    else:
+                        reused_row['raw_data'] = item
+                return reused_row
             
-            processed_item.update({
-                'hard_limits': len(hard_limits),
-                'used_resources': len(used_resources),
-                'resources': ', '.join(hard_limits.keys()) if hard_limits else '<none>',
-            })
-        except Exception as e:
-            logging.debug(f"Error processing ResourceQuota fields: {e}")
-    
-    def _add_limitrange_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add LimitRange-specific fields"""
-        try:
-            spec = item.spec
-            limits = spec.limits if spec and hasattr(spec, 'limits') else []
-            processed_item.update({
-                'limits_count': len(limits),
-                'types': ', '.join(set(limit.type for limit in limits if hasattr(limit, 'type'))) if limits else '<none>',
-            })
-        except Exception as e:
-            logging.debug(f"Error processing LimitRange fields: {e}")
-    
-    def _add_hpa_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add HorizontalPodAutoscaler-specific fields"""
-        try:
-            spec = item.spec
-            status = item.status if hasattr(item, 'status') else None
-            
-            min_replicas = getattr(spec, 'min_replicas', 1) if spec else 1
-            max_replicas = getattr(spec, 'max_replicas', 1) if spec else 1
-            current_replicas = getattr(status, 'current_replicas', 0) if status else 0
-            
-            processed_item.update({
-                'min_replicas': min_replicas,
-                'max_replicas': max_replicas,
-                'current_replicas': current_replicas,
-                'target_ref': f"{spec.scale_target_ref.kind}/{spec.scale_target_ref.name}" if spec and hasattr(spec, 'scale_target_ref') else '<none>',
-            })
-        except Exception as e:
-            logging.debug(f"Error processing HPA fields: {e}")
-    
-    def _add_pdb_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add PodDisruptionBudget-specific fields"""
-        try:
-            spec = item.spec
-            status = item.status if hasattr(item, 'status') else None
+            # Rows keep the creation time - the table formats the age when a cell is painted
+            created_ts = timestamp_to_epoch(creation_timestamp)
             
-            min_available = getattr(spec, 'min_available', None) if spec else None
-            max_unavailable = getattr(spec, 'max_unavailable', None) if spec else None
+            if self.config.compact_rows:
+                processed_item = ResourceRow(
+                    name, namespace, created_ts, creation_timestamp, metadata.get('labels'),
+                    self.config.resource_type, metadata.get('uid'), resource_version
+                )
+            else:
+                # Build base item dictionary
+                processed_item = {
+                    'name': name,
+                    'namespace': namespace,
+                    'created_ts': created_ts,
+                    'age': format_age_from_epoch(created_ts),
+                    'created': creation_timestamp,
+                    'labels': metadata.get('labels') or {},
+                    'annotations': metadata.get('annotations') or {},
+                    'resource_type': self.config.resource_type,
+                    'uid': metadata.get('uid'),
+                    'resource_version': resource_version,
+                }
             
-            processed_item.update({
-                'min_available': str(min_available) if min_available is not None else '<none>',
-                'max_unavailable': str(max_unavailable) if max_unavailable is not None else '<none>',
-                'current_healthy': getattr(status, 'current_healthy', 0) if status else 0,
-                'desired_healthy': getattr(status, 'desired_healthy', 0) if status else 0,
-            })
-        except Exception as e:
-            logging.debug(f"Error processing PDB fields: {e}")
-    
-    def _add_priorityclass_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add PriorityClass-specific fields"""
-        try:
-            value = getattr(item, 'value', 0)
-            global_default = getattr(item, 'global_default', False)
-            description = getattr(item, 'description', '')
-            
-            processed_item.update({
-                'value': value,
-                'global_default': global_default,
-                'description': description or '<none>',
-            })
-        except Exception as e:
-            logging.debug(f"Error processing PriorityClass fields: {e}")
-    
-    def _add_runtimeclass_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add RuntimeClass-specific fields"""
-        try:
-            handler = getattr(item, 'handler', '')
-            processed_item.update({
-                'handler': handler or '<none>',
-            })
-        except Exception as e:
-            logging.debug(f"Error processing RuntimeClass fields: {e}")
-    
-    def _add_lease_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add Lease-specific fields"""
-        try:
-            spec = item.spec
-            holder_identity = getattr(spec, 'holder_identity', '') if spec else ''
-            lease_duration = getattr(spec, 'lease_duration_seconds', 0) if spec else 0
-            
-            processed_item.update({
-                'holder_identity': holder_identity or '<none>',
-                'holder': holder_identity or '<none>',  # For compatibility with LeasesPage
-                'lease_duration': f"{lease_duration}s" if lease_duration else '<none>',
-            })
-        except Exception as e:
-            logging.debug(f"Error processing Lease fields: {e}")
-    
-    def _add_mutatingwebhook_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add MutatingWebhookConfiguration-specific fields"""
-        try:
-            webhooks = getattr(item, 'webhooks', [])
-            processed_item.update({
-                'webhooks_count': len(webhooks),
-                'webhooks': ', '.join([w.name for w in webhooks if hasattr(w, 'name')]) if webhooks else '<none>',
-            })
-        except Exception as e:
-            logging.debug(f"Error processing MutatingWebhookConfiguration fields: {e}")
-    
-    def _add_validatingwebhook_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add ValidatingWebhookConfiguration-specific fields"""
-        try:
-            webhooks = getattr(item, 'webhooks', [])
-            processed_item.update({
-                'webhooks_count': len(webhooks),
-                'webhooks': ', '.join([w.name for w in webhooks if hasattr(w, 'name')]) if webhooks else '<none>',
-            })
-        except Exception as e:
-            logging.debug(f"Error processing ValidatingWebhookConfiguration fields: {e}")
-    
-    def _add_serviceaccount_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add ServiceAccount-specific fields"""
-        try:
-            secrets = getattr(item, 'secrets', [])
-            image_pull_secrets = getattr(item, 'image_pull_secrets', [])
+            # Add resource-specific fields for performance
+            self._add_resource_specific_fields(processed_item, item, preloaded_metrics)
             
-            processed_item.update({
-                'secrets_count': len(secrets),
-                'image_pull_secrets_count': len(image_pull_secrets),
-                'automount_token': getattr(item, 'automount_service_account_token', True),
-            })
-        except Exception as e:
-            logging.debug(f"Error processing ServiceAccount fields: {e}")
-    
-    def _add_endpoints_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add Endpoints-specific fields"""
-        try:
-            subsets = getattr(item, 'subsets', [])
+            # The decoded API object already has the serialized shape UI components expect
+            if self.config.compact_rows:
+                # Objects from the informer store are shared - only listed objects are worth encoding
+                processed_item.set_raw(item, encode=self._load_source != 'informer')
+            else:
+                processed_item['raw_data'] = item
             
-            # Get addresses and ports more comprehensively
-            all_addresses = []
-            all_ports = []
+            return processed_item
             
-            for subset in subsets:
-                addresses = getattr(subset, 'addresses', []) or []
-                ports = getattr(subset, 'ports', []) or []
-                
-                # Collect IP addresses
-                for addr in addresses:
-                    if hasattr(addr, 'ip') and addr.ip:
-                        all_addresses.append(addr.ip)
-                
-                # Collect port information
-                for port in ports:
-                    port_info = f"{getattr(port, 'port', 'unknown')}"
-                    if hasattr(port, 'protocol'):
-                        port_info += f"/{port.protocol}"
-                    if hasattr(port, 'name') and port.name:
-                        port_info += f" ({port.name})"
-                    all_ports.append(port_info)
-            
-            processed_item.update({
-                'endpoints_count': len(all_addresses),
-                'endpoints': ', '.join(all_addresses[:3]) + ('...' if len(all_addresses) > 3 else '') if all_addresses else '<none>',
-                'ports': ', '.join(all_ports) if all_ports else '<none>',
-            })
-        except Exception as e:
-            logging.debug(f"Error processing Endpoints fields: {e}")
-    
-    def _add_role_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add Role/ClusterRole-specific fields"""
-        try:
-            rules = getattr(item, 'rules', [])
-            processed_item.update({
-                'rules_count': len(rules),
-            })
         except Exception as e:
-            logging.debug(f"Error processing Role fields: {e}")
+            logging.error(f"❌ [PROCESS ERROR] Error processing single {self.config.resource_type} item: {e}")
+            import traceback
+            logging.error(f"Full traceback: {traceback.format_exc()}")
+            return None
     
-    def _add_rolebinding_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add RoleBinding/ClusterRoleBinding-specific fields"""
-        try:
-            subjects = getattr(item, 'subjects', [])
-            role_ref = getattr(item, 'role_ref', None)
-            
-            processed_item.update({
-                'subjects_count': len(subjects),
-                'role_ref': f"{role_ref.kind}/{role_ref.name}" if role_ref and hasattr(role_ref, 'kind') and hasattr(role_ref, 'name') else '<none>',
-            })
-        except Exception as e:
-            logging.debug(f"Error processing RoleBinding fields: {e}")
+    def _add_resource_specific_fields(self, processed_item: Dict[str, Any], item: Dict[str, Any], preloaded_metrics: Optional[Dict[str, Any]] = None):
+        """Add the resource type's registered columns"""
+        # Table rows carry printed columns instead of spec/status
+        if 'cells' in item:
+            self._add_table_fields(processed_item, item['cells'])
+            return
+        
+        self._extract_columns(item, processed_item)
     
-    def _add_crd_fields(self, processed_item: Dict[str, Any], item: Any):
-        """Add CustomResourceDefinition-specific fields"""
-        try:
-            spec = item.spec
-            status = item.status if hasattr(item, 'status') else None
-            
-            group = getattr(spec, 'group', '') if spec else ''
-            scope = getattr(spec, 'scope', 'Namespaced') if spec else 'Namespaced'
-            
-            processed_item.update({
-                'group': group or '<none>',
-                'scope': scope,
-                'established': 'True' if status and hasattr(status, 'conditions') and any(c.type == 'Established' and c.status == 'True' for c in status.conditions) else 'False',
-            })
-        except Exception as e:
-            logging.debug(f"Error processing CRD fields: {e}")
+    def _add_table_fields(self, processed_item: Dict[str, Any], cells: Dict[str, Any]):
+        """Add fields from the server-printed Table columns"""
+        column_fields = TABLE_FORMAT_RESOURCES.get(self.config.resource_type)
+        if column_fields is None:
+            # Custom resources show whatever their CRD prints, keyed by the printed column name
+            for column, value in cells.items():
+                if column.lower() not in PRINTED_METADATA_COLUMNS:
+                    processed_item[column] = '<none>' if value is None or value == '' else value
+            return
+        
+        for column, field_names in column_fields.items():
+            value = cells.get(column)
+            if value is None or value == '':
+                value = '<none>'
+            for field_name in field_names:
+                processed_item[field_name] = value
     
     def _generate_cache_key(self) -> str:
         """Generate cache key for this resource loading operation - FIXED to include cluster"""
@@ -1548,6 +1016,130 @@ class ResourceLoadWorker(EnhancedBaseWorker):
 # cancel() method inherited from EnhancedBaseWorker
 
 
+class SearchResourceLoadWorker(ResourceLoadWorker):
+    """
+    Lists a resource the way ResourceLoadWorker does and keeps the objects matching a search query -
+    for searches the loaded rows cannot answer yet. Matches become the same rows a load builds.
+    """
+    
+    def __init__(self, config: ResourceConfig, loader_instance, search_query: str):
+        # One filtered result - pages are not streamed to the page as they arrive
+        super().__init__(replace(config, progressive_loading=False, use_process_pool=False), loader_instance)
+        self.worker_id = f"search_resource_load_{config.resource_type}"
+        self.search_query = search_query.lower() if search_query else ""
+    
+    def execute(self) -> LoadResult:
+        """Execute search across all resources with filtering"""
+        start_time = time.time()
+        
+        try:
+            if self._known_forbidden():
+                get_access_review_cache().note_skipped()
+                return self._access_denied_result(start_time)
+            
+            items = self._load_from_api()
+            
+            if self.is_cancelled():
+                return LoadResult(
+                    success=False, 
+                    resource_type=self.config.resource_type,
+                    error_message="Search operation cancelled"
+                )
+            
+            matched_items = [item for item in items if self._item_matches_search(item)]
+            processed_items = (self._process_items_chunked(matched_items) if self.config.enable_chunking
+                               else self._process_items(matched_items))
+            
+            return LoadResult(
+                success=True,
+                resource_type=self.config.resource_type,
+                items=processed_items,
+                total_count=len(processed_items),
+                load_time_ms=(time.time() - start_time) * 1000,
+                from_cache=False,
+                metadata={'search_query': self.search_query, 'source': self._load_source}
+            )
+            
+        except RequestCancelled:
+            return LoadResult(
+                success=False,
+                resource_type=self.config.resource_type,
+                error_message="Search operation cancelled",
+                load_time_ms=(time.time() - start_time) * 1000
+            )
+        except ApiException as api_error:
+            # Handle Kubernetes API exceptions during search
+            if api_error.status == 404:
+                logging.info(f"Resource type {self.config.resource_type} not available for search in this cluster")
+                return LoadResult(
+                    success=True,
+                    resource_type=self.config.resource_type,
+                    items=[],
+                    total_count=0,
+                    load_time_ms=(time.time() - start_time) * 1000,
+                    from_cache=False,
+                    metadata={'search_query': self.search_query}
+                )
+            else:
+                error_message = f"Search API Error {api_error.status}: {api_error.reason}"
+                return LoadResult(
+                    success=False,
+                    resource_type=self.config.resource_type,
+                    error_message=f"Search failed: {error_message}",
+                    load_time_ms=(time.time() - start_time) * 1000
+                )
+        except Exception as e:
+            error_handler = get_error_handler()
+            error_message = error_handler.format_connection_error(str(e), self.config.resource_type)
+            
+            return LoadResult(
+                success=False,
+                resource_type=self.config.resource_type,
+                error_message=f"Search failed: {error_message}",
+                load_time_ms=(time.time() - start_time) * 1000
+            )
+    
+    def _item_matches_search(self, item: Dict[str, Any]) -> bool:
+        """Whether the name, namespace, labels, printed columns or spec of a listed object contain the query"""
+        if not self.search_query:
+            return True
+        
+        query = self.search_query
+        metadata = item.get('metadata') or {}
+        if query in (metadata.get('name') or '').lower() or query in (metadata.get('namespace') or '').lower():
+            return True
+        for key, value in (metadata.get('labels') or {}).items():
+            if query in key.lower() or query in str(value).lower():
+                return True
+        
+        # Table rows carry printed columns instead of spec
+        for value in (item.get('cells') or {}).values():
+            if value is not None and query in str(value).lower():
+                return True
+        spec = item.get('spec')
+        return bool(spec) and query in str(spec).lower()
+
+
+class NamespaceNamesWorker(EnhancedBaseWorker):
+    """Worker that lists namespace names from metadata only, for namespace dropdowns"""
+    
+    def __init__(self, worker_id: str, loader_instance):
+        super().__init__(worker_id)
+        self.loader = loader_instance
+    
+    def execute(self) -> LoadResult:
+        start_time = time.time()
+        names = self.loader.list_resource_names('namespaces')
+        return LoadResult(
+            success=True,
+            resource_type='namespaces',
+            items=names,
+            total_count=len(names),
+            load_time_ms=(time.time() - start_time) * 1000,
+            metadata={'source': 'api', 'format': 'metadata'}
+        )
+
+
 class HighPerformanceResourceLoader(QObject):
     """
     High-Performance Unified Resource Loader
@@ -1558,8 +1150,11 @@ class HighPerformanceResourceLoader(QObject):
     # Signals for UI updates
     loading_started = pyqtSignal(str)  # resource_type
     loading_progress = pyqtSignal(str, int, int)  # resource_type, current, total
+    loading_partial = pyqtSignal(str, object)  # resource_type, partial LoadResult (one page of rows)
     loading_completed = pyqtSignal(str, object)  # resource_type, LoadResult
     loading_error = pyqtSignal(str, str)  # resource_type, error_message
+    namespace_names_loaded = pyqtSignal(object)  # LoadResult whose items are namespace names
+    cache_revalidated = pyqtSignal(str, object)  # resource_type, LoadResult - cached rows confirmed current
     
     def __init__(self):
         super().__init__()
@@ -1581,6 +1176,9 @@ class HighPerformanceResourceLoader(QObject):
         self._load_stats = defaultdict(list)
         self._stats_lock = threading.RLock()
         
+        # Stale-while-revalidate cache of completed results
+        self._result_cache = ResultCache()
+        
         # Initialize default configurations for all resource types
         self._initialize_default_configs()
         
@@ -1606,6 +1204,9 @@ class HighPerformanceResourceLoader(QObject):
             import gc
             import sys
             
+            # Drop cached results that are too stale to be shown
+            self._clear_old_cache_entries()
+            
             # Get object count
             object_count = len(gc.get_objects())
             
@@ -1628,6 +1229,9 @@ class HighPerformanceResourceLoader(QObject):
                 memory_mb = process.memory_info().rss / 1024 / 1024
                 if memory_mb > 800:  # Log if over 800MB (increased threshold)
                     logging.info(f"Memory usage: {memory_mb:.1f} MB, {object_count} objects")
+                if memory_mb > MEMORY_PRESSURE_MB:
+                    self._clear_old_cache_entries(force=True)
+                    clear_decoded_raw_cache()
             except ImportError:
                 pass
                 
@@ -1653,11 +1257,12 @@ class HighPerformanceResourceLoader(QObject):
         for resource_type in high_frequency_resources:
             config = ResourceConfig(
                 resource_type=resource_type,
-                api_method=self._get_api_method(resource_type),
                 batch_size=100,
                 timeout_seconds=15,
                 enable_streaming=True,
-                max_concurrent_requests=8
+                max_concurrent_requests=8,
+                use_informer=True,
+                cache_ttl_seconds=10
             )
             
             # Enable heavy data optimizations for large datasets
@@ -1675,137 +1280,31 @@ class HighPerformanceResourceLoader(QObject):
         for resource_type in medium_frequency_resources:
             self._config_cache[resource_type] = ResourceConfig(
                 resource_type=resource_type,
-                api_method=self._get_api_method(resource_type),
                 batch_size=50,
                 timeout_seconds=20,
                 enable_streaming=True,
-                max_concurrent_requests=5
+                max_concurrent_requests=5,
+                use_informer=resource_type not in SENSITIVE_RESOURCES,
+                cache_ttl_seconds=30,
+                enable_snapshot=resource_type not in SENSITIVE_RESOURCES
             )
         
         # Configure low-frequency resources for efficiency
         for resource_type in low_frequency_resources:
             self._config_cache[resource_type] = ResourceConfig(
                 resource_type=resource_type,
-                api_method=self._get_api_method(resource_type),
                 batch_size=25,
                 timeout_seconds=30,
                 enable_streaming=False,
-                max_concurrent_requests=3
+                max_concurrent_requests=3,
+                cache_ttl_seconds=120
             )
-    
-    def _get_api_method(self, resource_type: str) -> str:
-        """Get the appropriate API method name for the resource type"""
-        method_mapping = {
-            # Core v1 resources
-            'pods': 'list_pod_for_all_namespaces',
-            'nodes': 'list_node',
-            'services': 'list_service_for_all_namespaces',
-            'configmaps': 'list_config_map_for_all_namespaces',
-            'secrets': 'list_secret_for_all_namespaces',
-            'namespaces': 'list_namespace',
-            'events': 'list_event_for_all_namespaces',
-            'endpoints': 'list_endpoints_for_all_namespaces',
-            'persistentvolumes': 'list_persistent_volume',
-            'persistentvolumeclaims': 'list_persistent_volume_claim_for_all_namespaces',
-            'replicationcontrollers': 'list_replication_controller_for_all_namespaces',
-            'limitranges': 'list_limit_range_for_all_namespaces',
-            'resourcequotas': 'list_resource_quota_for_all_namespaces',
-            'serviceaccounts': 'list_service_account_for_all_namespaces',
-            'leases': 'list_lease_for_all_namespaces',
-            
-            # Apps v1 resources
-            'deployments': 'list_deployment_for_all_namespaces',
-            'replicasets': 'list_replica_set_for_all_namespaces',
-            'daemonsets': 'list_daemon_set_for_all_namespaces',
-            'statefulsets': 'list_stateful_set_for_all_namespaces',
-            
-            # Networking v1 resources
-            'ingresses': 'list_ingress_for_all_namespaces',
-            'networkpolicies': 'list_network_policy_for_all_namespaces',
-            'ingressclasses': 'list_ingress_class',
-            
-            # Storage v1 resources
-            'storageclasses': 'list_storage_class',
-            
-            # Batch v1 resources
-            'jobs': 'list_job_for_all_namespaces',
-            'cronjobs': 'list_cron_job_for_all_namespaces',
-            
-            # RBAC v1 resources
-            'roles': 'list_role_for_all_namespaces',
-            'rolebindings': 'list_role_binding_for_all_namespaces',
-            'clusterroles': 'list_cluster_role',
-            'clusterrolebindings': 'list_cluster_role_binding',
-            
-            # Autoscaling v2 resources
-            'horizontalpodautoscalers': 'list_horizontal_pod_autoscaler_for_all_namespaces',
-            
-            # Policy v1 resources
-            'poddisruptionbudgets': 'list_pod_disruption_budget_for_all_namespaces',
-            
-            # Scheduling v1 resources
-            'priorityclasses': 'list_priority_class',
-            
-            # Node v1 resources
-            'runtimeclasses': 'list_runtime_class',
-            
-            # Admission registration v1 resources
-            'mutatingwebhookconfigurations': 'list_mutating_webhook_configuration',
-            'validatingwebhookconfigurations': 'list_validating_webhook_configuration',
-            
-            # Custom Resources
-            'customresourcedefinitions': 'list_custom_resource_definition',
-        }
         
-        return method_mapping.get(resource_type, 'list_pod_for_all_namespaces')
-    
-    def _get_namespaced_api_method(self, resource_type: str) -> str:
-        """Get the appropriate namespaced API method name for the resource type"""
-        namespaced_method_mapping = {
-            # Core v1 resources
-            'pods': 'list_namespaced_pod',
-            'services': 'list_namespaced_service',
-            'configmaps': 'list_namespaced_config_map',
-            'secrets': 'list_namespaced_secret',
-            'events': 'list_namespaced_event',
-            'endpoints': 'list_namespaced_endpoints',
-            'persistentvolumeclaims': 'list_namespaced_persistent_volume_claim',
-            'replicationcontrollers': 'list_namespaced_replication_controller',
-            'limitranges': 'list_namespaced_limit_range',
-            'resourcequotas': 'list_namespaced_resource_quota',
-            'serviceaccounts': 'list_namespaced_service_account',
-            'leases': 'list_namespaced_lease',
-            
-            # Apps v1 resources
-            'deployments': 'list_namespaced_deployment',
-            'replicasets': 'list_namespaced_replica_set',
-            'daemonsets': 'list_namespaced_daemon_set',
-            'statefulsets': 'list_namespaced_stateful_set',
-            
-            # Networking v1 resources
-            'ingresses': 'list_namespaced_ingress',
-            'networkpolicies': 'list_namespaced_network_policy',
-            
-            # Batch v1 resources
-            'jobs': 'list_namespaced_job',
-            'cronjobs': 'list_namespaced_cron_job',
-            
-            # RBAC v1 resources
-            'roles': 'list_namespaced_role',
-            'rolebindings': 'list_namespaced_role_binding',
-            
-            # Autoscaling v2 resources
-            'horizontalpodautoscalers': 'list_namespaced_horizontal_pod_autoscaler',
-            
-            # Policy v1 resources
-            'poddisruptionbudgets': 'list_namespaced_pod_disruption_budget',
-        }
-        
-        
-        if resource_type in cluster_scoped_resources:
-            return self._get_api_method(resource_type)
-        
-        return namespaced_method_mapping.get(resource_type, 'list_namespaced_pod')
+        # List pages that only show printed columns download Table rows instead of full objects
+        for resource_type in TABLE_FORMAT_RESOURCES:
+            config = self._config_cache.get(resource_type) or ResourceConfig(resource_type=resource_type)
+            config.use_table_format = True
+            self._config_cache[resource_type] = config
     
     @log_performance
     def load_resources_with_search_async(
@@ -1819,19 +1318,23 @@ class HighPerformanceResourceLoader(QObject):
             logging.error("Resource type is required for search loading")
             return ""
         
-        # Create search-enabled configuration
-        config = ResourceConfig(
-            resource_type=resource_type,
-            api_method=self._get_api_method(resource_type),
+        # Search lists like a load of the page, so matches become the same rows
+        config = replace(
+            self._get_config_for_resource(resource_type, namespace),
             namespace=namespace,
-            batch_size=50,  # Larger batch for search
             timeout_seconds=45,  # Longer timeout for search
-            enable_pagination=True,  # Enable pagination for comprehensive search
-            max_concurrent_requests=3  # More requests for search
+            enable_pagination=True  # Enable pagination for comprehensive search
         )
         
         operation_id = f"search_{resource_type}_{int(time.time())}"
         
+        # Repeated searches within the TTL are answered from the result cache
+        cache_key = self._result_cache_key(resource_type, namespace, search_query)
+        cached_entry = self._result_cache.get(cache_key)
+        if cached_entry is not None and cached_entry.is_fresh():
+            self._emit_cached_result(resource_type, self._result_cache.as_cached_result(cached_entry))
+            return operation_id
+        
         # Cancel any existing load for this resource type
         self._cancel_existing_load(resource_type, namespace)
         
@@ -1848,7 +1351,9 @@ class HighPerformanceResourceLoader(QObject):
         
         # Connect worker signals for completion handling
         worker.signals.finished.connect(
-            lambda result: self._handle_load_completion_success(result, resource_type, namespace, operation_id)
+            lambda result: self._handle_load_completion_success(
+                result, resource_type, namespace, operation_id, cache_key, config.cache_ttl_seconds
+            )
         )
         worker.signals.error.connect(
             lambda error: self._handle_load_completion_error(error, resource_type, namespace, operation_id)
@@ -1891,6 +1396,18 @@ class HighPerformanceResourceLoader(QObject):
         operation_id = f"{resource_type}_{namespace or 'all'}_{int(time.time() * 1000)}"
         logging.debug(f"Unified Resource Loader: Generated operation_id: {operation_id}")
         
+        # Serve the last result instantly - fresh results need no API call, stale ones are revalidated
+        cache_key = self._result_cache_key(resource_type, namespace)
+        cached_entry = self._result_cache.get(cache_key) if config.cache_ttl_seconds > 0 else None
+        if cached_entry is not None:
+            self._emit_cached_result(resource_type, self._result_cache.as_cached_result(cached_entry))
+            if cached_entry.is_fresh():
+                logging.info(f"Unified Resource Loader: Served {resource_type} from cache ({cached_entry.age:.1f}s old)")
+                return operation_id
+            
+            # Revalidate in one piece so streamed pages do not replace the rows already shown
+            config = replace(config, progressive_loading=False)
+        
         # Register this operation to prevent duplicates
         with self._dedup_lock:
             self._pending_operations[operation_key] = operation_id
@@ -1904,7 +1421,7 @@ class HighPerformanceResourceLoader(QObject):
         
         # Create and start worker
         logging.debug(f"Unified Resource Loader: Creating ResourceLoadWorker for {resource_type}")
-        worker = ResourceLoadWorker(config, self)
+        worker = ResourceLoadWorker(config, self, cached_entry.result if cached_entry else None)
         
         # Track the worker
         with self._worker_lock:
@@ -1913,8 +1430,13 @@ class HighPerformanceResourceLoader(QObject):
             logging.debug(f"Unified Resource Loader: Tracking worker with key: {worker_key}")
         
         # Connect worker signals for completion handling
+        worker.signals.partial.connect(
+            lambda result: self._handle_partial_result(result, resource_type)
+        )
         worker.signals.finished.connect(
-            lambda result: self._handle_load_completion_success(result, resource_type, namespace, operation_id)
+            lambda result: self._handle_load_completion_success(
+                result, resource_type, namespace, operation_id, cache_key, config.cache_ttl_seconds
+            )
         )
         worker.signals.error.connect(
             lambda error: self._handle_load_completion_error(error, resource_type, namespace, operation_id)
@@ -1933,28 +1455,20 @@ class HighPerformanceResourceLoader(QObject):
         base_config = self._config_cache.get(resource_type)
         
         if not base_config:
-            # Create default config for unknown resource types
-            base_config = ResourceConfig(
-                resource_type=resource_type,
-                api_method=self._get_api_method(resource_type)
-            )
+            info = get_resource_registry().resolve(resource_type)
+            if info is not None and not info.builtin:
+                # Custom resources are listed as server-printed Table rows - their columns come from the CRD
+                base_config = ResourceConfig(resource_type=resource_type, use_table_format=True,
+                                             page_size=CUSTOM_RESOURCE_PAGE_SIZE)
+            else:
+                # Create default config for unknown resource types
+                base_config = ResourceConfig(resource_type=resource_type)
             self._config_cache[resource_type] = base_config
         
         # Create a copy with namespace if specified
         if namespace:
-            # Get the correct namespaced API method
-            namespaced_api_method = self._get_namespaced_api_method(resource_type)
-            
-            config = ResourceConfig(
-                resource_type=base_config.resource_type,
-                api_method=namespaced_api_method,
-                namespace=namespace,
-                batch_size=base_config.batch_size,
-                timeout_seconds=base_config.timeout_seconds,
-                enable_streaming=base_config.enable_streaming,
-                max_concurrent_requests=base_config.max_concurrent_requests
-            )
-            return config
+            # Copy every tuning flag so namespaced loads behave like the base config
+            return replace(base_config, namespace=namespace)
         
         return base_config
     
@@ -1970,10 +1484,41 @@ class HighPerformanceResourceLoader(QObject):
     
 # Method removed - monitoring is now handled by EnhancedBaseWorker signals
     
-    def _handle_load_completion_success(self, result: LoadResult, resource_type: str, namespace: Optional[str], operation_id: str):
+    def _handle_partial_result(self, result: LoadResult, resource_type: str):
+        """Forward one streamed page and report overall progress (total is 0 when unknown)"""
+        try:
+            self.loading_partial.emit(resource_type, result)
+            self.loading_progress.emit(resource_type, result.total_count, result.metadata.get('expected_total', 0))
+        except Exception as e:
+            logging.debug(f"Unified Resource Loader: Error emitting partial result for {resource_type}: {e}")
+    
+    def _handle_load_completion_success(self, result: LoadResult, resource_type: str, namespace: Optional[str], operation_id: str,
+                                        cache_key=None, cache_ttl_seconds: int = 0):
         """Handle successful load completion"""
         logging.info(f"Unified Resource Loader: Load completed successfully for {resource_type} (operation_id: {operation_id})")
         try:
+            if cache_key is not None and result.success:
+                if result.metadata.get('unchanged'):
+                    # The page already shows these rows from the cache or snapshot - only confirm them
+                    if not self._result_cache.touch(cache_key):
+                        confirmed = replace(result, from_cache=False, metadata={
+                            'source': result.metadata.get('source'),
+                            'resource_version': result.metadata.get('resource_version'),
+                        })
+                        self._result_cache.put(cache_key, confirmed, confirmed.metadata['resource_version'], cache_ttl_seconds)
+                    self.cache_revalidated.emit(resource_type, result)
+                    return
+                # A delta only describes this transition - later cache hits are full results
+                cached = replace(result, metadata={
+                    key: value for key, value in result.metadata.items() if key not in ('delta', 'delta_base')
+                })
+                self._result_cache.put(cache_key, cached, result.metadata.get('resource_version'), cache_ttl_seconds)
+                
+                # Search results (keyed by query) are not worth persisting
+                config = self._config_cache.get(resource_type)
+                if not cache_key[3] and (config is None or config.enable_snapshot):
+                    self._save_snapshot(resource_type, namespace, result)
+            
             if resource_type == 'nodes':
                 import time
                 from Utils import get_timestamp_with_ms
@@ -2014,6 +1559,87 @@ class HighPerformanceResourceLoader(QObject):
             self._cleanup_worker(resource_type, namespace)
             self._cleanup_pending_operation(resource_type, namespace)
     
+    def _result_cache_key(self, resource_type: str, namespace: Optional[str], query: Optional[str] = None):
+        """Result cache key for the current cluster"""
+        try:
+            cluster_name = get_kubernetes_client().current_cluster
+        except Exception:
+            cluster_name = None
+        return ResultCache.make_key(cluster_name, resource_type, namespace, query)
+    
+    def _emit_cached_result(self, resource_type: str, result: LoadResult):
+        """Emit a cached result as a completed load, after the caller has stored its operation id"""
+        def emit_cached():
+            try:
+                self.loading_completed.emit(resource_type, result)
+            except Exception as e:
+                logging.debug(f"Unified Resource Loader: Error emitting cached {resource_type}: {e}")
+        
+        if QThread.currentThread() is self.thread():
+            QTimer.singleShot(0, emit_cached)
+        else:
+            emit_cached()
+    
+    def _get_cluster_identity(self):
+        """(kube context, API server URL) that cached and persisted rows belong to"""
+        try:
+            kube_client = get_kubernetes_client()
+            return kube_client.current_cluster, kube_client.service.api_service.get_server_host()
+        except Exception:
+            return None, None
+    
+    def _load_snapshot_result(self, resource_type: str, namespace: Optional[str]) -> Optional[LoadResult]:
+        """Rows persisted by a previous session as a stale cached LoadResult (blocking - worker thread)"""
+        context, server = self._get_cluster_identity()
+        snapshot = get_snapshot_store().load(context, server, resource_type, namespace)
+        if not snapshot:
+            return None
+        
+        items = snapshot['items']
+        config = self._config_cache.get(resource_type)
+        if config is None or config.compact_rows:
+            items = [ResourceRow.from_dict(item) for item in items]
+        logging.info(f"Unified Resource Loader: Showing {len(items)} {resource_type} from the on-disk snapshot while loading")
+        return LoadResult(
+            success=True,
+            resource_type=resource_type,
+            items=items,
+            total_count=len(items),
+            from_cache=True,
+            metadata={
+                'source': 'snapshot',
+                'resource_version': snapshot['resource_version'],
+                'stale': True,
+                'cache_age': round(time.time() - snapshot['saved_at'], 1),
+            }
+        )
+    
+    def _save_snapshot(self, resource_type: str, namespace: Optional[str], result: LoadResult):
+        """Persist the rows of a completed load for the next start"""
+        context, server = self._get_cluster_identity()
+        get_snapshot_store().save_async(
+            context, server, resource_type, namespace, result.items, result.metadata.get('resource_version')
+        )
+    
+    def invalidate_cache(self, resource_type: Optional[str] = None, namespace: Optional[str] = None):
+        """Drop cached results after a resource was changed, so the next load is not served stale"""
+        try:
+            cluster_name = get_kubernetes_client().current_cluster
+        except Exception:
+            cluster_name = None
+        removed = self._result_cache.invalidate(cluster_name, resource_type, namespace)
+        if cluster_name:
+            get_snapshot_store().invalidate(cluster_name, resource_type)
+        logging.debug(f"Unified Resource Loader: Invalidated {removed} cached results for {resource_type or 'all resources'}")
+    
+    def get_result_cache_stats(self) -> Dict[str, Any]:
+        """Hit rate, size and eviction counts of the result cache"""
+        return self._result_cache.get_stats()
+    
+    def get_cancellation_stats(self) -> Dict[str, Any]:
+        """Requests and retry waits aborted by cancelled loads, and the blocking time that freed up"""
+        return get_cancellation_stats()
+    
     def _cleanup_worker(self, resource_type: str, namespace: Optional[str]):
         """Cleanup worker reference"""
         worker_key = f"{resource_type}_{namespace or 'all'}"
@@ -2075,79 +1701,112 @@ class HighPerformanceResourceLoader(QObject):
         
         logging.info("Cancelled all active resource loading operations")
     
-    # Cache management functions removed (no more caching)
+    def _get_metadata_list_method(self, resource_type: str) -> MetadataListMethod:
+        """Metadata-only list method for any resource type the cluster serves"""
+        list_method = get_resource_registry().list_method(resource_type, MetadataListMethod)
+        if list_method is None:
+            raise ValueError(f"Unknown resource type '{resource_type}'")
+        return list_method
+    
+    def list_metadata(self, resource_type: str, namespace: Optional[str] = None,
+                      field_selector: Optional[str] = None, request_timeout: int = 30) -> List[Dict[str, Any]]:
+        """List only the metadata of every object of a resource type (blocking - call from a worker thread)"""
+        list_method = self._get_metadata_list_method(resource_type)
+        kwargs = {'namespace': namespace, 'field_selector': field_selector, '_request_timeout': request_timeout}
+        
+        metadata_items = []
+        continue_token = None
+        while True:
+            body = list_raw(list_method, limit=METADATA_PAGE_SIZE, _continue=continue_token, **kwargs)
+            metadata_items.extend(item.get('metadata') or {} for item in get_list_items(body))
+            continue_token = get_list_continue(body)
+            if not continue_token:
+                return metadata_items
+    
+    def list_resource_names(self, resource_type: str, namespace: Optional[str] = None) -> List[str]:
+        """Names of every object of a resource type from a metadata-only list (blocking)"""
+        return [metadata['name'] for metadata in self.list_metadata(resource_type, namespace) if metadata.get('name')]
+    
+    def count_resources(self, resource_type: str, namespace: Optional[str] = None,
+                        field_selector: Optional[str] = None, request_timeout: int = 30) -> int:
+        """Count objects of a resource type without downloading them (blocking - call from a worker thread)
+        
+        Unfiltered lists are counted from a single limit=1 page and its remainingItemCount;
+        selector-filtered lists do not report it, so their metadata pages are counted instead.
+        """
+        list_method = self._get_metadata_list_method(resource_type)
+        kwargs = {'namespace': namespace, 'field_selector': field_selector, '_request_timeout': request_timeout}
+        
+        body = list_raw(list_method, limit=1, **kwargs)
+        count = len(get_list_items(body))
+        continue_token = get_list_continue(body)
+        
+        remaining_count = get_list_remaining_count(body)
+        if continue_token and remaining_count is not None:
+            return count + remaining_count
+        
+        while continue_token:
+            body = list_raw(list_method, limit=METADATA_PAGE_SIZE, _continue=continue_token, **kwargs)
+            count += len(get_list_items(body))
+            continue_token = get_list_continue(body)
+        
+        return count
     
-    def _get_api_client(self, kube_client, resource_type=None):
-        """Get the appropriate API client for the resource type"""
-        api_mapping = {
-            # Core v1 resources
-            'pods': kube_client.v1,
-            'nodes': kube_client.v1,
-            'services': kube_client.v1,
-            'configmaps': kube_client.v1,
-            'secrets': kube_client.v1,
-            'namespaces': kube_client.v1,
-            'events': kube_client.v1,
-            'endpoints': kube_client.v1,
-            'persistentvolumes': kube_client.v1,
-            'persistentvolumeclaims': kube_client.v1,
-            'replicationcontrollers': kube_client.v1,
-            'limitranges': kube_client.v1,
-            'resourcequotas': kube_client.v1,
-            'serviceaccounts': kube_client.v1,
-            
-            # Apps v1 resources
-            'deployments': kube_client.apps_v1,
-            'replicasets': kube_client.apps_v1,
-            'daemonsets': kube_client.apps_v1,
-            'statefulsets': kube_client.apps_v1,
-            
-            # Networking v1 resources  
-            'ingresses': kube_client.networking_v1,
-            'networkpolicies': kube_client.networking_v1,
-            'ingressclasses': kube_client.networking_v1,
-            
-            # Storage v1 resources
-            'storageclasses': kube_client.storage_v1,
-            
-            # Batch v1 resources
-            'jobs': kube_client.batch_v1,
-            'cronjobs': kube_client.batch_v1,
-            
-            # RBAC v1 resources
-            'roles': kube_client.rbac_v1,
-            'rolebindings': kube_client.rbac_v1,
-            'clusterroles': kube_client.rbac_v1,
-            'clusterrolebindings': kube_client.rbac_v1,
-            
-            # Autoscaling v2 resources
-            'horizontalpodautoscalers': kube_client.autoscaling_v2,
-            
-            # Policy v1 resources
-            'poddisruptionbudgets': kube_client.policy_v1,
-            
-            # Scheduling v1 resources
-            'priorityclasses': kube_client.scheduling_v1,
-            
-            # Node v1 resources
-            'runtimeclasses': kube_client.node_v1,
-            
-            # Admission registration v1 resources
-            'mutatingwebhookconfigurations': kube_client.admissionregistration_v1,
-            'validatingwebhookconfigurations': kube_client.admissionregistration_v1,
-            
-            # Coordination v1 resources
-            'leases': kube_client.coordination_v1,
-            
-            # Custom Resources
-            'customresourcedefinitions': kube_client.apiextensions_v1,
-        }
+    def load_namespace_names_async(self) -> str:
+        """Load namespace names for namespace dropdowns from a metadata-only list
         
-        # Use the resource_type parameter if provided, otherwise fall back to default
-        if resource_type:
-            return api_mapping.get(resource_type, kube_client.v1)
-        return kube_client.v1  # Default fallback
-
+        Emits namespace_names_loaded instead of loading_completed so pages listing full
+        Namespace objects do not receive the name-only result.
+        """
+        operation_id = f"namespace_names_{int(time.time() * 1000)}"
+        
+        with self._worker_lock:
+            existing_worker = self._active_workers.get('namespace_names')
+            if existing_worker is not None and not existing_worker.is_timed_out():
+                return existing_worker.worker_id
+            
+            worker = NamespaceNamesWorker(operation_id, self)
+            self._active_workers['namespace_names'] = worker
+        
+        worker.signals.finished.connect(self._handle_namespace_names_result)
+        worker.signals.error.connect(
+            lambda error: self._handle_namespace_names_result(
+                LoadResult(success=False, resource_type='namespaces', error_message=str(error))
+            )
+        )
+        
+        get_thread_manager().submit_worker(operation_id, worker)
+        return operation_id
+    
+    def _handle_namespace_names_result(self, result: LoadResult):
+        """Forward namespace names to the dropdowns"""
+        with self._worker_lock:
+            self._active_workers.pop('namespace_names', None)
+        try:
+            self.namespace_names_loaded.emit(result)
+        except Exception as e:
+            logging.debug(f"Unified Resource Loader: Error emitting namespace names: {e}")
+    
+    def cancel_load(self, resource_type: str, namespace: Optional[str] = None):
+        """Cancel an in-flight load so its remaining pages are not fetched"""
+        self._cancel_existing_load(resource_type, namespace)
+        self._cleanup_worker(resource_type, namespace)
+        self._cleanup_pending_operation(resource_type, namespace)
+    
+    def stop_informers(self, cluster_name: Optional[str] = None):
+        """Stop shared informers for one cluster, or for all clusters"""
+        informer_cache = get_informer_cache()
+        if cluster_name:
+            informer_cache.stop_cluster(cluster_name)
+        else:
+            informer_cache.stop_all()
+    
+    def get_informer_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get statistics for the shared informers"""
+        return get_informer_cache().get_stats()
+    
+    # Cache management functions removed (no more caching)
+    
     def cleanup(self):
         """Cleanup resources and shutdown thread pool"""
         logging.info("Shutting down High-Performance Resource Loader")
@@ -2155,6 +1814,13 @@ class HighPerformanceResourceLoader(QObject):
         # Cancel all active loads
         self.cancel_all_loads()
         
+        # Stop list+watch informers
+        shutdown_informer_cache()
+        
+        # Flush pending snapshot writes
+        shutdown_snapshot_store()
+        shutdown_row_process_pool()
+        
         # Force garbage collection of large objects
         self._force_memory_cleanup()
         
@@ -2169,8 +1835,9 @@ class HighPerformanceResourceLoader(QObject):
         with self._stats_lock:
             self._load_stats.clear()
         
-        # Clear configuration cache
+        # Clear configuration and result caches
         self._config_cache.clear()
+        self._result_cache.clear()
         
         logging.info("Resource Loader cleanup completed")
     
@@ -2197,77 +1864,19 @@ class HighPerformanceResourceLoader(QObject):
     def _clear_old_cache_entries(self, force=False):
         """Clear old cache entries to free memory"""
         try:
-            current_time = time.time()
-            max_age = 300 if not force else 60  # 5 minutes normal, 1 minute if forced
-            
-            with self._cache_lock:
-                keys_to_remove = []
-                for key, (data, timestamp) in self._resource_cache.items():
-                    if current_time - timestamp > max_age:
-                        keys_to_remove.append(key)
-                
-                for key in keys_to_remove:
-                    del self._resource_cache[key]
-                
-                if keys_to_remove:
-                    logging.info(f"Cleared {len(keys_to_remove)} old cache entries")
+            max_age = self._result_cache.max_stale_seconds if not force else 60  # Too stale to show, 1 minute if forced
+            
+            removed = self._result_cache.evict_older_than(max_age)
+            if force:
+                # Memory pressure - also drop the least recently used half of what is left
+                removed += self._result_cache.trim(0.5)
+            
+            if removed:
+                logging.info(f"Cleared {removed} old cache entries")
                     
         except Exception as e:
             logging.debug(f"Error clearing old cache entries: {e}")
     
-    @staticmethod
-    def _format_capacity(raw_value: str) -> str:
-        """Format Kubernetes capacity values to human-readable format"""
-        if not raw_value:
-            return ''
-        
-        if 'Ki' in raw_value:
-            # Convert from Ki to GB
-            ki_value = int(raw_value.replace('Ki', ''))
-            gb_value = ki_value / (1024 * 1024)
-            return f"{gb_value:.1f}GB"
-        elif 'Gi' in raw_value:
-            # Convert from Gi to GB
-            gi_value = int(raw_value.replace('Gi', ''))
-            return f"{gi_value}GB"
-        else:
-            return raw_value
-    
-    @staticmethod
-    def _process_node_conditions(conditions) -> tuple:
-        """Process node conditions and return (status, conditions_text)"""
-        node_status = 'Unknown'
-        conditions_list = []
-        
-        if conditions:
-            for condition in conditions:
-                if condition.type == 'Ready':
-                    node_status = 'Ready' if condition.status == 'True' else 'NotReady'
-                
-                # Format condition for display: Type=Status
-                condition_display = f"{condition.type}={condition.status}"
-                
-                # Add reason if available for non-True conditions
-                if condition.status != 'True' and hasattr(condition, 'reason') and condition.reason:
-                    condition_display += f" ({condition.reason})"
-                
-                conditions_list.append(condition_display)
-        
-        conditions_text = ", ".join(conditions_list) if conditions_list else "Unknown"
-        return node_status, conditions_text
-    
-    @staticmethod
-    def _extract_node_roles(labels) -> list:
-        """Extract node roles from Kubernetes labels"""
-        roles = []
-        if labels:
-            for label_key in labels:
-                if 'node-role.kubernetes.io/' in label_key:
-                    role = label_key.replace('node-role.kubernetes.io/', '')
-                    if role:
-                        roles.append(role)
-        return roles if roles else ['<none>']
-    
     def __del__(self):
         """Destructor to ensure cleanup"""
         try:
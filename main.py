@@ -7,6 +7,7 @@ import webbrowser
 import requests
 import json
 import gc
+import multiprocessing
 from datetime import datetime
 from PyQt6.QtCore import QPoint
 
@@ -998,6 +999,8 @@ def main():
         return 1
     
 if __name__ == "__main__":
+    # Frozen builds re-run this entry point in spawned row-extractor processes
+    multiprocessing.freeze_support()
     exit_status = 1
     try:
         exit_status = main()